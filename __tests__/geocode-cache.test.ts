@@ -0,0 +1,134 @@
+import { GeocodeCache, forwardKey, normalizeQuery, reverseKey } from '../lib/geocode-cache';
+
+jest.mock('@react-native-async-storage/async-storage', () => ({
+  getItem: jest.fn(() => Promise.resolve(null)),
+  setItem: jest.fn(() => Promise.resolve()),
+}));
+
+const HOUR = 3600 * 1000;
+const TTL = { r: 7 * 24 * HOUR, f: 24 * HOUR, g: 30 * 24 * HOUR };
+
+type Place = { name: string };
+const places = (...names: string[]): Place[] => names.map((name) => ({ name }));
+const matchesPlace = (place: Place, normalized: string) => normalizeQuery(place.name).startsWith(normalized);
+
+describe('geocode cache', () => {
+  let now = 0;
+
+  beforeEach(() => {
+    now = Date.UTC(2026, 0, 1);
+    jest.spyOn(Date, 'now').mockImplementation(() => now);
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  describe('keys', () => {
+    it('should normalize case, accents and punctuation in forward queries', () => {
+      expect(normalizeQuery('  San   JOSÉ, Costa-Rica ')).toBe('san jose costa rica');
+      expect(forwardKey('Heredia')).toBe(forwardKey('  heredia'));
+    });
+
+    it('should share a reverse key within one ~110 m cell', () => {
+      expect(reverseKey(9.92811, -84.09071)).toBe(reverseKey(9.92849, -84.09039));
+      expect(reverseKey(9.92811, -84.09071)).not.toBe(reverseKey(9.92911, -84.09071));
+    });
+  });
+
+  describe('getOrLoad', () => {
+    it('should load once and serve repeats from memory', async () => {
+      const cache = new GeocodeCache(10, TTL, false);
+      const loader = jest.fn(() => Promise.resolve('Barrio Escalante'));
+
+      await expect(cache.getOrLoad('r:1:2', loader)).resolves.toBe('Barrio Escalante');
+      await expect(cache.getOrLoad('r:1:2', loader)).resolves.toBe('Barrio Escalante');
+
+      expect(loader).toHaveBeenCalledTimes(1);
+      expect(cache.stats).toMatchObject({ hits: 1, misses: 1 });
+    });
+
+    it('should share one load between concurrent callers', async () => {
+      const cache = new GeocodeCache(10, TTL, false);
+      const loader = jest.fn(() => Promise.resolve('Sabana'));
+
+      const results = await Promise.all([cache.getOrLoad('g:abc', loader), cache.getOrLoad('g:abc', loader)]);
+
+      expect(results).toEqual(['Sabana', 'Sabana']);
+      expect(loader).toHaveBeenCalledTimes(1);
+    });
+
+    it('should expire negative results after a few minutes', async () => {
+      const cache = new GeocodeCache(10, TTL, false);
+      const loader = jest.fn(() => Promise.resolve(null));
+
+      await cache.getOrLoad('r:5:5', loader);
+      now += 4 * 60 * 1000;
+      await cache.getOrLoad('r:5:5', loader);
+      expect(loader).toHaveBeenCalledTimes(1);
+
+      now += 2 * 60 * 1000;
+      await cache.getOrLoad('r:5:5', loader);
+      expect(loader).toHaveBeenCalledTimes(2);
+    });
+
+    it('should evict the least recently used entry', async () => {
+      const cache = new GeocodeCache(2, TTL, false);
+      await cache.getOrLoad('g:a', () => Promise.resolve('a'));
+      await cache.getOrLoad('g:b', () => Promise.resolve('b'));
+      await cache.getOrLoad('g:a', () => Promise.resolve('stale'));
+      await cache.getOrLoad('g:c', () => Promise.resolve('c'));
+
+      const reload = jest.fn(() => Promise.resolve('b again'));
+      await expect(cache.getOrLoad('g:a', () => Promise.resolve('stale'))).resolves.toBe('a');
+      await expect(cache.getOrLoad('g:b', reload)).resolves.toBe('b again');
+      expect(reload).toHaveBeenCalledTimes(1);
+      expect(cache.stats.evictions).toBeGreaterThanOrEqual(1);
+    });
+  });
+
+  describe('getSuggestions', () => {
+    it('should filter a complete shorter-prefix list instead of loading', async () => {
+      const cache = new GeocodeCache(10, TTL, false);
+      await cache.getSuggestions('sa', 5, matchesPlace, () =>
+        Promise.resolve(places('San José', 'San Pedro', 'Santa Ana'))
+      );
+      const loader = jest.fn(() => Promise.resolve(places('unused')));
+
+      const result = await cache.getSuggestions('San P', 5, matchesPlace, loader);
+
+      expect(result).toEqual(places('San Pedro'));
+      expect(loader).not.toHaveBeenCalled();
+      expect(cache.stats.prefixHits).toBe(1);
+    });
+
+    it('should load when the shorter list was cut off at the provider limit', async () => {
+      const cache = new GeocodeCache(10, TTL, false);
+      await cache.getSuggestions('sa', 3, matchesPlace, () =>
+        Promise.resolve(places('San José', 'San Pedro', 'Santa Ana'))
+      );
+      const loader = jest.fn(() => Promise.resolve(places('San Rafael')));
+
+      await expect(cache.getSuggestions('san r', 3, matchesPlace, loader)).resolves.toEqual(places('San Rafael'));
+      expect(loader).toHaveBeenCalledTimes(1);
+    });
+
+    it('should keep the parent expiry on a prefix-derived entry', async () => {
+      const cache = new GeocodeCache(10, TTL, false);
+      await cache.getSuggestions('sa', 5, matchesPlace, () => Promise.resolve(places('San José', 'Santa Ana')));
+
+      now += 23 * HOUR;
+      await expect(cache.getSuggestions('santa', 5, matchesPlace, () => Promise.resolve([]))).resolves.toEqual(
+        places('Santa Ana')
+      );
+
+      // One hour later the parent list has expired, and so has the subset filtered from it
+      now += HOUR;
+      const loader = jest.fn(() => Promise.resolve(places('Santa Ana', 'Santa Cruz')));
+      await expect(cache.getSuggestions('santa', 5, matchesPlace, loader)).resolves.toEqual(
+        places('Santa Ana', 'Santa Cruz')
+      );
+      expect(loader).toHaveBeenCalledTimes(1);
+    });
+  });
+});
@@ -0,0 +1,154 @@
+import { getHedgeStats, hedged, HedgeTimeoutError, resetHedgeStats } from '../lib/hedge';
+
+// Strategy settling after `ms` (never when ms is Infinity) that records whether it was aborted
+const strategyAfter = <T>(ms: number, value: T, fail = false) => {
+  const state = { started: 0, aborted: false };
+  const run = jest.fn(
+    (signal: AbortSignal) =>
+      new Promise<T>((resolve, reject) => {
+        state.started = Date.now();
+        const timer = Number.isFinite(ms)
+          ? setTimeout(() => (fail ? reject(new Error(String(value))) : resolve(value)), ms)
+          : null;
+        signal.addEventListener('abort', () => {
+          if (timer) clearTimeout(timer);
+          state.aborted = true;
+          reject(new Error('aborted'));
+        });
+      })
+  );
+  return { run, state };
+};
+
+describe('hedged', () => {
+  let t0 = 0;
+
+  beforeEach(() => {
+    jest.useFakeTimers();
+    t0 = Date.now();
+    resetHedgeStats();
+  });
+
+  afterEach(() => {
+    jest.useRealTimers();
+  });
+
+  it('should start the backup only once the threshold passes', async () => {
+    const primary = strategyAfter(Infinity, 'primary');
+    const backup = strategyAfter(100, 'backup');
+    const result = hedged('k', [primary.run, backup.run], { initialDelayMs: 2000 });
+
+    await jest.advanceTimersByTimeAsync(1999);
+    expect(backup.run).not.toHaveBeenCalled();
+
+    await jest.advanceTimersByTimeAsync(1);
+    expect(backup.run).toHaveBeenCalledTimes(1);
+    expect(backup.state.started - t0).toBe(2000);
+
+    await jest.advanceTimersByTimeAsync(100);
+    await expect(result).resolves.toBe('backup');
+    expect(getHedgeStats().k).toMatchObject({ calls: 1, hedged: 1, backupWins: 1, thresholdMs: 2000 });
+  });
+
+  it('should cancel the losing attempt', async () => {
+    const primary = strategyAfter(2100, 'primary');
+    const backup = strategyAfter(500, 'backup');
+    const result = hedged('k', [primary.run, backup.run], { initialDelayMs: 2000 });
+
+    await jest.advanceTimersByTimeAsync(2100);
+    await expect(result).resolves.toBe('primary');
+    expect(backup.state.aborted).toBe(true);
+    expect(primary.state.aborted).toBe(false);
+    expect(getHedgeStats().k.backupWins).toBe(0);
+  });
+
+  it('should start the backup at once when the primary fails', async () => {
+    const primary = strategyAfter(50, 'boom', true);
+    const backup = strategyAfter(10, 'backup');
+    const result = hedged('k', [primary.run, backup.run], { initialDelayMs: 2000 });
+
+    await jest.advanceTimersByTimeAsync(60);
+    await expect(result).resolves.toBe('backup');
+    expect(backup.state.started - t0).toBe(50);
+    expect(getHedgeStats().k).toMatchObject({ hedged: 0, failovers: 1 });
+  });
+
+  it('should reject with the last error when every strategy fails', async () => {
+    const result = hedged('k', [strategyAfter(10, 'first', true).run, strategyAfter(10, 'second', true).run]);
+    const assertion = expect(result).rejects.toThrow('second');
+
+    await jest.advanceTimersByTimeAsync(30);
+    await assertion;
+    expect(getHedgeStats().k.failures).toBe(1);
+  });
+
+  it('should give up after 10 s and abort every attempt', async () => {
+    const primary = strategyAfter(Infinity, 'primary');
+    const backup = strategyAfter(Infinity, 'backup');
+    const result = hedged('fetchTasks', [primary.run, backup.run], { timeoutMs: 10000 });
+    const assertion = expect(result).rejects.toThrow(HedgeTimeoutError);
+
+    await jest.advanceTimersByTimeAsync(9999);
+    expect(primary.state.aborted).toBe(false);
+
+    await jest.advanceTimersByTimeAsync(1);
+    await assertion;
+    expect(primary.state.aborted).toBe(true);
+    expect(backup.state.aborted).toBe(true);
+    expect(getHedgeStats().fetchTasks.timeouts).toBe(1);
+  });
+
+  it('should set the threshold from the primary latency percentile', async () => {
+    for (let i = 0; i < 5; i++) {
+      const call = hedged('k', [strategyAfter(300 + i * 10, 'primary').run, strategyAfter(10, 'backup').run]);
+      await jest.advanceTimersByTimeAsync(400);
+      await call;
+    }
+
+    const backup = strategyAfter(10, 'backup');
+    const call = hedged('k', [strategyAfter(Infinity, 'primary').run, backup.run]);
+    await jest.advanceTimersByTimeAsync(340);
+    expect(backup.run).toHaveBeenCalledTimes(1);
+    expect(backup.state.started - t0 - 5 * 400).toBe(340);
+    await jest.advanceTimersByTimeAsync(10);
+    await expect(call).resolves.toBe('backup');
+    expect(getHedgeStats().k.thresholdMs).toBe(340);
+  });
+
+  it('should record a cut-off primary at the time it was cut off', async () => {
+    const options = { initialDelayMs: 1000, minSamples: 1, minDelayMs: 1 };
+    const first = hedged('k', [strategyAfter(Infinity, 'primary').run, strategyAfter(400, 'backup').run], options);
+    await jest.advanceTimersByTimeAsync(1400);
+    await expect(first).resolves.toBe('backup');
+
+    // One censored sample of 1400 ms: the primary had been running that long when the backup won
+    const backup = strategyAfter(10, 'backup');
+    const second = hedged('k', [strategyAfter(Infinity, 'primary').run, backup.run], options);
+    await jest.advanceTimersByTimeAsync(1399);
+    expect(backup.run).not.toHaveBeenCalled();
+    await jest.advanceTimersByTimeAsync(1);
+    expect(backup.state.started - t0 - 1400).toBe(1400);
+    await jest.advanceTimersByTimeAsync(10);
+    await expect(second).resolves.toBe('backup');
+  });
+
+  it('should raise the threshold during a slow spell instead of hedging every call', async () => {
+    const options = { initialDelayMs: 200, minSamples: 1, minDelayMs: 1 };
+    const thresholds: number[] = [];
+    for (let i = 0; i < 3; i++) {
+      const call = hedged('k', [strategyAfter(Infinity, 'primary').run, strategyAfter(800, 'backup').run], options);
+      thresholds.push(getHedgeStats().k.thresholdMs);
+      await jest.advanceTimersByTimeAsync(5000);
+      await call;
+    }
+
+    // Each cut-off sample is threshold + 800 ms of backup, so the threshold climbs with the spell
+    expect(thresholds).toEqual([200, 1000, 1800]);
+    const backup = strategyAfter(10, 'backup');
+    const call = hedged('k', [strategyAfter(2000, 'primary').run, backup.run], options);
+    await jest.advanceTimersByTimeAsync(2000);
+    await expect(call).resolves.toBe('primary');
+    expect(backup.run).not.toHaveBeenCalled();
+    expect(getHedgeStats().k.thresholdMs).toBe(2600);
+  });
+});
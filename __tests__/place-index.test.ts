@@ -0,0 +1,68 @@
+import { getIndexedPlace, isIndexedPlaceId, searchPlaces } from '../lib/place-index';
+import { normalizeQuery } from '../lib/geocode-cache';
+
+jest.mock('@react-native-async-storage/async-storage', () => ({
+  getItem: jest.fn(() => Promise.resolve(null)),
+  setItem: jest.fn(() => Promise.resolve()),
+}));
+
+const index = require('../assets/data/cr-places-index.json') as {
+  places: [string, string, number, number][];
+  keys: string[];
+  ids: number[];
+};
+
+// Reference answer: scan every key, keep the `limit` smallest (most popular) place ids
+const bruteForce = (query: string, limit: number): string[] => {
+  const needle = normalizeQuery(query);
+  const ids = new Set<number>();
+  index.keys.forEach((key, i) => {
+    if (needle && key.startsWith(needle)) ids.add(index.ids[i]);
+  });
+  return Array.from(ids)
+    .sort((a, b) => a - b)
+    .slice(0, limit)
+    .map((id) => `cr:${id}`);
+};
+
+describe('place index', () => {
+  it('should keep keys sorted so prefix lookups can binary search', () => {
+    const sorted = [...index.keys].sort();
+    expect(index.keys).toEqual(sorted);
+    expect(index.ids).toHaveLength(index.keys.length);
+  });
+
+  it('should find places by any word, ignoring case and accents', () => {
+    expect(searchPlaces('limon').map((p) => p.name)).toContain('Limón');
+    expect(searchPlaces('JOSÉ').map((p) => p.name)).toContain('San José');
+  });
+
+  it('should rank the most popular place first', () => {
+    const [first] = searchPlaces('san jo');
+    expect(first).toMatchObject({ placeId: 'cr:0', name: 'San José', latitude: 9.9281, longitude: -84.0907 });
+  });
+
+  it('should match a brute-force scan for every prefix of every key', () => {
+    const prefixes = new Set<string>();
+    index.keys.forEach((key) => {
+      for (let end = 1; end <= Math.min(key.length, 6); end++) prefixes.add(key.slice(0, end));
+    });
+    prefixes.forEach((prefix) => {
+      expect(searchPlaces(prefix, 5).map((p) => p.placeId)).toEqual(bruteForce(prefix, 5));
+    });
+  });
+
+  it('should return nothing for an empty or unmatched query', () => {
+    expect(searchPlaces('   ')).toEqual([]);
+    expect(searchPlaces('zzzz')).toEqual([]);
+  });
+
+  it('should resolve indexed place ids and reject others', () => {
+    expect(isIndexedPlaceId('cr:3')).toBe(true);
+    expect(isIndexedPlaceId('ChIJ123')).toBe(false);
+    expect(getIndexedPlace('cr:3')).toMatchObject({ name: 'Heredia', description: 'Heredia, Costa Rica' });
+    expect(getIndexedPlace(`cr:${index.places.length}`)).toBeNull();
+    expect(getIndexedPlace('cr:abc')).toBeNull();
+    expect(getIndexedPlace('ChIJ123')).toBeNull();
+  });
+});
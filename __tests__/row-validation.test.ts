@@ -0,0 +1,133 @@
+import { compileSchema, validateRows, validationStats, TASK_ROWS, OFFER_ROWS } from '../lib/row-validation';
+import { OfferRowSchema, TaskRowSchema } from '../lib/schemas';
+
+const taskRow = (overrides: Record<string, unknown> = {}): Record<string, unknown> => ({
+  id: '3f1c2a9e-5b7d-4c1e-9a2b-1d2e3f4a5b6c',
+  title: 'Limpiar jardín',
+  description: 'Necesito ayuda con el jardín',
+  category: 'gardening',
+  reward: 15000,
+  location: 'San José, Costa Rica',
+  latitude: 9.9281,
+  longitude: -84.0907,
+  status: 'open',
+  user_id: '8a7b6c5d-4e3f-4a1b-8c2d-3e4f5a6b7c8d',
+  assigned_to: null,
+  created_at: '2026-03-14T10:20:30.123456+00:00',
+  updated_at: '2026-03-14T10:20:30.123456+00:00',
+  deadline: null,
+  time_estimate: '2 horas',
+  images: null,
+  tags: ['urgente'],
+  priority: 'medium',
+  is_urgent: false,
+  completed_at: null,
+  ...overrides,
+});
+
+const withoutColumn = (column: string) => {
+  const row = taskRow();
+  delete row[column];
+  return row;
+};
+
+const TASK_CASES: [string, unknown][] = [
+  ['a valid row', taskRow()],
+  ['all nullish columns null', taskRow({ description: null, category: null, reward: null, status: null, tags: null })],
+  ['a missing nullish column', withoutColumn('category')],
+  ['an extra column', taskRow({ offer_count: 3 })],
+  ['a 200-character title', taskRow({ title: 'x'.repeat(200) })],
+  ['a title over 200 characters', taskRow({ title: 'x'.repeat(201) })],
+  ['an empty title', taskRow({ title: '' })],
+  ['a missing title', withoutColumn('title')],
+  ['a 2000-character description', taskRow({ description: 'x'.repeat(2000) })],
+  ['a description over 2000 characters', taskRow({ description: 'x'.repeat(2001) })],
+  ['a malformed uuid', taskRow({ user_id: 'not-a-uuid' })],
+  ['reward as a string', taskRow({ reward: '15000' })],
+  ['a negative reward', taskRow({ reward: -1 })],
+  ['a NaN latitude', taskRow({ latitude: NaN })],
+  ['latitude out of range', taskRow({ latitude: 123 })],
+  ['an unknown status', taskRow({ status: 'archived' })],
+  ['a timestamp without offset', taskRow({ created_at: '2026-01-01 10:00:00' })],
+  ['a non-string tag', taskRow({ tags: ['ok', 3] })],
+  ['is_urgent as a string', taskRow({ is_urgent: 'false' })],
+  ['null', null],
+  ['an array', [taskRow()]],
+  ['a string', 'row'],
+];
+
+describe('row validation', () => {
+  describe('compileSchema', () => {
+    const compiled = compileSchema(TaskRowSchema);
+
+    it.each(TASK_CASES)('should agree with TaskRowSchema.safeParse for %s', (_, row) => {
+      expect(compiled(row)).toBe(TaskRowSchema.safeParse(row).success);
+    });
+
+    it('should accept a valid row and reject over-long titles and descriptions', () => {
+      expect(compiled(taskRow())).toBe(true);
+      expect(compiled(taskRow({ title: 'x'.repeat(201) }))).toBe(false);
+      expect(compiled(taskRow({ description: 'x'.repeat(2001) }))).toBe(false);
+    });
+
+    it('should agree with OfferRowSchema.safeParse on integer ratings', () => {
+      const compiledOffer = compileSchema(OfferRowSchema);
+      const offer = {
+        id: '3f1c2a9e-5b7d-4c1e-9a2b-1d2e3f4a5b6c',
+        task_id: '8a7b6c5d-4e3f-4a1b-8c2d-3e4f5a6b7c8d',
+        user_id: '8a7b6c5d-4e3f-4a1b-8c2d-3e4f5a6b7c8d',
+        proposed_reward: 12000,
+        message: 'Puedo mañana',
+        rating: 4,
+      };
+      [offer, { ...offer, rating: 4.5 }, { ...offer, rating: 6 }, { ...offer, message: null }].forEach((row) => {
+        expect(compiledOffer(row)).toBe(OfferRowSchema.safeParse(row).success);
+      });
+    });
+  });
+
+  describe('validateRows', () => {
+    const rows = Array.from({ length: 60 }, (_, i) => taskRow({ title: `Tarea ${i}` }));
+
+    beforeEach(() => {
+      jest.spyOn(console, 'warn').mockImplementation(() => {});
+    });
+
+    afterEach(() => {
+      jest.restoreAllMocks();
+    });
+
+    it('should return the same row objects in every mode', () => {
+      (['full', 'compiled', 'sampled'] as const).forEach((mode) => {
+        const valid = validateRows(TASK_ROWS, rows, { mode });
+        expect(valid).toHaveLength(rows.length);
+        expect(valid[0]).toBe(rows[0]);
+      });
+    });
+
+    it('should drop the same invalid rows in full and compiled mode', () => {
+      const batch = [...rows];
+      batch[7] = taskRow({ title: 'x'.repeat(201) });
+      batch[31] = taskRow({ latitude: 123 });
+
+      expect(validateRows(TASK_ROWS, batch, { mode: 'full' })).toHaveLength(rows.length - 2);
+      expect(validateRows(TASK_ROWS, batch, { mode: 'compiled' })).toHaveLength(rows.length - 2);
+    });
+
+    it('should escalate sampled mode to a full pass on column drift', () => {
+      const batch = [...rows];
+      batch[13] = taskRow({ reward: '15000' });
+      const before = validationStats.escalations;
+
+      const valid = validateRows(TASK_ROWS, batch, { mode: 'sampled', sampleEvery: 25 });
+
+      expect(validationStats.escalations).toBe(before + 1);
+      expect(valid).toHaveLength(rows.length - 1);
+      expect(valid).not.toContain(batch[13]);
+    });
+
+    it('should validate offers with the offer shape', () => {
+      expect(validateRows(OFFER_ROWS, [taskRow()], { mode: 'compiled' })).toHaveLength(0);
+    });
+  });
+});
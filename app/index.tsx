@@ -21,13 +21,12 @@ import { useTheme } from '../contexts/ThemeContext';
 import { useLocalization } from '../contexts/LocalizationContext';
 import { getCategoryLabel } from '../lib/utils';
 import { shouldUseOSMTiles } from '../lib/utils';
-import { fetchTasks, calculateDistance, fetchUserProfile, seedLocalTasksIfNeeded } from '../lib/database';
+import { fetchTasks, calculateDistance, fetchUserPublicCard, seedLocalTasksIfNeeded, fetchTaskClusters, TaskCluster, searchTasks, fetchTasksNearbyByCategory } from '../lib/database';
 import { testSupabaseConnection, testSupabaseAuth, testSupabaseTables, testSupabaseNetwork } from '../lib/supabase-test';
 import { useSupabase } from '../lib/feature-flags';
 import CategoryIcon from '../components/CategoryIcon';
 import CategoryBadge from '../components/CategoryBadge';
 import UserProfileCard from '../components/UserProfileCard';
-import { fetchPaymentsCountsForUser } from '../lib/database';
 import ChambitoMascot from '../components/ChambitoMascot';
 import BottomNavigation from '../components/BottomNavigation';
 
@@ -52,6 +51,9 @@ const GBSYS_COSTA_RICA = {
   longitude: -84.043457, // W 84° 2' 36.445''
 };
 
+// Radius for "nearest task in this category" when the map only holds the viewport
+const NEAREST_SEARCH_KM = 150;
+
 // Available categories
 const ALL_CATEGORIES = [
   'plumbing',
@@ -111,6 +113,11 @@ export default function MapScreen() {
   const [expandedPositions, setExpandedPositions] = useState<Record<string, { latitude: number; longitude: number }>>({});
   const [isExpanded, setIsExpanded] = useState(false);
   const [expandedCluster, setExpandedCluster] = useState<{ lat: number; lon: number; radiusMeters: number } | null>(null);
+  // Server-side grid clusters for the visible region (null = render client markers)
+  const [serverClusters, setServerClusters] = useState<TaskCluster[] | null>(null);
+  // Demo mode or no clustering RPC: every open task is loaded and clustered on the client
+  const [useClientMarkers, setUseClientMarkers] = useState(false);
+  const lastMapQueryRef = useRef<string>('');
   
   const { user, loading: authLoading } = useAuth();
   const { theme } = useTheme();
@@ -373,25 +380,72 @@ export default function MapScreen() {
     return Array.from(categories);
   };
 
+  // Tasks with their distance from the user, my own tasks hidden, overlaps jittered apart
+  const prepareTasks = (list: Task[], latitude: number, longitude: number) => {
+    const tasksWithDistance = list.map(task => ({
+      ...task,
+      distance: calculateDistance(latitude, longitude, task.latitude || 0, task.longitude || 0)
+    }));
+    // Hide my own created tasks from the public map view
+    return applyMarkerJitter(tasksWithDistance.filter(t => t.user_id !== user?.id));
+  };
+
+  const regionZoom = (region: Region) => {
+    const screenWidth = Dimensions.get('window').width || 390;
+    return Math.log2((360 / Math.max(region.longitudeDelta, 1e-6)) * (screenWidth / 256));
+  };
+
+  const mapQueryKey = (region: Region) => [
+    region.latitude.toFixed(5),
+    region.longitude.toFixed(5),
+    region.latitudeDelta.toFixed(5),
+    region.longitudeDelta.toFixed(5),
+    selectedCategories[0] ?? 'All',
+    user?.id ?? '',
+  ].join(':');
+
+  // Clusters for the region; single-task cells carry their task row
+  const fetchRegionClusters = (region: Region) => {
+    const useAll = selectedCategories.length === 0 || selectedCategories.includes('All');
+    return fetchTaskClusters(
+      {
+        minLat: region.latitude - region.latitudeDelta / 2,
+        minLon: region.longitude - region.longitudeDelta / 2,
+        maxLat: region.latitude + region.latitudeDelta / 2,
+        maxLon: region.longitude + region.longitudeDelta / 2,
+      },
+      regionZoom(region),
+      { categories: useAll ? undefined : [selectedCategories[0]], excludeUserId: user?.id }
+    );
+  };
+
+  const applyClusters = (clusters: TaskCluster[], latitude: number, longitude: number) => {
+    setServerClusters(clusters);
+    setTasks(prepareTasks(clusters.flatMap(c => (c.task ? [c.task] : [])), latitude, longitude));
+  };
+
   const loadAllTasks = async (latitude: number, longitude: number) => {
     const start = Date.now();
     try {
       setLoading(true);
+      const region: Region = currentRegion ?? { latitude, longitude, latitudeDelta: 0.0922, longitudeDelta: 0.0421 };
+      const clusters = await fetchRegionClusters(region);
+      if (clusters) {
+        // Only the viewport is loaded; the region effect follows pans and zooms from here
+        lastMapQueryRef.current = mapQueryKey(region);
+        setUseClientMarkers(false);
+        applyClusters(clusters, latitude, longitude);
+        setAvailableCategories(['All', ...ALL_CATEGORIES]);
+        if (!currentRegion) setCurrentRegion(region);
+        return;
+      }
+
+      setUseClientMarkers(true);
+      setServerClusters(null);
       const all = await fetchTasks();
-      const tasksWithDistance = (all || []).map(task => ({
-          ...task,
-          distance: calculateDistance(
-            latitude,
-            longitude,
-            task.latitude || 0,
-            task.longitude || 0
-          )
-        }));
-        // Hide my own created tasks from the public map view
-        const notMine = tasksWithDistance.filter(t => t.user_id !== user?.id);
-        const jittered = applyMarkerJitter(notMine);
-        setTasks(jittered);
-        setAvailableCategories(getAvailableCategories(notMine));
+      const jittered = prepareTasks(all || [], latitude, longitude);
+      setTasks(jittered);
+      setAvailableCategories(getAvailableCategories(jittered));
 
       // Compute filtered list immediately to avoid empty-state flicker
       const useAll = selectedCategories.length === 0;
@@ -449,6 +503,56 @@ export default function MapScreen() {
     filterTasks();
   }, [tasks, searchQuery, selectedCategories]);
 
+  // Follow the viewport: clusters for the visible region, or server-side search results.
+  // The spiral keeps the current markers until it closes.
+  useEffect(() => {
+    if (!currentRegion || isExpanded || useClientMarkers) return;
+    const query = searchQuery.trim();
+    const key = query ? `q:${query}:${user?.id ?? ''}` : mapQueryKey(currentRegion);
+    if (key === lastMapQueryRef.current) return;
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      const originLat = userLocation?.coords.latitude ?? GBSYS_COSTA_RICA.latitude;
+      const originLon = userLocation?.coords.longitude ?? GBSYS_COSTA_RICA.longitude;
+      if (query) {
+        const found = await searchTasks(query);
+        if (cancelled) return;
+        lastMapQueryRef.current = key;
+        setServerClusters(null);
+        setTasks(prepareTasks(found, originLat, originLon));
+        return;
+      }
+      const clusters = await fetchRegionClusters(currentRegion);
+      // On a failed request keep the markers already on screen
+      if (cancelled || !clusters) return;
+      lastMapQueryRef.current = key;
+      applyClusters(clusters, originLat, originLon);
+    }, 250);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [currentRegion, selectedCategories, searchQuery, isExpanded, useClientMarkers, user?.id]);
+
+  // With server clusters only single-task cells get a task marker
+  const singletonTaskIds = serverClusters
+    ? new Set(serverClusters.filter(c => c.count === 1 && c.taskId).map(c => c.taskId as string))
+    : null;
+  const markerTasks = singletonTaskIds ? filteredTasks.filter(t => singletonTaskIds.has(t.id)) : filteredTasks;
+  const resultCount = serverClusters ? serverClusters.reduce((sum, c) => sum + c.count, 0) : filteredTasks.length;
+
+  const handleClusterPress = (cluster: TaskCluster) => {
+    const nextRegion: Region = {
+      latitude: cluster.latitude,
+      longitude: cluster.longitude,
+      latitudeDelta: (currentRegion?.latitudeDelta ?? 0.12) / 4,
+      longitudeDelta: (currentRegion?.longitudeDelta ?? 0.12) / 4,
+    };
+    setCurrentRegion(nextRegion);
+    mapRef.current?.animateToRegion(nextRegion, 300);
+  };
+
   const getCategoryColor = (category: string) => {
     const colors: { [key: string]: string } = {
       'plumbing': '#2196F3',
@@ -535,25 +639,11 @@ export default function MapScreen() {
   const openOverlayForTask = (task: Task & { distance: number }) => {
     setSelectedTask(task);
     if (task.user_id) {
-      fetchUserProfile(task.user_id).then((profile) => {
-        if (!profile) { setSelectedTaskUser(null); return; }
-        const mapped = {
-          id: profile.id,
-          name: profile.full_name || 'User',
-          avatar: profile.avatar_url,
-          rating: profile.rating ?? 0,
-          total_reviews: 0,
-          completed_tasks: profile.total_jobs ?? 0,
-          total_earnings: profile.total_earnings ?? 0,
-          wallet_balance: 0,
-          member_since: profile.created_at || new Date().toISOString(),
-          location: profile.location,
-          verified: profile.is_verified ?? false,
-        };
+      fetchUserPublicCard(task.user_id).then((card) => {
+        if (!card) { setSelectedTaskUser(null); return; }
+        const { payments, ...mapped } = card;
         setSelectedTaskUser(mapped);
-        fetchPaymentsCountsForUser(profile.id).then((counts) => {
-          setSelectedUserPayments(counts);
-        }).catch(() => setSelectedUserPayments(null));
+        setSelectedUserPayments(payments);
       }).catch(() => setSelectedTaskUser(null));
     } else {
       setSelectedTaskUser(null);
@@ -678,14 +768,20 @@ export default function MapScreen() {
     searchInputRef.current?.blur();
   };
 
-  const focusNearestForSelection = () => {
+  const focusNearestForSelection = async () => {
     try {
       // Prefer current map center if available so repeated taps behave predictably
       const originLat = currentRegion?.latitude ?? userLocation?.coords.latitude ?? GBSYS_COSTA_RICA.latitude;
       const originLon = currentRegion?.longitude ?? userLocation?.coords.longitude ?? GBSYS_COSTA_RICA.longitude;
 
       const useAll = selectedCategories.length === 0 || selectedCategories.includes('All');
-      const candidateTasks = useAll ? tasks : tasks.filter(t => selectedCategories.includes(t.category));
+      // With server clusters the loaded tasks are just the viewport's, so ask the server
+      const candidateTasks: Task[] = useClientMarkers
+        ? (useAll ? tasks : tasks.filter(t => selectedCategories.includes(t.category)))
+        : useAll
+          ? []
+          : (await fetchTasksNearbyByCategory(selectedCategories[0], originLat, originLon, NEAREST_SEARCH_KM, 5))
+              .filter(t => t.user_id !== user?.id);
       if (candidateTasks.length === 0) return;
 
       const nearest = candidateTasks.reduce((closest, current) => {
@@ -700,7 +796,7 @@ export default function MapScreen() {
           ? calculateDistance(originLat, originLon, closest.latitude || 0, closest.longitude || 0)
           : Number.POSITIVE_INFINITY;
         return currentDistance < closestDistance ? current : closest;
-      }, null as (Task & { distance: number }) | null);
+      }, null as Task | null);
 
       if (!nearest || !nearest.latitude || !nearest.longitude) return;
       const nextRegion: Region = {
@@ -739,11 +835,8 @@ export default function MapScreen() {
     setSearchQuery('');
     setSelectedTask(null);
     setSelectedTaskUser(null);
+    // The selection effect below centers on the nearest task for the new category
     setSelectedCategories((prev) => (prev.length === 1 && prev[0] === category ? [] : [category]));
-    // After state updates flush, center to the nearest visible task for current selection
-    Promise.resolve().then(() => {
-      focusNearestForSelection();
-    });
   };
 
   const focusNearestForCategory = (category: string) => {
@@ -780,12 +873,12 @@ export default function MapScreen() {
     }
   };
 
-  // Re-focus when inputs change (selected categories, data set, or map center)
+  // Re-focus when inputs change (selected categories, or the full task set in client mode)
   useEffect(() => {
-    // Center to the nearest task whenever categories or task set changes
+    // With server clusters tasks follow the viewport, so only a category change refocuses
     focusNearestForSelection();
     // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [selectedCategories, tasks]);
+  }, [selectedCategories, useClientMarkers ? tasks : null]);
 
   // Zoom helpers
   const MIN_DELTA = 0.005;
@@ -831,7 +924,7 @@ export default function MapScreen() {
       <View style={[styles.container, { backgroundColor: theme.colors.background }]}>
         <View style={styles.loadingContainer}>
           <Image
-            source={require('../assets/task-loading.png')}
+            source={require('../assets/optimized/task-loading.webp')}
             style={{ width: 200, height: 200 }}
             resizeMode="contain"
           />
@@ -843,13 +936,13 @@ export default function MapScreen() {
     );
   }
 
-  // Empty state: no tasks nearby
-  if (!authLoading && !loading && filteredTasks.length === 0) {
+  // Empty state: no tasks at all (client mode; with clusters an empty viewport just shows the map)
+  if (!authLoading && !loading && useClientMarkers && filteredTasks.length === 0) {
     return (
       <View style={[styles.container, { backgroundColor: theme.colors.background }]}> 
         <View style={styles.loadingContainer}> 
           <Image
-            source={require('../assets/task-not-found.png')}
+            source={require('../assets/optimized/task-not-found.webp')}
             style={{ width: 160, height: 160 }}
             resizeMode="contain"
           />
@@ -928,7 +1021,7 @@ export default function MapScreen() {
             )}
           </View>
           <Text style={[styles.searchResults, { color: theme.colors.text.secondary }]}> 
-            {filteredTasks.length} {filteredTasks.length === 1 ? 'result' : 'results'}
+            {resultCount} {resultCount === 1 ? 'result' : 'results'}
           </Text>
       </View>
 
@@ -1149,10 +1242,21 @@ export default function MapScreen() {
               </View>
             </Marker>
           )}
-          {filteredTasks.map((task) => {
+          {serverClusters && serverClusters.filter(c => c.count > 1).map((cluster) => (
+            <Marker
+              key={cluster.key}
+              coordinate={{ latitude: cluster.latitude, longitude: cluster.longitude }}
+              onPress={() => handleClusterPress(cluster)}
+            >
+              <View style={[styles.clusterMarker, { backgroundColor: theme.colors.primary.blue }]}>
+                <Text style={styles.clusterMarkerText}>{cluster.count > 999 ? `${Math.floor(cluster.count / 1000)}k` : cluster.count}</Text>
+              </View>
+            </Marker>
+          ))}
+          {markerTasks.map((task) => {
             // Determine if price label should be shown based on proximity (zoom-aware)
             const thresholdMeters = computeLabelSeparationMeters();
-            const hasCloseNeighbor = filteredTasks.some((other) => {
+            const hasCloseNeighbor = markerTasks.some((other) => {
               if (other.id === task.id) return false;
               return (
                 calculateDistance(
@@ -1185,7 +1289,7 @@ export default function MapScreen() {
             } else {
               // If not expanded: always show for tasks separated at least ~15% of the overlap radius
               const looseThreshold = computeOverlapMeters() * 0.15;
-              const nearAnother = filteredTasks.some((other) => {
+              const nearAnother = markerTasks.some((other) => {
                 if (other.id === task.id) return false;
                 const d = calculateDistance(
                   task.latitude || 0,
@@ -1715,6 +1819,26 @@ const styles = StyleSheet.create({
     fontSize: 18,
     color: 'white',
   },
+  clusterMarker: {
+    minWidth: 40,
+    height: 40,
+    paddingHorizontal: 8,
+    borderRadius: 20,
+    justifyContent: 'center',
+    alignItems: 'center',
+    borderWidth: 2,
+    borderColor: 'white',
+    shadowColor: '#000',
+    shadowOffset: { width: 0, height: 2 },
+    shadowOpacity: 0.25,
+    shadowRadius: 4,
+    elevation: 5,
+  },
+  clusterMarkerText: {
+    color: 'white',
+    fontSize: 14,
+    fontWeight: '700',
+  },
   clusterCloseMarker: {
     width: 34,
     height: 34,
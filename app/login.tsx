@@ -49,7 +49,7 @@ export default function LoginScreen() {
       {/* Header with Image */}
       <View style={styles.headerSection}>
         <Image 
-          source={require('../assets/login.png')} 
+          source={require('../assets/optimized/login.webp')} 
           style={styles.headerImage} 
           resizeMode="cover"
           onError={(error) => console.log('Image loading error:', error)}
@@ -28,7 +28,7 @@ import BottomNavigation from '../components/BottomNavigation';
 const { height } = Dimensions.get('window');
 
 // Import Chambito icon
-const chambitoIcon = require('../assets/chambito.png');
+const chambitoIcon = require('../assets/optimized/chambito.webp');
 
 export default function MyTasksScreen() {
   const router = useRouter();
@@ -26,25 +26,25 @@ const onboardingSteps: Array<{
     id: 1,
     title: 'onboardingStep1Title',
     description: 'onboardingStep1Description',
-    image: require('../assets/onboarding-1.png'),
+    image: require('../assets/optimized/onboarding-1.webp'),
   },
   {
     id: 2,
     title: 'onboardingStep2Title',
     description: 'onboardingStep2Description',
-    image: require('../assets/onboarding-2.png'),
+    image: require('../assets/optimized/onboarding-2.webp'),
   },
   {
     id: 3,
     title: 'onboardingStep3Title',
     description: 'onboardingStep3Description',
-    image: require('../assets/onboarding-3.png'),
+    image: require('../assets/optimized/onboarding-3.webp'),
   },
   {
     id: 4,
     title: 'onboardingStep4Title',
     description: 'onboardingStep4Description',
-    image: require('../assets/onboarding-4.png'),
+    image: require('../assets/optimized/onboarding-4.webp'),
   },
 ];
 
@@ -4,8 +4,8 @@ import { useRouter } from 'expo-router';
 import { useAuth } from '../contexts/AuthContext';
 import { useTheme } from '../contexts/ThemeContext';
 import { useLocalization } from '../contexts/LocalizationContext';
-import { fetchUserProfile, fetchReviewsForUserWithContext, type UserReviewWithContext, fetchUserProgress } from '../lib/database';
-import { mapProfileToProgress, computeEarnedBadges, BADGES, getRankColor } from '../lib/rank';
+import { fetchUserProfile, fetchReviewsForUserWithContext, type UserReviewWithContext, fetchMyLeaderboardPosition, fetchLeaderboard, fetchUserBadges, type LeaderboardEntry } from '../lib/database';
+import { mapProfileToProgress, mapStoredProgress, computeEarnedBadges, toEarnedBadges, BADGES, getRankColor } from '../lib/rank';
 
 export default function RankScreen() {
   const router = useRouter();
@@ -14,21 +14,32 @@ export default function RankScreen() {
   const { t } = useLocalization();
   const [profile, setProfile] = useState<any | null>(null);
   const [reviews, setReviews] = useState<UserReviewWithContext[]>([]);
+  const [myPosition, setMyPosition] = useState<Awaited<ReturnType<typeof fetchMyLeaderboardPosition>>>(null);
+  const [leaders, setLeaders] = useState<LeaderboardEntry[]>([]);
+  const [storedBadges, setStoredBadges] = useState<Awaited<ReturnType<typeof fetchUserBadges>>>(null);
 
   useEffect(() => {
     (async () => {
       if (!user) return;
-      const p = await fetchUserProfile(user.id);
+      const [p, revs, mine, top, badges] = await Promise.all([
+        fetchUserProfile(user.id),
+        fetchReviewsForUserWithContext(user.id),
+        fetchMyLeaderboardPosition(user.id),
+        fetchLeaderboard(10),
+        fetchUserBadges(user.id),
+      ]);
       setProfile(p || { id: user.id, full_name: user.email?.split('@')[0] || 'Usuario', rating: 0, total_jobs: 0, total_earnings: 0 });
-      const revs = await fetchReviewsForUserWithContext(user.id);
       setReviews(revs);
-      // Optionally pull stored progress (xp/level/badges) for future use
-      const stored = await fetchUserProgress(user.id);
+      setMyPosition(mine);
+      setLeaders(top);
+      setStoredBadges(badges);
     })();
   }, [user]);
 
   const progress = useMemo(() => {
     if (!profile) return null;
+    // Prefer the server-side rank engine; demo mode and older databases compute locally
+    if (myPosition) return mapStoredProgress(myPosition);
     return mapProfileToProgress({
       id: profile.id,
       rating: profile.rating ?? 0,
@@ -37,10 +48,11 @@ export default function RankScreen() {
       // @ts-ignore
       completed_tasks: profile.total_jobs ?? 0,
     } as any);
-  }, [profile]);
+  }, [profile, myPosition]);
 
   const earned = useMemo(() => {
     if (!profile) return [] as ReturnType<typeof computeEarnedBadges>;
+    if (storedBadges) return toEarnedBadges(storedBadges);
     return computeEarnedBadges({
       id: profile.id,
       rating: profile.rating ?? 0,
@@ -48,7 +60,7 @@ export default function RankScreen() {
       completed_tasks: profile.total_jobs ?? 0,
       total_earnings: profile.total_earnings ?? 0,
     });
-  }, [profile]);
+  }, [profile, storedBadges]);
 
   if (!user || !progress) {
     return (
@@ -61,6 +73,7 @@ export default function RankScreen() {
   const rankColor = progress.color;
   const { level, rank, progress: p } = progress;
   const earnedSet = new Set(earned.filter(e => e.earned).map(e => e.id));
+  const earnedAt = new Map(earned.filter(e => e.earned && storedBadges).map(e => [e.id, e.earnedAt]));
 
   return (
     <ScrollView style={[styles.container, { backgroundColor: theme.colors.background }]}> 
@@ -74,11 +87,29 @@ export default function RankScreen() {
         <Text style={[styles.progressText, { color: theme.colors.text.secondary }]}>
           Progreso en {rank.name}: {Math.round((p.progress || 0) * 100)}%
         </Text>
+        {!!myPosition && (
+          <Text style={[styles.progressText, { color: theme.colors.text.secondary, marginTop: 4 }]}>🏆 Posición #{myPosition.position} · {myPosition.xp} XP</Text>
+        )}
         {!!profile?.rating && (
           <Text style={[styles.progressText, { color: theme.colors.text.secondary, marginTop: 4 }]}>⭐ Promedio: {Number(profile.rating).toFixed(1)}</Text>
         )}
       </View>
 
+      {leaders.length > 0 && (
+        <>
+          <Text style={[styles.subtitle, { color: theme.colors.text.primary }]}>Tabla de Líderes</Text>
+          <View style={{ gap: 6, marginBottom: 8 }}>
+            {leaders.map((l) => (
+              <View key={l.user_id} style={[styles.leaderRow, { backgroundColor: theme.colors.surface, borderColor: l.user_id === user.id ? rankColor : theme.colors.border }]}> 
+                <Text style={[styles.leaderPosition, { color: theme.colors.text.primary }]}>#{l.position}</Text>
+                <Text style={[styles.leaderName, { color: theme.colors.text.primary }]} numberOfLines={1}>{l.full_name || 'Usuario'}</Text>
+                <Text style={[styles.leaderMeta, { color: theme.colors.text.secondary }]}>Nv {l.level} · {l.xp} XP</Text>
+              </View>
+            ))}
+          </View>
+        </>
+      )}
+
       <Text style={[styles.subtitle, { color: theme.colors.text.primary }]}>Insignias</Text>
       <View style={styles.badgesGrid}>
         {BADGES.map((b) => {
@@ -88,6 +119,9 @@ export default function RankScreen() {
               <Text style={[styles.badgeName, { color: theme.colors.text.primary }]}>{b.name}</Text>
               <Text style={[styles.badgeDesc, { color: theme.colors.text.secondary }]}>{b.description}</Text>
               <Text style={[styles.badgeCat, { color: theme.colors.text.secondary }]}>{b.category}</Text>
+              {has && !!earnedAt.get(b.id) && (
+                <Text style={[styles.badgeCat, { color: theme.colors.text.secondary }]}>Obtenida {new Date(earnedAt.get(b.id) as string).toLocaleDateString()}</Text>
+              )}
             </View>
           );
         })}
@@ -132,6 +166,10 @@ const styles = StyleSheet.create({
   progressBarBg: { height: 10, backgroundColor: '#E5E7EB', borderRadius: 6, marginTop: 10, overflow: 'hidden' },
   progressBarFg: { height: 10, borderRadius: 6 },
   progressText: { fontSize: 12, marginTop: 8 },
+  leaderRow: { flexDirection: 'row', alignItems: 'center', borderWidth: 1, borderRadius: 10, paddingVertical: 8, paddingHorizontal: 12 },
+  leaderPosition: { width: 44, fontSize: 14, fontWeight: '800' },
+  leaderName: { flex: 1, fontSize: 14, fontWeight: '600' },
+  leaderMeta: { fontSize: 12 },
   subtitle: { fontSize: 18, fontWeight: '600', marginTop: 12, marginBottom: 8 },
   badgesGrid: { flexDirection: 'row', flexWrap: 'wrap', gap: 8 },
   badgeItem: { flexBasis: '48%', padding: 10, borderRadius: 10, borderWidth: 1 },
@@ -60,7 +60,7 @@ export default function RegisterScreen() {
       {/* Header with Image */}
       <View style={styles.headerSection}>
         <Image 
-          source={require('../assets/login.png')} 
+          source={require('../assets/optimized/login.webp')} 
           style={styles.headerImage} 
           resizeMode="cover"
         />
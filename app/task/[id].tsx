@@ -4,7 +4,7 @@ import { typography, spacing } from '../../lib/designSystem';
 import { useRouter, useLocalSearchParams } from 'expo-router';
 import { useAuth } from '../../contexts/AuthContext';
 // import { useTheme } from '../../contexts/ThemeContext';
-import { fetchTaskById, fetchUserProfile, fetchPaymentsCountsForUser } from '../../lib/database';
+import { fetchTaskById, fetchUserPublicCard } from '../../lib/database';
 import { Task } from '../../lib/types';
 // import CategoryIcon from '../../components/CategoryIcon';
 import ChambitoMascot from '../../components/ChambitoMascot';
@@ -44,24 +44,11 @@ export default function TaskDetailScreen() {
       setTask(taskData);
       if (taskData.user_id) {
         try {
-          const profile = await fetchUserProfile(taskData.user_id);
-          if (profile) {
-            const mapped = {
-              id: profile.id,
-              name: profile.full_name || 'User',
-              avatar: profile.avatar_url,
-              rating: profile.rating ?? 0,
-              total_reviews: 0,
-              completed_tasks: profile.total_jobs ?? 0,
-              total_earnings: profile.total_earnings ?? 0,
-              wallet_balance: 0,
-              member_since: profile.created_at || new Date().toISOString(),
-              location: profile.location,
-              verified: profile.is_verified ?? false,
-            };
+          const card = await fetchUserPublicCard(taskData.user_id);
+          if (card) {
+            const { payments, ...mapped } = card;
             setPoster(mapped);
-            const counts = await fetchPaymentsCountsForUser(taskData.user_id);
-            setPaymentsCount(counts);
+            setPaymentsCount(payments);
           } else {
             setPoster(null);
           }
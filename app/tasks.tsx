@@ -241,7 +241,7 @@ export default function TaskListScreen() {
       <View style={[styles.container, { backgroundColor: theme.colors.background }]}> 
         <View style={styles.loadingContainer}> 
           <Image
-            source={require('../assets/task-not-found.png')}
+            source={require('../assets/optimized/task-not-found.webp')}
             style={styles.emptyImage}
             resizeMode="contain"
           />
@@ -385,6 +385,7 @@ export default function TaskListScreen() {
         {filteredTasks.slice(0, 20).map((task) => (
           <TouchableOpacity
             key={task.id}
+            testID="task-item"
             style={[styles.taskCard, { backgroundColor: theme.colors.surface }]}
             onPress={() => router.push(`/task/${task.id}`)}
           >
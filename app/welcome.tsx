@@ -32,8 +32,8 @@ export default function WelcomeScreen() {
   // User input fields
   const [email, setEmail] = useState('');
   const [password, setPassword] = useState('');
-  const splashSource = require('../assets/splash.png');
-  const loginSource = require('../assets/login.png');
+  const splashSource = require('../assets/optimized/splash.webp');
+  const loginSource = require('../assets/optimized/login.webp');
   const [splashHeight, setSplashHeight] = useState(height);
 
   useEffect(() => {
@@ -149,7 +149,7 @@ export default function WelcomeScreen() {
       {/* Header with Image */}
       <View style={styles.headerSection}>
         <Image 
-          source={require('../assets/login.png')} 
+          source={require('../assets/optimized/login.webp')} 
           style={styles.headerImage} 
           resizeMode="cover"
         />
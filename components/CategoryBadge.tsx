@@ -65,7 +65,7 @@ export default function CategoryBadge({ category, size = 'medium' }: CategoryBad
   return (
     <View style={[styles.container, { width: dim, height: dim, borderRadius: dim / 2, backgroundColor: bg }] }>
       <Image
-        source={require('../assets/chambito.png')}
+        source={require('../assets/optimized/chambito.webp')}
         style={{ width: dim * 0.85, height: dim * 0.85, resizeMode: 'contain' }}
       />
       <View style={[styles.emojiBubble, { width: dim * 0.5, height: dim * 0.5, borderRadius: (dim * 0.5) / 2 }] }>
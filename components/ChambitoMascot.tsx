@@ -2,9 +2,9 @@ import React from 'react';
 import { View, Text, StyleSheet, Image } from 'react-native';
 
 // Import the Chambito mascot image (default)
-const chambitoImage = require('../assets/chambito.png');
+const chambitoImage = require('../assets/optimized/chambito.webp');
 // Optional queen variant for loading overlays
-const chambitoQueen = require('../assets/chambito-queen.png');
+const chambitoQueen = require('../assets/optimized/chambito-queen.webp');
 
 interface ChambitoMascotProps {
   mood?: 'happy' | 'working' | 'thinking' | 'success' | 'error';
@@ -89,7 +89,7 @@ export default function CreateTaskForm({ initialCoords = null, initialCategory =
       <ScrollView style={styles.content} showsVerticalScrollIndicator={false} keyboardShouldPersistTaps="handled">
         <View style={styles.welcomeSection}>
           <Image 
-            source={require('../assets/create-new-task.png')} 
+            source={require('../assets/optimized/create-new-task.webp')} 
             style={styles.welcomeImage}
             resizeMode="contain"
           />
@@ -265,7 +265,7 @@ export default function CreateTaskForm({ initialCoords = null, initialCategory =
           backgroundColor: 'rgba(0,0,0,0.15)'
         }}>
           <Image
-            source={require('../assets/task-loading.png')}
+            source={require('../assets/optimized/task-loading.webp')}
             style={{ width: 180, height: 180 }}
             resizeMode="contain"
           />
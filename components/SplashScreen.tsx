@@ -13,7 +13,7 @@ const SplashScreen: React.FC<SplashScreenProps> = ({ visible }) => {
   return (
     <View style={styles.container}>
       <Image
-        source={require('../assets/splash.png')}
+        source={require('../assets/optimized/splash.webp')}
         style={styles.image}
         resizeMode="contain"
       />
@@ -1,7 +1,17 @@
-import React, { createContext, useContext, useState, useEffect } from 'react';
+import React, { createContext, useContext, useState, useEffect, useMemo, useCallback } from 'react';
 import AsyncStorage from '@react-native-async-storage/async-storage';
-import localizations, { Language, LocalizationStrings } from '../lib/localization';
-import i18n from '../lib/i18n';
+import {
+  DEFAULT_LANGUAGE,
+  Language,
+  LocalizationStrings,
+  MessageTable,
+  getLoadedTable,
+  isLanguage,
+  loadLocale,
+  toStrings,
+  translate,
+} from '../lib/localization';
+import i18n, { ensureI18nLanguage } from '../lib/i18n';
 
 interface LocalizationContextType {
   language: Language;
@@ -25,44 +35,50 @@ interface LocalizationProviderProps {
 }
 
 export const LocalizationProvider: React.FC<LocalizationProviderProps> = ({ children }) => {
-  const [language, setLanguageState] = useState<Language>('es-CR');
+  const [language, setLanguageState] = useState<Language>(DEFAULT_LANGUAGE);
+  const [table, setTable] = useState<MessageTable>(() => getLoadedTable(DEFAULT_LANGUAGE)!);
+
+  // Switch only once the language's chunk is loaded so nothing renders untranslated
+  const applyLanguage = useCallback(async (nextLanguage: Language) => {
+    const nextTable = await loadLocale(nextLanguage);
+    setTable(nextTable);
+    setLanguageState(nextLanguage);
+  }, []);
 
   useEffect(() => {
     // Load saved language preference; default to Spanish if unset or invalid
     const loadLanguage = async () => {
       try {
         const savedLanguage = await AsyncStorage.getItem('userLanguage');
-        if (savedLanguage === 'es-CR' || savedLanguage === 'en' || savedLanguage === 'zh') {
-          setLanguageState(savedLanguage as Language);
+        if (isLanguage(savedLanguage)) {
+          await applyLanguage(savedLanguage);
         } else {
-          await AsyncStorage.setItem('userLanguage', 'es-CR');
-          setLanguageState('es-CR');
+          await AsyncStorage.setItem('userLanguage', DEFAULT_LANGUAGE);
         }
       } catch (error) {
         console.error('Error loading language preference:', error);
-        setLanguageState('es-CR');
       }
     };
 
     loadLanguage();
-  }, []);
+  }, [applyLanguage]);
 
   const setLanguage = async (newLanguage: Language) => {
     try {
       await AsyncStorage.setItem('userLanguage', newLanguage);
-      setLanguageState(newLanguage);
+      await applyLanguage(newLanguage);
       // Update i18next for immediate UI refresh
+      await ensureI18nLanguage(newLanguage);
       await i18n.changeLanguage(newLanguage);
     } catch (error) {
       console.error('Error saving language preference:', error);
     }
   };
 
-  const strings = localizations[language];
+  // Flat id lookup; the full strings object is only built when the table changes
+  const strings = useMemo(() => toStrings(table), [table]);
 
-  const t = (key: keyof LocalizationStrings): string => {
-    return strings[key] || key;
-  };
+  const t = useCallback((key: keyof LocalizationStrings): string => translate(table, key), [table]);
 
   const value = {
     language,
@@ -11,6 +11,8 @@ import {
   safeValidateCreateTask,
   safeValidateOffer
 } from './schemas';
+import { OFFER_ROWS, TASK_ROWS, validateRows } from './row-validation';
+import { getHedgeStats, hedged, HedgeStrategy } from './hedge';
 import AsyncStorage from '@react-native-async-storage/async-storage';
 import { Platform } from 'react-native';
 import Constants from 'expo-constants';
@@ -87,6 +89,11 @@ export const clearDemoTasks = async (): Promise<void> => {
 };
 
 // Task-related functions
+
+// Upper bound for the hedged task fetch; before hedging, a stalled primary plus
+// the sequential retries could take over 20 s
+const FETCH_TASKS_TIMEOUT_MS = 10000;
+
 export const fetchTasks = async (): Promise<Task[]> => {
   // If demo mode is enabled, return mock data
   if (isDemoMode()) {
@@ -107,81 +114,42 @@ export const fetchTasks = async (): Promise<Task[]> => {
     const startFetch = Date.now();
     const isExpoGo = ((Constants as any)?.appOwnership === 'expo');
     const isIOS = Platform.OS === 'ios';
-    
-    // Expo Go on iOS sometimes stalls with postgrest-js; use direct REST
-    const queryPromise = (isExpoGo && isIOS)
-      ? (async () => {
-          // Ensure direct REST cannot hang forever in Expo Go on iOS
-          const DIRECT_TIMEOUT_MS = 10000;
-          const controller = new AbortController();
-          const timeoutId = setTimeout(() => {
-            try { controller.abort('timeout'); } catch {}
-          }, DIRECT_TIMEOUT_MS);
-          try {
-            const { baseUrl, headers, anonKey } = getSupabaseRestInfo();
-            // Provide apikey both in header and as query param for maximum compatibility in Expo Go
-            const url = `${baseUrl}/tasks?select=*&order=created_at.desc&apikey=${encodeURIComponent(anonKey)}`;
-            (globalThis as any).console?.log?.('[fetchTasks] iOS Expo Go direct REST →', url.replace(anonKey, '***'));
-            const resp = await fetch(url, { headers: headers as any, signal: (controller as any).signal });
-            (globalThis as any).console?.log?.('[fetchTasks] REST status', resp.status);
-            if (!resp.ok) return { data: null, error: { message: `HTTP ${resp.status}` } };
-            const json = await resp.json();
-            (globalThis as any).console?.log?.('[fetchTasks] REST rows', Array.isArray(json) ? json.length : typeof json);
-            return { data: json, error: null };
-          } catch (e: any) {
-            const msg = e?.name === 'AbortError' ? `timeout after ${DIRECT_TIMEOUT_MS}ms` : (e?.message || 'direct fetch failed');
-            (globalThis as any).console?.error?.('[fetchTasks] REST exception', msg);
-            return { data: null, error: { message: msg } };
-          } finally {
-            clearTimeout(timeoutId);
-          }
-        })()
-      : (db
-          .from('tasks')
-          .select('*')
-          .order('created_at', { ascending: false }) as unknown as Promise<any>);
-
-    // If using direct REST on iOS Expo Go, we already applied an internal timeout
-    const usingDirectREST = (isExpoGo && isIOS);
-    const TIMEOUT_MS = 10000;
-    let timedOut = false;
-    const timeoutPromise = new Promise((resolve) =>
-      setTimeout(() => {
-        timedOut = true;
-        resolve({ data: null, error: { message: 'fetchTasks timeout after ' + TIMEOUT_MS + 'ms' } });
-      }, TIMEOUT_MS)
-    );
 
-    let result: any = usingDirectREST ? await queryPromise : await Promise.race([queryPromise, timeoutPromise]);
-    // If timed out, try alternate strategies
-    if (result?.error && String(result.error.message || '').includes('timeout')) {
-      // 1) Try direct REST again without apikey query param (already attempted above), then
-      try {
-        const { baseUrl, headers } = getSupabaseRestInfo();
-        const resp = await fetch(`${baseUrl}/tasks?select=*&order=created_at.desc`, { headers: headers as any });
-        if (resp.ok) {
-          const json = await resp.json();
-          result = { data: json, error: null };
-        }
-      } catch {}
-      // 2) If still failing, try postgrest-js client even on iOS Expo Go
-      if (!result?.data) {
-        try {
-          const pg = (await db
-            .from('tasks')
-            .select('*')
-            .order('created_at', { ascending: false })) as any;
-          if (!pg.error) {
-            result = { data: pg.data, error: null };
-          }
-        } catch {}
-      }
+    const viaPostgrest: HedgeStrategy<any[]> = async (signal) => {
+      const { data, error } = await db
+        .from('tasks')
+        .select('*')
+        .order('created_at', { ascending: false })
+        .abortSignal(signal);
+      if (error) throw error;
+      return data ?? [];
+    };
+    const viaDirectRest: HedgeStrategy<any[]> = async (signal) => {
+      const { baseUrl, headers, anonKey } = getSupabaseRestInfo();
+      // apikey both in header and as query param for maximum compatibility in Expo Go
+      const url = `${baseUrl}/tasks?select=*&order=created_at.desc&apikey=${encodeURIComponent(anonKey)}`;
+      const resp = await fetch(url, { headers: headers as any, signal });
+      if (!resp.ok) throw new Error(`HTTP ${resp.status}`);
+      return resp.json();
+    };
+
+    // Expo Go on iOS sometimes stalls with postgrest-js, so direct REST leads there.
+    // The other strategy is hedged in once the primary runs past its usual p95, and
+    // a fresh request through the leading strategy follows as the last attempt
+    // (the old sequential fallback's final retry), all within the 10 s bound.
+    const strategies = (isExpoGo && isIOS)
+      ? [viaDirectRest, viaPostgrest, viaDirectRest]
+      : [viaPostgrest, viaDirectRest, viaPostgrest];
+    let data: any[] | null = null;
+    let error: any = null;
+    try {
+      data = await hedged('fetchTasks', strategies, { timeoutMs: FETCH_TASKS_TIMEOUT_MS });
+    } catch (e: any) {
+      error = { message: e?.message || 'fetchTasks failed', details: e?.details, hint: e?.hint, code: e?.code };
     }
-    const data = result?.data ?? null;
-    const error = result?.error ?? null;
 
     if (error) {
-      console.error('Supabase error details:', { message: error.message, details: error.details, hint: error.hint, code: error.code, timedOut });
+      console.error('Supabase error details:', { message: error.message, details: error.details, hint: error.hint, code: error.code, hedge: getHedgeStats().fetchTasks });
       // When Supabase is enabled, NEVER fallback to local data - only return what's in Supabase
       if (useSupabase()) {
         console.warn('[Supabase enabled] Returning empty array due to fetch error - no local fallback');
@@ -204,14 +172,15 @@ export const fetchTasks = async (): Promise<Task[]> => {
     console.log('Successfully fetched tasks:', data?.length || 0, 'in', (Date.now() - startFetch) + 'ms');
     
     // When using Supabase, ONLY return Supabase data - no local merge
+    const rows = validateRows<Task>(TASK_ROWS, data || []);
     if (useSupabase()) {
-      return (data || []) as Task[];
+      return rows;
     }
     
     // Only merge local tasks when Supabase is disabled (demo mode)
     const createdLocal = await loadDemoTasks();
     return [
-      ...((data || []) as Task[]),
+      ...rows,
       ...createdLocal,
     ];
   } catch (error: any) {
@@ -224,59 +193,131 @@ export const fetchTasks = async (): Promise<Task[]> => {
   }
 };
 
-export const fetchTasksNearby = async (latitude: number, longitude: number, maxDistance: number = 10): Promise<Task[]> => {
+export type TaskWithDistance = Task & { distance: number; offer_count?: number };
+
+// Radius RPC rows are { task, distance_km[, offer_count] }, nearest first; no limit unless one is passed
+const mapNearbyRows = (rows: any[]): TaskWithDistance[] =>
+  rows.map((row) => ({
+    ...(row.task as Task),
+    distance: Number(row.distance_km),
+    ...(row.offer_count != null ? { offer_count: Number(row.offer_count) } : {}),
+  }));
+
+const demoTasksNearby = (latitude: number, longitude: number, maxDistance: number, category?: string): TaskWithDistance[] => {
+  // Using mock data for nearby tasks
+  (globalThis as any).console?.log?.(
+    `[demo] fetchTasksNearby@(${latitude.toFixed(5)},${longitude.toFixed(5)}) radius:${maxDistance}km`
+  );
+  return MOCK_TASKS.map(t => {
+    const j = jitterDemoLatLon(t.id, t.latitude, t.longitude);
+    return { ...t, latitude: j.latitude, longitude: j.longitude } as Task;
+  })
+    .filter(task => !!task.latitude && !!task.longitude && (!category || task.category === category))
+    .map(task => ({ ...task, distance: calculateDistance(latitude, longitude, task.latitude!, task.longitude!) }))
+    .filter(task => task.distance <= maxDistance)
+    .sort((a, b) => a.distance - b.distance);
+};
+
+export const fetchTasksNearby = async (
+  latitude: number,
+  longitude: number,
+  maxDistance: number = 10,
+  limit?: number
+): Promise<TaskWithDistance[]> => {
   // If demo mode is enabled, return mock data filtered by distance
   if (isDemoMode()) {
-    // Using mock data for nearby tasks
-    (globalThis as any).console?.log?.(
-      `[demo] fetchTasksNearby@(${latitude.toFixed(5)},${longitude.toFixed(5)}) radius:${maxDistance}km`
-    );
-    return MOCK_TASKS.map(t => {
-      const j = jitterDemoLatLon(t.id, t.latitude, t.longitude);
-      return { ...t, latitude: j.latitude, longitude: j.longitude } as Task;
-    }).filter(task => {
-      if (!task.latitude || !task.longitude) return false;
-      
-      const distance = calculateDistance(
-        latitude,
-        longitude,
-        task.latitude,
-        task.longitude
-      );
-      return distance <= maxDistance;
-    });
+    return demoTasksNearby(latitude, longitude, maxDistance).slice(0, limit);
   }
 
   try {
-    // Using PostGIS distance calculation if available, otherwise fetch all and filter client-side
-    const { data, error } = await db
+    // earth_box/earth_distance on the ll_to_earth GiST index, sorted and limited server-side
+    const { data, error } = await db.rpc('get_tasks_nearby', {
+      p_latitude: latitude,
+      p_longitude: longitude,
+      p_radius_km: maxDistance,
+      p_limit: limit ?? null,
+    });
+    if (!error && Array.isArray(data)) {
+      return mapNearbyRows(data);
+    }
+    console.error('Error fetching nearby tasks via RPC, falling back to client filter:', error);
+
+    const { data: all, error: listError } = await db
       .from('tasks')
       .select('*')
       .eq('status', 'open')
       .order('created_at', { ascending: false });
 
-    if (error) {
-      console.error('Error fetching nearby tasks:', error);
+    if (listError) {
+      console.error('Error fetching nearby tasks:', listError);
       return [];
     }
 
     // Filter by distance client-side
-    const nearbyTasks = (data || []).filter(task => {
-      if (!task.latitude || !task.longitude) return false;
-      
-      const distance = calculateDistance(
-        latitude,
-        longitude,
-        task.latitude,
-        task.longitude
-      );
-      
-      return distance <= maxDistance;
+    return (all || [])
+      .filter(task => !!task.latitude && !!task.longitude)
+      .map(task => ({ ...task, distance: calculateDistance(latitude, longitude, task.latitude, task.longitude) }))
+      .filter(task => task.distance <= maxDistance)
+      .sort((a, b) => a.distance - b.distance)
+      .slice(0, limit) as TaskWithDistance[];
+  } catch (error: any) {
+    console.error('Error fetching nearby tasks:', error);
+    return [];
+  }
+};
+
+export const fetchTasksNearbyByCategory = async (
+  category: string,
+  latitude: number,
+  longitude: number,
+  maxDistance: number = 10,
+  limit?: number
+): Promise<TaskWithDistance[]> => {
+  if (isDemoMode()) {
+    return demoTasksNearby(latitude, longitude, maxDistance, category).slice(0, limit);
+  }
+  try {
+    const { data, error } = await db.rpc('get_tasks_nearby_by_category', {
+      p_latitude: latitude,
+      p_longitude: longitude,
+      p_category: category,
+      p_radius_km: maxDistance,
+      p_limit: limit ?? null,
     });
+    if (error || !Array.isArray(data)) {
+      console.error('Error fetching nearby tasks by category:', error);
+      return [];
+    }
+    return mapNearbyRows(data);
+  } catch (error: any) {
+    console.error('Error fetching nearby tasks by category:', error);
+    return [];
+  }
+};
 
-    return nearbyTasks;
+export const fetchTasksNearbyWithOfferCounts = async (
+  latitude: number,
+  longitude: number,
+  maxDistance: number = 10,
+  limit?: number
+): Promise<TaskWithDistance[]> => {
+  if (isDemoMode()) {
+    return demoTasksNearby(latitude, longitude, maxDistance).slice(0, limit).map(task => ({ ...task, offer_count: 0 }));
+  }
+  try {
+    const { data, error } = await db.rpc('get_tasks_nearby_with_offer_counts', {
+      p_latitude: latitude,
+      p_longitude: longitude,
+      p_radius_km: maxDistance,
+      p_limit: limit ?? null,
+    });
+    if (error || !Array.isArray(data)) {
+      console.error('Error fetching nearby tasks with offer counts:', error);
+      return [];
+    }
+    return mapNearbyRows(data);
   } catch (error: any) {
-    console.error('Error fetching nearby tasks:', error);
+    console.error('Error fetching nearby tasks with offer counts:', error);
     return [];
   }
 };
@@ -440,7 +481,7 @@ export const fetchOffersForTask = async (taskId: string): Promise<Offer[]> => {
       return [];
     }
 
-    return data || [];
+    return validateRows<Offer>(OFFER_ROWS, data || []);
   } catch (error: any) {
     console.error('Error fetching offers:', error);
     return [];
@@ -874,6 +915,70 @@ export const fetchPaymentsCountsForUser = async (userId: string): Promise<{ made
   }
 };
 
+// Public user card (profile + precomputed stats) for the map overlay and task detail
+export type UserPublicCard = {
+  id: string;
+  name: string;
+  avatar?: string;
+  rating: number;
+  total_reviews: number;
+  completed_tasks: number;
+  total_earnings: number;
+  wallet_balance: number;
+  member_since: string;
+  location?: string;
+  verified: boolean;
+  payments: { made: number; received: number };
+};
+
+const mapUserPublicCard = (
+  profile: any,
+  stats: { jobs_completed?: number; avg_rating?: number; review_count?: number; earnings?: number } | null,
+  payments: { made: number; received: number }
+): UserPublicCard => ({
+  id: profile.id,
+  name: profile.full_name || 'User',
+  avatar: profile.avatar_url,
+  rating: stats && stats.review_count ? Number(stats.avg_rating) : (profile.rating ?? 0),
+  total_reviews: stats?.review_count ?? 0,
+  completed_tasks: stats ? (stats.jobs_completed ?? 0) : (profile.total_jobs ?? 0),
+  total_earnings: stats?.earnings != null ? Number(stats.earnings) : (profile.total_earnings ?? 0),
+  wallet_balance: 0,
+  member_since: profile.created_at || new Date().toISOString(),
+  location: profile.location,
+  verified: profile.is_verified ?? false,
+  payments,
+});
+
+// One primary-key lookup via get_user_public_card(); falls back to the
+// profile + payments count queries in demo mode or before the migration runs
+export const fetchUserPublicCard = async (userId: string): Promise<UserPublicCard | null> => {
+  if (!userId) return null;
+  try {
+    if (!isDemoMode()) {
+      const { data, error } = await db.rpc('get_user_public_card', { p_user_id: userId });
+      if (!error) {
+        const card = data as any;
+        if (!card || !card.profile) return null;
+        // stats is null for users without a user_public_stats row yet
+        const stats = card.stats ?? null;
+        return mapUserPublicCard(card.profile, stats, {
+          made: stats?.payments_made ?? 0,
+          received: stats?.payments_received ?? 0,
+        });
+      }
+    }
+
+    const profile = await fetchUserProfile(userId);
+    if (!profile) return null;
+    const payments = await fetchPaymentsCountsForUser(userId);
+    return mapUserPublicCard(profile, null, payments);
+  } catch (error: any) {
+    console.error('Error fetching user card:', error);
+    return null;
+  }
+};
+
 export const updateUserProfile = async (userId: string, updates: any) => {
   try {
     // Filter out fields that might not exist in the database schema
@@ -975,23 +1080,122 @@ export const fetchUserProgress = async (userId: string): Promise<UserProgress |
   }
 };
 
-export const upsertUserProgress = async (progress: UserProgress): Promise<boolean> => {
+// xp/level/rank are maintained server-side by the rank engine; clients only write badges
+export const upsertUserProgress = async (progress: Pick<UserProgress, 'user_id' | 'badges'>): Promise<boolean> => {
   try {
     if (isDemoMode()) return true;
     const { error } = await db.from('user_progress').upsert({
       user_id: progress.user_id,
-      xp: progress.xp,
-      level: progress.level,
-      rank: progress.rank,
       badges: progress.badges,
-      updated_at: new Date().toISOString(),
-    });
+    }, { onConflict: 'user_id' });
     return !error;
   } catch {
     return false;
   }
 };
 
+// Badges earned server-side by the badge engine (null when unavailable, e.g. demo mode)
+export const fetchUserBadges = async (userId: string): Promise<{ badge_id: string; earned_at: string }[] | null> => {
+  try {
+    if (isDemoMode() || !userId) return null;
+    const { data, error } = await db
+      .from('user_badges')
+      .select('badge_id, earned_at')
+      .eq('user_id', userId)
+      .order('earned_at', { ascending: true });
+    if (error || !Array.isArray(data)) return null;
+    return data as { badge_id: string; earned_at: string }[];
+  } catch {
+    return null;
+  }
+};
+
+// Leaderboard (competition ranking: equal XP shares a position)
+export type LeaderboardEntry = {
+  position: number;
+  user_id: string;
+  full_name?: string;
+  avatar_url?: string;
+  xp: number;
+  level: number;
+  rank: string;
+};
+
+export const fetchLeaderboard = async (limit: number = 20, offset: number = 0): Promise<LeaderboardEntry[]> => {
+  try {
+    if (isDemoMode()) return [];
+    const { data, error } = await db.rpc('get_leaderboard', { p_limit: limit, p_offset: offset });
+    if (error || !Array.isArray(data)) return [];
+    return (data as any[]).map((row) => ({
+      position: Number(row.leaderboard_position),
+      user_id: row.user_id,
+      full_name: row.full_name,
+      avatar_url: row.avatar_url,
+      xp: row.xp,
+      level: row.level,
+      rank: row.rank,
+    }));
+  } catch {
+    return [];
+  }
+};
+
+export const fetchMyLeaderboardPosition = async (
+  userId: string
+): Promise<(Omit<LeaderboardEntry, 'full_name' | 'avatar_url'>) | null> => {
+  try {
+    if (isDemoMode() || !userId) return null;
+    const { data, error } = await db.rpc('get_my_leaderboard_position', { p_user_id: userId });
+    if (error || !data) return null;
+    const row = data as any;
+    return { position: Number(row.position), user_id: row.user_id, xp: row.xp, level: row.level, rank: row.rank };
+  } catch {
+    return null;
+  }
+};
+
+// Map clusters: one row per visible grid cell (taskId and task set when the cell holds one task)
+export type TaskCluster = {
+  key: string;
+  latitude: number;
+  longitude: number;
+  count: number;
+  taskId?: string;
+  task?: Task;
+};
+
+export type MapBounds = { minLat: number; minLon: number; maxLat: number; maxLon: number };
+
+export const fetchTaskClusters = async (
+  bounds: MapBounds,
+  zoom: number,
+  options: { categories?: string[]; excludeUserId?: string } = {}
+): Promise<TaskCluster[] | null> => {
+  try {
+    if (isDemoMode()) return null;
+    const { data, error } = await db.rpc('get_task_clusters', {
+      p_min_lat: bounds.minLat,
+      p_min_lon: bounds.minLon,
+      p_max_lat: bounds.maxLat,
+      p_max_lon: bounds.maxLon,
+      p_zoom: Math.round(zoom),
+      p_categories: options.categories && options.categories.length > 0 ? options.categories : null,
+      p_exclude_user: options.excludeUserId || null,
+    });
+    if (error || !Array.isArray(data)) return null;
+    return (data as any[]).map((row) => ({
+      key: row.cluster_key,
+      latitude: Number(row.latitude),
+      longitude: Number(row.longitude),
+      count: Number(row.task_count),
+      taskId: row.task_id || undefined,
+      task: (row.task as Task) || undefined,
+    }));
+  } catch {
+    return null;
+  }
+};
+
 // Demo: seed payments for demo reviews/tasks so history is consistent
 async function seedDemoPaymentsForTasks(taskIds: string[], payeeId: string) {
   try {
@@ -1051,7 +1255,7 @@ export const fetchTasksByCategory = async (category: string): Promise<Task[]> =>
       return [];
     }
 
-    return data || [];
+    return validateRows<Task>(TASK_ROWS, data || []);
   } catch (error) {
     console.error('Error fetching tasks by category:', error);
     return [];
@@ -1073,7 +1277,7 @@ export const fetchTasksByUser = async (userId: string): Promise<Task[]> => {
         return [];
       }
 
-      return (data || []) as Task[];
+      return validateRows<Task>(TASK_ROWS, data || []);
     }
 
     // Only use local storage when Supabase is disabled (demo mode)
@@ -1103,7 +1307,7 @@ export const fetchTasksAssignedToUser = async (userId: string): Promise<Task[]>
       console.error('Error fetching tasks assigned to user:', error);
       return [];
     }
-    return (data || []) as Task[];
+    return validateRows<Task>(TASK_ROWS, data || []);
   } catch (e) {
     return [];
   }
@@ -1120,6 +1324,18 @@ export const taskService = {
   searchTasks,
   fetchTasksByCategory,
   fetchTasksByUser,
+  fetchTasksNearbyByCategory,
+  fetchTasksNearbyWithOfferCounts,
+  calculateDistance,
+  // { data, error } shape used by app/map.tsx
+  getNearbyTasks: async (latitude: number, longitude: number, maxDistance: number = 10) => ({
+    data: await fetchTasksNearby(latitude, longitude, maxDistance),
+    error: null,
+  }),
+  getTasksByCategoryAndLocation: async (category: string, latitude: number, longitude: number, maxDistance: number = 10) => ({
+    data: await fetchTasksNearbyByCategory(category, latitude, longitude, maxDistance),
+    error: null,
+  }),
 };
 
 // Export TASK_CATEGORIES for backward compatibility
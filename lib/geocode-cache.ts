@@ -0,0 +1,182 @@
+// Geocoding cache: LRU + TTL in memory, persisted to AsyncStorage
+//
+// Keys are spatially/textually quantized so nearby lookups share entries:
+//   reverse  r:<lat cell>:<lon cell>   (cells of REVERSE_CELL_DEG, ~110 m)
+//   forward  f:<normalized query>      (lowercase, no accents, single spaces)
+//   geocode  g:<place_id>
+// A forward miss can also be served from a cached shorter prefix whose result
+// list was complete (fewer than the provider limit), by filtering it locally.
+
+import AsyncStorage from '@react-native-async-storage/async-storage';
+
+export const REVERSE_CELL_DEG = 0.001;
+
+const STORAGE_KEY = 'geocode_cache_v1';
+const PERSIST_DELAY_MS = 1000;
+// "Nothing here" answers expire quickly so a provider hiccup is not remembered for days
+const NEGATIVE_TTL_MS = 5 * 60 * 1000;
+
+type Entry<T> = { value: T; expiresAt: number };
+
+export type GeocodeCacheStats = {
+  hits: number;
+  prefixHits: number;
+  restored: number;
+  misses: number;
+  evictions: number;
+};
+
+export const normalizeQuery = (input: string): string =>
+  input
+    .normalize('NFD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .toLowerCase()
+    .replace(/[^a-z0-9 ]+/g, ' ')
+    .replace(/\s+/g, ' ')
+    .trim();
+
+export const reverseKey = (latitude: number, longitude: number): string =>
+  `r:${Math.floor(latitude / REVERSE_CELL_DEG)}:${Math.floor(longitude / REVERSE_CELL_DEG)}`;
+
+export const forwardKey = (query: string): string => `f:${normalizeQuery(query)}`;
+
+export const placeKey = (placeId: string): string => `g:${placeId}`;
+
+export class GeocodeCache {
+  private entries = new Map<string, Entry<unknown>>();
+  private inflight = new Map<string, Promise<unknown>>();
+  private loaded: Promise<void> | null = null;
+  private persistTimer: ReturnType<typeof setTimeout> | null = null;
+  readonly stats: GeocodeCacheStats = { hits: 0, prefixHits: 0, restored: 0, misses: 0, evictions: 0 };
+
+  constructor(
+    private readonly maxEntries: number = 500,
+    private readonly ttlMs: Record<'r' | 'f' | 'g', number> = {
+      r: 7 * 24 * 3600 * 1000,
+      f: 24 * 3600 * 1000,
+      g: 30 * 24 * 3600 * 1000,
+    },
+    private readonly persist: boolean = true
+  ) {}
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  // Cached value, or the result of loader() stored under key (concurrent callers share one load)
+  async getOrLoad<T>(key: string, loader: () => Promise<T>): Promise<T> {
+    await this.ensureLoaded();
+    const cached = this.lookup<T>(key);
+    if (cached !== undefined) {
+      this.stats.hits++;
+      return cached;
+    }
+    const pending = this.inflight.get(key);
+    if (pending) return pending as Promise<T>;
+
+    this.stats.misses++;
+    const promise = loader()
+      .then((value) => {
+        // Negative results (null) are cached briefly so dead ends do not refetch per keystroke
+        this.store(key, value);
+        return value;
+      })
+      .finally(() => this.inflight.delete(key));
+    this.inflight.set(key, promise);
+    return promise;
+  }
+
+  // Forward lookups: reuse a complete result list cached for a shorter prefix
+  async getSuggestions<T>(
+    query: string,
+    limit: number,
+    matches: (item: T, normalized: string) => boolean,
+    loader: () => Promise<T[]>
+  ): Promise<T[]> {
+    await this.ensureLoaded();
+    const normalized = normalizeQuery(query);
+    for (let end = normalized.length - 1; end >= 1; end--) {
+      const shorter = this.lookupEntry<T[]>(forwardKey(normalized.slice(0, end)));
+      if (shorter !== undefined && shorter.value.length < limit) {
+        this.stats.prefixHits++;
+        const filtered = shorter.value.filter((item) => matches(item, normalized));
+        // A subset is no fresher than the list it came from
+        this.store(forwardKey(normalized), filtered, shorter.expiresAt);
+        return filtered;
+      }
+    }
+    return this.getOrLoad(forwardKey(normalized), loader);
+  }
+
+  clear(): void {
+    this.entries.clear();
+    this.schedulePersist();
+  }
+
+  private lookup<T>(key: string): T | undefined {
+    return this.lookupEntry<T>(key)?.value;
+  }
+
+  private lookupEntry<T>(key: string): Entry<T> | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+    if (entry.expiresAt <= Date.now()) {
+      this.entries.delete(key);
+      return undefined;
+    }
+    // Re-insert to mark as most recently used (Map keeps insertion order)
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry as Entry<T>;
+  }
+
+  private store(key: string, value: unknown, expiresAt?: number): void {
+    const kind = key.charAt(0) as 'r' | 'f' | 'g';
+    const ttl = value === null ? NEGATIVE_TTL_MS : (this.ttlMs[kind] ?? this.ttlMs.f);
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: expiresAt ?? Date.now() + ttl });
+    while (this.entries.size > this.maxEntries) {
+      const oldest = this.entries.keys().next().value as string;
+      this.entries.delete(oldest);
+      this.stats.evictions++;
+    }
+    this.schedulePersist();
+  }
+
+  private ensureLoaded(): Promise<void> {
+    if (!this.persist) return Promise.resolve();
+    if (!this.loaded) {
+      this.loaded = (async () => {
+        try {
+          const raw = await AsyncStorage.getItem(STORAGE_KEY);
+          if (!raw) return;
+          const now = Date.now();
+          const saved = JSON.parse(raw) as [string, Entry<unknown>][];
+          for (const [key, entry] of saved) {
+            if (entry.expiresAt > now && !this.entries.has(key)) {
+              this.entries.set(key, entry);
+              this.stats.restored++;
+            }
+          }
+        } catch {
+          // Corrupt or unavailable storage: start cold
+        }
+      })();
+    }
+    return this.loaded;
+  }
+
+  private schedulePersist(): void {
+    if (!this.persist || this.persistTimer) return;
+    this.persistTimer = setTimeout(async () => {
+      this.persistTimer = null;
+      try {
+        await AsyncStorage.setItem(STORAGE_KEY, JSON.stringify(Array.from(this.entries.entries())));
+      } catch {
+        // Persistence is best effort
+      }
+    }, PERSIST_DELAY_MS);
+  }
+}
+
+export const geocodeCache = new GeocodeCache();
@@ -0,0 +1,182 @@
+// Request hedging: start the primary strategy and, if it has not answered by
+// the hedge threshold, start the next one as well. The first success wins and
+// every other attempt is aborted through its AbortSignal. A strategy that
+// fails starts the next one immediately instead of waiting for the threshold.
+//
+// The threshold is a percentile (default p95) of the primary attempt's recent
+// latency for the same key, clamped to [minDelayMs, maxDelayMs]. Until
+// minSamples calls have been sampled it is initialDelayMs. A primary still
+// running when the call ends (a backup won, or the deadline passed) is
+// recorded as a censored sample at the time it was cut off: all we know is
+// that it took at least that long. Those samples sit above the current
+// threshold, so a slow spell pulls the percentile up (to maxDelayMs at most)
+// instead of hedging every call. With steady latency, hedging at p95 adds
+// about 5% extra requests while cutting the tail to roughly threshold +
+// backup latency; during a slow spell it hedges more often until the
+// threshold catches up.
+
+export type HedgeStrategy<T> = (signal: AbortSignal) => Promise<T>;
+
+export type HedgeOptions = {
+  percentile?: number;
+  initialDelayMs?: number;
+  minDelayMs?: number;
+  maxDelayMs?: number;
+  minSamples?: number;
+  window?: number;
+  // Reject (and abort everything) if nothing succeeded by then; 0 = no limit
+  timeoutMs?: number;
+};
+
+export type HedgeStats = {
+  calls: number;
+  // Backups started because the threshold passed
+  hedged: number;
+  // Backups started because an earlier attempt failed
+  failovers: number;
+  backupWins: number;
+  failures: number;
+  timeouts: number;
+  thresholdMs: number;
+};
+
+const DEFAULTS: Required<HedgeOptions> = {
+  percentile: 0.95,
+  initialDelayMs: 2000,
+  minDelayMs: 200,
+  maxDelayMs: 5000,
+  minSamples: 5,
+  window: 50,
+  timeoutMs: 0,
+};
+
+export class HedgeTimeoutError extends Error {
+  constructor(key: string, timeoutMs: number) {
+    super(`${key} timeout after ${timeoutMs}ms`);
+    this.name = 'HedgeTimeoutError';
+  }
+}
+
+class LatencyTracker {
+  private samples: number[] = [];
+  readonly stats: HedgeStats = { calls: 0, hedged: 0, failovers: 0, backupWins: 0, failures: 0, timeouts: 0, thresholdMs: 0 };
+
+  record(ms: number, window: number) {
+    this.samples.push(ms);
+    if (this.samples.length > window) this.samples.shift();
+  }
+
+  threshold(options: Required<HedgeOptions>): number {
+    if (this.samples.length < options.minSamples) return options.initialDelayMs;
+    const sorted = [...this.samples].sort((a, b) => a - b);
+    const rank = Math.min(sorted.length - 1, Math.ceil(options.percentile * sorted.length) - 1);
+    return Math.min(options.maxDelayMs, Math.max(options.minDelayMs, sorted[Math.max(0, rank)]));
+  }
+}
+
+const trackers = new Map<string, LatencyTracker>();
+
+const trackerFor = (key: string): LatencyTracker => {
+  let tracker = trackers.get(key);
+  if (!tracker) {
+    tracker = new LatencyTracker();
+    trackers.set(key, tracker);
+  }
+  return tracker;
+};
+
+export const hedged = <T>(key: string, strategies: HedgeStrategy<T>[], options: HedgeOptions = {}): Promise<T> => {
+  const opts = { ...DEFAULTS, ...options };
+  const tracker = trackerFor(key);
+  tracker.stats.calls += 1;
+  const started = Date.now();
+  const primaryThresholdMs = tracker.threshold(opts);
+  let primaryDone = false;
+  const controllers: AbortController[] = [];
+  const errors: unknown[] = [];
+  let next = 0;
+  let failed = 0;
+  let settled = false;
+  let hedgeTimer: ReturnType<typeof setTimeout> | null = null;
+  let deadlineTimer: ReturnType<typeof setTimeout> | null = null;
+
+  return new Promise<T>((resolve, reject) => {
+    const finish = (winner = -1) => {
+      settled = true;
+      if (hedgeTimer) clearTimeout(hedgeTimer);
+      if (deadlineTimer) clearTimeout(deadlineTimer);
+      // Cut-off primary: censored at its elapsed time rather than dropped, so slow spells raise the threshold
+      if (!primaryDone) tracker.record(Date.now() - started, opts.window);
+      controllers.forEach((controller, index) => {
+        if (index === winner) return;
+        try { controller.abort(); } catch {}
+      });
+    };
+
+    const launch = (reason: 'primary' | 'hedge' | 'failover') => {
+      if (settled || next >= strategies.length) return;
+      const index = next++;
+      if (reason === 'hedge') tracker.stats.hedged += 1;
+      if (reason === 'failover') tracker.stats.failovers += 1;
+      if (hedgeTimer) clearTimeout(hedgeTimer);
+      if (next < strategies.length) {
+        tracker.stats.thresholdMs = index === 0 ? primaryThresholdMs : tracker.threshold(opts);
+        hedgeTimer = setTimeout(() => launch('hedge'), tracker.stats.thresholdMs);
+      }
+      const controller = new AbortController();
+      controllers.push(controller);
+      let attempt: Promise<T>;
+      try {
+        attempt = strategies[index](controller.signal);
+      } catch (error) {
+        attempt = Promise.reject(error);
+      }
+      attempt.then(
+        (value) => {
+          if (settled) return;
+          if (index === 0) {
+            // The primary's own latency; backups start later and would skew it
+            primaryDone = true;
+            tracker.record(Date.now() - started, opts.window);
+          }
+          finish(index);
+          if (index > 0) tracker.stats.backupWins += 1;
+          resolve(value);
+        },
+        (error) => {
+          if (settled) return;
+          if (index === 0) primaryDone = true;
+          errors[index] = error;
+          failed += 1;
+          if (next < strategies.length) {
+            launch('failover');
+          } else if (failed === next) {
+            finish();
+            tracker.stats.failures += 1;
+            reject(errors[index]);
+          }
+        }
+      );
+    };
+
+    if (opts.timeoutMs > 0) {
+      deadlineTimer = setTimeout(() => {
+        if (settled) return;
+        finish();
+        tracker.stats.timeouts += 1;
+        reject(new HedgeTimeoutError(key, opts.timeoutMs));
+      }, opts.timeoutMs);
+    }
+    launch('primary');
+  });
+};
+
+export const getHedgeStats = (): Record<string, HedgeStats> => {
+  const out: Record<string, HedgeStats> = {};
+  trackers.forEach((tracker, key) => {
+    out[key] = { ...tracker.stats };
+  });
+  return out;
+};
+
+export const resetHedgeStats = () => trackers.clear();
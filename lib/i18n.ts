@@ -1,18 +1,22 @@
 import i18n from 'i18next';
 import { initReactI18next } from 'react-i18next';
 import * as Localization from 'expo-localization';
-import localizations from './localization';
+import { DEFAULT_LANGUAGE, Language, getLoadedTable, isLanguage, loadLocale, toStrings } from './localization';
 // Polyfill Intl.PluralRules for Hermes/older RN
 import 'intl-pluralrules';
 
-// Transform our existing localizations to i18next resources
-const resources = Object.entries(localizations).reduce<Record<string, { translation: any }>>(
-  (acc, [lng, strings]) => {
-    acc[lng] = { translation: { ...strings } };
-    return acc;
-  },
-  {}
-);
+// Only the default language is bundled; others are added as their chunk loads
+const resources = {
+  [DEFAULT_LANGUAGE]: { translation: toStrings(getLoadedTable(DEFAULT_LANGUAGE)!) },
+};
+
+// Load a language's table and register it with i18next before switching to it
+export const ensureI18nLanguage = async (language: Language): Promise<void> => {
+  const table = await loadLocale(language);
+  if (!i18n.hasResourceBundle(language, 'translation')) {
+    i18n.addResourceBundle(language, 'translation', toStrings(table));
+  }
+};
 
 const languageDetector = {
   type: 'languageDetector' as const,
@@ -39,6 +43,7 @@ if (!i18n.isInitialized) {
       fallbackLng: 'es-CR',
       interpolation: { escapeValue: false },
     })
+    .then(() => (isLanguage(i18n.language) ? ensureI18nLanguage(i18n.language) : undefined))
     .catch(() => {});
 }
 
@@ -0,0 +1,251 @@
+// Generated by `python -m currijobs_harness compile-locales` from lib/locales/messages/en.json; do not edit
+const messages: (string | null)[] = [
+  "CurriJobs", // appName
+  "Find tasks near you", // appSubtitle
+  "Tasks Near You", // tasksNearYou
+  "List", // taskList
+  "Create", // createTask
+  "Profile", // profile
+  "Settings", // settings
+  "Email", // email
+  "Password", // password
+  "Login", // login
+  "Logout", // logout
+  "Sign Up", // signUp
+  "Forgot Password?", // forgotPassword
+  "Auto-login in progress...", // autoLoginInProgress
+  "Logging in...", // loggingIn
+  "All", // all
+  "Plumbing", // plumbing
+  "Electrician", // electrician
+  "Carpentry", // carpentry
+  "Painting", // painting
+  "Appliance Repair", // applianceRepair
+  "Cleaning", // cleaning
+  "Laundry & Ironing", // laundryIroning
+  "Cooking", // cooking
+  "Grocery Shopping", // groceryShopping
+  "Pet Care", // petCare
+  "Gardening", // gardening
+  "Moving Help", // movingHelp
+  "Trash Removal", // trashRemoval
+  "Window Washing", // windowWashing
+  "Babysitting", // babysitting
+  "Elderly Care", // elderlyCare
+  "Tutoring", // tutoring
+  "Delivery & Errands", // deliveryErrands
+  "Tech Support", // techSupport
+  "Photography", // photography
+  "Task Title", // taskTitle
+  "Description", // taskDescription
+  "Category", // taskCategory
+  "Reward", // taskReward
+  "Location", // taskLocation
+  "Time Estimate", // taskTimeEstimate
+  "Distance", // taskDistance
+  "Status", // taskStatus
+  "Created At", // taskCreatedAt
+  "View Details", // viewDetails
+  "Submit Offer", // submitOffer
+  "Make Offer", // makeOffer
+  "Accept Offer", // acceptOffer
+  "Reject Offer", // rejectOffer
+  "Complete Task", // completeTask
+  "Cancel Task", // cancelTask
+  "Select the worker for this job", // selectWorker
+  "Offers", // offers
+  "Proposed reward", // proposedReward
+  "Message", // offerMessage
+  "Assign", // assign
+  "My Created Tasks", // myCreatedTasks
+  "My Tasks", // myTasks
+  "Long press the map to create a new task", // longPressMapToCreate
+  "Create New Task", // createNewTask
+  "My Created - In Progress", // myCreatedInProgress
+  "Assigned To Me", // assignedToMe
+  "Search tasks, categories, or locations...", // searchPlaceholder
+  "Search tasks", // searchTasks
+  "Search categories", // searchCategories
+  "Search locations", // searchLocations
+  "Filter by category", // filterByCategory
+  "Clear search", // clearSearch
+  "No results found", // noResultsFound
+  "Nearby", // nearby
+  "Confirm Cancellation", // confirmCancellation
+  "Are you sure you want to cancel this task? This action cannot be undone.", // cancelTaskConfirmation
+  "Could not cancel task", // couldNotCancelTask
+  "Confirm", // confirmCancel
+  "AI Recommendations", // aiRecommendations
+  "Recommended for you", // recommendedForYou
+  "Based on your location", // basedOnYourLocation
+  "Based on your history", // basedOnYourHistory
+  "Map View", // mapView
+  "List View", // listView
+  "Your location", // yourLocation
+  "Nearby tasks", // nearbyTasks
+  "km away", // kilometersAway
+  "miles away", // milesAway
+  "Go Home", // goHome
+  "Long press to drop/move the pin", // longPressToDropPin
+  "Close", // close
+  "Cancel", // cancel
+  "Confirm", // confirm
+  "Back", // back
+  "Save", // save
+  "Delete", // delete
+  "Edit", // edit
+  "Loading...", // loading
+  "Finding tasks near you...", // findingTasksNearYou
+  "No tasks found", // noTasksFound
+  "An error occurred", // errorOccurred
+  "Try again", // tryAgain
+  "Network error", // networkError
+  "$", // currency
+  "Reward", // reward
+  "Price", // price
+  "Total", // total
+  "Time estimate", // timeEstimate
+  "Time not specified", // timeNotSpecified
+  "hours", // hours
+  "minutes", // minutes
+  "days", // days
+  "Location", // location
+  "Address", // address
+  "Coordinates", // coordinates
+  "Distance", // distance
+  "Profile", // userName
+  "Name", // name
+  "Phone", // phone
+  "Rating", // rating
+  "Reviews", // reviews
+  "Completed tasks", // completedTasks
+  "Member since", // memberSince
+  "Language", // language
+  "Theme", // theme
+  "Notifications", // notifications
+  "Privacy", // privacy
+  "Help", // help
+  "About", // about
+  "New task nearby", // newTaskNearby
+  "Offer received", // offerReceived
+  "Offer accepted", // offerAccepted
+  "Offer rejected", // offerRejected
+  "Task completed", // taskCompleted
+  "Payment received", // paymentReceived
+  "Invalid email", // invalidEmail
+  "Invalid password", // invalidPassword
+  "Network connection error", // networkConnectionError
+  "Location permission denied", // locationPermissionDenied
+  "Camera permission denied", // cameraPermissionDenied
+  "Task created successfully", // taskCreatedSuccessfully
+  "Offer submitted successfully", // offerSubmittedSuccessfully
+  "Profile updated successfully", // profileUpdatedSuccessfully
+  "Settings saved successfully", // settingsSavedSuccessfully
+  "Error fetching tasks", // errorFetchingTasks
+  "Error creating task", // errorCreatingTask
+  "Success", // success
+  "Get Started", // getStarted
+  "Welcome to CurriJobs", // welcomeToCurriJobs
+  "Connecting trusted workers and clients.", // connectingWorkersAndClients
+  "Create Account", // createAccount
+  "Continue with Google", // continueWithGoogle
+  "Continue with Apple", // continueWithApple
+  "By registering, you accept our Terms and Privacy Policy", // termsAndPrivacy
+  "Join CurriJobs!", // joinCurriJobs
+  "Create your account to get started", // createAccountToGetStarted
+  "Full Name", // fullName
+  "Confirm Password", // confirmPassword
+  "Creating Account...", // creatingAccount
+  "Already have an account?", // alreadyHaveAccount
+  "Login to continue", // loginToContinue
+  "Login failed", // loginFailed
+  "Skip to demo", // skipToDemo
+  "Go to App", // skipToApp
+  "Error", // error
+  "Next", // next
+  "Previous", // previous
+  "Let's Go!", // letsGo
+  "Skip introduction", // skipOnboarding
+  "Explore jobs near you", // onboardingStep1Title
+  "Use the map to find jobs near you. Each marker is an opportunity.", // onboardingStep1Description
+  "Filter by category", // onboardingStep2Title
+  "Use category filters to find exactly what you need.", // onboardingStep2Description
+  "Create and manage your jobs", // onboardingStep3Title
+  "Post your own jobs or apply to others. Stay in full control.", // onboardingStep3Description
+  "Ready to start!", // onboardingStep4Title
+  "You're all set. Welcome to the Currijobs community!", // onboardingStep4Description
+  "Category", // category
+  "Posted by", // postedBy
+  "Overview", // overview
+  "Recent Payments", // recentPayments
+  "Current tasks posted", // currentTasksPosted
+  "Total tasks completed", // totalTasksCompleted
+  "Earnings this month", // earningsThisMonth
+  "Lifetime earnings", // lifetimeEarnings
+  "View all payments", // viewAllPayments
+  "Paid by", // paidBy
+  "Account", // account
+  "Preferences", // preferences
+  "Support", // support
+  "Legal", // legal
+  "Edit Profile", // editProfile
+  "Update your personal information", // editProfileSubtitle
+  "Identity Verification", // identityVerification
+  "Verify your identity for better trust", // identityVerificationSubtitle
+  "Payment Methods", // paymentMethods
+  "Manage your payment options", // paymentMethodsSubtitle
+  "Push Notifications", // pushNotifications
+  "Get notified about new tasks and offers", // pushNotificationsSubtitle
+  "Location Services", // locationServices
+  "Allow location access for nearby tasks", // locationServicesSubtitle
+  "App Settings", // appSettings
+  "Language, theme, and accessibility", // appSettingsSubtitle
+  "Help Center", // helpCenter
+  "Get help and find answers", // helpCenterSubtitle
+  "Contact Support", // contactSupport
+  "Reach out to our support team", // contactSupportSubtitle
+  "Send Feedback", // sendFeedback
+  "Help us improve the app", // sendFeedbackSubtitle
+  "Privacy Policy", // privacyPolicy
+  "How we protect your data", // privacyPolicySubtitle
+  "Terms of Service", // termsOfService
+  "Our terms and conditions", // termsOfServiceSubtitle
+  "Sign out of your account", // signOutSubtitle
+  "Theme Mode", // themeMode
+  "Light Mode", // lightMode
+  "Dark Mode", // darkMode
+  "Colorblind Support", // colorblindSupport
+  "Custom Theme", // customTheme
+  "Customize Theme", // customizeTheme
+  "Open Theme Customizer", // openThemeCustomizer
+  "Custom Colors", // customColorsLabel
+  "Choose your own color scheme", // chooseCustomColors
+  "Default Theme", // defaultThemeLabel
+  "Use system color palette", // useSystemPalette
+  "Normal Vision", // colorblindNormal
+  "Protanopia", // colorblindProtanopia
+  "Deuteranopia", // colorblindDeuteranopia
+  "Tritanopia", // colorblindTritanopia
+  "Standard colors", // colorblindStandardColors
+  "Colors optimized for normal vision", // colorblindNormalDesc
+  "Colors adapted for red-green difficulty", // colorblindProtanopiaDesc
+  "Colors adapted for red-green difficulty", // colorblindDeuteranopiaDesc
+  "Colors adapted for blue-yellow difficulty", // colorblindTritanopiaDesc
+  "Your Rank", // yourRank
+  "Badges", // badgesLabel
+  "Reviews History", // reviewsHistory
+  "How to rank up", // howToRankUp
+  "• Complete more tasks and keep a high rating.", // tipCompleteHighRating
+  "• Vary categories to aim for “Category Master”.", // tipVaryCategories
+  "• Participate in seasonal events for special badges.", // tipParticipateEvents
+  "Progress", // progress
+  "Average", // averageRating
+  "Payment", // payment
+  "Client", // client
+  "Open", // openStatus
+  "In Progress", // inProgressStatus
+  "Completed", // completedStatus
+  "Cancelled", // cancelledStatus
+];
+
+export default messages;
@@ -0,0 +1,251 @@
+// Generated by `python -m currijobs_harness compile-locales` from lib/locales/messages/es-CR.json; do not edit
+const messages: (string | null)[] = [
+  "CurriJobs", // appName
+  "Encuentra trabajos cerca de ti", // appSubtitle
+  "Trabajos Cerca de Ti", // tasksNearYou
+  "Lista", // taskList
+  "Crear", // createTask
+  "Perfil", // profile
+  "Configuración", // settings
+  "Correo", // email
+  "Contraseña", // password
+  "Iniciar Sesión", // login
+  "Cerrar Sesión", // logout
+  "Registrarse", // signUp
+  "¿Olvidaste tu contraseña?", // forgotPassword
+  "Inicio automático en progreso...", // autoLoginInProgress
+  "Iniciando sesión...", // loggingIn
+  "Todos", // all
+  "Plomería", // plumbing
+  "Electricidad", // electrician
+  "Carpintería", // carpentry
+  "Pintura", // painting
+  "Reparación de Electrodomésticos", // applianceRepair
+  "Limpieza", // cleaning
+  "Lavandería y Planchado", // laundryIroning
+  "Cocina", // cooking
+  "Compras", // groceryShopping
+  "Cuidado de Mascotas", // petCare
+  "Jardinería", // gardening
+  "Ayuda para Mudanzas", // movingHelp
+  "Eliminación de Basura", // trashRemoval
+  "Limpieza de Ventanas", // windowWashing
+  "Cuidado de Niños", // babysitting
+  "Cuidado de Adultos Mayores", // elderlyCare
+  "Tutoría", // tutoring
+  "Entregas y Mandados", // deliveryErrands
+  "Soporte Técnico", // techSupport
+  "Fotografía", // photography
+  "Título del Trabajo", // taskTitle
+  "Descripción", // taskDescription
+  "Categoría", // taskCategory
+  "Recompensa", // taskReward
+  "Ubicación", // taskLocation
+  "Tiempo Estimado", // taskTimeEstimate
+  "Distancia", // taskDistance
+  "Estado", // taskStatus
+  "Fecha de Creación", // taskCreatedAt
+  "Ver Detalles", // viewDetails
+  "Enviar Oferta", // submitOffer
+  "Hacer Oferta", // makeOffer
+  "Aceptar Oferta", // acceptOffer
+  "Rechazar Oferta", // rejectOffer
+  "Completar Trabajo", // completeTask
+  "Cancelar Trabajo", // cancelTask
+  "Selecciona quién realizará el trabajo", // selectWorker
+  "Ofertas", // offers
+  "Recompensa propuesta", // proposedReward
+  "Mensaje", // offerMessage
+  "Asignar", // assign
+  "Mis Tareas Creadas", // myCreatedTasks
+  "Mis Tareas", // myTasks
+  "Mantén presionado el mapa para crear una nueva tarea", // longPressMapToCreate
+  "Crear Nueva Tarea", // createNewTask
+  "Mis creadas - En progreso", // myCreatedInProgress
+  "Asignadas a mí", // assignedToMe
+  "Buscar trabajos, categorías o ubicaciones...", // searchPlaceholder
+  "Buscar trabajos", // searchTasks
+  "Buscar categorías", // searchCategories
+  "Buscar ubicaciones", // searchLocations
+  "Filtrar por categoría", // filterByCategory
+  "Limpiar búsqueda", // clearSearch
+  "No se encontraron resultados", // noResultsFound
+  "Cercanos", // nearby
+  "Confirmar cancelación", // confirmCancellation
+  "¿Estás seguro de que quieres cancelar esta tarea? Esta acción no se puede deshacer.", // cancelTaskConfirmation
+  "No se pudo cancelar la tarea", // couldNotCancelTask
+  "Confirmar", // confirmCancel
+  "Recomendaciones IA", // aiRecommendations
+  "Recomendado para ti", // recommendedForYou
+  "Basado en tu ubicación", // basedOnYourLocation
+  "Basado en tu historial", // basedOnYourHistory
+  "Vista de Mapa", // mapView
+  "Vista de Lista", // listView
+  "Tu ubicación", // yourLocation
+  "Trabajos cercanos", // nearbyTasks
+  "km de distancia", // kilometersAway
+  "millas de distancia", // milesAway
+  "Ir a casa", // goHome
+  "Mantén presionado para colocar/mover el pin", // longPressToDropPin
+  "Cerrar", // close
+  "Cancelar", // cancel
+  "Confirmar", // confirm
+  "Atrás", // back
+  "Guardar", // save
+  "Eliminar", // delete
+  "Editar", // edit
+  "Cargando...", // loading
+  "Buscando trabajos cerca de ti...", // findingTasksNearYou
+  "No se encontraron trabajos", // noTasksFound
+  "Ocurrió un error", // errorOccurred
+  "Intentar de nuevo", // tryAgain
+  "Error de conexión", // networkError
+  "₡", // currency
+  "Recompensa", // reward
+  "Precio", // price
+  "Total", // total
+  "Tiempo estimado", // timeEstimate
+  "Tiempo no especificado", // timeNotSpecified
+  "horas", // hours
+  "minutos", // minutes
+  "días", // days
+  "Ubicación", // location
+  "Dirección", // address
+  "Coordenadas", // coordinates
+  "Distancia", // distance
+  "Perfil", // userName
+  "Nombre", // name
+  "Teléfono", // phone
+  "Calificación", // rating
+  "Reseñas", // reviews
+  "Trabajos completados", // completedTasks
+  "Miembro desde", // memberSince
+  "Idioma", // language
+  "Tema", // theme
+  "Notificaciones", // notifications
+  "Privacidad", // privacy
+  "Ayuda", // help
+  "Acerca de", // about
+  "Nuevo trabajo cerca", // newTaskNearby
+  "Oferta recibida", // offerReceived
+  "Oferta aceptada", // offerAccepted
+  "Oferta rechazada", // offerRejected
+  "Trabajo completado", // taskCompleted
+  "Pago recibido", // paymentReceived
+  "Correo inválido", // invalidEmail
+  "Contraseña inválida", // invalidPassword
+  "Error de conexión de red", // networkConnectionError
+  "Permiso de ubicación denegado", // locationPermissionDenied
+  "Permiso de cámara denegado", // cameraPermissionDenied
+  "Trabajo creado exitosamente", // taskCreatedSuccessfully
+  "Oferta enviada exitosamente", // offerSubmittedSuccessfully
+  "Perfil actualizado exitosamente", // profileUpdatedSuccessfully
+  "Configuración guardada exitosamente", // settingsSavedSuccessfully
+  "Error al obtener las tareas", // errorFetchingTasks
+  "Error al crear la tarea", // errorCreatingTask
+  "Éxito", // success
+  "Comenzar", // getStarted
+  "Bienvenido a CurriJobs", // welcomeToCurriJobs
+  "Conectando trabajadores y clientes de confianza.", // connectingWorkersAndClients
+  "Crear cuenta", // createAccount
+  "Continuar con Google", // continueWithGoogle
+  "Continuar con Apple", // continueWithApple
+  "Al registrarte, aceptas nuestras Términos y Política de privacidad", // termsAndPrivacy
+  "Únete a CurriJobs!", // joinCurriJobs
+  "Crea tu cuenta para comenzar", // createAccountToGetStarted
+  "Nombre completo", // fullName
+  "Confirmar contraseña", // confirmPassword
+  "Creando cuenta...", // creatingAccount
+  "¿Ya tienes una cuenta?", // alreadyHaveAccount
+  "Inicia sesión para continuar", // loginToContinue
+  "Error al iniciar sesión", // loginFailed
+  "Saltar al demo", // skipToDemo
+  "Ir a la App", // skipToApp
+  "Error", // error
+  "Siguiente", // next
+  "Anterior", // previous
+  "¡Vamos!", // letsGo
+  "Saltar introducción", // skipOnboarding
+  "Explora trabajos cerca de ti", // onboardingStep1Title
+  "Usa el mapa para encontrar trabajos cerca de ti. Cada marcador es una oportunidad.", // onboardingStep1Description
+  "Filtra por categoría", // onboardingStep2Title
+  "Usa filtros por categoría para encontrar exactamente lo que necesitas.", // onboardingStep2Description
+  "Crea y gestiona tus trabajos", // onboardingStep3Title
+  "Publica tus propios trabajos o aplica a los de otros. Mantén el control total.", // onboardingStep3Description
+  "¡Listo para empezar!", // onboardingStep4Title
+  "Ya tienes todo para empezar. ¡Bienvenido a la comunidad Currijobs!", // onboardingStep4Description
+  "Categoría", // category
+  "Publicado por", // postedBy
+  "Resumen", // overview
+  "Pagos Recientes", // recentPayments
+  "Trabajos actuales publicados", // currentTasksPosted
+  "Trabajos completados", // totalTasksCompleted
+  "Ganancias de este mes", // earningsThisMonth
+  "Ganancias totales", // lifetimeEarnings
+  "Ver todos los pagos", // viewAllPayments
+  "Pagado por", // paidBy
+  "Cuenta", // account
+  "Preferencias", // preferences
+  "Soporte", // support
+  "Legal", // legal
+  "Editar Perfil", // editProfile
+  "Actualiza tu información personal", // editProfileSubtitle
+  "Verificación de Identidad", // identityVerification
+  "Verifica tu identidad para mayor confianza", // identityVerificationSubtitle
+  "Métodos de Pago", // paymentMethods
+  "Administra tus opciones de pago", // paymentMethodsSubtitle
+  "Notificaciones Push", // pushNotifications
+  "Recibe avisos de nuevos trabajos y ofertas", // pushNotificationsSubtitle
+  "Servicios de Ubicación", // locationServices
+  "Permite el acceso a tu ubicación para trabajos cercanos", // locationServicesSubtitle
+  "Configuración de la App", // appSettings
+  "Idioma, tema y accesibilidad", // appSettingsSubtitle
+  "Centro de Ayuda", // helpCenter
+  "Obtén ayuda y respuestas", // helpCenterSubtitle
+  "Contactar Soporte", // contactSupport
+  "Comunícate con nuestro equipo de soporte", // contactSupportSubtitle
+  "Enviar Comentarios", // sendFeedback
+  "Ayúdanos a mejorar la app", // sendFeedbackSubtitle
+  "Política de Privacidad", // privacyPolicy
+  "Cómo protegemos tus datos", // privacyPolicySubtitle
+  "Términos de Servicio", // termsOfService
+  "Nuestros términos y condiciones", // termsOfServiceSubtitle
+  "Cierra la sesión de tu cuenta", // signOutSubtitle
+  "Modo de tema", // themeMode
+  "Modo claro", // lightMode
+  "Modo oscuro", // darkMode
+  "Soporte daltonismo", // colorblindSupport
+  "Tema personalizado", // customTheme
+  "Personalizar tema", // customizeTheme
+  "Abrir personalizador de tema", // openThemeCustomizer
+  "Colores personalizados", // customColorsLabel
+  "Elige tu propia paleta de colores", // chooseCustomColors
+  "Tema predeterminado", // defaultThemeLabel
+  "Usar paleta del sistema", // useSystemPalette
+  "Visión normal", // colorblindNormal
+  "Protanopia", // colorblindProtanopia
+  "Deuteranopia", // colorblindDeuteranopia
+  "Tritanopia", // colorblindTritanopia
+  "Colores estándar", // colorblindStandardColors
+  "Colores optimizados para visión normal", // colorblindNormalDesc
+  "Colores adaptados para dificultad con rojo-verde", // colorblindProtanopiaDesc
+  "Colores adaptados para dificultad con rojo-verde", // colorblindDeuteranopiaDesc
+  "Colores adaptados para dificultad con azul-amarillo", // colorblindTritanopiaDesc
+  "Tu Rango", // yourRank
+  "Insignias", // badgesLabel
+  "Historial de Reseñas", // reviewsHistory
+  "Cómo subir de rango", // howToRankUp
+  "• Completa más tareas y mantén una calificación alta.", // tipCompleteHighRating
+  "• Varía las categorías para optar por “Maestro de Categoría”.", // tipVaryCategories
+  "• Participa en eventos especiales para insignias de temporada.", // tipParticipateEvents
+  "Progreso", // progress
+  "Promedio", // averageRating
+  "Pago", // payment
+  "Cliente", // client
+  "Abierta", // openStatus
+  "En progreso", // inProgressStatus
+  "Completada", // completedStatus
+  "Cancelada", // cancelledStatus
+];
+
+export default messages;
@@ -0,0 +1,253 @@
+// Generated by `python -m currijobs_harness compile-locales` from lib/localization.ts; do not edit
+import type { LocalizationStrings } from '../localization';
+
+export const MESSAGE_IDS: Record<keyof LocalizationStrings, number> = {
+  appName: 0,
+  appSubtitle: 1,
+  tasksNearYou: 2,
+  taskList: 3,
+  createTask: 4,
+  profile: 5,
+  settings: 6,
+  email: 7,
+  password: 8,
+  login: 9,
+  logout: 10,
+  signUp: 11,
+  forgotPassword: 12,
+  autoLoginInProgress: 13,
+  loggingIn: 14,
+  all: 15,
+  plumbing: 16,
+  electrician: 17,
+  carpentry: 18,
+  painting: 19,
+  applianceRepair: 20,
+  cleaning: 21,
+  laundryIroning: 22,
+  cooking: 23,
+  groceryShopping: 24,
+  petCare: 25,
+  gardening: 26,
+  movingHelp: 27,
+  trashRemoval: 28,
+  windowWashing: 29,
+  babysitting: 30,
+  elderlyCare: 31,
+  tutoring: 32,
+  deliveryErrands: 33,
+  techSupport: 34,
+  photography: 35,
+  taskTitle: 36,
+  taskDescription: 37,
+  taskCategory: 38,
+  taskReward: 39,
+  taskLocation: 40,
+  taskTimeEstimate: 41,
+  taskDistance: 42,
+  taskStatus: 43,
+  taskCreatedAt: 44,
+  viewDetails: 45,
+  submitOffer: 46,
+  makeOffer: 47,
+  acceptOffer: 48,
+  rejectOffer: 49,
+  completeTask: 50,
+  cancelTask: 51,
+  selectWorker: 52,
+  offers: 53,
+  proposedReward: 54,
+  offerMessage: 55,
+  assign: 56,
+  myCreatedTasks: 57,
+  myTasks: 58,
+  longPressMapToCreate: 59,
+  createNewTask: 60,
+  myCreatedInProgress: 61,
+  assignedToMe: 62,
+  searchPlaceholder: 63,
+  searchTasks: 64,
+  searchCategories: 65,
+  searchLocations: 66,
+  filterByCategory: 67,
+  clearSearch: 68,
+  noResultsFound: 69,
+  nearby: 70,
+  confirmCancellation: 71,
+  cancelTaskConfirmation: 72,
+  couldNotCancelTask: 73,
+  confirmCancel: 74,
+  aiRecommendations: 75,
+  recommendedForYou: 76,
+  basedOnYourLocation: 77,
+  basedOnYourHistory: 78,
+  mapView: 79,
+  listView: 80,
+  yourLocation: 81,
+  nearbyTasks: 82,
+  kilometersAway: 83,
+  milesAway: 84,
+  goHome: 85,
+  longPressToDropPin: 86,
+  close: 87,
+  cancel: 88,
+  confirm: 89,
+  back: 90,
+  save: 91,
+  delete: 92,
+  edit: 93,
+  loading: 94,
+  findingTasksNearYou: 95,
+  noTasksFound: 96,
+  errorOccurred: 97,
+  tryAgain: 98,
+  networkError: 99,
+  currency: 100,
+  reward: 101,
+  price: 102,
+  total: 103,
+  timeEstimate: 104,
+  timeNotSpecified: 105,
+  hours: 106,
+  minutes: 107,
+  days: 108,
+  location: 109,
+  address: 110,
+  coordinates: 111,
+  distance: 112,
+  userName: 113,
+  name: 114,
+  phone: 115,
+  rating: 116,
+  reviews: 117,
+  completedTasks: 118,
+  memberSince: 119,
+  language: 120,
+  theme: 121,
+  notifications: 122,
+  privacy: 123,
+  help: 124,
+  about: 125,
+  newTaskNearby: 126,
+  offerReceived: 127,
+  offerAccepted: 128,
+  offerRejected: 129,
+  taskCompleted: 130,
+  paymentReceived: 131,
+  invalidEmail: 132,
+  invalidPassword: 133,
+  networkConnectionError: 134,
+  locationPermissionDenied: 135,
+  cameraPermissionDenied: 136,
+  taskCreatedSuccessfully: 137,
+  offerSubmittedSuccessfully: 138,
+  profileUpdatedSuccessfully: 139,
+  settingsSavedSuccessfully: 140,
+  errorFetchingTasks: 141,
+  errorCreatingTask: 142,
+  success: 143,
+  getStarted: 144,
+  welcomeToCurriJobs: 145,
+  connectingWorkersAndClients: 146,
+  createAccount: 147,
+  continueWithGoogle: 148,
+  continueWithApple: 149,
+  termsAndPrivacy: 150,
+  joinCurriJobs: 151,
+  createAccountToGetStarted: 152,
+  fullName: 153,
+  confirmPassword: 154,
+  creatingAccount: 155,
+  alreadyHaveAccount: 156,
+  loginToContinue: 157,
+  loginFailed: 158,
+  skipToDemo: 159,
+  skipToApp: 160,
+  error: 161,
+  next: 162,
+  previous: 163,
+  letsGo: 164,
+  skipOnboarding: 165,
+  onboardingStep1Title: 166,
+  onboardingStep1Description: 167,
+  onboardingStep2Title: 168,
+  onboardingStep2Description: 169,
+  onboardingStep3Title: 170,
+  onboardingStep3Description: 171,
+  onboardingStep4Title: 172,
+  onboardingStep4Description: 173,
+  category: 174,
+  postedBy: 175,
+  overview: 176,
+  recentPayments: 177,
+  currentTasksPosted: 178,
+  totalTasksCompleted: 179,
+  earningsThisMonth: 180,
+  lifetimeEarnings: 181,
+  viewAllPayments: 182,
+  paidBy: 183,
+  account: 184,
+  preferences: 185,
+  support: 186,
+  legal: 187,
+  editProfile: 188,
+  editProfileSubtitle: 189,
+  identityVerification: 190,
+  identityVerificationSubtitle: 191,
+  paymentMethods: 192,
+  paymentMethodsSubtitle: 193,
+  pushNotifications: 194,
+  pushNotificationsSubtitle: 195,
+  locationServices: 196,
+  locationServicesSubtitle: 197,
+  appSettings: 198,
+  appSettingsSubtitle: 199,
+  helpCenter: 200,
+  helpCenterSubtitle: 201,
+  contactSupport: 202,
+  contactSupportSubtitle: 203,
+  sendFeedback: 204,
+  sendFeedbackSubtitle: 205,
+  privacyPolicy: 206,
+  privacyPolicySubtitle: 207,
+  termsOfService: 208,
+  termsOfServiceSubtitle: 209,
+  signOutSubtitle: 210,
+  themeMode: 211,
+  lightMode: 212,
+  darkMode: 213,
+  colorblindSupport: 214,
+  customTheme: 215,
+  customizeTheme: 216,
+  openThemeCustomizer: 217,
+  customColorsLabel: 218,
+  chooseCustomColors: 219,
+  defaultThemeLabel: 220,
+  useSystemPalette: 221,
+  colorblindNormal: 222,
+  colorblindProtanopia: 223,
+  colorblindDeuteranopia: 224,
+  colorblindTritanopia: 225,
+  colorblindStandardColors: 226,
+  colorblindNormalDesc: 227,
+  colorblindProtanopiaDesc: 228,
+  colorblindDeuteranopiaDesc: 229,
+  colorblindTritanopiaDesc: 230,
+  yourRank: 231,
+  badgesLabel: 232,
+  reviewsHistory: 233,
+  howToRankUp: 234,
+  tipCompleteHighRating: 235,
+  tipVaryCategories: 236,
+  tipParticipateEvents: 237,
+  progress: 238,
+  averageRating: 239,
+  payment: 240,
+  client: 241,
+  openStatus: 242,
+  inProgressStatus: 243,
+  completedStatus: 244,
+  cancelledStatus: 245,
+};
+
+export const MESSAGE_COUNT = 246;
@@ -0,0 +1,251 @@
+// Generated by `python -m currijobs_harness compile-locales` from lib/locales/messages/zh.json; do not edit
+const messages: (string | null)[] = [
+  "CurriJobs", // appName
+  "在您附近找到任务", // appSubtitle
+  "附近的任务", // tasksNearYou
+  "列表", // taskList
+  "创建", // createTask
+  "个人资料", // profile
+  "设置", // settings
+  "邮箱", // email
+  "密码", // password
+  "登录", // login
+  "登出", // logout
+  "注册", // signUp
+  "忘记密码？", // forgotPassword
+  "自动登录进行中...", // autoLoginInProgress
+  "登录中...", // loggingIn
+  "全部", // all
+  "管道工", // plumbing
+  "电工", // electrician
+  "木工", // carpentry
+  "油漆工", // painting
+  "家电维修", // applianceRepair
+  "清洁", // cleaning
+  "洗衣熨烫", // laundryIroning
+  "烹饪", // cooking
+  "杂货购物", // groceryShopping
+  "宠物护理", // petCare
+  "园艺", // gardening
+  "搬家帮助", // movingHelp
+  "垃圾清理", // trashRemoval
+  "窗户清洁", // windowWashing
+  "保姆", // babysitting
+  "老人护理", // elderlyCare
+  "辅导", // tutoring
+  "送货跑腿", // deliveryErrands
+  "技术支持", // techSupport
+  "摄影", // photography
+  "任务标题", // taskTitle
+  "描述", // taskDescription
+  "类别", // taskCategory
+  "报酬", // taskReward
+  "位置", // taskLocation
+  "时间估算", // taskTimeEstimate
+  "距离", // taskDistance
+  "状态", // taskStatus
+  "创建时间", // taskCreatedAt
+  "查看详情", // viewDetails
+  "提交报价", // submitOffer
+  "出价", // makeOffer
+  "接受报价", // acceptOffer
+  "拒绝报价", // rejectOffer
+  "完成任务", // completeTask
+  "取消任务", // cancelTask
+  null, // selectWorker
+  null, // offers
+  null, // proposedReward
+  null, // offerMessage
+  null, // assign
+  "我创建的任务", // myCreatedTasks
+  "我的任务", // myTasks
+  "长按地图创建新任务", // longPressMapToCreate
+  "创建新任务", // createNewTask
+  null, // myCreatedInProgress
+  null, // assignedToMe
+  "搜索任务、类别或位置...", // searchPlaceholder
+  "搜索任务", // searchTasks
+  "搜索类别", // searchCategories
+  "搜索位置", // searchLocations
+  "按类别筛选", // filterByCategory
+  "清除搜索", // clearSearch
+  "未找到结果", // noResultsFound
+  "附近", // nearby
+  "确认取消", // confirmCancellation
+  "您确定要取消此任务吗？此操作无法撤销。", // cancelTaskConfirmation
+  "无法取消任务", // couldNotCancelTask
+  "确认", // confirmCancel
+  "AI推荐", // aiRecommendations
+  "为您推荐", // recommendedForYou
+  "基于您的位置", // basedOnYourLocation
+  "基于您的历史", // basedOnYourHistory
+  "地图视图", // mapView
+  "列表视图", // listView
+  "您的位置", // yourLocation
+  "附近的任务", // nearbyTasks
+  "公里远", // kilometersAway
+  "英里远", // milesAway
+  "回家", // goHome
+  "长按以放置/移动图钉", // longPressToDropPin
+  "关闭", // close
+  "取消", // cancel
+  "确认", // confirm
+  null, // back
+  "保存", // save
+  "删除", // delete
+  "编辑", // edit
+  "加载中...", // loading
+  "正在查找您附近的任务...", // findingTasksNearYou
+  "未找到任务", // noTasksFound
+  "发生错误", // errorOccurred
+  "重试", // tryAgain
+  "网络错误", // networkError
+  "¥", // currency
+  "报酬", // reward
+  "价格", // price
+  "总计", // total
+  "时间估算", // timeEstimate
+  "未指定时间", // timeNotSpecified
+  "小时", // hours
+  "分钟", // minutes
+  "天", // days
+  "位置", // location
+  "地址", // address
+  "坐标", // coordinates
+  "距离", // distance
+  "个人资料", // userName
+  "姓名", // name
+  "电话", // phone
+  "评分", // rating
+  "评论", // reviews
+  "已完成的任务", // completedTasks
+  "注册时间", // memberSince
+  "语言", // language
+  "主题", // theme
+  "通知", // notifications
+  "隐私", // privacy
+  "帮助", // help
+  "关于", // about
+  "附近有新任务", // newTaskNearby
+  "收到报价", // offerReceived
+  "报价已接受", // offerAccepted
+  "报价已拒绝", // offerRejected
+  "任务已完成", // taskCompleted
+  "已收到付款", // paymentReceived
+  "邮箱无效", // invalidEmail
+  "密码无效", // invalidPassword
+  "网络连接错误", // networkConnectionError
+  "位置权限被拒绝", // locationPermissionDenied
+  "相机权限被拒绝", // cameraPermissionDenied
+  "任务创建成功", // taskCreatedSuccessfully
+  "报价提交成功", // offerSubmittedSuccessfully
+  "个人资料更新成功", // profileUpdatedSuccessfully
+  "设置保存成功", // settingsSavedSuccessfully
+  "获取任务时出错", // errorFetchingTasks
+  "创建任务时出错", // errorCreatingTask
+  "成功", // success
+  "开始使用", // getStarted
+  "欢迎使用 CurriJobs", // welcomeToCurriJobs
+  "连接值得信赖的工人和客户。", // connectingWorkersAndClients
+  "创建账户", // createAccount
+  "使用 Google 继续", // continueWithGoogle
+  "使用 Apple 继续", // continueWithApple
+  "注册即表示您同意我们的条款和隐私政策", // termsAndPrivacy
+  "加入 CurriJobs！", // joinCurriJobs
+  "创建您的账户开始使用", // createAccountToGetStarted
+  "全名", // fullName
+  "确认密码", // confirmPassword
+  "创建账户中...", // creatingAccount
+  "已有账户？", // alreadyHaveAccount
+  "登录继续", // loginToContinue
+  "登录失败", // loginFailed
+  "跳转到演示", // skipToDemo
+  "进入应用", // skipToApp
+  "错误", // error
+  "下一步", // next
+  "上一步", // previous
+  "开始吧！", // letsGo
+  "跳过介绍", // skipOnboarding
+  "探索附近的职位", // onboardingStep1Title
+  "使用地图查找您附近的职位。每个标记都是一个机会。", // onboardingStep1Description
+  "按类别筛选", // onboardingStep2Title
+  "使用类别筛选器找到您需要的确切内容。", // onboardingStep2Description
+  "创建和管理您的职位", // onboardingStep3Title
+  "发布您自己的职位或申请其他职位。保持完全控制。", // onboardingStep3Description
+  "准备开始！", // onboardingStep4Title
+  "您已准备就绪。欢迎加入 Currijobs 社区！", // onboardingStep4Description
+  "类别", // category
+  null, // postedBy
+  "概览", // overview
+  "最近付款", // recentPayments
+  "当前发布的任务", // currentTasksPosted
+  "完成的任务总数", // totalTasksCompleted
+  "本月收入", // earningsThisMonth
+  "累计收入", // lifetimeEarnings
+  "查看所有付款", // viewAllPayments
+  "付款方", // paidBy
+  "账户", // account
+  "偏好", // preferences
+  "支持", // support
+  "法律", // legal
+  "编辑资料", // editProfile
+  "更新您的个人信息", // editProfileSubtitle
+  "身份验证", // identityVerification
+  "验证身份以提高信任度", // identityVerificationSubtitle
+  "支付方式", // paymentMethods
+  "管理您的支付选项", // paymentMethodsSubtitle
+  "推送通知", // pushNotifications
+  "接收新任务和报价通知", // pushNotificationsSubtitle
+  "定位服务", // locationServices
+  "允许访问您的位置以查看附近任务", // locationServicesSubtitle
+  "应用设置", // appSettings
+  "语言、主题和无障碍", // appSettingsSubtitle
+  "帮助中心", // helpCenter
+  "获取帮助和答案", // helpCenterSubtitle
+  "联系支持", // contactSupport
+  "联系技术支持团队", // contactSupportSubtitle
+  "发送反馈", // sendFeedback
+  "帮助我们改进应用", // sendFeedbackSubtitle
+  "隐私政策", // privacyPolicy
+  "我们如何保护您的数据", // privacyPolicySubtitle
+  "服务条款", // termsOfService
+  "我们的条款和条件", // termsOfServiceSubtitle
+  "退出您的账户", // signOutSubtitle
+  "主题模式", // themeMode
+  "浅色模式", // lightMode
+  "深色模式", // darkMode
+  "色盲支持", // colorblindSupport
+  "自定义主题", // customTheme
+  "自定义主题", // customizeTheme
+  "打开主题定制器", // openThemeCustomizer
+  "自定义颜色", // customColorsLabel
+  "选择您自己的配色方案", // chooseCustomColors
+  "默认主题", // defaultThemeLabel
+  "使用系统配色", // useSystemPalette
+  "正常视觉", // colorblindNormal
+  "红色盲", // colorblindProtanopia
+  "绿色盲", // colorblindDeuteranopia
+  "蓝黄色盲", // colorblindTritanopia
+  "标准颜色", // colorblindStandardColors
+  "为正常视觉优化的颜色", // colorblindNormalDesc
+  "为红绿色盲适配的颜色", // colorblindProtanopiaDesc
+  "为红绿色盲适配的颜色", // colorblindDeuteranopiaDesc
+  "为蓝黄色盲适配的颜色", // colorblindTritanopiaDesc
+  "你的等级", // yourRank
+  "徽章", // badgesLabel
+  "评价历史", // reviewsHistory
+  "如何提升等级", // howToRankUp
+  "• 完成更多任务并保持高评分。", // tipCompleteHighRating
+  "• 多尝试不同类别以获得“类别大师”。", // tipVaryCategories
+  "• 参加季节性活动以获取特殊徽章。", // tipParticipateEvents
+  "进度", // progress
+  "平均评分", // averageRating
+  "付款", // payment
+  "客户", // client
+  "开放", // openStatus
+  "进行中", // inProgressStatus
+  "已完成", // completedStatus
+  "已取消", // cancelledStatus
+];
+
+export default messages;
@@ -1,5 +1,8 @@
 // Location utilities for address autocomplete and geocoding
 
+import { geocodeCache, normalizeQuery, placeKey, reverseKey } from './geocode-cache';
+import { getIndexedPlace, searchPlaces, PlaceMatch } from './place-index';
+
 export interface AddressSuggestion {
   id: string;
   description: string;
@@ -79,58 +82,75 @@ const isDemoMode = () => {
   return process.env.EXPO_PUBLIC_DEMO_MODE === 'true' || process.env.NODE_ENV === 'development';
 };
 
-// Get address suggestions based on input
-export const getAddressSuggestions = async (input: string): Promise<AddressSuggestion[]> => {
-  if (isDemoMode()) {
-    // Return mock suggestions based on input
-    const filtered = MOCK_ADDRESSES.filter(addr => 
-      addr.description.toLowerCase().includes(input.toLowerCase()) ||
-      addr.structured_formatting.main_text.toLowerCase().includes(input.toLowerCase())
-    );
-    return filtered.slice(0, 5); // Limit to 5 results
-  }
+const SUGGESTION_LIMIT = 5;
 
+const suggestionMatches = (addr: AddressSuggestion, normalized: string) =>
+  normalizeQuery(addr.description).includes(normalized) ||
+  normalizeQuery(addr.structured_formatting.main_text).includes(normalized);
+
+// Provider lookups (mock data until the Google APIs are wired); callers go through the cache
+const fetchSuggestions = async (input: string): Promise<AddressSuggestion[]> => {
   // TODO: Implement real Google Places API
-  // For now, return mock data
-  return MOCK_ADDRESSES.filter(addr => 
-    addr.description.toLowerCase().includes(input.toLowerCase())
-  ).slice(0, 5);
+  const normalized = normalizeQuery(input);
+  return MOCK_ADDRESSES.filter(addr => suggestionMatches(addr, normalized)).slice(0, SUGGESTION_LIMIT);
 };
 
-// Geocode an address to get coordinates
-export const geocodeAddress = async (placeId: string): Promise<GeocodingResult | null> => {
-  if (isDemoMode()) {
-    return MOCK_GEOCODING[placeId] || null;
-  }
-
+const fetchGeocode = async (placeId: string): Promise<GeocodingResult | null> => {
   // TODO: Implement real Google Geocoding API
-  // For now, return mock data
   return MOCK_GEOCODING[placeId] || null;
 };
 
-// Reverse geocode coordinates to get address
-export const reverseGeocode = async (latitude: number, longitude: number): Promise<string | null> => {
-  if (isDemoMode()) {
-    // Find the closest mock location
-    let closest: string | null = null;
-    let minDistance = Infinity;
-    
-    Object.entries(MOCK_GEOCODING).forEach(([_placeId, result]) => {
-      const distance = Math.sqrt(
-        Math.pow(result.latitude - latitude, 2) + 
-        Math.pow(result.longitude - longitude, 2)
-      );
-      if (distance < minDistance) {
-        minDistance = distance;
-        closest = result.address;
-      }
-    });
-    
-    return closest;
+const fetchReverseGeocode = async (latitude: number, longitude: number): Promise<string | null> => {
+  if (!isDemoMode()) {
+    // TODO: Implement real reverse geocoding
+    return null;
+  }
+  // Closest mock location (squared distance is enough to compare)
+  let closest: string | null = null;
+  let minDistance = Infinity;
+  for (const result of Object.values(MOCK_GEOCODING)) {
+    const dLat = result.latitude - latitude;
+    const dLon = result.longitude - longitude;
+    const distance = dLat * dLat + dLon * dLon;
+    if (distance < minDistance) {
+      minDistance = distance;
+      closest = result.address;
+    }
+  }
+  return closest;
+};
+
+const toSuggestion = (place: PlaceMatch): AddressSuggestion => ({
+  id: place.placeId,
+  description: place.description,
+  place_id: place.placeId,
+  structured_formatting: {
+    main_text: place.name,
+    secondary_text: place.description.slice(place.name.length + 2),
+  },
+});
+
+// Get address suggestions based on input: the offline place index first,
+// then the provider (cached per normalized prefix) for anything it lacks
+export const getAddressSuggestions = async (input: string): Promise<AddressSuggestion[]> => {
+  if (!normalizeQuery(input)) return [];
+  const local = searchPlaces(input, SUGGESTION_LIMIT);
+  if (local.length > 0) return local.map(toSuggestion);
+  return geocodeCache.getSuggestions(input, SUGGESTION_LIMIT, suggestionMatches, () => fetchSuggestions(input));
+};
+
+// Geocode an address to get coordinates
+export const geocodeAddress = async (placeId: string): Promise<GeocodingResult | null> => {
+  const indexed = getIndexedPlace(placeId);
+  if (indexed) {
+    return { latitude: indexed.latitude, longitude: indexed.longitude, address: indexed.description };
   }
+  return geocodeCache.getOrLoad(placeKey(placeId), () => fetchGeocode(placeId));
+};
 
-  // TODO: Implement real reverse geocoding
-  return null;
+// Reverse geocode coordinates to get address (cached per ~110 m cell)
+export const reverseGeocode = async (latitude: number, longitude: number): Promise<string | null> => {
+  return geocodeCache.getOrLoad(reverseKey(latitude, longitude), () => fetchReverseGeocode(latitude, longitude));
 };
 
 // Calculate distance between two points
@@ -0,0 +1,79 @@
+// Offline place autocomplete over assets/data/cr-places-index.json
+//
+// The artifact is built by `python -m currijobs_harness place-index` from
+// assets/data/cr-gazetteer.csv. Keys are accent-folded and sorted, places are
+// ordered by popularity, so a prefix lookup is one binary search plus a scan
+// of the matching key range keeping the smallest place ids.
+
+import { normalizeQuery } from './geocode-cache';
+
+type PlaceIndex = {
+  version: number;
+  places: [string, string, number, number][]; // name, description, latitude, longitude
+  keys: string[];
+  ids: number[];
+};
+
+export type PlaceMatch = {
+  placeId: string;
+  name: string;
+  description: string;
+  latitude: number;
+  longitude: number;
+};
+
+const PLACE_ID_PREFIX = 'cr:';
+
+let index: PlaceIndex | null = null;
+
+// Loaded on first use so the JSON is not parsed during startup
+const getIndex = (): PlaceIndex => {
+  if (!index) {
+    index = require('../assets/data/cr-places-index.json') as PlaceIndex;
+  }
+  return index;
+};
+
+const lowerBound = (keys: string[], needle: string): number => {
+  let lo = 0;
+  let hi = keys.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (keys[mid] < needle) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+};
+
+const toMatch = (idx: PlaceIndex, placeId: number): PlaceMatch => {
+  const [name, description, latitude, longitude] = idx.places[placeId];
+  return { placeId: `${PLACE_ID_PREFIX}${placeId}`, name, description, latitude, longitude };
+};
+
+// Best `limit` places whose name, later word or alias starts with the query
+export const searchPlaces = (query: string, limit: number = 5): PlaceMatch[] => {
+  const needle = normalizeQuery(query);
+  if (!needle) return [];
+  const idx = getIndex();
+  const best: number[] = [];
+  for (let i = lowerBound(idx.keys, needle); i < idx.keys.length && idx.keys[i].startsWith(needle); i++) {
+    const placeId = idx.ids[i];
+    if (best.includes(placeId)) continue;
+    if (best.length < limit) {
+      best.push(placeId);
+    } else {
+      const worst = Math.max(...best);
+      if (placeId < worst) best[best.indexOf(worst)] = placeId;
+    }
+  }
+  return best.sort((a, b) => a - b).map((placeId) => toMatch(idx, placeId));
+};
+
+export const isIndexedPlaceId = (placeId: string): boolean => placeId.startsWith(PLACE_ID_PREFIX);
+
+export const getIndexedPlace = (placeId: string): PlaceMatch | null => {
+  if (!isIndexedPlaceId(placeId)) return null;
+  const idx = getIndex();
+  const id = Number(placeId.slice(PLACE_ID_PREFIX.length));
+  return Number.isInteger(id) && id >= 0 && id < idx.places.length ? toMatch(idx, id) : null;
+};
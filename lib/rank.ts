@@ -135,11 +135,17 @@ export function computeEarnedBadges(profileLike: {
   if (completed >= 1) earned.add('first-job');
   if (completed >= 100) earned.add('hundred-wins');
   if (rating >= 5 && completed >= 10) earned.add('five-stars');
-  // The rest require telemetry we don’t track yet; leave locked by default
+  // The rest need event history; the server-side badge engine awards them (see toEarnedBadges)
 
   return BADGES.map(b => ({ id: b.id, earned: earned.has(b.id), earnedAt: earned.has(b.id) ? now : undefined }));
 }
 
+// Persisted badges from the server (user_badges) in the same shape as computeEarnedBadges
+export function toEarnedBadges(rows: { badge_id: string; earned_at: string }[]): EarnedBadge[] {
+  const earnedAt = new Map(rows.map(r => [r.badge_id, r.earned_at]));
+  return BADGES.map(b => ({ id: b.id, earned: earnedAt.has(b.id), earnedAt: earnedAt.get(b.id) }));
+}
+
 export function mapProfileToProgress(profile: EnhancedUserProfile | (Partial<EnhancedUserProfile> & { id: string; xp?: number })): {
   level: number;
   rank: RankDefinition;
@@ -158,7 +164,11 @@ export function mapProfileToProgress(profile: EnhancedUserProfile | (Partial<Enh
   return { level, rank, progress, color };
 }
 
-
-
-
-
+// Server-maintained progress (user_progress.level/xp from the rank engine)
+export function mapStoredProgress(stored: { level: number; xp: number }): ReturnType<typeof mapProfileToProgress> {
+  const level = Math.max(1, Math.min(120, Math.floor(stored.level || 1)));
+  const rank = getRankForLevel(level);
+  const progress = getLevelProgressWithinRank(level, stored.xp);
+  const color = getRankColor(rank.name);
+  return { level, rank, progress, color };
+}
@@ -0,0 +1,214 @@
+// Validation for lists of rows coming back from PostgREST
+//
+//   full      every row through its Zod schema (dev and tests)
+//   sampled   every row's column signature plus every Nth row through the
+//             compiled validator; any mismatch re-checks the whole batch
+//   compiled  every row through the compiled validator
+//
+// compileSchema walks a z.object once and returns a plain predicate, so the
+// hot list shapes skip Zod's per-row parse context and output copy. Rows are
+// returned as-is (never the parsed copy) so all modes hand back the same objects.
+
+import { z } from 'zod';
+import { OfferRowSchema, TaskRowSchema } from './schemas';
+
+export type ValidationMode = 'full' | 'sampled' | 'compiled';
+
+export type RowValidator = (row: unknown) => boolean;
+
+export type ListShape = {
+  name: string;
+  schema: z.AnyZodObject;
+  check: RowValidator;
+};
+
+export type ValidationOptions = {
+  mode?: ValidationMode;
+  sampleEvery?: number;
+};
+
+const DEFAULT_SAMPLE_EVERY = 25;
+const MODES: ValidationMode[] = ['full', 'sampled', 'compiled'];
+const Kind = z.ZodFirstPartyTypeKind;
+const UUID_RE = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
+
+const defaultMode = (): ValidationMode => {
+  const configured = process.env.EXPO_PUBLIC_ROW_VALIDATION as ValidationMode | undefined;
+  if (configured && MODES.includes(configured)) return configured;
+  const dev = typeof __DEV__ !== 'undefined' && __DEV__;
+  return dev || process.env.NODE_ENV === 'test' ? 'full' : 'sampled';
+};
+
+let currentMode: ValidationMode = defaultMode();
+// Rotates so successive refreshes sample different rows
+let sampleOffset = 0;
+
+export const validationStats = { rows: 0, checked: 0, rejected: 0, escalations: 0 };
+
+export const getValidationMode = (): ValidationMode => currentMode;
+
+export const setValidationMode = (mode: ValidationMode) => {
+  currentMode = mode;
+};
+
+// String checks other than these (datetime, email, url, ...) defer to Zod for the field
+const compileString = (schema: z.ZodString): RowValidator => {
+  const checks: RowValidator[] = [];
+  for (const check of schema._def.checks) {
+    if (check.kind === 'min') checks.push((v) => (v as string).length >= check.value);
+    else if (check.kind === 'max') checks.push((v) => (v as string).length <= check.value);
+    else if (check.kind === 'length') checks.push((v) => (v as string).length === check.value);
+    else if (check.kind === 'uuid') checks.push((v) => UUID_RE.test(v as string));
+    else return (v) => schema.safeParse(v).success;
+  }
+  return (v) => {
+    if (typeof v !== 'string') return false;
+    for (let i = 0; i < checks.length; i++) if (!checks[i](v)) return false;
+    return true;
+  };
+};
+
+const compileNumber = (schema: z.ZodNumber): RowValidator => {
+  const checks: RowValidator[] = [];
+  for (const check of schema._def.checks) {
+    if (check.kind === 'min') {
+      checks.push(check.inclusive ? (v) => (v as number) >= check.value : (v) => (v as number) > check.value);
+    } else if (check.kind === 'max') {
+      checks.push(check.inclusive ? (v) => (v as number) <= check.value : (v) => (v as number) < check.value);
+    } else if (check.kind === 'int') {
+      checks.push((v) => Number.isInteger(v));
+    } else if (check.kind === 'finite') {
+      checks.push((v) => Number.isFinite(v));
+    } else {
+      return (v) => schema.safeParse(v).success;
+    }
+  }
+  return (v) => {
+    if (typeof v !== 'number' || Number.isNaN(v)) return false;
+    for (let i = 0; i < checks.length; i++) if (!checks[i](v)) return false;
+    return true;
+  };
+};
+
+const compileNode = (schema: z.ZodTypeAny): RowValidator => {
+  const def = schema._def;
+  switch (def.typeName) {
+    case Kind.ZodOptional: {
+      const inner = compileNode(def.innerType);
+      return (v) => v === undefined || inner(v);
+    }
+    case Kind.ZodNullable: {
+      const inner = compileNode(def.innerType);
+      return (v) => v === null || inner(v);
+    }
+    case Kind.ZodDefault: {
+      const inner = compileNode(def.innerType);
+      return (v) => v === undefined || inner(v);
+    }
+    case Kind.ZodString:
+      return compileString(schema as z.ZodString);
+    case Kind.ZodNumber:
+      return compileNumber(schema as z.ZodNumber);
+    case Kind.ZodBoolean:
+      return (v) => typeof v === 'boolean';
+    case Kind.ZodEnum: {
+      const values = new Set<unknown>(def.values);
+      return (v) => values.has(v);
+    }
+    case Kind.ZodArray: {
+      if (def.minLength || def.maxLength || def.exactLength) return (v) => schema.safeParse(v).success;
+      const item = compileNode(def.type);
+      return (v) => Array.isArray(v) && v.every(item);
+    }
+    case Kind.ZodObject:
+      return compileSchema(schema as z.AnyZodObject);
+    default:
+      return (v) => schema.safeParse(v).success;
+  }
+};
+
+// Plain predicate accepting exactly what schema.safeParse accepts (unknown keys allowed)
+export const compileSchema = (schema: z.AnyZodObject): RowValidator => {
+  const fields = Object.entries(schema.shape as z.ZodRawShape).map(
+    ([key, field]) => [key, compileNode(field)] as const
+  );
+  return (row) => {
+    if (typeof row !== 'object' || row === null || Array.isArray(row)) return false;
+    const record = row as Record<string, unknown>;
+    for (let i = 0; i < fields.length; i++) {
+      if (!fields[i][1](record[fields[i][0]])) return false;
+    }
+    return true;
+  };
+};
+
+export const defineListShape = (name: string, schema: z.AnyZodObject): ListShape => ({
+  name,
+  schema,
+  check: compileSchema(schema),
+});
+
+const typeOf = (value: unknown): string => (Array.isArray(value) ? 'array' : typeof value);
+
+// Same columns in the same order, and each non-null column keeps one JS type
+const sameShape = (rows: unknown[]): boolean => {
+  if (rows.length === 0) return true;
+  const first = rows[0];
+  if (typeof first !== 'object' || first === null) return false;
+  const columns = Object.keys(first);
+  const signature = columns.join(',');
+  const types: Record<string, string> = {};
+  for (let i = 0; i < rows.length; i++) {
+    const row = rows[i] as Record<string, unknown>;
+    if (typeof row !== 'object' || row === null || Object.keys(row).join(',') !== signature) return false;
+    for (let c = 0; c < columns.length; c++) {
+      const value = row[columns[c]];
+      if (value === null || value === undefined) continue;
+      const type = typeOf(value);
+      const seen = types[columns[c]];
+      if (seen === undefined) types[columns[c]] = type;
+      else if (seen !== type) return false;
+    }
+  }
+  return true;
+};
+
+const rejectInvalid = <T>(shape: ListShape, rows: unknown[], check: RowValidator): T[] => {
+  const valid = rows.filter(check);
+  const rejected = rows.length - valid.length;
+  validationStats.checked += rows.length;
+  if (rejected > 0) {
+    validationStats.rejected += rejected;
+    const bad = rows.find((row) => !check(row));
+    const issue = shape.schema.safeParse(bad);
+    console.warn(`[validation] dropped ${rejected}/${rows.length} ${shape.name} rows`, issue.success ? '' : issue.error.issues[0]);
+  }
+  return valid as T[];
+};
+
+// Rows of a list that satisfy shape; invalid rows are dropped with a warning
+export const validateRows = <T>(shape: ListShape, rows: unknown[], options: ValidationOptions = {}): T[] => {
+  const mode = options.mode ?? currentMode;
+  validationStats.rows += rows.length;
+  if (mode === 'full') {
+    return rejectInvalid<T>(shape, rows, (row) => shape.schema.safeParse(row).success);
+  }
+  if (mode === 'compiled') {
+    return rejectInvalid<T>(shape, rows, shape.check);
+  }
+
+  const every = Math.max(1, options.sampleEvery ?? DEFAULT_SAMPLE_EVERY);
+  // Short lists still get one sampled row
+  const start = sampleOffset++ % Math.min(every, Math.max(rows.length, 1));
+  let suspect = !sameShape(rows);
+  for (let i = start; !suspect && i < rows.length; i += every) {
+    validationStats.checked++;
+    if (!shape.check(rows[i])) suspect = true;
+  }
+  if (!suspect) return rows as T[];
+  validationStats.escalations++;
+  return rejectInvalid<T>(shape, rows, shape.check);
+};
+
+export const TASK_ROWS = defineListShape('tasks', TaskRowSchema);
+export const OFFER_ROWS = defineListShape('offers', OfferRowSchema);
@@ -141,6 +141,49 @@ export const PaymentSchema = BaseSchema.extend({
   job_longitude: z.number().min(-180).max(180).optional(),
 });
 
+// Row schemas: list shapes as PostgREST returns them. Timestamps carry a UTC
+// offset and unset columns come back as null, so these are looser than the
+// form schemas above. Validated through lib/row-validation.ts.
+const RowTimestampSchema = z.string().datetime({ offset: true });
+
+export const TaskRowSchema = z.object({
+  id: z.string().uuid(),
+  title: z.string().min(1).max(200),
+  description: z.string().max(2000).nullish(),
+  category: z.string().nullish(),
+  reward: z.number().min(0).max(1000000).nullish(),
+  location: z.string().nullish(),
+  latitude: z.number().min(-90).max(90).nullish(),
+  longitude: z.number().min(-180).max(180).nullish(),
+  status: TaskStatusSchema.nullish(),
+  user_id: z.string().uuid().nullish(),
+  assigned_to: z.string().uuid().nullish(),
+  created_at: RowTimestampSchema.nullish(),
+  updated_at: RowTimestampSchema.nullish(),
+  deadline: RowTimestampSchema.nullish(),
+  time_estimate: z.string().nullish(),
+  images: z.array(z.string()).nullish(),
+  tags: z.array(z.string()).nullish(),
+  priority: z.enum(['low', 'medium', 'high']).nullish(),
+  is_urgent: z.boolean().nullish(),
+  completed_at: RowTimestampSchema.nullish(),
+});
+
+export const OfferRowSchema = z.object({
+  id: z.string().uuid(),
+  task_id: z.string().uuid(),
+  user_id: z.string().uuid(),
+  proposed_reward: z.number().min(0).max(1000000),
+  message: z.string(),
+  status: OfferStatusSchema.nullish(),
+  accepted_at: RowTimestampSchema.nullish(),
+  completed_at: RowTimestampSchema.nullish(),
+  rating: z.number().int().min(1).max(5).nullish(),
+  review: z.string().nullish(),
+  created_at: RowTimestampSchema.nullish(),
+  updated_at: RowTimestampSchema.nullish(),
+});
+
 // Search and Filter schemas
 export const TaskSearchSchema = z.object({
   query: z.string().optional(),
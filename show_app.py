@@ -6,8 +6,6 @@ Show CurriJobs App Access
 import requests
 import time
 import webbrowser
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 
 def check_expo_ports():
     """Check which ports Expo is using"""
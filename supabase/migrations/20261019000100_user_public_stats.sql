@@ -0,0 +1,258 @@
+-- Precomputed public user stats for the map overlay and task detail card
+-- Replaces fetchUserProfile + fetchPaymentsCountsForUser (two full id scans
+-- over payments) with one primary-key lookup via get_user_public_card()
+
+-- 1. Stats table, one row per user, maintained by triggers below
+CREATE TABLE IF NOT EXISTS user_public_stats (
+  user_id UUID PRIMARY KEY REFERENCES auth.users(id) ON DELETE CASCADE,
+  jobs_completed INTEGER NOT NULL DEFAULT 0,
+  payments_made INTEGER NOT NULL DEFAULT 0,
+  payments_received INTEGER NOT NULL DEFAULT 0,
+  rating_sum INTEGER NOT NULL DEFAULT 0,
+  review_count INTEGER NOT NULL DEFAULT 0,
+  avg_rating DECIMAL(3, 2) GENERATED ALWAYS AS (
+    CASE WHEN review_count > 0 THEN ROUND(rating_sum::numeric / review_count, 2) ELSE 0 END
+  ) STORED,
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+ALTER TABLE user_public_stats ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "User public stats are viewable by everyone" ON user_public_stats;
+CREATE POLICY "User public stats are viewable by everyone" ON user_public_stats
+  FOR SELECT USING (true);
+
+-- 2. Delta helper: upsert-and-add so concurrent writers serialize on one row
+CREATE OR REPLACE FUNCTION bump_user_public_stats(
+  p_user_id UUID,
+  p_jobs INTEGER DEFAULT 0,
+  p_made INTEGER DEFAULT 0,
+  p_received INTEGER DEFAULT 0,
+  p_rating_sum INTEGER DEFAULT 0,
+  p_reviews INTEGER DEFAULT 0
+)
+RETURNS VOID AS $$
+BEGIN
+  IF p_user_id IS NULL THEN
+    RETURN;
+  END IF;
+  INSERT INTO user_public_stats AS s (user_id, jobs_completed, payments_made, payments_received, rating_sum, review_count)
+  VALUES (p_user_id, GREATEST(p_jobs, 0), GREATEST(p_made, 0), GREATEST(p_received, 0), GREATEST(p_rating_sum, 0), GREATEST(p_reviews, 0))
+  ON CONFLICT (user_id) DO UPDATE SET
+    jobs_completed = GREATEST(s.jobs_completed + p_jobs, 0),
+    payments_made = GREATEST(s.payments_made + p_made, 0),
+    payments_received = GREATEST(s.payments_received + p_received, 0),
+    rating_sum = GREATEST(s.rating_sum + p_rating_sum, 0),
+    review_count = GREATEST(s.review_count + p_reviews, 0),
+    updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Triggers are statement-level with transition tables: a bulk insert of N
+-- payments for one user is one upsert on that user's row, not N updates
+-- piling up versions of the same row inside a single transaction
+
+-- 3. Payments: count every row per payer and payee (same as the old client count)
+CREATE OR REPLACE FUNCTION user_public_stats_on_payment()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    PERFORM bump_user_public_stats(d.user_id, p_made => d.made, p_received => d.received)
+    FROM (
+      SELECT user_id, SUM(made)::int AS made, SUM(received)::int AS received
+      FROM (
+        SELECT payer_id AS user_id, 1 AS made, 0 AS received FROM new_rows
+        UNION ALL SELECT payee_id, 0, 1 FROM new_rows
+      ) x GROUP BY user_id ORDER BY user_id
+    ) d;
+  ELSIF TG_OP = 'DELETE' THEN
+    PERFORM bump_user_public_stats(d.user_id, p_made => d.made, p_received => d.received)
+    FROM (
+      SELECT user_id, SUM(made)::int AS made, SUM(received)::int AS received
+      FROM (
+        SELECT payer_id AS user_id, -1 AS made, 0 AS received FROM old_rows
+        UNION ALL SELECT payee_id, 0, -1 FROM old_rows
+      ) x GROUP BY user_id ORDER BY user_id
+    ) d;
+  ELSE
+    PERFORM bump_user_public_stats(d.user_id, p_made => d.made, p_received => d.received)
+    FROM (
+      SELECT user_id, SUM(made)::int AS made, SUM(received)::int AS received
+      FROM (
+        SELECT payer_id AS user_id, 1 AS made, 0 AS received FROM new_rows
+        UNION ALL SELECT payee_id, 0, 1 FROM new_rows
+        UNION ALL SELECT payer_id, -1, 0 FROM old_rows
+        UNION ALL SELECT payee_id, 0, -1 FROM old_rows
+      ) x GROUP BY user_id HAVING SUM(made) <> 0 OR SUM(received) <> 0 ORDER BY user_id
+    ) d;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS payments_user_public_stats ON payments;
+DROP TRIGGER IF EXISTS payments_user_public_stats_insert ON payments;
+CREATE TRIGGER payments_user_public_stats_insert
+  AFTER INSERT ON payments REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION user_public_stats_on_payment();
+DROP TRIGGER IF EXISTS payments_user_public_stats_update ON payments;
+CREATE TRIGGER payments_user_public_stats_update
+  AFTER UPDATE ON payments REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION user_public_stats_on_payment();
+DROP TRIGGER IF EXISTS payments_user_public_stats_delete ON payments;
+CREATE TRIGGER payments_user_public_stats_delete
+  AFTER DELETE ON payments REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION user_public_stats_on_payment();
+
+-- 4. Reviews: running sum and count for the reviewed user
+CREATE OR REPLACE FUNCTION user_public_stats_on_review()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    PERFORM bump_user_public_stats(d.user_id, p_rating_sum => d.rating_sum, p_reviews => d.reviews)
+    FROM (
+      SELECT reviewed_id AS user_id, SUM(rating)::int AS rating_sum, COUNT(*)::int AS reviews
+      FROM new_rows GROUP BY reviewed_id ORDER BY reviewed_id
+    ) d;
+  ELSIF TG_OP = 'DELETE' THEN
+    PERFORM bump_user_public_stats(d.user_id, p_rating_sum => -d.rating_sum, p_reviews => -d.reviews)
+    FROM (
+      SELECT reviewed_id AS user_id, SUM(rating)::int AS rating_sum, COUNT(*)::int AS reviews
+      FROM old_rows GROUP BY reviewed_id ORDER BY reviewed_id
+    ) d;
+  ELSE
+    PERFORM bump_user_public_stats(d.user_id, p_rating_sum => d.rating_sum, p_reviews => d.reviews)
+    FROM (
+      SELECT user_id, SUM(rating)::int AS rating_sum, SUM(reviews)::int AS reviews
+      FROM (
+        SELECT reviewed_id AS user_id, rating, 1 AS reviews FROM new_rows
+        UNION ALL SELECT reviewed_id, -rating, -1 FROM old_rows
+      ) x GROUP BY user_id HAVING SUM(rating) <> 0 OR SUM(reviews) <> 0 ORDER BY user_id
+    ) d;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS reviews_user_public_stats ON reviews;
+DROP TRIGGER IF EXISTS reviews_user_public_stats_insert ON reviews;
+CREATE TRIGGER reviews_user_public_stats_insert
+  AFTER INSERT ON reviews REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION user_public_stats_on_review();
+DROP TRIGGER IF EXISTS reviews_user_public_stats_update ON reviews;
+CREATE TRIGGER reviews_user_public_stats_update
+  AFTER UPDATE ON reviews REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION user_public_stats_on_review();
+DROP TRIGGER IF EXISTS reviews_user_public_stats_delete ON reviews;
+CREATE TRIGGER reviews_user_public_stats_delete
+  AFTER DELETE ON reviews REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION user_public_stats_on_review();
+
+-- 5. Tasks: a job counts for the assigned worker while the task is completed
+CREATE OR REPLACE FUNCTION user_public_stats_on_task()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    PERFORM bump_user_public_stats(d.user_id, p_jobs => d.jobs)
+    FROM (
+      SELECT assigned_to AS user_id, COUNT(*)::int AS jobs
+      FROM new_rows WHERE status = 'completed' AND assigned_to IS NOT NULL
+      GROUP BY assigned_to ORDER BY assigned_to
+    ) d;
+  ELSIF TG_OP = 'DELETE' THEN
+    PERFORM bump_user_public_stats(d.user_id, p_jobs => -d.jobs)
+    FROM (
+      SELECT assigned_to AS user_id, COUNT(*)::int AS jobs
+      FROM old_rows WHERE status = 'completed' AND assigned_to IS NOT NULL
+      GROUP BY assigned_to ORDER BY assigned_to
+    ) d;
+  ELSE
+    PERFORM bump_user_public_stats(d.user_id, p_jobs => d.jobs)
+    FROM (
+      SELECT user_id, SUM(jobs)::int AS jobs
+      FROM (
+        SELECT assigned_to AS user_id, 1 AS jobs FROM new_rows WHERE status = 'completed'
+        UNION ALL SELECT assigned_to, -1 FROM old_rows WHERE status = 'completed'
+      ) x WHERE user_id IS NOT NULL GROUP BY user_id HAVING SUM(jobs) <> 0 ORDER BY user_id
+    ) d;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS tasks_user_public_stats ON tasks;
+DROP TRIGGER IF EXISTS tasks_user_public_stats_insert ON tasks;
+CREATE TRIGGER tasks_user_public_stats_insert
+  AFTER INSERT ON tasks REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION user_public_stats_on_task();
+DROP TRIGGER IF EXISTS tasks_user_public_stats_update ON tasks;
+CREATE TRIGGER tasks_user_public_stats_update
+  AFTER UPDATE ON tasks REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION user_public_stats_on_task();
+DROP TRIGGER IF EXISTS tasks_user_public_stats_delete ON tasks;
+CREATE TRIGGER tasks_user_public_stats_delete
+  AFTER DELETE ON tasks REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION user_public_stats_on_task();
+
+-- 6. Backfill from existing history (idempotent: recomputes every row)
+INSERT INTO user_public_stats (user_id, jobs_completed, payments_made, payments_received, rating_sum, review_count)
+SELECT u.user_id,
+       COALESCE(j.jobs, 0), COALESCE(pm.made, 0), COALESCE(pr.received, 0),
+       COALESCE(r.rating_sum, 0), COALESCE(r.reviews, 0)
+FROM (
+  SELECT assigned_to AS user_id FROM tasks WHERE status = 'completed' AND assigned_to IS NOT NULL
+  UNION SELECT payer_id FROM payments
+  UNION SELECT payee_id FROM payments
+  UNION SELECT reviewed_id FROM reviews
+) u
+LEFT JOIN (SELECT assigned_to, COUNT(*) AS jobs FROM tasks WHERE status = 'completed' GROUP BY assigned_to) j ON j.assigned_to = u.user_id
+LEFT JOIN (SELECT payer_id, COUNT(*) AS made FROM payments GROUP BY payer_id) pm ON pm.payer_id = u.user_id
+LEFT JOIN (SELECT payee_id, COUNT(*) AS received FROM payments GROUP BY payee_id) pr ON pr.payee_id = u.user_id
+LEFT JOIN (SELECT reviewed_id, SUM(rating) AS rating_sum, COUNT(*) AS reviews FROM reviews GROUP BY reviewed_id) r ON r.reviewed_id = u.user_id
+WHERE u.user_id IS NOT NULL
+ON CONFLICT (user_id) DO UPDATE SET
+  jobs_completed = EXCLUDED.jobs_completed,
+  payments_made = EXCLUDED.payments_made,
+  payments_received = EXCLUDED.payments_received,
+  rating_sum = EXCLUDED.rating_sum,
+  review_count = EXCLUDED.review_count,
+  updated_at = NOW();
+
+-- 7. One-call card: public profile fields + stats by primary key
+CREATE OR REPLACE FUNCTION get_user_public_card(p_user_id UUID)
+RETURNS JSON AS $$
+  SELECT json_build_object(
+    'profile', json_build_object(
+      'id', p.id,
+      'full_name', p.full_name,
+      'avatar_url', p.avatar_url,
+      'location', p.location,
+      'rating', p.rating,
+      'total_jobs', p.total_jobs,
+      'total_earnings', p.total_earnings,
+      'is_verified', p.is_verified,
+      'created_at', p.created_at
+    ),
+    -- NULL without a stats row, so the client falls back to the profile counts
+    'stats', CASE WHEN s.user_id IS NOT NULL THEN json_build_object(
+      'jobs_completed', s.jobs_completed,
+      'payments_made', s.payments_made,
+      'payments_received', s.payments_received,
+      'avg_rating', s.avg_rating,
+      'review_count', s.review_count
+    ) END
+  )
+  FROM profiles p
+  LEFT JOIN user_public_stats s ON s.user_id = p.id
+  WHERE p.id = p_user_id;
+$$ LANGUAGE sql STABLE;
+
+GRANT SELECT ON user_public_stats TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION get_user_public_card(UUID) TO anon, authenticated;
+
+-- Internal helpers run only from the triggers above. EXECUTE defaults to PUBLIC,
+-- and PostgREST would otherwise serve them at /rpc/ to any caller
+REVOKE ALL ON FUNCTION bump_user_public_stats(UUID, INTEGER, INTEGER, INTEGER, INTEGER, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION user_public_stats_on_payment() FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION user_public_stats_on_review() FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION user_public_stats_on_task() FROM PUBLIC, anon, authenticated;
@@ -0,0 +1,307 @@
+-- Server-side rank engine and leaderboard
+-- XP, level and rank live in user_progress and are recomputed from
+-- user_public_stats (jobs, rating, earnings) whenever task completion,
+-- payment or review triggers change a user's stats. A per-XP histogram
+-- makes "my position" a short aggregate instead of a count over all users.
+
+-- 1. Earnings: completed payments received, tracked next to the other stats
+ALTER TABLE user_public_stats ADD COLUMN IF NOT EXISTS earnings DECIMAL(12, 2) NOT NULL DEFAULT 0;
+
+DROP FUNCTION IF EXISTS bump_user_public_stats(UUID, INTEGER, INTEGER, INTEGER, INTEGER, INTEGER);
+CREATE OR REPLACE FUNCTION bump_user_public_stats(
+  p_user_id UUID,
+  p_jobs INTEGER DEFAULT 0,
+  p_made INTEGER DEFAULT 0,
+  p_received INTEGER DEFAULT 0,
+  p_rating_sum INTEGER DEFAULT 0,
+  p_reviews INTEGER DEFAULT 0,
+  p_earnings DECIMAL DEFAULT 0
+)
+RETURNS VOID AS $$
+BEGIN
+  IF p_user_id IS NULL THEN
+    RETURN;
+  END IF;
+  INSERT INTO user_public_stats AS s (user_id, jobs_completed, payments_made, payments_received, rating_sum, review_count, earnings)
+  VALUES (p_user_id, GREATEST(p_jobs, 0), GREATEST(p_made, 0), GREATEST(p_received, 0), GREATEST(p_rating_sum, 0), GREATEST(p_reviews, 0), GREATEST(p_earnings, 0))
+  ON CONFLICT (user_id) DO UPDATE SET
+    jobs_completed = GREATEST(s.jobs_completed + p_jobs, 0),
+    payments_made = GREATEST(s.payments_made + p_made, 0),
+    payments_received = GREATEST(s.payments_received + p_received, 0),
+    rating_sum = GREATEST(s.rating_sum + p_rating_sum, 0),
+    review_count = GREATEST(s.review_count + p_reviews, 0),
+    earnings = GREATEST(s.earnings + p_earnings, 0),
+    updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE OR REPLACE FUNCTION user_public_stats_on_payment()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    PERFORM bump_user_public_stats(d.user_id, p_made => d.made, p_received => d.received, p_earnings => d.earnings)
+    FROM (
+      SELECT user_id, SUM(made)::int AS made, SUM(received)::int AS received, SUM(earnings) AS earnings
+      FROM (
+        SELECT payer_id AS user_id, 1 AS made, 0 AS received, 0::numeric AS earnings FROM new_rows
+        UNION ALL SELECT payee_id, 0, 1, CASE WHEN status = 'completed' THEN amount ELSE 0 END FROM new_rows
+      ) x GROUP BY user_id ORDER BY user_id
+    ) d;
+  ELSIF TG_OP = 'DELETE' THEN
+    PERFORM bump_user_public_stats(d.user_id, p_made => d.made, p_received => d.received, p_earnings => d.earnings)
+    FROM (
+      SELECT user_id, SUM(made)::int AS made, SUM(received)::int AS received, SUM(earnings) AS earnings
+      FROM (
+        SELECT payer_id AS user_id, -1 AS made, 0 AS received, 0::numeric AS earnings FROM old_rows
+        UNION ALL SELECT payee_id, 0, -1, CASE WHEN status = 'completed' THEN -amount ELSE 0 END FROM old_rows
+      ) x GROUP BY user_id ORDER BY user_id
+    ) d;
+  ELSE
+    PERFORM bump_user_public_stats(d.user_id, p_made => d.made, p_received => d.received, p_earnings => d.earnings)
+    FROM (
+      SELECT user_id, SUM(made)::int AS made, SUM(received)::int AS received, SUM(earnings) AS earnings
+      FROM (
+        SELECT payer_id AS user_id, 1 AS made, 0 AS received, 0::numeric AS earnings FROM new_rows
+        UNION ALL SELECT payee_id, 0, 1, CASE WHEN status = 'completed' THEN amount ELSE 0 END FROM new_rows
+        UNION ALL SELECT payer_id, -1, 0, 0 FROM old_rows
+        UNION ALL SELECT payee_id, 0, -1, CASE WHEN status = 'completed' THEN -amount ELSE 0 END FROM old_rows
+      ) x GROUP BY user_id
+      HAVING SUM(made) <> 0 OR SUM(received) <> 0 OR SUM(earnings) <> 0
+      ORDER BY user_id
+    ) d;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+UPDATE user_public_stats s SET earnings = e.earnings
+FROM (
+  SELECT payee_id, SUM(amount) AS earnings FROM payments WHERE status = 'completed' GROUP BY payee_id
+) e
+WHERE e.payee_id = s.user_id AND s.earnings IS DISTINCT FROM e.earnings;
+
+-- 2. XP model (mirrors computeLevel in lib/rank.ts without the demo seed boost):
+--    100 XP per completed job, 500 XP per rating point above 4.0,
+--    1 XP per ¢1,500 earned (one level per ¢150k); level = XP / 100
+CREATE OR REPLACE FUNCTION compute_progress_xp(p_jobs INTEGER, p_avg_rating DECIMAL, p_earnings DECIMAL)
+RETURNS INTEGER AS $$
+  SELECT (
+    GREATEST(COALESCE(p_jobs, 0), 0) * 100
+    + FLOOR(GREATEST(COALESCE(p_avg_rating, 0) - 4, 0) * 500)
+    + FLOOR(GREATEST(COALESCE(p_earnings, 0), 0) / 1500)
+  )::int;
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION level_for_xp(p_xp INTEGER)
+RETURNS INTEGER AS $$
+  SELECT LEAST(120, GREATEST(1, COALESCE(p_xp, 0) / 100));
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Same bands as RANKS in lib/rank.ts
+CREATE OR REPLACE FUNCTION rank_for_level(p_level INTEGER)
+RETURNS TEXT AS $$
+  SELECT CASE
+    WHEN p_level >= 75 THEN 'Leyenda de Chambito'
+    WHEN p_level >= 50 THEN 'Veterano'
+    WHEN p_level >= 35 THEN 'Maestro'
+    WHEN p_level >= 20 THEN 'Experto'
+    WHEN p_level >= 10 THEN 'Oficial'
+    WHEN p_level >= 5 THEN 'Aprendiz'
+    ELSE 'Novato'
+  END;
+$$ LANGUAGE sql IMMUTABLE;
+
+-- 3. Progress columns the app already reads (xp, rank) and the leaderboard index
+ALTER TABLE user_progress ADD COLUMN IF NOT EXISTS xp INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE user_progress ADD COLUMN IF NOT EXISTS rank TEXT NOT NULL DEFAULT 'Novato';
+
+CREATE INDEX IF NOT EXISTS idx_user_progress_xp ON user_progress (xp DESC, user_id);
+
+-- XP is owned by the engine: clients may only write their badges and achievements
+REVOKE INSERT, UPDATE ON user_progress FROM anon, authenticated;
+GRANT INSERT (user_id, badges, achievements), UPDATE (badges, achievements) ON user_progress TO authenticated;
+
+-- 4. Histogram of users per XP value (XP 0 is implicit: everyone not counted here)
+CREATE TABLE IF NOT EXISTS user_progress_xp_histogram (
+  xp INTEGER PRIMARY KEY CHECK (xp > 0),
+  users INTEGER NOT NULL DEFAULT 0
+);
+
+ALTER TABLE user_progress_xp_histogram ENABLE ROW LEVEL SECURITY;
+
+CREATE OR REPLACE FUNCTION bump_xp_histogram(p_xp INTEGER, p_users INTEGER)
+RETURNS VOID AS $$
+BEGIN
+  IF p_xp IS NULL OR p_xp <= 0 OR p_users = 0 THEN
+    RETURN;
+  END IF;
+  INSERT INTO user_progress_xp_histogram AS h (xp, users) VALUES (p_xp, GREATEST(p_users, 0))
+  ON CONFLICT (xp) DO UPDATE SET users = GREATEST(h.users + p_users, 0);
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE OR REPLACE FUNCTION user_progress_on_xp_change()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    PERFORM bump_xp_histogram(d.xp, d.users)
+    FROM (SELECT xp, COUNT(*)::int AS users FROM new_rows WHERE xp > 0 GROUP BY xp ORDER BY xp) d;
+  ELSIF TG_OP = 'DELETE' THEN
+    PERFORM bump_xp_histogram(d.xp, -d.users)
+    FROM (SELECT xp, COUNT(*)::int AS users FROM old_rows WHERE xp > 0 GROUP BY xp ORDER BY xp) d;
+  ELSE
+    PERFORM bump_xp_histogram(d.xp, d.users)
+    FROM (
+      SELECT xp, SUM(users)::int AS users
+      FROM (
+        SELECT xp, 1 AS users FROM new_rows WHERE xp > 0
+        UNION ALL SELECT xp, -1 FROM old_rows WHERE xp > 0
+      ) x GROUP BY xp HAVING SUM(users) <> 0 ORDER BY xp
+    ) d;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS user_progress_xp_insert ON user_progress;
+CREATE TRIGGER user_progress_xp_insert
+  AFTER INSERT ON user_progress REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION user_progress_on_xp_change();
+DROP TRIGGER IF EXISTS user_progress_xp_update ON user_progress;
+CREATE TRIGGER user_progress_xp_update
+  AFTER UPDATE ON user_progress REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION user_progress_on_xp_change();
+DROP TRIGGER IF EXISTS user_progress_xp_delete ON user_progress;
+CREATE TRIGGER user_progress_xp_delete
+  AFTER DELETE ON user_progress REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION user_progress_on_xp_change();
+
+-- 5. Recompute progress whenever stats change (one upsert per statement)
+CREATE OR REPLACE FUNCTION user_public_stats_on_change()
+RETURNS TRIGGER AS $$
+BEGIN
+  INSERT INTO user_progress AS up (user_id, xp, level, rank, experience_points, tasks_completed, total_earnings)
+  SELECT n.user_id, x.xp, level_for_xp(x.xp), rank_for_level(level_for_xp(x.xp)), x.xp, n.jobs_completed, n.earnings
+  FROM new_rows n
+  CROSS JOIN LATERAL (SELECT compute_progress_xp(n.jobs_completed, n.avg_rating, n.earnings) AS xp) x
+  ORDER BY n.user_id
+  ON CONFLICT (user_id) DO UPDATE SET
+    xp = EXCLUDED.xp,
+    level = EXCLUDED.level,
+    rank = EXCLUDED.rank,
+    experience_points = EXCLUDED.experience_points,
+    tasks_completed = EXCLUDED.tasks_completed,
+    total_earnings = EXCLUDED.total_earnings,
+    updated_at = NOW()
+  WHERE (up.xp, up.tasks_completed, up.total_earnings)
+    IS DISTINCT FROM (EXCLUDED.xp, EXCLUDED.tasks_completed, EXCLUDED.total_earnings);
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS user_public_stats_progress_insert ON user_public_stats;
+CREATE TRIGGER user_public_stats_progress_insert
+  AFTER INSERT ON user_public_stats REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION user_public_stats_on_change();
+DROP TRIGGER IF EXISTS user_public_stats_progress_update ON user_public_stats;
+CREATE TRIGGER user_public_stats_progress_update
+  AFTER UPDATE ON user_public_stats REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION user_public_stats_on_change();
+
+-- 6. Backfill progress for users that already have stats, then rebuild the histogram
+INSERT INTO user_progress AS up (user_id, xp, level, rank, experience_points, tasks_completed, total_earnings)
+SELECT s.user_id, x.xp, level_for_xp(x.xp), rank_for_level(level_for_xp(x.xp)), x.xp, s.jobs_completed, s.earnings
+FROM user_public_stats s
+CROSS JOIN LATERAL (SELECT compute_progress_xp(s.jobs_completed, s.avg_rating, s.earnings) AS xp) x
+ON CONFLICT (user_id) DO UPDATE SET
+  xp = EXCLUDED.xp,
+  level = EXCLUDED.level,
+  rank = EXCLUDED.rank,
+  experience_points = EXCLUDED.experience_points,
+  tasks_completed = EXCLUDED.tasks_completed,
+  total_earnings = EXCLUDED.total_earnings,
+  updated_at = NOW();
+
+DELETE FROM user_progress_xp_histogram;
+INSERT INTO user_progress_xp_histogram (xp, users)
+SELECT xp, COUNT(*) FROM user_progress WHERE xp > 0 GROUP BY xp;
+
+-- 7. Leaderboard RPCs. Ranking is competition style: equal XP shares a
+--    position, the next distinct XP skips ahead (1, 2, 2, 4).
+CREATE OR REPLACE FUNCTION get_leaderboard(p_limit INTEGER DEFAULT 20, p_offset INTEGER DEFAULT 0)
+RETURNS TABLE (
+  leaderboard_position BIGINT,
+  user_id UUID,
+  full_name TEXT,
+  avatar_url TEXT,
+  xp INTEGER,
+  level INTEGER,
+  rank TEXT
+) AS $$
+  WITH page AS (
+    SELECT up.user_id, up.xp, up.level, up.rank
+    FROM user_progress up
+    ORDER BY up.xp DESC, up.user_id
+    LIMIT LEAST(GREATEST(p_limit, 1), 100) OFFSET GREATEST(p_offset, 0)
+  )
+  SELECT 1 + COALESCE((SELECT SUM(h.users) FROM user_progress_xp_histogram h WHERE h.xp > page.xp), 0)::bigint,
+         page.user_id, p.full_name, p.avatar_url, page.xp, page.level, page.rank
+  FROM page
+  LEFT JOIN profiles p ON p.id = page.user_id
+  ORDER BY page.xp DESC, page.user_id;
+$$ LANGUAGE sql STABLE SECURITY DEFINER SET search_path = public;
+
+CREATE OR REPLACE FUNCTION get_my_leaderboard_position(p_user_id UUID DEFAULT auth.uid())
+RETURNS JSON AS $$
+  SELECT json_build_object(
+    'user_id', up.user_id,
+    'xp', up.xp,
+    'level', up.level,
+    'rank', up.rank,
+    'position', 1 + COALESCE((SELECT SUM(h.users) FROM user_progress_xp_histogram h WHERE h.xp > up.xp), 0)
+  )
+  FROM user_progress up
+  WHERE up.user_id = p_user_id;
+$$ LANGUAGE sql STABLE SECURITY DEFINER SET search_path = public;
+
+GRANT EXECUTE ON FUNCTION get_leaderboard(INTEGER, INTEGER) TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION get_my_leaderboard_position(UUID) TO authenticated;
+
+-- Engine internals are trigger-only. The new bump_user_public_stats signature is
+-- a new function, so 0100's revoke does not cover it; without these any caller
+-- could bump stats or skew the histogram through /rpc/
+REVOKE ALL ON FUNCTION bump_user_public_stats(UUID, INTEGER, INTEGER, INTEGER, INTEGER, INTEGER, DECIMAL) FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION bump_xp_histogram(INTEGER, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION user_public_stats_on_payment() FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION user_progress_on_xp_change() FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION user_public_stats_on_change() FROM PUBLIC, anon, authenticated;
+
+-- 8. Card stats include earnings
+CREATE OR REPLACE FUNCTION get_user_public_card(p_user_id UUID)
+RETURNS JSON AS $$
+  SELECT json_build_object(
+    'profile', json_build_object(
+      'id', p.id,
+      'full_name', p.full_name,
+      'avatar_url', p.avatar_url,
+      'location', p.location,
+      'rating', p.rating,
+      'total_jobs', p.total_jobs,
+      'total_earnings', p.total_earnings,
+      'is_verified', p.is_verified,
+      'created_at', p.created_at
+    ),
+    -- NULL without a stats row, so the client falls back to the profile counts
+    'stats', CASE WHEN s.user_id IS NOT NULL THEN json_build_object(
+      'jobs_completed', s.jobs_completed,
+      'payments_made', s.payments_made,
+      'payments_received', s.payments_received,
+      'avg_rating', s.avg_rating,
+      'review_count', s.review_count,
+      'earnings', s.earnings
+    ) END
+  )
+  FROM profiles p
+  LEFT JOIN user_public_stats s ON s.user_id = p.id
+  WHERE p.id = p_user_id;
+$$ LANGUAGE sql STABLE;
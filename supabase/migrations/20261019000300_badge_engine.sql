@@ -0,0 +1,387 @@
+-- Event-driven badge engine
+-- Task completions, offers, sign-ins and stats changes (payments, reviews)
+-- update small per-user counters once per event; badges are awarded when a
+-- counter crosses its threshold and persisted with the time they were earned.
+-- Thresholds follow the BADGES descriptions in lib/rank.ts.
+-- ambassador, mentor and special-mission need referral/mission data we do
+-- not store yet and stay locked.
+
+-- Columns the completion events read (same as fix-deadline-column.sql)
+ALTER TABLE tasks ADD COLUMN IF NOT EXISTS deadline TIMESTAMP WITH TIME ZONE;
+ALTER TABLE tasks ADD COLUMN IF NOT EXISTS completed_at TIMESTAMP WITH TIME ZONE;
+
+-- 1. Earned badges
+CREATE TABLE IF NOT EXISTS user_badges (
+  user_id UUID NOT NULL REFERENCES auth.users(id) ON DELETE CASCADE,
+  badge_id TEXT NOT NULL,
+  earned_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+  PRIMARY KEY (user_id, badge_id)
+);
+
+ALTER TABLE user_badges ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Badges are viewable by everyone" ON user_badges;
+CREATE POLICY "Badges are viewable by everyone" ON user_badges
+  FOR SELECT USING (true);
+
+-- 2. Rolling counters (one row per user) and per-category job counts
+CREATE TABLE IF NOT EXISTS user_badge_counters (
+  user_id UUID PRIMARY KEY REFERENCES auth.users(id) ON DELETE CASCADE,
+  week_start DATE,
+  week_jobs INTEGER NOT NULL DEFAULT 0,
+  best_week_jobs INTEGER NOT NULL DEFAULT 0,
+  festive_week_start DATE,
+  festive_week_jobs INTEGER NOT NULL DEFAULT 0,
+  best_festive_week_jobs INTEGER NOT NULL DEFAULT 0,
+  on_time_jobs INTEGER NOT NULL DEFAULT 0,
+  community_jobs INTEGER NOT NULL DEFAULT 0,
+  eco_jobs INTEGER NOT NULL DEFAULT 0,
+  first_offers INTEGER NOT NULL DEFAULT 0,
+  login_day DATE,
+  login_streak INTEGER NOT NULL DEFAULT 0,
+  best_login_streak INTEGER NOT NULL DEFAULT 0,
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS user_category_counts (
+  user_id UUID NOT NULL REFERENCES auth.users(id) ON DELETE CASCADE,
+  category TEXT NOT NULL,
+  jobs INTEGER NOT NULL DEFAULT 0,
+  PRIMARY KEY (user_id, category)
+);
+
+ALTER TABLE user_badge_counters ENABLE ROW LEVEL SECURITY;
+ALTER TABLE user_category_counts ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Users can view their own badge counters" ON user_badge_counters;
+CREATE POLICY "Users can view their own badge counters" ON user_badge_counters
+  FOR SELECT USING (auth.uid() = user_id);
+
+DROP POLICY IF EXISTS "Users can view their own category counts" ON user_category_counts;
+CREATE POLICY "Users can view their own category counts" ON user_category_counts
+  FOR SELECT USING (auth.uid() = user_id);
+
+-- 3. Event helpers
+-- Festive weeks: the weeks of New Year, Independence Day (Sep 15) and Christmas
+CREATE OR REPLACE FUNCTION festive_week_start(p_day DATE)
+RETURNS DATE AS $$
+  SELECT w FROM (SELECT date_trunc('week', p_day)::date AS w, EXTRACT(YEAR FROM p_day)::int AS y) x
+  WHERE EXISTS (
+    SELECT 1 FROM unnest(ARRAY[
+      make_date(y, 1, 1), make_date(y, 9, 15), make_date(y, 12, 25), make_date(y + 1, 1, 1)
+    ]) AS h(day)
+    WHERE h.day BETWEEN x.w AND x.w + 6
+  );
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION award_badge(p_user_id UUID, p_badge_id TEXT, p_earned_at TIMESTAMP WITH TIME ZONE DEFAULT NOW())
+RETURNS VOID AS $$
+  INSERT INTO user_badges (user_id, badge_id, earned_at)
+  VALUES (p_user_id, p_badge_id, COALESCE(p_earned_at, NOW()))
+  ON CONFLICT (user_id, badge_id) DO NOTHING;
+$$ LANGUAGE sql SECURITY DEFINER SET search_path = public;
+
+-- Award every counter-based badge the user now qualifies for
+CREATE OR REPLACE FUNCTION evaluate_counter_badges(p_user_id UUID)
+RETURNS VOID AS $$
+  INSERT INTO user_badges (user_id, badge_id)
+  SELECT c.user_id, b.badge_id
+  FROM user_badge_counters c
+  CROSS JOIN LATERAL unnest(ARRAY[
+    CASE WHEN c.on_time_jobs >= 5 THEN 'speedster' END,
+    CASE WHEN c.best_week_jobs >= 10 THEN 'marathon' END,
+    CASE WHEN c.best_festive_week_jobs >= 3 THEN 'work-feast' END,
+    CASE WHEN c.community_jobs >= 5 THEN 'community-helper' END,
+    CASE WHEN c.eco_jobs >= 10 THEN 'eco-hero' END,
+    CASE WHEN c.first_offers >= 10 THEN 'deal-hunter' END,
+    CASE WHEN c.best_login_streak >= 30 THEN 'attendance' END,
+    CASE WHEN (SELECT MAX(jobs) FROM user_category_counts cc WHERE cc.user_id = c.user_id) >= 20
+      THEN 'category-master' END
+  ]) AS b(badge_id)
+  WHERE c.user_id = p_user_id AND b.badge_id IS NOT NULL
+  ON CONFLICT (user_id, badge_id) DO NOTHING;
+$$ LANGUAGE sql SECURITY DEFINER SET search_path = public;
+
+-- One completed job: category count, weekly and festive windows, on-time and theme counters
+CREATE OR REPLACE FUNCTION record_job_completion(
+  p_user_id UUID,
+  p_category TEXT,
+  p_done_at TIMESTAMP WITH TIME ZONE,
+  p_deadline TIMESTAMP WITH TIME ZONE
+)
+RETURNS VOID AS $$
+DECLARE
+  c user_badge_counters%ROWTYPE;
+  v_week DATE := date_trunc('week', p_done_at)::date;
+  v_festive DATE := festive_week_start(p_done_at::date);
+BEGIN
+  INSERT INTO user_category_counts AS cc (user_id, category, jobs)
+  VALUES (p_user_id, COALESCE(p_category, 'other'), 1)
+  ON CONFLICT (user_id, category) DO UPDATE SET jobs = cc.jobs + 1;
+
+  INSERT INTO user_badge_counters (user_id) VALUES (p_user_id) ON CONFLICT (user_id) DO NOTHING;
+  SELECT * INTO c FROM user_badge_counters WHERE user_id = p_user_id FOR UPDATE;
+
+  -- Weekly window: events for an older week than the current one do not reopen it
+  IF c.week_start IS NULL OR v_week > c.week_start THEN
+    c.week_start := v_week;
+    c.week_jobs := 1;
+  ELSIF v_week = c.week_start THEN
+    c.week_jobs := c.week_jobs + 1;
+  END IF;
+  c.best_week_jobs := GREATEST(c.best_week_jobs, c.week_jobs);
+
+  IF v_festive IS NOT NULL THEN
+    IF c.festive_week_start IS NULL OR v_festive > c.festive_week_start THEN
+      c.festive_week_start := v_festive;
+      c.festive_week_jobs := 1;
+    ELSIF v_festive = c.festive_week_start THEN
+      c.festive_week_jobs := c.festive_week_jobs + 1;
+    END IF;
+    c.best_festive_week_jobs := GREATEST(c.best_festive_week_jobs, c.festive_week_jobs);
+  END IF;
+
+  IF p_deadline IS NOT NULL AND p_done_at < p_deadline THEN
+    c.on_time_jobs := c.on_time_jobs + 1;
+  END IF;
+  IF p_category IN ('elderly_care', 'babysitting', 'grocery_shopping', 'tutoring') THEN
+    c.community_jobs := c.community_jobs + 1;
+  END IF;
+  IF p_category IN ('gardening', 'trash_removal') THEN
+    c.eco_jobs := c.eco_jobs + 1;
+  END IF;
+
+  UPDATE user_badge_counters SET
+    week_start = c.week_start, week_jobs = c.week_jobs, best_week_jobs = c.best_week_jobs,
+    festive_week_start = c.festive_week_start, festive_week_jobs = c.festive_week_jobs,
+    best_festive_week_jobs = c.best_festive_week_jobs, on_time_jobs = c.on_time_jobs,
+    community_jobs = c.community_jobs, eco_jobs = c.eco_jobs, updated_at = NOW()
+  WHERE user_id = p_user_id;
+
+  -- Christmas week
+  IF v_festive IS NOT NULL AND v_festive = date_trunc('week', make_date(EXTRACT(YEAR FROM p_done_at)::int, 12, 25))::date THEN
+    PERFORM award_badge(p_user_id, 'xmas-hero', p_done_at);
+  END IF;
+  PERFORM evaluate_counter_badges(p_user_id);
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- One first offer on a task (deal-hunter counts these)
+CREATE OR REPLACE FUNCTION record_first_offer(p_user_id UUID)
+RETURNS VOID AS $$
+BEGIN
+  INSERT INTO user_badge_counters AS c (user_id, first_offers)
+  VALUES (p_user_id, 1)
+  ON CONFLICT (user_id) DO UPDATE SET
+    first_offers = c.first_offers + 1,
+    updated_at = NOW();
+  PERFORM evaluate_counter_badges(p_user_id);
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- One sign-in: consecutive days extend the streak; repeat or out-of-order days are no-ops
+CREATE OR REPLACE FUNCTION record_login(p_user_id UUID, p_at TIMESTAMP WITH TIME ZONE)
+RETURNS VOID AS $$
+DECLARE
+  v_day DATE := (p_at AT TIME ZONE 'America/Costa_Rica')::date;
+BEGIN
+  INSERT INTO user_badge_counters AS c (user_id, login_day, login_streak, best_login_streak)
+  VALUES (p_user_id, v_day, 1, 1)
+  ON CONFLICT (user_id) DO UPDATE SET
+    login_streak = CASE WHEN c.login_day = v_day - 1 THEN c.login_streak + 1 ELSE 1 END,
+    best_login_streak = GREATEST(c.best_login_streak, CASE WHEN c.login_day = v_day - 1 THEN c.login_streak + 1 ELSE 1 END),
+    login_day = v_day,
+    updated_at = NOW()
+  WHERE c.login_day IS NULL OR c.login_day < v_day;
+  PERFORM evaluate_counter_badges(p_user_id);
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- 4. Event triggers (statement-level; each event is consumed once)
+CREATE OR REPLACE FUNCTION badge_events_on_task()
+RETURNS TRIGGER AS $$
+DECLARE
+  r RECORD;
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    FOR r IN
+      SELECT n.assigned_to AS user_id, n.category, COALESCE(n.completed_at, NOW()) AS done_at, n.deadline
+      FROM new_rows n
+      WHERE n.status = 'completed' AND n.assigned_to IS NOT NULL
+      ORDER BY 1, 3
+    LOOP
+      PERFORM record_job_completion(r.user_id, r.category, r.done_at, r.deadline);
+    END LOOP;
+  ELSE
+    FOR r IN
+      SELECT n.assigned_to AS user_id, n.category, COALESCE(n.completed_at, NOW()) AS done_at, n.deadline
+      FROM new_rows n JOIN old_rows o ON o.id = n.id
+      WHERE n.status = 'completed' AND o.status IS DISTINCT FROM 'completed' AND n.assigned_to IS NOT NULL
+      ORDER BY 1, 3
+    LOOP
+      PERFORM record_job_completion(r.user_id, r.category, r.done_at, r.deadline);
+    END LOOP;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS tasks_badge_events_insert ON tasks;
+CREATE TRIGGER tasks_badge_events_insert
+  AFTER INSERT ON tasks REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION badge_events_on_task();
+DROP TRIGGER IF EXISTS tasks_badge_events_update ON tasks;
+CREATE TRIGGER tasks_badge_events_update
+  AFTER UPDATE ON tasks REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION badge_events_on_task();
+
+CREATE OR REPLACE FUNCTION badge_events_on_offer()
+RETURNS TRIGGER AS $$
+DECLARE
+  r RECORD;
+BEGIN
+  FOR r IN
+    SELECT n.user_id
+    FROM new_rows n
+    WHERE NOT EXISTS (
+      SELECT 1 FROM offers o
+      WHERE o.task_id = n.task_id AND o.id <> n.id AND (o.created_at, o.id) < (n.created_at, n.id)
+    )
+    ORDER BY n.user_id, n.created_at, n.id
+  LOOP
+    PERFORM record_first_offer(r.user_id);
+  END LOOP;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS offers_badge_events_insert ON offers;
+CREATE TRIGGER offers_badge_events_insert
+  AFTER INSERT ON offers REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION badge_events_on_offer();
+
+CREATE OR REPLACE FUNCTION badge_events_on_login()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF NEW.last_sign_in_at IS NOT NULL AND NEW.last_sign_in_at IS DISTINCT FROM OLD.last_sign_in_at THEN
+    PERFORM record_login(NEW.id, NEW.last_sign_in_at);
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- GoTrue stamps auth.users.last_sign_in_at on every sign-in
+DO $$
+BEGIN
+  IF EXISTS (
+    SELECT 1 FROM information_schema.columns
+    WHERE table_schema = 'auth' AND table_name = 'users' AND column_name = 'last_sign_in_at'
+  ) THEN
+    DROP TRIGGER IF EXISTS on_auth_user_signed_in ON auth.users;
+    CREATE TRIGGER on_auth_user_signed_in
+      AFTER UPDATE OF last_sign_in_at ON auth.users
+      FOR EACH ROW EXECUTE FUNCTION badge_events_on_login();
+  END IF;
+END $$;
+
+-- Stats-driven milestones (jobs from task completion, rating from reviews)
+CREATE OR REPLACE FUNCTION badge_events_on_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+  INSERT INTO user_badges (user_id, badge_id)
+  SELECT n.user_id, b.badge_id
+  FROM new_rows n
+  CROSS JOIN LATERAL unnest(ARRAY[
+    CASE WHEN n.jobs_completed >= 1 THEN 'first-job' END,
+    CASE WHEN n.jobs_completed >= 100 THEN 'hundred-wins' END,
+    CASE WHEN n.avg_rating >= 5 AND n.review_count >= 10 THEN 'five-stars' END
+  ]) AS b(badge_id)
+  WHERE b.badge_id IS NOT NULL
+  ORDER BY n.user_id
+  ON CONFLICT (user_id, badge_id) DO NOTHING;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS user_public_stats_badges_insert ON user_public_stats;
+CREATE TRIGGER user_public_stats_badges_insert
+  AFTER INSERT ON user_public_stats REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION badge_events_on_stats();
+DROP TRIGGER IF EXISTS user_public_stats_badges_update ON user_public_stats;
+CREATE TRIGGER user_public_stats_badges_update
+  AFTER UPDATE ON user_public_stats REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION badge_events_on_stats();
+
+-- 5. Backfill counters from history once (streaks start fresh)
+INSERT INTO user_category_counts (user_id, category, jobs)
+SELECT assigned_to, COALESCE(category, 'other'), COUNT(*)
+FROM tasks WHERE status = 'completed' AND assigned_to IS NOT NULL
+GROUP BY assigned_to, COALESCE(category, 'other')
+ON CONFLICT (user_id, category) DO UPDATE SET jobs = EXCLUDED.jobs;
+
+WITH jobs AS (
+  SELECT assigned_to AS user_id, category, deadline, COALESCE(completed_at, updated_at, created_at) AS done_at
+  FROM tasks WHERE status = 'completed' AND assigned_to IS NOT NULL
+),
+weeks AS (
+  SELECT user_id, date_trunc('week', done_at)::date AS week_start, COUNT(*) AS jobs
+  FROM jobs GROUP BY 1, 2
+),
+festive AS (
+  SELECT user_id, festive_week_start(done_at::date) AS week_start, COUNT(*) AS jobs
+  FROM jobs WHERE festive_week_start(done_at::date) IS NOT NULL GROUP BY 1, 2
+),
+firsts AS (
+  SELECT user_id, COUNT(*) AS first_offers
+  FROM (SELECT DISTINCT ON (task_id) task_id, user_id FROM offers ORDER BY task_id, created_at, id) f
+  GROUP BY user_id
+),
+users AS (
+  SELECT user_id FROM jobs UNION SELECT user_id FROM firsts
+)
+INSERT INTO user_badge_counters (
+  user_id, week_start, week_jobs, best_week_jobs, festive_week_start, festive_week_jobs,
+  best_festive_week_jobs, on_time_jobs, community_jobs, eco_jobs, first_offers
+)
+SELECT u.user_id,
+       lw.week_start, COALESCE(lw.jobs, 0), COALESCE((SELECT MAX(jobs) FROM weeks w WHERE w.user_id = u.user_id), 0),
+       lf.week_start, COALESCE(lf.jobs, 0), COALESCE((SELECT MAX(jobs) FROM festive f WHERE f.user_id = u.user_id), 0),
+       (SELECT COUNT(*) FROM jobs j WHERE j.user_id = u.user_id AND j.deadline IS NOT NULL AND j.done_at < j.deadline),
+       (SELECT COUNT(*) FROM jobs j WHERE j.user_id = u.user_id AND j.category IN ('elderly_care', 'babysitting', 'grocery_shopping', 'tutoring')),
+       (SELECT COUNT(*) FROM jobs j WHERE j.user_id = u.user_id AND j.category IN ('gardening', 'trash_removal')),
+       COALESCE(fo.first_offers, 0)
+FROM users u
+LEFT JOIN LATERAL (SELECT week_start, jobs FROM weeks w WHERE w.user_id = u.user_id ORDER BY week_start DESC LIMIT 1) lw ON true
+LEFT JOIN LATERAL (SELECT week_start, jobs FROM festive f WHERE f.user_id = u.user_id ORDER BY week_start DESC LIMIT 1) lf ON true
+LEFT JOIN firsts fo ON fo.user_id = u.user_id
+ON CONFLICT (user_id) DO NOTHING;
+
+SELECT evaluate_counter_badges(user_id) FROM user_badge_counters;
+
+INSERT INTO user_badges (user_id, badge_id)
+SELECT s.user_id, b.badge_id
+FROM user_public_stats s
+CROSS JOIN LATERAL unnest(ARRAY[
+  CASE WHEN s.jobs_completed >= 1 THEN 'first-job' END,
+  CASE WHEN s.jobs_completed >= 100 THEN 'hundred-wins' END,
+  CASE WHEN s.avg_rating >= 5 AND s.review_count >= 10 THEN 'five-stars' END
+]) AS b(badge_id)
+WHERE b.badge_id IS NOT NULL
+ON CONFLICT (user_id, badge_id) DO NOTHING;
+
+-- Earned set and counters are written only by the engine
+REVOKE INSERT, UPDATE, DELETE ON user_badges, user_badge_counters, user_category_counts FROM anon, authenticated;
+GRANT SELECT ON user_badges TO anon, authenticated;
+GRANT SELECT ON user_badge_counters, user_category_counts TO authenticated;
+
+-- Event helpers and triggers are engine-only. EXECUTE defaults to PUBLIC, and
+-- PostgREST would otherwise let any caller award badges or inflate counters
+REVOKE ALL ON FUNCTION award_badge(UUID, TEXT, TIMESTAMP WITH TIME ZONE) FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION evaluate_counter_badges(UUID) FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION record_job_completion(UUID, TEXT, TIMESTAMP WITH TIME ZONE, TIMESTAMP WITH TIME ZONE) FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION record_first_offer(UUID) FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION record_login(UUID, TIMESTAMP WITH TIME ZONE) FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION badge_events_on_task() FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION badge_events_on_offer() FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION badge_events_on_login() FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION badge_events_on_stats() FROM PUBLIC, anon, authenticated;
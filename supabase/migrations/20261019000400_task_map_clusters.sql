@@ -0,0 +1,245 @@
+-- Server-side map clustering for open tasks
+-- Open tasks are aggregated into Web Mercator grid cells per zoom level
+-- (4x4 cells per 256px tile, so one cell is ~64px on screen). Triggers on
+-- tasks keep zoom 12..16 current; coarser zooms are summed from zoom 12 at
+-- query time. The grid nests (the zoom-z cell of a zoom-12 cell is
+-- x >> (12 - z)), so this is exact, and a task write only touches cells of
+-- ~2.4 km and smaller instead of the few country-wide low-zoom rows every
+-- open task would otherwise lock. get_task_clusters() returns the centroids
+-- and counts for a viewport, with the task row for single-task cells, so the
+-- map only receives visible markers.
+
+-- 1. Cell math (zoom 3..16 are clustered; closer zooms return raw tasks)
+CREATE OR REPLACE FUNCTION task_map_cell_x(p_lon DOUBLE PRECISION, p_zoom INTEGER)
+RETURNS INTEGER AS $$
+  SELECT FLOOR((p_lon + 180.0) / 360.0 * (2 ^ p_zoom) * 4)::int;
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION task_map_cell_y(p_lat DOUBLE PRECISION, p_zoom INTEGER)
+RETURNS INTEGER AS $$
+  SELECT FLOOR(
+    (1 - LN(TAN(RADIANS(LEAST(GREATEST(p_lat, -85.0511), 85.0511))) + 1 / COS(RADIANS(LEAST(GREATEST(p_lat, -85.0511), 85.0511)))) / PI())
+    / 2 * (2 ^ p_zoom) * 4
+  )::int;
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Cell edges: west edge of column x, north edge of row y
+CREATE OR REPLACE FUNCTION task_map_cell_lon(p_x INTEGER, p_zoom INTEGER)
+RETURNS DOUBLE PRECISION AS $$
+  SELECT p_x / ((2 ^ p_zoom) * 4) * 360.0 - 180.0;
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION task_map_cell_lat(p_y INTEGER, p_zoom INTEGER)
+RETURNS DOUBLE PRECISION AS $$
+  SELECT DEGREES(ATAN(SINH(PI() * (1 - 2 * p_y / ((2 ^ p_zoom) * 4)))));
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Finest zoom read by get_task_clusters() for coarser zooms
+CREATE OR REPLACE FUNCTION task_map_base_zoom()
+RETURNS INTEGER AS $$
+  SELECT 12;
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE TABLE IF NOT EXISTS task_map_cells (
+  zoom SMALLINT NOT NULL,
+  cell_x INTEGER NOT NULL,
+  cell_y INTEGER NOT NULL,
+  category TEXT NOT NULL,
+  task_count INTEGER NOT NULL DEFAULT 0,
+  sum_lat DOUBLE PRECISION NOT NULL DEFAULT 0,
+  sum_lon DOUBLE PRECISION NOT NULL DEFAULT 0,
+  PRIMARY KEY (zoom, cell_x, cell_y, category)
+);
+
+ALTER TABLE task_map_cells ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Map cells are viewable by everyone" ON task_map_cells;
+CREATE POLICY "Map cells are viewable by everyone" ON task_map_cells
+  FOR SELECT USING (true);
+
+-- Singleton and street-level lookups by bounding box
+CREATE INDEX IF NOT EXISTS idx_tasks_open_lat_lon ON tasks (latitude, longitude) WHERE status = 'open';
+
+-- 2. Incremental refresh: each statement applies its net per-cell deltas once
+-- Cells that drop to zero are swept through a partial index
+CREATE INDEX IF NOT EXISTS idx_task_map_cells_empty ON task_map_cells (zoom) WHERE task_count <= 0;
+
+CREATE OR REPLACE FUNCTION task_map_cells_on_change()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    INSERT INTO task_map_cells AS c (zoom, cell_x, cell_y, category, task_count, sum_lat, sum_lon)
+    SELECT z, task_map_cell_x(lon, z), task_map_cell_y(lat, z), category, SUM(sign), SUM(sign * lat), SUM(sign * lon)
+    FROM (
+      SELECT latitude::float8 AS lat, longitude::float8 AS lon, COALESCE(category, 'other') AS category, 1 AS sign
+      FROM new_rows WHERE status = 'open' AND latitude IS NOT NULL AND longitude IS NOT NULL
+    ) changed CROSS JOIN generate_series(task_map_base_zoom(), 16) AS z
+    GROUP BY 1, 2, 3, 4
+    ORDER BY 1, 2, 3, 4
+    ON CONFLICT (zoom, cell_x, cell_y, category) DO UPDATE SET
+      task_count = c.task_count + EXCLUDED.task_count,
+      sum_lat = c.sum_lat + EXCLUDED.sum_lat,
+      sum_lon = c.sum_lon + EXCLUDED.sum_lon;
+  ELSIF TG_OP = 'DELETE' THEN
+    INSERT INTO task_map_cells AS c (zoom, cell_x, cell_y, category, task_count, sum_lat, sum_lon)
+    SELECT z, task_map_cell_x(lon, z), task_map_cell_y(lat, z), category, SUM(sign), SUM(sign * lat), SUM(sign * lon)
+    FROM (
+      SELECT latitude::float8 AS lat, longitude::float8 AS lon, COALESCE(category, 'other') AS category, -1 AS sign
+      FROM old_rows WHERE status = 'open' AND latitude IS NOT NULL AND longitude IS NOT NULL
+    ) changed CROSS JOIN generate_series(task_map_base_zoom(), 16) AS z
+    GROUP BY 1, 2, 3, 4
+    ORDER BY 1, 2, 3, 4
+    ON CONFLICT (zoom, cell_x, cell_y, category) DO UPDATE SET
+      task_count = c.task_count + EXCLUDED.task_count,
+      sum_lat = c.sum_lat + EXCLUDED.sum_lat,
+      sum_lon = c.sum_lon + EXCLUDED.sum_lon;
+  ELSE
+    INSERT INTO task_map_cells AS c (zoom, cell_x, cell_y, category, task_count, sum_lat, sum_lon)
+    SELECT z, task_map_cell_x(lon, z), task_map_cell_y(lat, z), category, SUM(sign), SUM(sign * lat), SUM(sign * lon)
+    FROM (
+      SELECT latitude::float8 AS lat, longitude::float8 AS lon, COALESCE(category, 'other') AS category, 1 AS sign
+      FROM new_rows WHERE status = 'open' AND latitude IS NOT NULL AND longitude IS NOT NULL
+      UNION ALL
+      SELECT latitude::float8, longitude::float8, COALESCE(category, 'other'), -1
+      FROM old_rows WHERE status = 'open' AND latitude IS NOT NULL AND longitude IS NOT NULL
+    ) changed CROSS JOIN generate_series(task_map_base_zoom(), 16) AS z
+    GROUP BY 1, 2, 3, 4
+    HAVING SUM(sign) <> 0 OR SUM(sign * lat) <> 0 OR SUM(sign * lon) <> 0
+    ORDER BY 1, 2, 3, 4
+    ON CONFLICT (zoom, cell_x, cell_y, category) DO UPDATE SET
+      task_count = c.task_count + EXCLUDED.task_count,
+      sum_lat = c.sum_lat + EXCLUDED.sum_lat,
+      sum_lon = c.sum_lon + EXCLUDED.sum_lon;
+  END IF;
+
+  IF TG_OP <> 'INSERT' THEN
+    DELETE FROM task_map_cells WHERE task_count <= 0;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS tasks_map_cells_insert ON tasks;
+CREATE TRIGGER tasks_map_cells_insert
+  AFTER INSERT ON tasks REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION task_map_cells_on_change();
+DROP TRIGGER IF EXISTS tasks_map_cells_update ON tasks;
+CREATE TRIGGER tasks_map_cells_update
+  AFTER UPDATE ON tasks REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION task_map_cells_on_change();
+DROP TRIGGER IF EXISTS tasks_map_cells_delete ON tasks;
+CREATE TRIGGER tasks_map_cells_delete
+  AFTER DELETE ON tasks REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION task_map_cells_on_change();
+
+-- 3. Full rebuild (initial backfill; safe to rerun if cells ever drift)
+CREATE OR REPLACE FUNCTION rebuild_task_map_cells()
+RETURNS VOID AS $$
+BEGIN
+  LOCK TABLE task_map_cells IN EXCLUSIVE MODE;
+  DELETE FROM task_map_cells;
+  INSERT INTO task_map_cells (zoom, cell_x, cell_y, category, task_count, sum_lat, sum_lon)
+  SELECT z, task_map_cell_x(longitude::float8, z), task_map_cell_y(latitude::float8, z), COALESCE(category, 'other'),
+         COUNT(*), SUM(latitude::float8), SUM(longitude::float8)
+  FROM tasks CROSS JOIN generate_series(task_map_base_zoom(), 16) AS z
+  WHERE status = 'open' AND latitude IS NOT NULL AND longitude IS NOT NULL
+  GROUP BY 1, 2, 3, 4;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+SELECT rebuild_task_map_cells();
+
+-- 4. Viewport query: one row per visible cell (task_id and task set for single-task cells)
+DROP FUNCTION IF EXISTS get_task_clusters(DOUBLE PRECISION, DOUBLE PRECISION, DOUBLE PRECISION, DOUBLE PRECISION, INTEGER, TEXT[], UUID);
+CREATE OR REPLACE FUNCTION get_task_clusters(
+  p_min_lat DOUBLE PRECISION,
+  p_min_lon DOUBLE PRECISION,
+  p_max_lat DOUBLE PRECISION,
+  p_max_lon DOUBLE PRECISION,
+  p_zoom INTEGER,
+  p_categories TEXT[] DEFAULT NULL,
+  p_exclude_user UUID DEFAULT NULL
+)
+RETURNS TABLE (
+  cluster_key TEXT,
+  latitude DOUBLE PRECISION,
+  longitude DOUBLE PRECISION,
+  task_count INTEGER,
+  task_id UUID,
+  task tasks
+) AS $$
+DECLARE
+  z INTEGER := LEAST(GREATEST(COALESCE(p_zoom, 12), 3), 17);
+  src INTEGER := GREATEST(LEAST(GREATEST(COALESCE(p_zoom, 12), 3), 17), task_map_base_zoom());
+  shift INTEGER := GREATEST(task_map_base_zoom() - LEAST(GREATEST(COALESCE(p_zoom, 12), 3), 17), 0);
+BEGIN
+  -- Street level: individual tasks
+  IF z > 16 THEN
+    RETURN QUERY
+    SELECT 't:' || t.id::text, t.latitude::float8, t.longitude::float8, 1, t.id, t
+    FROM tasks t
+    WHERE t.status = 'open'
+      AND t.latitude BETWEEN p_min_lat AND p_max_lat
+      AND t.longitude BETWEEN p_min_lon AND p_max_lon
+      AND (p_categories IS NULL OR COALESCE(t.category, 'other') = ANY(p_categories))
+      AND (p_exclude_user IS NULL OR t.user_id IS DISTINCT FROM p_exclude_user)
+    LIMIT 1000;
+    RETURN;
+  END IF;
+
+  RETURN QUERY
+  WITH cells AS (
+    -- Whole zoom-z cells touching the viewport, summed from their src-zoom cells
+    SELECT c.cell_x >> shift AS cell_x, c.cell_y >> shift AS cell_y,
+           SUM(c.task_count)::int AS n, SUM(c.sum_lat) AS slat, SUM(c.sum_lon) AS slon
+    FROM task_map_cells c
+    WHERE c.zoom = src
+      AND c.cell_x BETWEEN task_map_cell_x(p_min_lon, z) << shift AND ((task_map_cell_x(p_max_lon, z) + 1) << shift) - 1
+      AND c.cell_y BETWEEN task_map_cell_y(p_max_lat, z) << shift AND ((task_map_cell_y(p_min_lat, z) + 1) << shift) - 1
+      AND (p_categories IS NULL OR c.category = ANY(p_categories))
+    GROUP BY 1, 2
+  ),
+  -- The caller's own tasks are hidden on the map; subtract them live
+  mine AS (
+    SELECT task_map_cell_x(t.longitude::float8, z) AS cell_x, task_map_cell_y(t.latitude::float8, z) AS cell_y,
+           COUNT(*)::int AS n, SUM(t.latitude::float8) AS slat, SUM(t.longitude::float8) AS slon
+    FROM tasks t
+    WHERE p_exclude_user IS NOT NULL AND t.user_id = p_exclude_user AND t.status = 'open'
+      AND t.latitude IS NOT NULL AND t.longitude IS NOT NULL
+      AND (p_categories IS NULL OR COALESCE(t.category, 'other') = ANY(p_categories))
+    GROUP BY 1, 2
+  ),
+  net AS (
+    SELECT c.cell_x, c.cell_y, c.n - COALESCE(m.n, 0) AS n,
+           c.slat - COALESCE(m.slat, 0) AS slat, c.slon - COALESCE(m.slon, 0) AS slon
+    FROM cells c LEFT JOIN mine m ON m.cell_x = c.cell_x AND m.cell_y = c.cell_y
+  )
+  SELECT 'c:' || z || ':' || net.cell_x || ':' || net.cell_y,
+         net.slat / net.n, net.slon / net.n, net.n, one.id, one.t
+  FROM net
+  -- Single-task cells: the task itself, found by cell membership (the cell's
+  -- box on idx_tasks_open_lat_lon, then the exact cell test), not by centroid
+  LEFT JOIN LATERAL (
+    SELECT t.id, t
+    FROM tasks t
+    WHERE net.n = 1 AND t.status = 'open'
+      AND t.latitude BETWEEN task_map_cell_lat(net.cell_y + 1, z) - 1e-9 AND task_map_cell_lat(net.cell_y, z) + 1e-9
+      AND t.longitude BETWEEN task_map_cell_lon(net.cell_x, z) - 1e-9 AND task_map_cell_lon(net.cell_x + 1, z) + 1e-9
+      AND task_map_cell_x(t.longitude::float8, z) = net.cell_x
+      AND task_map_cell_y(t.latitude::float8, z) = net.cell_y
+      AND (p_categories IS NULL OR COALESCE(t.category, 'other') = ANY(p_categories))
+      AND (p_exclude_user IS NULL OR t.user_id IS DISTINCT FROM p_exclude_user)
+    ORDER BY t.id
+    LIMIT 1
+  ) one ON true
+  WHERE net.n > 0;
+END;
+$$ LANGUAGE plpgsql STABLE SECURITY DEFINER SET search_path = public;
+
+GRANT SELECT ON task_map_cells TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION get_task_clusters(DOUBLE PRECISION, DOUBLE PRECISION, DOUBLE PRECISION, DOUBLE PRECISION, INTEGER, TEXT[], UUID) TO anon, authenticated;
+
+-- The rebuild locks task_map_cells and the trigger is internal; neither may be
+-- reachable through /rpc/ (EXECUTE defaults to PUBLIC)
+REVOKE ALL ON FUNCTION rebuild_task_map_cells() FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION task_map_cells_on_change() FROM PUBLIC, anon, authenticated;
@@ -0,0 +1,72 @@
+-- Radius search for tasks on the ll_to_earth GiST index
+-- earth_box() is a bounding cube the GiST index can answer; earth_distance()
+-- then trims the corners and orders by great-circle distance. The functions
+-- are plain SQL without SET options so the planner inlines them and the
+-- caller's RLS and index both apply (extensions schema must be on the
+-- search_path, as it is for the Supabase API roles).
+
+-- 1. Extensions and the index (also created by update-supabase-schema.sql)
+CREATE EXTENSION IF NOT EXISTS cube;
+CREATE EXTENSION IF NOT EXISTS earthdistance;
+
+CREATE INDEX IF NOT EXISTS idx_tasks_location ON tasks USING GIST (ll_to_earth(latitude, longitude));
+
+-- 2. Open tasks within p_radius_km, nearest first (p_limit NULL = all of them)
+CREATE OR REPLACE FUNCTION get_tasks_nearby(
+  p_latitude DOUBLE PRECISION,
+  p_longitude DOUBLE PRECISION,
+  p_radius_km DOUBLE PRECISION DEFAULT 10,
+  p_limit INTEGER DEFAULT NULL
+)
+RETURNS TABLE (task tasks, distance_km DOUBLE PRECISION) AS $$
+  SELECT t, earth_distance(ll_to_earth(p_latitude, p_longitude), ll_to_earth(t.latitude, t.longitude)) / 1000.0
+  FROM tasks t
+  WHERE earth_box(ll_to_earth(p_latitude, p_longitude), p_radius_km * 1000.0) @> ll_to_earth(t.latitude, t.longitude)
+    AND earth_distance(ll_to_earth(p_latitude, p_longitude), ll_to_earth(t.latitude, t.longitude)) <= p_radius_km * 1000.0
+    AND t.status = 'open'
+  ORDER BY 2
+  LIMIT p_limit;
+$$ LANGUAGE sql STABLE;
+
+-- 3. Same, restricted to one category
+CREATE OR REPLACE FUNCTION get_tasks_nearby_by_category(
+  p_latitude DOUBLE PRECISION,
+  p_longitude DOUBLE PRECISION,
+  p_category TEXT,
+  p_radius_km DOUBLE PRECISION DEFAULT 10,
+  p_limit INTEGER DEFAULT NULL
+)
+RETURNS TABLE (task tasks, distance_km DOUBLE PRECISION) AS $$
+  SELECT t, earth_distance(ll_to_earth(p_latitude, p_longitude), ll_to_earth(t.latitude, t.longitude)) / 1000.0
+  FROM tasks t
+  WHERE earth_box(ll_to_earth(p_latitude, p_longitude), p_radius_km * 1000.0) @> ll_to_earth(t.latitude, t.longitude)
+    AND earth_distance(ll_to_earth(p_latitude, p_longitude), ll_to_earth(t.latitude, t.longitude)) <= p_radius_km * 1000.0
+    AND t.status = 'open'
+    AND t.category = p_category
+  ORDER BY 2
+  LIMIT p_limit;
+$$ LANGUAGE sql STABLE;
+
+-- 4. Pending offer counts (offers RLS hides other users' offers, so count as definer)
+CREATE OR REPLACE FUNCTION task_pending_offer_count(p_task_id UUID)
+RETURNS INTEGER AS $$
+  SELECT COUNT(*)::int FROM offers WHERE task_id = p_task_id AND status = 'pending';
+$$ LANGUAGE sql STABLE SECURITY DEFINER SET search_path = public;
+
+CREATE OR REPLACE FUNCTION get_tasks_nearby_with_offer_counts(
+  p_latitude DOUBLE PRECISION,
+  p_longitude DOUBLE PRECISION,
+  p_radius_km DOUBLE PRECISION DEFAULT 10,
+  p_limit INTEGER DEFAULT NULL
+)
+RETURNS TABLE (task tasks, distance_km DOUBLE PRECISION, offer_count INTEGER) AS $$
+  -- Counts only for the rows that survive the limit
+  SELECT n.task, n.distance_km, task_pending_offer_count((n.task).id)
+  FROM get_tasks_nearby(p_latitude, p_longitude, p_radius_km, p_limit) n
+  ORDER BY n.distance_km;
+$$ LANGUAGE sql STABLE;
+
+GRANT EXECUTE ON FUNCTION get_tasks_nearby(DOUBLE PRECISION, DOUBLE PRECISION, DOUBLE PRECISION, INTEGER) TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION get_tasks_nearby_by_category(DOUBLE PRECISION, DOUBLE PRECISION, TEXT, DOUBLE PRECISION, INTEGER) TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION get_tasks_nearby_with_offer_counts(DOUBLE PRECISION, DOUBLE PRECISION, DOUBLE PRECISION, INTEGER) TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION task_pending_offer_count(UUID) TO anon, authenticated;
@@ -0,0 +1,50 @@
+-- Index-friendly RLS policies for offers, task cancellations and payments
+-- The offers and task_cancellations SELECT policies asked
+-- auth.uid() IN (SELECT user_id FROM tasks WHERE id = task_id), a correlated
+-- subquery run for every candidate row. The rewrites ask the opposite
+-- question once per statement (which tasks does the caller own?) through a
+-- STABLE SECURITY DEFINER helper the planner turns into a hashed SubPlan, and
+-- wrap auth.uid() in a scalar subquery so it is an InitPlan evaluated once
+-- instead of a function call per row. Visible rows are unchanged; measured
+-- with `python -m currijobs_harness rls-profile`.
+
+-- 1. Ids of the tasks the caller owns (empty for anon)
+CREATE OR REPLACE FUNCTION current_user_task_ids()
+RETURNS SETOF UUID AS $$
+  SELECT id FROM tasks WHERE user_id = auth.uid();
+$$ LANGUAGE sql STABLE SECURITY DEFINER SET search_path = public;
+
+REVOKE ALL ON FUNCTION current_user_task_ids() FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION current_user_task_ids() TO anon, authenticated;
+
+-- 2. Offers: the bidder or the task owner
+DROP POLICY IF EXISTS "Offers are viewable by task owner and offer creator" ON offers;
+CREATE POLICY "Offers are viewable by task owner and offer creator" ON offers
+  FOR SELECT USING (
+    user_id = (SELECT auth.uid())
+    OR task_id IN (SELECT current_user_task_ids())
+  );
+
+-- 3. Task cancellations: the canceller or the task owner
+DROP POLICY IF EXISTS "Task cancellations are viewable by task owner and canceller" ON task_cancellations;
+CREATE POLICY "Task cancellations are viewable by task owner and canceller" ON task_cancellations
+  FOR SELECT USING (
+    cancelled_by = (SELECT auth.uid())
+    OR task_id IN (SELECT current_user_task_ids())
+  );
+
+-- 4. Payments: payer or payee, with auth.uid() evaluated once
+DROP POLICY IF EXISTS "Payments are viewable by payer and payee" ON payments;
+CREATE POLICY "Payments are viewable by payer and payee" ON payments
+  FOR SELECT USING (
+    payer_id = (SELECT auth.uid())
+    OR payee_id = (SELECT auth.uid())
+  );
+
+-- 5. Supporting indexes: the per-task offer list is ordered by created_at
+--    (fetchOffersForTask), and the cancellation policy filters on cancelled_by
+CREATE INDEX IF NOT EXISTS idx_offers_task_created ON offers (task_id, created_at DESC);
+-- task_id leads idx_offers_task_created, which covers every lookup the
+-- single-column index served; keeping both only costs writes on offers
+DROP INDEX IF EXISTS idx_offers_task_id;
+CREATE INDEX IF NOT EXISTS idx_task_cancellations_cancelled_by ON task_cancellations (cancelled_by);
@@ -0,0 +1,21 @@
+-- Workload-driven indexes
+-- Generated by `python -m currijobs_harness index-advisor` from a replay of the
+-- app workload (14 statements x 20 rounds) against 2,000 users and 50,000 tasks.
+-- Ranked by planner cost saved per replay minus index maintenance for the
+-- workload's writes; each pick was re-costed against the ones before it.
+
+-- 1. tasks_assigned_to_user
+--    saves 7,423 cost units per replay, write cost 8
+CREATE INDEX IF NOT EXISTS idx_tasks_assigned_to ON tasks (assigned_to);
+
+-- 2. payments_for_user, payments_received_count
+--    saves 4,169 cost units per replay, write cost 4
+CREATE INDEX IF NOT EXISTS idx_payments_payee_id ON payments (payee_id);
+
+-- 3. open_tasks_by_category
+--    saves 2,120 cost units per replay, write cost 2
+CREATE INDEX IF NOT EXISTS idx_tasks_category_created_at_open ON tasks (category, created_at DESC) WHERE status = 'open';
+
+-- 4. payments_made_count
+--    saves 2,084 cost units per replay, write cost 4
+CREATE INDEX IF NOT EXISTS idx_payments_payer_id ON payments (payer_id);
@@ -0,0 +1,12 @@
+"""
+CurriJobs Test Harness
+One entry point for the test, demo and benchmark scripts
+
+Usage (from test-automation/):
+    python -m currijobs_harness --help
+    python -m currijobs_harness ping
+    python -m currijobs_harness --profile-startup quick-test
+
+Heavy dependencies (selenium, requests, webbrowser) are only imported by the
+subcommand that needs them, so quick checks start in milliseconds.
+"""
@@ -0,0 +1,317 @@
+"""
+Image optimization build stage
+Resizes the PNGs listed in assets/image-manifest.json to the densities they
+are rendered at and re-encodes them (WebP by default) into assets/optimized:
+
+    assets/optimized/login.webp      @1x, fits the manifest box in points
+    assets/optimized/login@2x.webp   Metro picks the scale matching the device
+    assets/optimized/login@3x.webp
+
+Each manifest box is the largest size the image is drawn at, in points.
+Densities are never upscaled past the source; a scale that would come out
+the same size as the one below it is skipped and Metro falls back to the
+nearest one. Variants are encoded in
+parallel across cores and cached by content hash (source bytes + settings +
+Pillow version) under the harness cache, so a rebuild only encodes what
+changed. assets/optimized/index.json records the hash of every output;
+--check verifies it without encoding and fails if app code still requires
+an original PNG that has an optimized version.
+
+Reports shipped bytes and decode time (Pillow decode as a proxy for the
+device decoder) for the originals versus the variants.
+
+Usage:
+    python -m currijobs_harness optimize-assets
+    python -m currijobs_harness optimize-assets --check
+    python -m currijobs_harness optimize-assets --jobs 4 --format png
+"""
+
+import os
+
+from currijobs_harness.cli import REPO_ROOT
+
+MANIFEST_PATH = os.path.join(REPO_ROOT, "assets", "image-manifest.json")
+HISTORY_NAME = "assets"
+# Bump when the encoding code changes in a way that changes the output bytes
+PIPELINE_VERSION = 1
+SOURCE_DIRS = ("app", "components", "contexts", "lib")
+
+
+def add_arguments(parser):
+    parser.add_argument("--manifest", default=MANIFEST_PATH, help="Manifest (default: assets/image-manifest.json)")
+    parser.add_argument("--format", choices=("webp", "png"), default=None, help="Override the manifest output format")
+    parser.add_argument("--jobs", type=int, default=None, help="Encoder processes (default: CPU count)")
+    parser.add_argument("--decode-runs", type=int, default=5, help="Decodes per file when timing (default: 5)")
+    parser.add_argument("--check", action="store_true", help="Fail if outputs are stale or originals are still required")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+def load_manifest(path):
+    import json
+
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    manifest["output_dir"] = os.path.join(REPO_ROOT, manifest["output"])
+    return manifest
+
+
+def file_sha256(path):
+    import hashlib
+
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def plan(manifest, fmt):
+    """One job per (image, scale): source, output name, target box in pixels and cache key"""
+    import hashlib
+    import json
+
+    import PIL
+    from PIL import Image
+
+    jobs = []
+    assets_dir = os.path.join(REPO_ROOT, "assets")
+    for name, spec in manifest["images"].items():
+        source = os.path.join(assets_dir, name)
+        source_hash = file_sha256(source)
+        stem = os.path.splitext(name)[0]
+        with Image.open(source) as image:
+            width, height = image.size
+        previous = None
+        for scale in manifest["scales"]:
+            box = [spec["box"][0] * scale, spec["box"][1] * scale]
+            size = fit(width, height, box)
+            if size == previous:
+                continue
+            previous = size
+            settings = {
+                "box": box,
+                "format": spec.get("format", fmt),
+                "quality": spec.get("quality", manifest["quality"]),
+                "pipeline": PIPELINE_VERSION,
+                "pillow": PIL.__version__,
+            }
+            key = hashlib.sha256((source_hash + json.dumps(settings, sort_keys=True)).encode()).hexdigest()
+            suffix = "" if scale == 1 else f"@{scale}x"
+            jobs.append({
+                "source": source,
+                "output": f"{stem}{suffix}.{settings['format']}",
+                "scale": scale,
+                "key": key,
+                **settings,
+            })
+    return jobs
+
+
+def fit(width, height, box):
+    """Largest size with the source aspect ratio inside box, never upscaled"""
+    ratio = min(box[0] / width, box[1] / height, 1.0)
+    return max(1, round(width * ratio)), max(1, round(height * ratio))
+
+
+def encode(job):
+    """Resize and encode one variant; runs in a worker process, returns (output, bytes)"""
+    import io
+
+    from PIL import Image
+
+    with Image.open(job["source"]) as image:
+        image.load()
+        has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+        image = image.convert("RGBA" if has_alpha else "RGB")
+        size = fit(image.width, image.height, job["box"])
+        if size != image.size:
+            image = image.resize(size, Image.LANCZOS)
+        out = io.BytesIO()
+        if job["format"] == "webp":
+            image.save(out, "WEBP", quality=job["quality"], method=6, exact=False)
+        else:
+            # Lossless, recompressed at the highest zlib effort
+            image.save(out, "PNG", optimize=True)
+    return job["output"], out.getvalue()
+
+
+def run_jobs(jobs, cache, workers):
+    """Encode cache misses in parallel; returns {output: (bytes, cached)}"""
+    from concurrent.futures import ProcessPoolExecutor
+
+    results, misses = {}, []
+    for job in jobs:
+        cached = os.path.join(cache, f"{job['key']}.{job['format']}")
+        if os.path.exists(cached):
+            with open(cached, "rb") as f:
+                data = f.read()
+            results[job["output"]] = (data, True)
+        else:
+            misses.append(job)
+
+    if misses:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for job, (output, data) in zip(misses, pool.map(encode, misses)):
+                with open(os.path.join(cache, f"{job['key']}.{job['format']}"), "wb") as f:
+                    f.write(data)
+                results[output] = (data, False)
+    return results
+
+
+def decode_ms(data, runs):
+    """Median Pillow decode time for an encoded image"""
+    import io
+    import statistics
+    import time
+
+    from PIL import Image
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        with Image.open(io.BytesIO(data)) as image:
+            image.load()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def original_requires(manifest):
+    """'file:line' for app code still requiring an original that has optimized variants"""
+    import re
+
+    names = "|".join(re.escape(name) for name in manifest["images"])
+    pattern = re.compile(rf"require\(['\"](?:\.\./)+assets/({names})['\"]\)")
+    hits = []
+    for top in SOURCE_DIRS:
+        for root, _, files in os.walk(os.path.join(REPO_ROOT, top)):
+            for name in files:
+                if not name.endswith((".ts", ".tsx")):
+                    continue
+                path = os.path.join(root, name)
+                with open(path, encoding="utf-8") as f:
+                    for line_no, line in enumerate(f, start=1):
+                        if pattern.search(line):
+                            hits.append(f"{os.path.relpath(path, REPO_ROOT)}:{line_no}")
+    return hits
+
+
+def check(manifest, jobs):
+    import json
+
+    index_path = os.path.join(manifest["output_dir"], "index.json")
+    index = {}
+    if os.path.exists(index_path):
+        with open(index_path, encoding="utf-8") as f:
+            index = json.load(f)
+    stale = [
+        job["output"] for job in jobs
+        if index.get(job["output"], {}).get("key") != job["key"]
+        or not os.path.exists(os.path.join(manifest["output_dir"], job["output"]))
+    ]
+    requires = original_requires(manifest)
+    for output in stale:
+        print(f"❌ {manifest['output']}/{output} is stale or missing")
+    for hit in requires:
+        print(f"❌ {hit} requires an original; use the {manifest['output']} variant")
+    if stale:
+        print("Run: python -m currijobs_harness optimize-assets")
+    if stale or requires:
+        return 1
+    print(f"✅ {len(jobs)} variants up to date and no originals required")
+    return 0
+
+
+def run(args):
+    import json
+    import time
+
+    from currijobs_harness import results
+    from currijobs_harness.bootstrap import cache_dir
+    from currijobs_harness.sourcemap import format_bytes
+
+    print("🖼️  CurriJobs Asset Optimizer")
+    print("=" * 50)
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("❌ Pillow is not installed; run: python -m currijobs_harness bootstrap")
+        return 1
+
+    manifest = load_manifest(args.manifest)
+    jobs = plan(manifest, args.format or manifest["format"])
+    if args.check:
+        return check(manifest, jobs)
+
+    cache = os.path.join(cache_dir(), "assets")
+    os.makedirs(cache, exist_ok=True)
+    os.makedirs(manifest["output_dir"], exist_ok=True)
+    workers = args.jobs or os.cpu_count() or 1
+    start = time.perf_counter()
+    encoded = run_jobs(jobs, cache, workers)
+    build_s = time.perf_counter() - start
+    misses = sum(1 for _, cached in encoded.values() if not cached)
+    print(f"⚙️  {len(jobs)} variants, {misses} encoded on {workers} worker(s), "
+          f"{len(jobs) - misses} from cache, {build_s:.1f} s")
+
+    index = {}
+    expected = {job["output"] for job in jobs}
+    for job in jobs:
+        data = encoded[job["output"]][0]
+        with open(os.path.join(manifest["output_dir"], job["output"]), "wb") as f:
+            f.write(data)
+        index[job["output"]] = {"key": job["key"], "bytes": len(data), "source": os.path.basename(job["source"])}
+    for name in os.listdir(manifest["output_dir"]):
+        if name != "index.json" and name not in expected:
+            os.remove(os.path.join(manifest["output_dir"], name))
+    with open(os.path.join(manifest["output_dir"], "index.json"), "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+    report = {"variants": len(jobs), "encoded": misses, "build_s": round(build_s, 2), "images": {}}
+    print(f"\n{'image':<30} {'original':>10} {'@1x':>9} {'@2x':>9} {'@3x':>9} {'decode ms':>16}")
+    by_source = {}
+    for job in jobs:
+        by_source.setdefault(job["source"], []).append(job)
+    totals = {"original": 0, "shipped": 0, "decode_original": 0.0, "decode_3x": 0.0}
+    for source, variants in by_source.items():
+        with open(source, "rb") as f:
+            original = f.read()
+        sizes = {job["scale"]: len(encoded[job["output"]][0]) for job in variants}
+        top = encoded[max(variants, key=lambda j: j["scale"])["output"]][0]
+        before_ms, after_ms = decode_ms(original, args.decode_runs), decode_ms(top, args.decode_runs)
+        name = os.path.basename(source)
+        report["images"][name] = {
+            "original_bytes": len(original),
+            "variant_bytes": sizes,
+            "decode_ms": {"original": round(before_ms, 2), "top_scale": round(after_ms, 2)},
+        }
+        totals["original"] += len(original)
+        totals["shipped"] += sum(sizes.values())
+        totals["decode_original"] += before_ms
+        totals["decode_3x"] += after_ms
+        print(f"{name:<30} {format_bytes(len(original)):>10} "
+              + " ".join(f"{format_bytes(sizes[s]) if s in sizes else '-':>9}" for s in (1, 2, 3))
+              + f" {before_ms:>7.1f} → {after_ms:<6.1f}")
+
+    top_scale = max(manifest["scales"])
+    # What a top-density device loads: its own scale, or the nearest one below when skipped
+    per_device = sum(sizes[max(sizes)] for sizes in (v["variant_bytes"] for v in report["images"].values()))
+    report["totals"] = {
+        "original_bytes": totals["original"],
+        "shipped_bytes": totals["shipped"],
+        "top_scale_bytes": per_device,
+        "decode_ms_original": round(totals["decode_original"], 1),
+        "decode_ms_top_scale": round(totals["decode_3x"], 1),
+    }
+    print(f"\n📦 Originals {format_bytes(totals['original'])} → all densities {format_bytes(totals['shipped'])} "
+          f"(-{(1 - totals['shipped'] / totals['original']) * 100:.0f}%), "
+          f"@{top_scale}x only {format_bytes(per_device)}")
+    print(f"⏱️  Decode {totals['decode_original']:.0f} ms → {totals['decode_3x']:.0f} ms at @{top_scale}x "
+          f"(-{(1 - totals['decode_3x'] / totals['decode_original']) * 100:.0f}%)")
+
+    if not args.no_history:
+        record = results.append_history(HISTORY_NAME, report)
+        print(f"📝 Recorded run for {record['commit']}")
+
+    requires = original_requires(manifest)
+    if requires:
+        print(f"⚠️  Still requiring originals: {', '.join(requires)}")
+    print(f"✅ Wrote {len(jobs)} variants to {manifest['output']}")
+    return 0
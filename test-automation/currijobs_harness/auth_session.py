@@ -0,0 +1,297 @@
+"""
+API-level sessions for browser tests
+Signs in against GoTrue (POST /token?grant_type=password) instead of typing
+into the login form, caches the session per worker until it is about to
+expire, and injects it into the browser under the storage key the app's
+GoTrueClient reads (lib/supabase-lightweight.ts). The app boots straight
+into the signed-in state, so a test opens its target route in one
+navigation.
+
+Sessions come from one of two sources:
+
+    GoTrue      the project in lib/supabase-lightweight.ts, or
+                CURRIJOBS_GOTRUE_URL / CURRIJOBS_ANON_KEY
+    stand-in    a session minted locally for an existing auth.users row,
+                signed with CURRIJOBS_JWT_SECRET (PostgREST's PGRST_JWT_SECRET).
+                For the local stack, which runs PostgREST without GoTrue, and for
+                seeded users, which have no password
+
+Cache layout: <harness cache>/sessions/<worker>.json. A cached session is
+reused while it has more than --min-ttl seconds left; an expiring GoTrue
+session is refreshed with its refresh token.
+
+In a Selenium test:
+
+    from currijobs_harness import auth_session
+
+    session = auth_session.get_session("test@example.com", "TestPassword123!")
+    auth_session.open_as(driver, "http://localhost:8081", "/create-task", session)
+
+Usage:
+    python -m currijobs_harness auth-session --email test@example.com --password ...
+    python -m currijobs_harness auth-session --email fixture-1@bench.currijobs.test --stand-in
+    python -m currijobs_harness auth-session --email test@example.com --print-token
+"""
+
+import json
+import os
+import re
+import time
+
+from currijobs_harness.cli import REPO_ROOT
+
+STORAGE_KEY = "supabase.auth.token"
+CLIENT_CONFIG = os.path.join(REPO_ROOT, "lib", "supabase-lightweight.ts")
+# gotrue-js refreshes sessions within ~90 s of expiry on load; keep well clear of that
+MIN_TTL_S = 300
+STAND_IN_TTL_S = 3600
+STAND_IN_SECRET = "currijobs-local-stand-in-secret-32chars"
+INJECTED_MARKER = "currijobs-harness:session-injected"
+
+# Runs before any app script on every document; writes the session once per tab so sign-out still sticks
+INJECT_JS = """
+(() => {
+  if (location.origin !== %(origin)s || sessionStorage.getItem(%(marker)s)) return;
+  localStorage.setItem(%(key)s, %(value)s);
+  sessionStorage.setItem(%(marker)s, '1');
+})();
+"""
+
+
+def add_arguments(parser):
+    from currijobs_harness import db
+
+    parser.add_argument("--email", required=True, help="User to sign in as")
+    parser.add_argument("--password", default=os.environ.get("CURRIJOBS_TEST_PASSWORD"),
+                        help="Password for GoTrue (CURRIJOBS_TEST_PASSWORD)")
+    parser.add_argument("--stand-in", action="store_true", help="Mint a session locally instead of calling GoTrue")
+    db.add_dsn_argument(parser)
+    parser.add_argument("--min-ttl", type=int, default=MIN_TTL_S,
+                        help=f"Reuse a cached session with at least this many seconds left (default: {MIN_TTL_S})")
+    parser.add_argument("--worker", default=None, help="Cache partition (default: as db-fixture)")
+    parser.add_argument("--print-token", action="store_true", help="Print only the access token")
+    parser.add_argument("--clear", action="store_true", help="Forget this worker's cached sessions")
+
+
+def client_config():
+    """(GoTrue URL, anon key) the app uses, overridable from the environment"""
+    url, key = os.environ.get("CURRIJOBS_GOTRUE_URL"), os.environ.get("CURRIJOBS_ANON_KEY")
+    if not (url and key):
+        with open(CLIENT_CONFIG, encoding="utf-8") as f:
+            source = f.read()
+        if not url:
+            url = re.search(r"const supabaseUrl = '([^']+)'", source).group(1) + "/auth/v1"
+        if not key:
+            key = re.search(r"const supabaseAnonKey = '([^']+)'", source).group(1)
+    return url.rstrip("/"), key
+
+
+def cache_path(worker=None):
+    from currijobs_harness.bootstrap import cache_dir
+    from currijobs_harness.db_fixture import worker_id
+
+    return os.path.join(cache_dir(), "sessions", f"{worker_id(worker)}.json")
+
+
+def load_cache(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(path, cache):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+    os.replace(tmp, path)
+
+
+def gotrue_token(url, anon_key, grant_type, body, timeout=15):
+    """POST {url}/token; returns the session with expires_at filled in"""
+    import urllib.error
+    import urllib.request
+
+    request = urllib.request.Request(
+        f"{url}/token?grant_type={grant_type}",
+        data=json.dumps(body).encode(),
+        headers={"apikey": anon_key, "Authorization": f"Bearer {anon_key}", "Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            session = json.load(response)
+    except urllib.error.HTTPError as e:
+        detail = e.read().decode(errors="replace")
+        try:
+            detail = json.loads(detail).get("error_description") or json.loads(detail).get("msg") or detail
+        except ValueError:
+            pass
+        raise RuntimeError(f"GoTrue {grant_type} failed ({e.code}): {detail}") from None
+    session.setdefault("expires_at", int(time.time()) + int(session.get("expires_in", 3600)))
+    return session
+
+
+def stand_in_secret():
+    """HS256 secret shared with the local PostgREST"""
+    return os.environ.get("CURRIJOBS_JWT_SECRET") or os.environ.get("PGRST_JWT_SECRET") or STAND_IN_SECRET
+
+
+def sign_jwt(claims, secret):
+    """HS256 JWT, as GoTrue issues"""
+    import base64
+    import hashlib
+    import hmac
+
+    def encode(data):
+        return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+    signing_input = ".".join(
+        encode(json.dumps(part, separators=(",", ":")).encode()) for part in ({"alg": "HS256", "typ": "JWT"}, claims)
+    )
+    signature = hmac.new(secret.encode(), signing_input.encode(), hashlib.sha256).digest()
+    return f"{signing_input}.{encode(signature)}"
+
+
+def stand_in_session(user_id, email, created_at=None, secret=None, ttl=STAND_IN_TTL_S):
+    """A GoTrue-shaped session for user_id without a GoTrue server"""
+    import secrets
+    import uuid
+
+    secret = secret or stand_in_secret()
+    now = int(time.time())
+    app_metadata = {"provider": "email", "providers": ["email"]}
+    claims = {
+        "aud": "authenticated",
+        "exp": now + ttl,
+        "iat": now,
+        "iss": "currijobs-harness",
+        "sub": str(user_id),
+        "email": email,
+        "role": "authenticated",
+        "app_metadata": app_metadata,
+        "user_metadata": {},
+        "aal": "aal1",
+        "amr": [{"method": "password", "timestamp": now}],
+        "session_id": str(uuid.uuid4()),
+    }
+    created = created_at or time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+    return {
+        "access_token": sign_jwt(claims, secret),
+        "token_type": "bearer",
+        "expires_in": ttl,
+        "expires_at": now + ttl,
+        "refresh_token": secrets.token_urlsafe(16),
+        "user": {
+            "id": str(user_id),
+            "aud": "authenticated",
+            "role": "authenticated",
+            "email": email,
+            "email_confirmed_at": created,
+            "app_metadata": app_metadata,
+            "user_metadata": {},
+            "identities": [],
+            "created_at": created,
+            "updated_at": created,
+        },
+    }
+
+
+def lookup_user(dsn, email, pooled=None):
+    """(id, created_at ISO string) of the auth.users row for email"""
+    from currijobs_harness import db
+
+    with db.connect(dsn, pooled=pooled) as conn:
+        row = conn.execute("SELECT id, created_at FROM auth.users WHERE email = %s", (email,)).fetchone()
+    if not row:
+        raise LookupError(f"No auth.users row for {email}")
+    return row[0], row[1].isoformat() if row[1] else None
+
+
+def get_session(email, password=None, stand_in=False, dsn=None, pooled=None, min_ttl=MIN_TTL_S, worker=None):
+    """Cached session for email, signing in or refreshing only when needed; returns (session, source)"""
+    from currijobs_harness import db
+
+    url, anon_key = client_config()
+    key = f"stand-in|{email}" if stand_in else f"{url}|{email}"
+    path = cache_path(worker)
+    cache = load_cache(path)
+    cached = cache.get(key)
+    if cached and cached["expires_at"] - time.time() > min_ttl:
+        return cached, "cache"
+
+    if stand_in:
+        user_id, created_at = lookup_user(dsn or db.DEFAULT_DSN, email, pooled)
+        session, source = stand_in_session(user_id, email, created_at), "stand-in"
+    else:
+        session = None
+        if cached and cached.get("refresh_token"):
+            try:
+                session, source = gotrue_token(url, anon_key, "refresh_token", {"refresh_token": cached["refresh_token"]}), "refresh"
+            except RuntimeError:
+                session = None
+        if session is None:
+            if not password:
+                raise ValueError(f"No cached session for {email}; pass a password")
+            session, source = gotrue_token(url, anon_key, "password", {"email": email, "password": password}), "gotrue"
+    cache[key] = session
+    save_cache(path, cache)
+    return session, source
+
+
+def inject(driver, base_url, session, storage_key=STORAGE_KEY):
+    """Arrange for session to be in localStorage before the app's first script runs
+
+    Chrome installs the write as a new-document script, so the next navigation
+    lands signed in. Other drivers get the write after loading the origin,
+    which costs one extra navigation.
+    """
+    from urllib.parse import urlsplit
+
+    parts = urlsplit(base_url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    values = {key: json.dumps(value) for key, value in
+              {"origin": origin, "marker": INJECTED_MARKER, "key": storage_key, "value": json.dumps(session)}.items()}
+    if hasattr(driver, "execute_cdp_cmd"):
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": INJECT_JS % values})
+        return True
+    driver.get(origin + "/")
+    driver.execute_script("localStorage.setItem(arguments[0], arguments[1]);", storage_key, json.dumps(session))
+    return False
+
+
+def open_as(driver, base_url, route, session, storage_key=STORAGE_KEY):
+    """Open route already signed in as session's user"""
+    inject(driver, base_url, session, storage_key)
+    driver.get(base_url.rstrip("/") + "/" + route.lstrip("/"))
+
+
+def run(args):
+    from currijobs_harness import db
+
+    if args.clear:
+        path = cache_path(args.worker)
+        if os.path.exists(path):
+            os.remove(path)
+        print(f"🧹 Cleared {path}")
+        return 0
+    try:
+        session, source = get_session(args.email, args.password, args.stand_in, db.dsn_for(args), db.pooled_for(args),
+                                      args.min_ttl, args.worker)
+    except Exception as e:
+        print(f"❌ Could not get a session for {args.email}: {e}")
+        return 1
+    if args.print_token:
+        print(session["access_token"])
+        return 0
+
+    print("🔑 CurriJobs Test Session")
+    print("=" * 50)
+    labels = {"cache": "cached", "refresh": "refreshed via GoTrue", "gotrue": "signed in via GoTrue", "stand-in": "minted locally"}
+    remaining = session["expires_at"] - time.time()
+    print(f"👤 {session['user']['email']} ({session['user']['id']})")
+    print(f"📦 {labels[source]}; expires in {remaining / 60:.0f} min")
+    print(f"✅ Stored under '{STORAGE_KEY}' for injection ({cache_path(args.worker)})")
+    return 0
@@ -0,0 +1,168 @@
+"""
+Cached dependency bootstrap
+Keeps one virtualenv per hash of requirements.txt + interpreter, and a shared
+wheelhouse so repeat and offline installs never touch the network
+
+Cache layout (CURRIJOBS_HARNESS_CACHE, default ~/.cache/currijobs-harness):
+    wheelhouse/          wheels built by `pip wheel`, shared by every key
+    envs/<key>/          virtualenv for one requirements/interpreter combination
+    envs/<key>/.complete marker written only after a successful install
+    stamps/<key>         marker for --no-venv installs into the current interpreter
+"""
+
+import hashlib
+import os
+import sys
+
+from currijobs_harness.cli import AUTOMATION_DIR
+
+DEFAULT_REQUIREMENTS = os.path.join(AUTOMATION_DIR, "requirements.txt")
+COMPLETE_MARKER = ".complete"
+
+
+def cache_dir():
+    """Root of the harness cache"""
+    default = os.path.join(os.path.expanduser("~"), ".cache", "currijobs-harness")
+    return os.environ.get("CURRIJOBS_HARNESS_CACHE", default)
+
+
+def requirements_key(requirements, python=None):
+    """Hash of the requirements file plus the interpreter it is installed for"""
+    import platform
+
+    digest = hashlib.sha256()
+    with open(requirements, "rb") as f:
+        digest.update(f.read())
+    digest.update((python or sys.version).encode())
+    digest.update(sys.implementation.cache_tag.encode())
+    digest.update(platform.machine().encode())
+    digest.update(sys.platform.encode())
+    return digest.hexdigest()[:16]
+
+
+def venv_python(env_dir):
+    """Path to the interpreter inside a virtualenv"""
+    if os.name == "nt":
+        return os.path.join(env_dir, "Scripts", "python.exe")
+    return os.path.join(env_dir, "bin", "python")
+
+
+def is_offline(offline=None):
+    """An explicit flag wins; otherwise CURRIJOBS_OFFLINE decides"""
+    if offline is not None:
+        return offline
+    return os.environ.get("CURRIJOBS_OFFLINE", "").lower() in ("1", "true", "yes", "on")
+
+
+def pip(python, *args):
+    """Run pip with the given interpreter, quietly"""
+    import subprocess
+
+    subprocess.check_call([python, "-m", "pip", "--disable-pip-version-check", "-q"] + list(args))
+
+
+def fill_wheelhouse(requirements, wheelhouse):
+    """Build or download wheels for every requirement into the wheelhouse"""
+    os.makedirs(wheelhouse, exist_ok=True)
+    pip(sys.executable, "wheel", "-r", requirements, "-w", wheelhouse, "--find-links", wheelhouse)
+
+
+def install_from_wheelhouse(python, requirements, wheelhouse):
+    """Install requirements strictly from the local wheelhouse"""
+    pip(python, "install", "--no-index", "--find-links", wheelhouse, "-r", requirements)
+
+
+def ensure_dependencies(requirements=DEFAULT_REQUIREMENTS, offline=None, use_venv=True):
+    """Make sure requirements are installed; return the interpreter to run tests with
+
+    On a cache hit nothing is executed. On a miss the wheelhouse is refreshed
+    (skipped when offline) and the install runs with --no-index against it.
+    If the refresh fails, e.g. without network, an existing wheelhouse is used
+    as is and the install fails only if it lacks a requirement.
+    """
+    import shutil
+    import subprocess
+
+    offline = is_offline(offline)
+    key = requirements_key(requirements)
+    root = cache_dir()
+    wheelhouse = os.path.join(root, "wheelhouse")
+
+    if use_venv:
+        env_dir = os.path.join(root, "envs", key)
+        python = venv_python(env_dir)
+        marker = os.path.join(env_dir, COMPLETE_MARKER)
+    else:
+        python = sys.executable
+        # Tie the stamp to this interpreter prefix as well as the key
+        prefix_hash = hashlib.sha256(sys.prefix.encode()).hexdigest()[:8]
+        marker = os.path.join(root, "stamps", f"{key}-{prefix_hash}")
+
+    if os.path.exists(marker) and os.path.exists(python):
+        print(f"✅ Dependencies up to date (cache {key})")
+        return python
+
+    print(f"📦 Installing dependencies (cache {key}{', offline' if offline else ''})...")
+    if not offline:
+        try:
+            fill_wheelhouse(requirements, wheelhouse)
+        except subprocess.CalledProcessError:
+            if not os.path.isdir(wheelhouse) or not os.listdir(wheelhouse):
+                raise
+            print("⚠️ Could not refresh the wheelhouse (no network?); installing from the cached wheels")
+    elif not os.path.isdir(wheelhouse):
+        raise RuntimeError(f"Offline install requested but no wheelhouse at {wheelhouse}")
+
+    if use_venv:
+        import venv
+
+        # A partial env from an interrupted run is not trustworthy
+        shutil.rmtree(env_dir, ignore_errors=True)
+        venv.EnvBuilder(with_pip=True, clear=True).create(env_dir)
+
+    install_from_wheelhouse(python, requirements, wheelhouse)
+
+    os.makedirs(os.path.dirname(marker), exist_ok=True)
+    with open(marker, "w") as f:
+        f.write(requirements_key(requirements) + "\n")
+    print("✅ Dependencies installed successfully")
+    return python
+
+
+def prune(keep_key=None):
+    """Remove cached virtualenvs other than keep_key"""
+    import shutil
+
+    envs = os.path.join(cache_dir(), "envs")
+    if not os.path.isdir(envs):
+        return 0
+    removed = 0
+    for name in os.listdir(envs):
+        if name != keep_key:
+            shutil.rmtree(os.path.join(envs, name), ignore_errors=True)
+            removed += 1
+    return removed
+
+
+def add_arguments(parser):
+    parser.add_argument("-r", "--requirements", default=DEFAULT_REQUIREMENTS, help="Requirements file")
+    parser.add_argument("--offline", action="store_true", default=None, help="Install only from the local wheelhouse")
+    parser.add_argument("--no-venv", action="store_true", help="Install into the current interpreter")
+    parser.add_argument("--print-python", action="store_true", help="Print the interpreter path and exit")
+    parser.add_argument("--prune", action="store_true", help="Delete virtualenvs for other requirement hashes")
+
+
+def run(args):
+    import subprocess
+
+    try:
+        python = ensure_dependencies(args.requirements, offline=args.offline, use_venv=not args.no_venv)
+    except (subprocess.CalledProcessError, RuntimeError) as e:
+        print(f"❌ Failed to install dependencies: {e}")
+        return 1
+    if args.prune:
+        removed = prune(keep_key=requirements_key(args.requirements))
+        print(f"🧹 Removed {removed} stale environment(s)")
+    if args.print_python:
+        print(python)
+    return 0
@@ -0,0 +1,171 @@
+"""
+Chrome helpers for harness commands
+Creates Selenium Chrome drivers with DevTools tracing enabled and reads the
+trace back out of the ChromeDriver performance log
+"""
+
+import json
+
+DEFAULT_APP_URL = "http://localhost:8081"
+
+TRACE_CATEGORIES = ",".join([
+    "devtools.timeline",
+    "disabled-by-default-devtools.timeline",
+    "disabled-by-default-devtools.timeline.frame",
+    "v8",
+    "v8.execute",
+    "blink.user_timing",
+    "loading",
+    "toplevel",
+])
+
+# Resolves with performance.now() once the app root has something a user can
+# interact with and two animation frames have been painted after it
+WAIT_FOR_INTERACTIVE_JS = """
+const done = arguments[arguments.length - 1];
+const timeoutMs = arguments[0];
+const started = performance.now();
+function ready() {
+  const root = document.getElementById('root');
+  return root && root.querySelector('[role="button"], button, input, textarea, a[href]');
+}
+(function poll() {
+  if (ready()) {
+    requestAnimationFrame(() => requestAnimationFrame(() => done(performance.now())));
+  } else if (performance.now() - started > timeoutMs) {
+    done(null);
+  } else {
+    setTimeout(poll, 25);
+  }
+})();
+"""
+
+# Resolves with performance.now() once an element matching the selector has
+# been painted, or null on timeout
+WAIT_FOR_SELECTOR_JS = """
+const done = arguments[arguments.length - 1];
+const selector = arguments[0];
+const timeoutMs = arguments[1];
+const started = performance.now();
+(function poll() {
+  if (document.querySelector(selector)) {
+    requestAnimationFrame(() => done(performance.now()));
+  } else if (performance.now() - started > timeoutMs) {
+    done(null);
+  } else {
+    setTimeout(poll, 25);
+  }
+})();
+"""
+
+NAVIGATION_TIMING_JS = """
+const nav = performance.getEntriesByType('navigation')[0];
+const paints = {};
+performance.getEntriesByType('paint').forEach(p => { paints[p.name] = p.startTime; });
+return {
+  dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd : null,
+  load_ms: nav ? nav.loadEventEnd : null,
+  first_paint_ms: paints['first-paint'] ?? null,
+  first_contentful_paint_ms: paints['first-contentful-paint'] ?? null,
+};
+"""
+
+# Installed before any app script: buffers layout shifts (minus those right
+# after input, as CLS does) and the latest largest-contentful-paint candidate
+VITALS_OBSERVER_JS = """
+window.__currijobsVitals = { shifts: [], lcp: null };
+try {
+  new PerformanceObserver((list) => {
+    for (const entry of list.getEntries()) {
+      if (entry.hadRecentInput) continue;
+      const node = (entry.sources || []).map((s) => s.node).find(Boolean);
+      const label = node && node.nodeType === 1
+        ? (node.getAttribute('data-testid') || node.id || node.nodeName.toLowerCase())
+        : null;
+      window.__currijobsVitals.shifts.push({ value: entry.value, start_ms: entry.startTime, source: label });
+    }
+  }).observe({ type: 'layout-shift', buffered: true });
+  new PerformanceObserver((list) => {
+    const entries = list.getEntries();
+    window.__currijobsVitals.lcp = entries[entries.length - 1].startTime;
+  }).observe({ type: 'largest-contentful-paint', buffered: true });
+} catch (e) {}
+"""
+
+READ_VITALS_JS = "return window.__currijobsVitals || null;"
+
+
+def make_driver(headless=True, trace=False, mobile_emulation=None, window_size=None, proxy=None):
+    """Chrome driver with a fresh profile (cold cache, no stored session); proxy also carries localhost traffic"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_experimental_option("excludeSwitches", ["enable-logging"])
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    if headless:
+        options.add_argument("--headless=new")
+    if window_size:
+        options.add_argument(f"--window-size={window_size[0]},{window_size[1]}")
+    if mobile_emulation:
+        options.add_experimental_option("mobileEmulation", mobile_emulation)
+    if proxy:
+        options.add_argument(f"--proxy-server={proxy}")
+        options.add_argument("--proxy-bypass-list=<-loopback>")
+    if trace:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL", "browser": "ALL"})
+        options.add_experimental_option("perfLoggingPrefs", {
+            "enableNetwork": True,
+            "enablePage": False,
+            "traceCategories": TRACE_CATEGORIES,
+        })
+    return webdriver.Chrome(options=options)
+
+
+def wait_for_interactive(driver, timeout_s=30):
+    """Milliseconds from navigation start to first interactive frame, or None"""
+    driver.set_script_timeout(timeout_s + 5)
+    return driver.execute_async_script(WAIT_FOR_INTERACTIVE_JS, timeout_s * 1000)
+
+
+def wait_for_selector(driver, selector, timeout_s=30):
+    """Milliseconds from navigation start to the first frame showing selector, or None"""
+    driver.set_script_timeout(timeout_s + 5)
+    return driver.execute_async_script(WAIT_FOR_SELECTOR_JS, selector, timeout_s * 1000)
+
+
+def navigation_timing(driver):
+    return driver.execute_script(NAVIGATION_TIMING_JS)
+
+
+def observe_vitals(driver):
+    """Record layout shifts and LCP from the next navigation on (Chrome only)"""
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": VITALS_OBSERVER_JS})
+
+
+def read_vitals(driver):
+    """{"shifts": [{value, start_ms, source}], "lcp": ms or None} since navigation"""
+    return driver.execute_script(READ_VITALS_JS)
+
+
+def read_performance_log(driver):
+    """Split the performance log into (trace events, devtools network messages)
+
+    Fetching the log makes ChromeDriver stop tracing and flush buffered trace
+    events, so call this once after the page is interactive.
+    """
+    trace_events, network = [], []
+    for entry in driver.get_log("performance"):
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, ValueError):
+            continue
+        method = message.get("method", "")
+        if method == "Tracing.dataCollected":
+            trace_events.append(message["params"])
+        elif method.startswith("Network."):
+            network.append(message)
+    return trace_events, network
+
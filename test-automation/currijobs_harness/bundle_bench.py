@@ -0,0 +1,165 @@
+"""
+Metro bundle benchmark
+Times cold and warm bundle builds per platform, records bundle size, attributes
+size to the top modules via the source map, and compares against the previous
+run in the history so a heavy new import shows up on the commit that added it
+
+Usage:
+    python -m currijobs_harness bundle-bench
+    python -m currijobs_harness bundle-bench --start-metro --platforms web,ios,android
+"""
+
+import statistics
+
+from currijobs_harness import metro
+from currijobs_harness.sourcemap import format_bytes
+
+HISTORY_NAME = "bundle"
+
+
+def add_arguments(parser):
+    parser.add_argument("--server", default=metro.DEFAULT_SERVER, help="Metro server URL")
+    parser.add_argument("--platforms", default="web,ios", help="Comma-separated platforms (default: web,ios)")
+    parser.add_argument("--entry", default=metro.DEFAULT_ENTRY, help="Bundle entry path")
+    parser.add_argument("--warm-runs", type=int, default=3, help="Warm requests per platform (default: 3)")
+    parser.add_argument("--production", action="store_true", help="Measure dev=false&minify=true bundles")
+    parser.add_argument("--start-metro", action="store_true", help="Start `expo start --clear` for a true cold build")
+    parser.add_argument("--port", type=int, default=8081, help="Port for --start-metro (default: 8081)")
+    parser.add_argument("--no-source-map", action="store_true", help="Skip module size attribution")
+    parser.add_argument("--top", type=int, default=15, help="Modules to list per platform (default: 15)")
+    parser.add_argument("--fail-on-growth", type=float, default=None, metavar="PCT",
+                        help="Exit 1 if any bundle grew more than PCT percent since the last run")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+def measure_platform(server, platform, args):
+    """Cold + warm timings, size and module attribution for one platform"""
+    import gzip
+    import json
+
+    dev, minify = not args.production, args.production
+    url = metro.bundle_url(server, platform, args.entry, dev=dev, minify=minify)
+
+    status, cold_ttfb, cold_ms, body = metro.fetch(url)
+    if status != 200:
+        raise RuntimeError(f"{platform} bundle returned HTTP {status}")
+
+    warm = [metro.fetch(url)[2] for _ in range(max(0, args.warm_runs))]
+    result = {
+        "cold_ms": round(cold_ms, 1),
+        "cold_ttfb_ms": round(cold_ttfb, 1),
+        "warm_ms": round(statistics.median(warm), 1) if warm else None,
+        "bytes": len(body),
+        "gzip_bytes": len(gzip.compress(body, compresslevel=6)),
+    }
+
+    if platform == "web":
+        # First load in the browser = HTML shell + bundle
+        html_status, _, html_ms, _ = metro.fetch(server)
+        if html_status == 200:
+            result["first_load_ms"] = round(html_ms + (result["warm_ms"] or cold_ms), 1)
+
+    if not args.no_source_map:
+        from currijobs_harness import sourcemap
+        from currijobs_harness.cli import REPO_ROOT
+
+        map_url = metro.bundle_url(server, platform, args.entry, dev=dev, minify=minify, ext="map")
+        map_status, _, _, map_body = metro.fetch(map_url)
+        if map_status == 200:
+            sizes = sourcemap.attribute_sizes(body.decode("utf-8", "replace"), json.loads(map_body))
+            grouped = sourcemap.group_sizes(sizes, REPO_ROOT)
+            result["modules"] = dict(sourcemap.top_modules(grouped, top=max(args.top, 50)))
+    return result
+
+
+def print_platform(platform, result, previous, top):
+    print(f"\n📦 {platform}")
+    print("-" * 50)
+    print(f"Cold build:   {result['cold_ms']:.0f} ms (first byte {result['cold_ttfb_ms']:.0f} ms)")
+    if result.get("warm_ms") is not None:
+        print(f"Warm build:   {result['warm_ms']:.0f} ms")
+    if result.get("first_load_ms") is not None:
+        print(f"First load:   {result['first_load_ms']:.0f} ms (HTML + bundle)")
+    size_line = f"Bundle size:  {format_bytes(result['bytes'])} ({format_bytes(result['gzip_bytes'])} gzip)"
+    if previous:
+        delta = result["bytes"] - previous["bytes"]
+        size_line += f"  Δ {'+' if delta >= 0 else '-'}{format_bytes(abs(delta))}"
+    print(size_line)
+
+    modules = result.get("modules")
+    if not modules:
+        return
+    prev_modules = (previous or {}).get("modules", {})
+    print(f"\nTop {min(top, len(modules))} modules:")
+    for name, size in list(modules.items())[:top]:
+        note = ""
+        if prev_modules:
+            if name not in prev_modules:
+                note = "  🆕"
+            elif size != prev_modules[name]:
+                delta = size - prev_modules[name]
+                note = f"  Δ {'+' if delta >= 0 else '-'}{format_bytes(abs(delta))}"
+        print(f"{format_bytes(size):>10}  {name}{note}")
+
+
+def growth_pct(result, previous):
+    if not previous or not previous.get("bytes"):
+        return 0.0
+    return (result["bytes"] - previous["bytes"]) * 100.0 / previous["bytes"]
+
+
+def run(args):
+    from currijobs_harness import results
+
+    print("🚀 Metro Bundle Benchmark")
+    print("=" * 50)
+
+    process = None
+    server = args.server
+    if args.start_metro:
+        print(f"🔄 Starting Metro on port {args.port} with a clean cache...")
+        process = metro.start_metro(port=args.port, clear=True)
+        server = f"http://localhost:{args.port}"
+    elif not metro.is_running(server):
+        print(f"❌ Metro is not running at {server}")
+        print("Please run: npm start (or pass --start-metro)")
+        return 1
+    else:
+        print("⚠️ Using an already-running Metro: 'cold' may be warm if it served this bundle before")
+
+    platforms = [p.strip() for p in args.platforms.split(",") if p.strip()]
+    # Only a run of the same build is a fair baseline: dev and minified production bundles are not comparable
+    baseline = results.last_record(HISTORY_NAME, entry=args.entry, production=args.production)
+    previous = (baseline or {}).get("platforms", {})
+    measured = {}
+    try:
+        for platform in platforms:
+            try:
+                measured[platform] = measure_platform(server, platform, args)
+            except Exception as e:
+                print(f"❌ {platform}: {e}")
+                continue
+            print_platform(platform, measured[platform], previous.get(platform), args.top)
+    finally:
+        metro.stop_metro(process)
+
+    if not measured:
+        return 1
+
+    if not args.no_history:
+        record = results.append_history(HISTORY_NAME, {
+            "entry": args.entry,
+            "production": args.production,
+            "cold_start": bool(args.start_metro),
+            "platforms": measured,
+        })
+        print(f"\n📝 Recorded run for {record['commit']} in {results.history_path(HISTORY_NAME)}")
+
+    if args.fail_on_growth is not None:
+        grown = {p: growth_pct(r, previous.get(p)) for p, r in measured.items()}
+        over = {p: g for p, g in grown.items() if g > args.fail_on_growth}
+        if over:
+            for p, g in over.items():
+                print(f"❌ {p} bundle grew {g:.1f}% (limit {args.fail_on_growth}%)")
+            return 1
+    return 0
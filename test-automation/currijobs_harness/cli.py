@@ -0,0 +1,145 @@
+"""
+Command-line dispatcher for the CurriJobs test harness
+Resolves the subcommand first and only then imports what it needs
+"""
+
+import argparse
+import os
+import sys
+
+HARNESS_DIR = os.path.dirname(os.path.abspath(__file__))
+AUTOMATION_DIR = os.path.dirname(HARNESS_DIR)
+REPO_ROOT = os.path.dirname(AUTOMATION_DIR)
+
+# Native harness commands: name -> (module inside currijobs_harness, help).
+# Each module exposes add_arguments(parser) and run(args) and must keep heavy
+# imports inside functions.
+COMMANDS = {
+    "ping": ("ping", "Check which Expo/PostgREST ports respond (stdlib only)"),
+    "bootstrap": ("bootstrap", "Install requirements into a cached, hash-keyed virtualenv"),
+    "bundle-bench": ("bundle_bench", "Time Metro cold/warm bundle builds and attribute bundle size"),
+    "startup-profile": ("startup_profile", "Trace cold start per route via Chrome DevTools"),
+    "simulate": ("simulator", "Concurrent marketplace simulator against PostgREST"),
+    "user-card-bench": ("user_card_bench", "Time the public user card lookup against growing payment histories"),
+    "leaderboard-check": ("leaderboard_check", "Verify the rank engine and leaderboard RPCs at 1M users"),
+    "cluster-bench": ("cluster_bench", "Compare viewport map clusters with raw task markers at 1M tasks"),
+    "radius-check": ("radius_check", "EXPLAIN-verify and time the earthdistance radius RPCs"),
+    "geocode-bench": ("geocode_bench", "Replay a geocoding trace with and without the lookup cache"),
+    "place-index": ("place_index", "Build the offline Costa Rica place autocomplete index"),
+    "place-index-bench": ("place_index_bench", "Time place autocomplete lookups and report the index size"),
+    "compile-locales": ("locale_compiler", "Compile lib/locales/messages into per-locale chunks"),
+    "locale-bench": ("locale_bench", "Compare eager locale bytes and first render before/after the per-locale split"),
+    "validation-bench": ("validation_bench", "Rows per second for full, compiled and sampled row validation"),
+    "optimize-assets": ("asset_pipeline", "Resize and re-encode app images per density with a content-hash cache"),
+    "rls-profile": ("rls_profile", "Profile RLS policy overhead and prove the policy rewrites"),
+    "index-advisor": ("index_advisor", "Replay the app workload and recommend indexes from hypothetical plans"),
+    "migrate": ("migrate", "Apply supabase/migrations in order with online index builds and lock timeouts"),
+    "migrate-bench": ("migrate_bench", "Measure write stalls from blocking vs online schema changes"),
+    "pool-bench": ("pool_bench", "Compare direct and PgBouncer-pooled connections at 10/100/1000 clients"),
+    "db-fixture": ("db_fixture", "Build a seeded template database and clone it per test worker"),
+    "auth-session": ("auth_session", "Get a cached API session for browser tests to inject instead of logging in"),
+    "data-factory": ("factory", "Seed related tasks, offers, payments and reviews in bulk for tests"),
+    "device-matrix": ("device_matrix", "Render timings and layout shift per route under phone/tablet emulation"),
+    "network-matrix": ("network_matrix", "Time to first task card and wasted requests under 3G, flaky 4G, satellite and offline links"),
+    "hedge-bench": ("hedge_bench", "Tail latency of hedged vs sequential fetch fallbacks against a slow stand-in"),
+}
+
+# Legacy standalone scripts: name -> (path relative to repo root, help).
+# They run in-process with runpy, exactly as `python <script>` would.
+SCRIPTS = {
+    "run-tests": ("test-automation/run_tests.py", "Install dependencies and run the simple test suite"),
+    "quick-test": ("test-automation/quick_test.py", "Check Expo server and iOS Simulator"),
+    "simple-test": ("test-automation/simple_test.py", "Basic server, web, Supabase and structure checks"),
+    "selenium-test": ("test-automation/selenium_test.py", "Selenium suite: loading, auth, tasks, search"),
+    "database-test": ("test-automation/database_test.py", "Database suite: server-side engines vs brute-force queries"),
+    "web-app-test": ("test-automation/web_app_test.py", "Web interface walkthrough"),
+    "interface-test": ("test-automation/interface_validation_test.py", "Interface validation test"),
+    "get-started-test": ("test-automation/get_started_button_test.py", "Get Started button test"),
+    "ios-comprehensive-test": ("test-automation/ios_comprehensive_test.py", "Comprehensive iOS-style web test"),
+    "ios-simulator-test": ("test-automation/ios_simulator_test.py", "iOS Simulator instructions (macOS; on Linux use device-matrix)"),
+    "ios-demo": ("test-automation/ios_demo.py", "iOS demo (macOS; on Linux use device-matrix)"),
+    "ipad-demo": ("test-automation/ipad_ui_demo.py", "iPad UI demo instructions (on Linux use device-matrix)"),
+    "automated-demo": ("test-automation/automated_demo.py", "Automated UI demo"),
+    "ui-demo": ("test-automation/ui_automation_demo.py", "UI automation demo"),
+    "open-app": ("open_app.py", "Open the app in the browser"),
+    "show-app": ("show_app.py", "Find the Expo port and open the app"),
+    "app-access": ("test_app_access.py", "Probe app URLs and optionally open a browser"),
+    "instructions": ("demo_instructions.py", "Print demo instructions"),
+}
+
+
+def build_parser():
+    """Build the top-level parser without importing any subcommand"""
+    parser = argparse.ArgumentParser(
+        prog="currijobs-harness",
+        description="CurriJobs test, demo and benchmark harness",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Run the subcommand under -X importtime and report import costs",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=15,
+        help="Number of imports to show with --profile-startup (default: 15)",
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="<command>")
+    for name, (_, help_text) in COMMANDS.items():
+        subparsers.add_parser(name, help=help_text, add_help=False)
+    for name, (_, help_text) in SCRIPTS.items():
+        subparsers.add_parser(name, help=help_text, add_help=False)
+    return parser
+
+
+def run_native(name, argv):
+    """Import a native command module and run it"""
+    import importlib
+
+    module_name, help_text = COMMANDS[name]
+    module = importlib.import_module(f"currijobs_harness.{module_name}")
+    parser = argparse.ArgumentParser(prog=f"currijobs-harness {name}", description=help_text)
+    module.add_arguments(parser)
+    args = parser.parse_args(argv)
+    return module.run(args) or 0
+
+
+def run_script(name, argv):
+    """Run a legacy script in-process as __main__"""
+    import runpy
+
+    rel_path, _ = SCRIPTS[name]
+    path = os.path.join(REPO_ROOT, rel_path)
+    saved_argv, saved_path = sys.argv, list(sys.path)
+    sys.argv = [path] + list(argv)
+    sys.path.insert(0, os.path.dirname(path))
+    try:
+        runpy.run_path(path, run_name="__main__")
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    finally:
+        sys.argv, sys.path[:] = saved_argv, saved_path
+    return 0
+
+
+def main(argv=None):
+    """Entry point for python -m currijobs_harness"""
+    argv = list(sys.argv[1:] if argv is None else argv)
+    parser = build_parser()
+    args, rest = parser.parse_known_args(argv)
+
+    if args.command is None:
+        parser.print_help()
+        return 1
+
+    # Everything after the subcommand name belongs to the subcommand
+    sub_argv = argv[argv.index(args.command) + 1:]
+
+    if args.profile_startup:
+        from currijobs_harness.profiling import profile_startup
+        return profile_startup([args.command] + sub_argv, top=args.profile_top)
+
+    if args.command in COMMANDS:
+        return run_native(args.command, sub_argv)
+    return run_script(args.command, sub_argv)
@@ -0,0 +1,161 @@
+"""
+Map clustering benchmark
+Seeds N open tasks (1M by default) around San José plus a sparse spread
+over the rest of Costa Rica, then compares what the map receives per
+viewport: the raw tasks in the bounding box (what the client clustered
+before) against get_task_clusters() at several zoom levels. Cluster
+totals are checked against a brute-force count, and each single-task
+cell's task_id against the cell it lies in. Everything runs in one
+transaction that is rolled back at the end.
+
+Usage:
+    python -m currijobs_harness cluster-bench
+    python -m currijobs_harness cluster-bench --tasks 100000 --zooms 10,13,16
+"""
+
+import random
+import time
+
+HISTORY_NAME = "clusters"
+SEED_PREFIX = "map"
+
+# Phone viewport in points; the map spans this many 256px tiles
+SCREEN_WIDTH = 390
+SCREEN_HEIGHT = 844
+
+CLUSTERS_SQL = "SELECT cluster_key, task_count, task_id FROM get_task_clusters(%s, %s, %s, %s, %s)"
+RAW_BBOX_SQL = """
+    SELECT id, latitude, longitude, category, reward FROM tasks
+    WHERE status = 'open' AND latitude BETWEEN %s AND %s AND longitude BETWEEN %s AND %s
+"""
+BRUTE_COUNT_SQL = """
+    SELECT COUNT(*) FROM tasks
+    WHERE status = 'open'
+      AND task_map_cell_x(longitude::float8, %(z)s) BETWEEN task_map_cell_x(%(min_lon)s, %(z)s) AND task_map_cell_x(%(max_lon)s, %(z)s)
+      AND task_map_cell_y(latitude::float8, %(z)s) BETWEEN task_map_cell_y(%(max_lat)s, %(z)s) AND task_map_cell_y(%(min_lat)s, %(z)s)
+"""
+SINGLETON_CELL_SQL = """
+    SELECT 'c:' || %(z)s || ':' || task_map_cell_x(longitude::float8, %(z)s) || ':' || task_map_cell_y(latitude::float8, %(z)s)
+    FROM tasks WHERE id = %(id)s
+"""
+
+
+def add_arguments(parser):
+    from currijobs_harness import db
+
+    db.add_dsn_argument(parser)
+    parser.add_argument("--tasks", type=int, default=1_000_000, help="Open tasks to seed (default: 1000000)")
+    parser.add_argument("--zooms", default="8,11,13,15,17", help="Comma-separated zoom levels (default: 8,11,13,15,17)")
+    parser.add_argument("--samples", type=int, default=20, help="Random viewports per zoom (default: 20)")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for viewports")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+def viewport(rng, zoom, center):
+    """Random phone-sized bounding box near center at the given zoom"""
+    lon_span = SCREEN_WIDTH / 256 * 360 / 2 ** zoom
+    lat_span = lon_span * SCREEN_HEIGHT / SCREEN_WIDTH
+    lat = center[0] + rng.gauss(0, 0.03)
+    lon = center[1] + rng.gauss(0, 0.03)
+    return lat - lat_span / 2, lon - lon_span / 2, lat + lat_span / 2, lon + lon_span / 2
+
+
+def timed(cur, sql, params):
+    start = time.perf_counter()
+    cur.execute(sql, params)
+    rows = cur.fetchall()
+    return rows, (time.perf_counter() - start) * 1000
+
+
+def run(args):
+    from currijobs_harness import db, results, seed, stats
+
+    print("🗺️  CurriJobs Map Cluster Benchmark")
+    print("=" * 50)
+    rng = random.Random(args.seed)
+    zooms = [int(z) for z in args.zooms.split(",") if z.strip()]
+
+    try:
+        conn = db.connect_for(args, autocommit=False)
+    except Exception as e:
+        print(f"❌ Could not connect to {db.target_for(args)}: {e}")
+        return 1
+
+    problems = []
+    report = {"tasks": args.tasks, "zooms": {}}
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT to_regprocedure('get_task_clusters(double precision,double precision,double precision,"
+                "double precision,integer,text[],uuid)') IS NOT NULL"
+            )
+            if not cur.fetchone()[0]:
+                print("❌ get_task_clusters() not found; apply supabase/migrations first")
+                return 1
+
+            start = time.perf_counter()
+            (owner,) = seed.create_users(cur, 1, prefix=SEED_PREFIX)
+            dense = args.tasks * 4 // 5
+            seed.create_tasks_near(cur, owner, dense, spread_km=6)
+            seed.create_tasks_near(cur, owner, args.tasks - dense, spread_km=60)
+            cur.execute("ANALYZE tasks")
+            cur.execute("ANALYZE task_map_cells")
+            report["seed_s"] = round(time.perf_counter() - start, 1)
+            print(f"🌱 Seeded {args.tasks:,} open tasks (cells maintained by triggers) in {report['seed_s']}s")
+
+            for zoom in zooms:
+                cluster_ms, raw_ms, cluster_rows, raw_rows = [], [], [], []
+                for i in range(args.samples):
+                    min_lat, min_lon, max_lat, max_lon = viewport(rng, zoom, seed.SAN_JOSE)
+                    rows, ms = timed(cur, CLUSTERS_SQL, (min_lat, min_lon, max_lat, max_lon, zoom))
+                    cluster_ms.append(ms)
+                    cluster_rows.append(len(rows))
+                    raw, ms = timed(cur, RAW_BBOX_SQL, (min_lat, max_lat, min_lon, max_lon))
+                    raw_ms.append(ms)
+                    raw_rows.append(len(raw))
+                    if i == 0 and zoom <= 16:
+                        cur.execute(BRUTE_COUNT_SQL, {
+                            "z": zoom, "min_lat": min_lat, "min_lon": min_lon, "max_lat": max_lat, "max_lon": max_lon,
+                        })
+                        expected = cur.fetchone()[0]
+                        total = sum(r[1] for r in rows)
+                        if total != expected:
+                            problems.append(f"zoom {zoom}: clusters cover {total} tasks, brute force {expected}")
+                        if any(r[1] == 1 and r[2] is None for r in rows):
+                            problems.append(f"zoom {zoom}: single-task cell without task_id")
+                        for key, _, task_id in (r for r in rows if r[1] == 1 and r[2] and zoom <= 16):
+                            cur.execute(SINGLETON_CELL_SQL, {"z": zoom, "id": task_id})
+                            if cur.fetchone()[0] != key:
+                                problems.append(f"zoom {zoom}: task_id of {key} lies in another cell")
+                                break
+                report["zooms"][str(zoom)] = {
+                    "clusters_ms": stats.summarize(cluster_ms),
+                    "raw_ms": stats.summarize(raw_ms),
+                    "cluster_rows_p50": stats.percentile(cluster_rows, 50),
+                    "cluster_rows_max": max(cluster_rows),
+                    "raw_rows_p50": stats.percentile(raw_rows, 50),
+                    "raw_rows_max": max(raw_rows),
+                }
+    finally:
+        conn.rollback()
+        conn.close()
+
+    print(f"\n{'zoom':>4} {'clusters p50':>13} {'p95':>7} {'markers':>8} | {'raw bbox p50':>13} {'p95':>8} {'rows':>8}")
+    for zoom, z in report["zooms"].items():
+        c, r = z["clusters_ms"], z["raw_ms"]
+        print(
+            f"{zoom:>4} {stats.fmt_ms(c['p50']):>13} {stats.fmt_ms(c['p95']):>7} {z['cluster_rows_p50']:>8} | "
+            f"{stats.fmt_ms(r['p50']):>13} {stats.fmt_ms(r['p95']):>8} {z['raw_rows_p50']:>8}"
+        )
+    print("🧹 Seed data rolled back")
+
+    if problems:
+        for problem in problems:
+            print(f"❌ {problem}")
+        return 1
+    print("✅ Cluster totals match brute-force counts")
+
+    if not args.no_history:
+        record = results.append_history(HISTORY_NAME, report)
+        print(f"📝 Recorded run for {record['commit']}")
+    return 0
@@ -0,0 +1,312 @@
+"""
+Template-database fixtures
+Builds a seeded Postgres database once and marks it as a template. Each
+test worker then gets a private copy with CREATE DATABASE ... TEMPLATE, a
+file-level copy that takes milliseconds instead of re-running seed scripts:
+
+    currijobs_tpl_<fingerprint>    schema + seeded marketplace, connections off
+    currijobs_test_<worker>        the worker's copy, dropped and re-cloned per test
+
+The template is cloned from the source database (the DSN's database). Its
+app tables are truncated and reseeded with a fixed random seed, so every
+clone holds the same users, tasks, offers, payments and reviews. If the
+source has other sessions (PostgREST, GoTrue), Postgres refuses to clone it;
+the schema then comes from pg_dump --schema-only (PATH or --pg-bin). The
+fingerprint covers the migrations, the seed code and the dataset size, so a
+schema change rebuilds the template and drops stale ones. Builds from
+parallel workers are serialized with an advisory lock.
+
+In a suite:
+
+    from currijobs_harness.db_fixture import DatabaseFixture
+
+    fixture = DatabaseFixture()          # builds or reuses the template
+    dsn = fixture.fresh()                # pristine copy for this worker
+    ...
+    fixture.teardown()
+
+Usage:
+    python -m currijobs_harness db-fixture build
+    python -m currijobs_harness db-fixture clone --worker gw0
+    python -m currijobs_harness db-fixture bench
+    python -m currijobs_harness db-fixture drop
+"""
+
+import os
+
+from currijobs_harness.cli import REPO_ROOT
+
+HISTORY_NAME = "fixture"
+TEMPLATE_PREFIX = "currijobs_tpl_"
+WORKER_PREFIX = "currijobs_test_"
+SEED_PREFIX = "fixture"
+DEFAULT_USERS = 200
+DEFAULT_TASKS = 2000
+RANDOM_SEED = 0.42
+BUILD_LOCK = "currijobs-harness:template"
+
+
+def add_arguments(parser):
+    from currijobs_harness import db
+
+    parser.add_argument("action", choices=("build", "clone", "drop", "bench"), help="What to do")
+    parser.add_argument("--dsn", default=db.DEFAULT_DSN, help="Source database (CURRIJOBS_DATABASE_URL)")
+    parser.add_argument("--users", type=int, default=DEFAULT_USERS, help=f"Seeded users (default: {DEFAULT_USERS})")
+    parser.add_argument("--tasks", type=int, default=DEFAULT_TASKS, help=f"Seeded tasks (default: {DEFAULT_TASKS})")
+    parser.add_argument("--worker", default=None, help="Worker id for clone (default: CURRIJOBS_TEST_WORKER, PYTEST_XDIST_WORKER or pid)")
+    parser.add_argument("--strategy", choices=("wal_log", "file_copy"), default=None,
+                        help="CREATE DATABASE strategy on Postgres 15+ (default: server default)")
+    parser.add_argument("--pg-bin", default=None, help="Directory with pg_dump/psql for the schema-only fallback")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the template even if it is current")
+    parser.add_argument("--iterations", type=int, default=5, help="Iterations per bench measurement (default: 5)")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+def worker_id(worker=None):
+    import re
+
+    worker = worker or os.environ.get("CURRIJOBS_TEST_WORKER") or os.environ.get("PYTEST_XDIST_WORKER") or str(os.getpid())
+    return re.sub(r"\W", "_", worker.lower())
+
+
+def fingerprint(source_db, users, tasks):
+    """Changes whenever the template's contents would"""
+    import hashlib
+
+    digest = hashlib.sha256(f"{source_db}:{users}:{tasks}:{RANDOM_SEED}".encode())
+    migrations = os.path.join(REPO_ROOT, "supabase", "migrations")
+    paths = [os.path.join(migrations, name) for name in sorted(os.listdir(migrations)) if name.endswith(".sql")]
+    paths.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "seed.py"))
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+def dsn_with_db(dsn, dbname):
+    from psycopg.conninfo import make_conninfo
+
+    return make_conninfo(dsn, dbname=dbname)
+
+
+def database_exists(admin, name):
+    return admin.execute("SELECT 1 FROM pg_database WHERE datname = %s", (name,)).fetchone() is not None
+
+
+def drop_database(admin, name):
+    from psycopg import sql
+
+    admin.execute(sql.SQL("UPDATE pg_database SET datistemplate = false WHERE datname = {}").format(sql.Literal(name)))
+    admin.execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(sql.Identifier(name)))
+
+
+def create_from(admin, name, template, strategy=None):
+    """CREATE DATABASE name TEMPLATE template; returns elapsed ms"""
+    import time
+
+    from psycopg import sql
+
+    query = sql.SQL("CREATE DATABASE {} TEMPLATE {}").format(sql.Identifier(name), sql.Identifier(template))
+    if strategy and admin.info.server_version >= 150000:
+        query += sql.SQL(" STRATEGY {}").format(sql.SQL(strategy.upper()))
+    start = time.perf_counter()
+    admin.execute(query)
+    return (time.perf_counter() - start) * 1000
+
+
+def copy_schema(source_dsn, target_dsn, pg_bin=None):
+    """pg_dump --schema-only source | psql target"""
+    import shutil
+    import subprocess
+
+    def tool(name):
+        path = os.path.join(pg_bin, name) if pg_bin else shutil.which(name)
+        if not path or not os.path.exists(path):
+            raise RuntimeError(f"{name} not found; pass --pg-bin or stop the other sessions on the source database")
+        return path
+
+    dump = subprocess.run([tool("pg_dump"), "--schema-only", "--no-owner", "--dbname", source_dsn],
+                          capture_output=True, text=True, check=True)
+    subprocess.run([tool("psql"), "--quiet", "--set", "ON_ERROR_STOP=1", "--dbname", target_dsn],
+                   input=dump.stdout, capture_output=True, text=True, check=True)
+
+
+def reset_data(cur):
+    """Truncate every app table (public schema and auth.users); every public table is user data or derived from it"""
+    cur.execute("SELECT format('%I.%I', schemaname, tablename) FROM pg_tables WHERE schemaname = 'public'")
+    tables = [row[0] for row in cur.fetchall()]
+    cur.execute("SELECT to_regclass('auth.users') IS NOT NULL")
+    if cur.fetchone()[0]:
+        tables.append("auth.users")
+    if tables:
+        cur.execute(f"TRUNCATE {', '.join(tables)} RESTART IDENTITY CASCADE")
+
+
+def seed_dataset(cur, users, tasks):
+    """The fixture dataset: same rows every build"""
+    from currijobs_harness import seed
+
+    cur.execute("SELECT setseed(%s)", (RANDOM_SEED,))
+    seed.create_marketplace(cur, users, tasks, prefix=SEED_PREFIX)
+
+
+def ensure_template(admin, dsn, users, tasks, rebuild=False, pg_bin=None):
+    """Build the template unless a current one exists; returns (name, build ms or None)"""
+    import time
+
+    from currijobs_harness import db
+
+    source_db = admin.info.dbname
+    name = TEMPLATE_PREFIX + fingerprint(source_db, users, tasks)
+    admin.execute("SELECT pg_advisory_lock(hashtext(%s))", (BUILD_LOCK,))
+    try:
+        if database_exists(admin, name) and not rebuild:
+            return name, None
+        start = time.perf_counter()
+        stale = admin.execute("SELECT datname FROM pg_database WHERE datname LIKE %s", (TEMPLATE_PREFIX + "%",)).fetchall()
+        for (old,) in stale:
+            drop_database(admin, old)
+
+        import psycopg
+
+        try:
+            create_from(admin, name, source_db)
+            copied_data = True
+        except psycopg.errors.ObjectInUse:
+            create_from(admin, name, "template0")
+            copy_schema(dsn, dsn_with_db(dsn, name), pg_bin)
+            copied_data = False
+
+        with db.connect(dsn_with_db(dsn, name), autocommit=False) as conn:
+            with conn.cursor() as cur:
+                if copied_data:
+                    reset_data(cur)
+                seed_dataset(cur, users, tasks)
+            conn.commit()
+            conn.autocommit = True
+            conn.execute("VACUUM (FREEZE, ANALYZE)")
+        admin.execute(f'ALTER DATABASE "{name}" WITH IS_TEMPLATE true ALLOW_CONNECTIONS false')
+        return name, (time.perf_counter() - start) * 1000
+    finally:
+        admin.execute("SELECT pg_advisory_unlock(hashtext(%s))", (BUILD_LOCK,))
+
+
+def clone(admin, template, worker, strategy=None):
+    """Fresh copy of the template for a worker; returns (dbname, ms)"""
+    name = WORKER_PREFIX + worker
+    drop_database(admin, name)
+    return name, create_from(admin, name, template, strategy)
+
+
+class DatabaseFixture:
+    """Per-worker pristine databases cloned from the seeded template"""
+
+    def __init__(self, dsn=None, users=DEFAULT_USERS, tasks=DEFAULT_TASKS, worker=None, strategy=None, pg_bin=None):
+        from currijobs_harness import db
+
+        self.dsn = dsn or db.DEFAULT_DSN
+        self.worker = worker_id(worker)
+        self.strategy = strategy
+        self.admin = db.connect(self.dsn, autocommit=True)
+        self.template, self.build_ms = ensure_template(self.admin, self.dsn, users, tasks, pg_bin=pg_bin)
+        self.database = None
+
+    def fresh(self):
+        """DSN of a pristine copy for this worker, replacing the previous one"""
+        self.database, self.clone_ms = clone(self.admin, self.template, self.worker, self.strategy)
+        return dsn_with_db(self.dsn, self.database)
+
+    def teardown(self):
+        if self.database:
+            drop_database(self.admin, self.database)
+            self.database = None
+        self.admin.close()
+
+
+def bench(admin, dsn, template, args):
+    """Reseeding a database per test vs cloning the template"""
+    import statistics
+    import time
+
+    from currijobs_harness import db
+
+    worker = worker_id("bench")
+    name, _ = clone(admin, template, worker)
+    reseed = []
+    with db.connect(dsn_with_db(dsn, name), autocommit=False) as conn:
+        for _ in range(args.iterations):
+            start = time.perf_counter()
+            with conn.cursor() as cur:
+                reset_data(cur)
+                seed_dataset(cur, args.users, args.tasks)
+            conn.commit()
+            reseed.append((time.perf_counter() - start) * 1000)
+    report = {"reseed_ms": round(statistics.median(reseed), 1), "clone_ms": {}}
+    strategies = [None] + (["wal_log", "file_copy"] if admin.info.server_version >= 150000 else [])
+    for strategy in strategies:
+        timings = []
+        for _ in range(args.iterations):
+            start = time.perf_counter()
+            clone(admin, template, worker, strategy)
+            timings.append((time.perf_counter() - start) * 1000)
+        report["clone_ms"][strategy or "default"] = round(statistics.median(timings), 1)
+    drop_database(admin, WORKER_PREFIX + worker)
+    return report
+
+
+def run(args):
+    from currijobs_harness import db, results
+
+    print("🧪 CurriJobs Database Fixtures")
+    print("=" * 50)
+    try:
+        admin = db.connect(args.dsn, autocommit=True)
+    except Exception as e:
+        print(f"❌ Could not connect to {db.redact(args.dsn)}: {e}")
+        return 1
+
+    try:
+        if args.action == "drop":
+            names = admin.execute(
+                "SELECT datname FROM pg_database WHERE datname LIKE %s OR datname LIKE %s",
+                (TEMPLATE_PREFIX + "%", WORKER_PREFIX + "%"),
+            ).fetchall()
+            for (name,) in names:
+                drop_database(admin, name)
+                print(f"🗑️  {name}")
+            print(f"✅ Dropped {len(names)} fixture database(s)")
+            return 0
+
+        try:
+            template, build_ms = ensure_template(admin, args.dsn, args.users, args.tasks, args.rebuild, args.pg_bin)
+        except Exception as e:
+            print(f"❌ Could not build the template: {e}")
+            return 1
+        if build_ms is None:
+            print(f"♻️  Template {template} is current")
+        else:
+            print(f"🏗️  Built {template} ({args.users:,} users, {args.tasks:,} tasks) in {build_ms / 1000:.1f}s")
+
+        if args.action == "clone":
+            name, ms = clone(admin, template, worker_id(args.worker), args.strategy)
+            print(f"🐑 {name} cloned in {ms:.0f} ms")
+            print(f"✅ {dsn_with_db(db.redact(args.dsn), name)}")
+            return 0
+
+        if args.action == "bench":
+            report = bench(admin, args.dsn, template, args)
+            report.update({"users": args.users, "tasks": args.tasks, "build_ms": build_ms})
+            print(f"\n🌱 Truncate + reseed: {report['reseed_ms']:,.0f} ms")
+            for strategy, ms in report["clone_ms"].items():
+                print(f"🐑 Clone ({strategy}): {ms:,.0f} ms ({report['reseed_ms'] / ms:.1f}x faster)")
+            if not args.no_history:
+                record = results.append_history(HISTORY_NAME, report)
+                print(f"📝 Recorded run for {record['commit']}")
+            best = min(report["clone_ms"].values())
+            if best >= report["reseed_ms"]:
+                print("❌ Cloning is not faster than reseeding at this size")
+                return 1
+            print(f"✅ Fresh database per test in {best:,.0f} ms")
+        return 0
+    finally:
+        admin.close()
@@ -0,0 +1,226 @@
+"""
+Device-emulation performance matrix for the Expo web build
+Loads each core route in Chrome emulating phones and tablets (viewport,
+pixel ratio, touch, user agent) with CDP CPU throttling, so mobile numbers
+come from the Linux CI runner instead of a macOS simulator. Per device and
+route it records:
+
+    interactive   first interactive frame (as startup-profile)
+    fcp / lcp     first and largest contentful paint
+    cls           cumulative layout shift (largest session window), plus the
+                  shift count and the element that moved most
+    render/script trace time spent in layout/paint and in JavaScript
+
+CPU rates are relative to the machine running Chrome; --cpu-scale adjusts
+them all for a faster or slower runner. Routes behind sign-in get an
+injected session with --email (see auth-session).
+
+Usage:
+    python -m currijobs_harness device-matrix
+    python -m currijobs_harness device-matrix --devices iphone-se,android-low --routes /,/tasks --runs 3
+    python -m currijobs_harness device-matrix --email fixture-1@bench.currijobs.test --stand-in
+"""
+
+import statistics
+
+from currijobs_harness.browser import DEFAULT_APP_URL
+
+HISTORY_NAME = "devices"
+DEFAULT_ROUTES = "/,/welcome,/login,/tasks,/map"
+
+IOS_SAFARI = "Mozilla/5.0 ({device}) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1"
+DEVICES = {
+    "iphone-se": {
+        "label": "iPhone SE", "width": 375, "height": 667, "pixel_ratio": 2, "cpu_rate": 3,
+        "user_agent": IOS_SAFARI.format(device="iPhone; CPU iPhone OS 17_0 like Mac OS X"),
+    },
+    "iphone-15": {
+        "label": "iPhone 15", "width": 393, "height": 852, "pixel_ratio": 3, "cpu_rate": 2,
+        "user_agent": IOS_SAFARI.format(device="iPhone; CPU iPhone OS 17_0 like Mac OS X"),
+    },
+    "ipad": {
+        "label": "iPad", "width": 820, "height": 1180, "pixel_ratio": 2, "cpu_rate": 2,
+        "user_agent": IOS_SAFARI.format(device="iPad; CPU OS 17_0 like Mac OS X"),
+    },
+    "android-low": {
+        "label": "Low-end Android", "width": 360, "height": 640, "pixel_ratio": 3, "cpu_rate": 6,
+        "user_agent": "Mozilla/5.0 (Linux; Android 8.1.0; Nokia 2.1) AppleWebKit/537.36 (KHTML, like Gecko) "
+                      "Chrome/120.0.0.0 Mobile Safari/537.36",
+    },
+}
+# Core Web Vitals thresholds
+CLS_GOOD = 0.1
+CLS_POOR = 0.25
+
+
+def add_arguments(parser):
+    parser.add_argument("--url", default=DEFAULT_APP_URL, help="App base URL (default: http://localhost:8081)")
+    parser.add_argument("--devices", default=",".join(DEVICES), help=f"Comma-separated devices (default: {','.join(DEVICES)})")
+    parser.add_argument("--routes", default=DEFAULT_ROUTES, help=f"Comma-separated routes (default: {DEFAULT_ROUTES})")
+    parser.add_argument("--runs", type=int, default=2, help="Cold loads per device and route (default: 2)")
+    parser.add_argument("--cpu-scale", type=float, default=1.0, help="Multiply every device's CPU throttling rate (default: 1)")
+    parser.add_argument("--settle", type=float, default=2.0, help="Seconds after interactive to keep collecting shifts (default: 2)")
+    parser.add_argument("--timeout", type=int, default=60, help="Seconds to wait for interactivity (default: 60)")
+    parser.add_argument("--max-cls", type=float, default=None, help="Fail if any route's CLS exceeds this")
+    parser.add_argument("--email", default=None, help="Open routes signed in as this user (auth-session)")
+    parser.add_argument("--password", default=None, help="Password for --email")
+    parser.add_argument("--stand-in", action="store_true", help="Mint the --email session locally")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+def cumulative_layout_shift(shifts):
+    """Largest session window: shifts less than 1 s apart, window at most 5 s"""
+    best = current = 0.0
+    window_start = previous = None
+    for shift in sorted(shifts, key=lambda s: s["start_ms"]):
+        start = shift["start_ms"]
+        if previous is None or start - previous > 1000 or start - window_start > 5000:
+            current, window_start = 0.0, start
+        current += shift["value"]
+        previous = start
+        best = max(best, current)
+    return best
+
+
+def worst_source(shifts):
+    totals = {}
+    for shift in shifts:
+        if shift.get("source"):
+            totals[shift["source"]] = totals.get(shift["source"], 0) + shift["value"]
+    return max(totals, key=totals.get) if totals else None
+
+
+def emulation(device):
+    """ChromeDriver mobileEmulation options for a device profile"""
+    return {
+        "deviceMetrics": {"width": device["width"], "height": device["height"],
+                          "pixelRatio": device["pixel_ratio"], "touch": True},
+        "userAgent": device["user_agent"],
+    }
+
+
+def profile_cell(url, device, args, session=None):
+    """One cold load of url on device; returns the analysis with vitals"""
+    import time
+
+    from currijobs_harness import auth_session, browser
+    from currijobs_harness.startup_profile import profile_route
+
+    def setup(driver):
+        browser.observe_vitals(driver)
+        driver.execute_cdp_cmd("Emulation.setCPUThrottlingRate", {"rate": device["cpu_rate"] * args.cpu_scale})
+        if session:
+            auth_session.inject(driver, args.url, session)
+
+    def collect(driver):
+        time.sleep(args.settle)
+        return browser.read_vitals(driver)
+
+    analysis, _ = profile_route(url, args, {"mobile_emulation": emulation(device)}, setup=setup, collect=collect)
+    vitals = analysis.get("collected") or {"shifts": [], "lcp": None}
+    analysis["cls"] = cumulative_layout_shift(vitals["shifts"])
+    analysis["shifts"] = vitals["shifts"]
+    analysis["lcp_ms"] = vitals["lcp"]
+    return analysis
+
+
+def summarize_cell(runs):
+    """Medians across runs; the shift source comes from all runs together"""
+    def median(values):
+        values = [v for v in values if v is not None]
+        return round(statistics.median(values), 1) if values else None
+
+    return {
+        "interactive_ms": median(r["interactive_ms"] for r in runs),
+        "first_contentful_paint_ms": median(r["navigation"].get("first_contentful_paint_ms") for r in runs if r["navigation"]),
+        "largest_contentful_paint_ms": median(r["lcp_ms"] for r in runs),
+        "cls": round(statistics.median(r["cls"] for r in runs), 4),
+        "shift_count": median(len(r["shifts"]) for r in runs),
+        "worst_shift_source": worst_source([s for r in runs for s in r["shifts"]]),
+        "render_ms": median(r["breakdown_ms"].get("render") for r in runs),
+        "script_ms": median(r["breakdown_ms"].get("script_execution") for r in runs),
+    }
+
+
+def cls_marker(cls):
+    if cls > CLS_POOR:
+        return "❌"
+    if cls > CLS_GOOD:
+        return "⚠️ "
+    return "  "
+
+
+def run(args):
+    from currijobs_harness import metro, results
+    from currijobs_harness.stats import fmt_ms
+
+    print("📱 CurriJobs Device Performance Matrix")
+    print("=" * 50)
+    unknown = [d for d in args.devices.split(",") if d.strip() and d.strip() not in DEVICES]
+    if unknown:
+        print(f"❌ Unknown device(s): {', '.join(unknown)} (choose from {', '.join(DEVICES)})")
+        return 1
+    if not metro.is_running(args.url):
+        print(f"❌ Expo web server not running at {args.url}")
+        print("Please run: npm run web")
+        return 1
+
+    session = None
+    if args.email:
+        from currijobs_harness import auth_session
+
+        try:
+            session, _ = auth_session.get_session(args.email, args.password, args.stand_in)
+        except Exception as e:
+            print(f"❌ Could not get a session for {args.email}: {e}")
+            return 1
+        print(f"🔑 Signed in as {args.email}")
+
+    devices = [d.strip() for d in args.devices.split(",") if d.strip()]
+    routes = [r.strip() for r in args.routes.split(",") if r.strip()]
+    matrix, failed = {}, []
+    for name in devices:
+        device = DEVICES[name]
+        rate = device["cpu_rate"] * args.cpu_scale
+        print(f"\n📱 {device['label']} ({device['width']}×{device['height']} @{device['pixel_ratio']}x, CPU {rate:g}x slower)")
+        print(f"  {'route':<12} {'interactive':>11} {'fcp':>8} {'lcp':>8} {'render':>8} {'script':>8} {'cls':>7} {'shifts':>6}")
+        matrix[name] = {}
+        for route in routes:
+            url = args.url.rstrip("/") + route
+            runs = []
+            for i in range(args.runs):
+                try:
+                    runs.append(profile_cell(url, device, args, session))
+                except Exception as e:
+                    print(f"  ❌ {route} run {i + 1}: {e}")
+            if not runs:
+                failed.append(f"{name} {route}")
+                continue
+            cell = summarize_cell(runs)
+            matrix[name][route] = cell
+            source = f"  moved most: {cell['worst_shift_source']}" if cell["cls"] > CLS_GOOD and cell["worst_shift_source"] else ""
+            print(f"  {route:<12} {fmt_ms(cell['interactive_ms']):>9}ms {fmt_ms(cell['first_contentful_paint_ms']):>6}ms "
+                  f"{fmt_ms(cell['largest_contentful_paint_ms']):>6}ms {fmt_ms(cell['render_ms']):>6}ms "
+                  f"{fmt_ms(cell['script_ms']):>6}ms {cls_marker(cell['cls'])}{cell['cls']:.3f} {cell['shift_count']:>6g}{source}")
+
+    if not any(matrix.values()):
+        print("\n❌ No route loaded on any device")
+        return 1
+    if not args.no_history:
+        record = results.append_history(HISTORY_NAME, {
+            "url": args.url, "runs": args.runs, "cpu_scale": args.cpu_scale, "signed_in": bool(session),
+            "devices": matrix,
+        })
+        print(f"\n📝 Recorded run for {record['commit']}")
+
+    over = [f"{name} {route} ({cell['cls']:.3f})" for name, cells in matrix.items() for route, cell in cells.items()
+            if args.max_cls is not None and cell["cls"] > args.max_cls]
+    if failed:
+        print(f"❌ Did not load: {', '.join(failed)}")
+    if over:
+        print(f"❌ CLS over {args.max_cls}: {', '.join(over)}")
+    if failed or over:
+        return 1
+    print(f"✅ Measured {len(routes)} route(s) on {len(devices)} device(s)")
+    return 0
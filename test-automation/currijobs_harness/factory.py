@@ -0,0 +1,318 @@
+"""
+Bulk test-data factory
+Builds related tasks, offers, payments and reviews in Python and writes
+them in batches, so a test can declare the data it needs instead of
+creating one task through the UI form:
+
+    from currijobs_harness.factory import CopySink, Factory
+
+    with db.connect(dsn, autocommit=False) as conn:
+        factory = Factory(CopySink(conn))
+        people = factory.users(40)
+        tasks = factory.tasks(200, owners=people, status="open", radius_km=5)
+        factory.offers(tasks[:30], bidders=people, per_task=3)
+        factory.flush()
+        conn.commit()
+
+Ids are generated client-side (seeded uuid4), so relations resolve without
+reading anything back, and a given seed always produces the same rows.
+Rows are buffered per table and written in dependency order by a sink:
+
+    CopySink   COPY ... FROM STDIN on a psycopg connection; can also create
+               auth users (profiles follow from the signup trigger)
+    RestSink   PostgREST array POSTs of --batch-size rows with
+               Prefer: return=minimal. Users come from existing profiles,
+               since PostgREST cannot create auth users. Inserts run as the
+               token's role; the default is a service_role token minted with
+               CURRIJOBS_JWT_SECRET, as auth-session does for users
+
+Usage:
+    python -m currijobs_harness data-factory
+    python -m currijobs_harness data-factory --tasks 200 --radius-km 5 --with-offers 30
+    python -m currijobs_harness data-factory --sink rest --url http://localhost:3000
+"""
+
+import datetime
+import math
+import random
+import uuid
+
+from currijobs_harness.seed import SAN_JOSE, TASK_CATEGORIES
+
+HISTORY_NAME = "factory"
+TABLE_ORDER = ("tasks", "offers", "payments", "reviews")
+KM_PER_DEGREE = 111.0
+DEFAULT_BATCH_SIZE = 1000
+
+
+def add_arguments(parser):
+    from currijobs_harness import db
+
+    db.add_dsn_argument(parser)
+    parser.add_argument("--sink", choices=("copy", "rest"), default="copy", help="How rows are written (default: copy)")
+    parser.add_argument("--url", default=db.DEFAULT_POSTGREST_URL, help="PostgREST URL for --sink rest (EXPO_PUBLIC_POSTGREST_URL)")
+    parser.add_argument("--token", default=None, help="JWT for --sink rest (default: minted service_role token)")
+    parser.add_argument("--users", type=int, default=40, help="Users to create (copy) or reuse (rest) (default: 40)")
+    parser.add_argument("--tasks", type=int, default=200, help="Open tasks (default: 200)")
+    parser.add_argument("--radius-km", type=float, default=5.0, help="Tasks fall within this distance of San José (default: 5)")
+    parser.add_argument("--with-offers", type=int, default=30, help="Open tasks that get offers (default: 30)")
+    parser.add_argument("--offers-per-task", type=int, default=3, help="Offers on each of those tasks (default: 3)")
+    parser.add_argument("--completed", type=int, default=50, help="Completed tasks with a payment and review (default: 50)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help=f"Rows per POST (default: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument("--budget-ms", type=float, default=1000.0, help="Fail if seeding takes longer (default: 1000)")
+    parser.add_argument("--keep", action="store_true", help="Commit the rows (copy sink) instead of rolling back")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+def point_within(rng, center, radius_km):
+    """Uniform random (lat, lon) within radius_km of center"""
+    distance = radius_km * math.sqrt(rng.random())
+    bearing = 2 * math.pi * rng.random()
+    lat = center[0] + distance * math.cos(bearing) / KM_PER_DEGREE
+    lon = center[1] + distance * math.sin(bearing) / (KM_PER_DEGREE * math.cos(math.radians(center[0])))
+    return lat, lon
+
+
+class CopySink:
+    """Writes batches with COPY on a psycopg connection; the caller commits"""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def users(self, count, prefix):
+        from currijobs_harness import seed
+
+        with self.conn.cursor() as cur:
+            return [str(user_id) for user_id in seed.create_users(cur, count, prefix=prefix)]
+
+    def write(self, table, columns, rows):
+        with self.conn.cursor() as cur:
+            with cur.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row([row[column] for column in columns])
+
+
+class RestSink:
+    """Writes batches as PostgREST array POSTs"""
+
+    def __init__(self, url, token=None, batch_size=DEFAULT_BATCH_SIZE, timeout=30):
+        import requests
+
+        from currijobs_harness import auth_session, db
+
+        if token is None:
+            now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+            claims = {"role": "service_role", "iss": "currijobs-harness", "iat": now, "exp": now + 3600}
+            token = auth_session.sign_jwt(claims, auth_session.stand_in_secret())
+        self.url = url.rstrip("/")
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.requests = 0
+        self.session = requests.Session()
+        self.session.headers.update(db.postgrest_headers(token, representation=False))
+        self.session.headers["Prefer"] = "return=minimal"
+
+    def users(self, count, prefix):
+        response = self.session.get(f"{self.url}/profiles", params={"select": "id", "limit": count}, timeout=self.timeout)
+        response.raise_for_status()
+        ids = [row["id"] for row in response.json()]
+        if len(ids) < count:
+            raise ValueError(f"PostgREST cannot create auth users; found {len(ids)} of {count} profiles")
+        return ids
+
+    def write(self, table, columns, rows):
+        import json
+
+        for start in range(0, len(rows), self.batch_size):
+            batch = [{column: row[column] for column in columns} for row in rows[start:start + self.batch_size]]
+            response = self.session.post(f"{self.url}/{table}", params={"columns": ",".join(columns)},
+                                         data=json.dumps(batch, default=datetime.datetime.isoformat), timeout=self.timeout)
+            self.requests += 1
+            if response.status_code >= 400:
+                raise RuntimeError(f"POST /{table} failed ({response.status_code}): {response.text[:200]}")
+
+
+class Factory:
+    """Related marketplace rows, buffered until flush()"""
+
+    def __init__(self, sink, seed=42, prefix="factory"):
+        self.sink = sink
+        self.rng = random.Random(seed)
+        self.prefix = prefix
+        self.now = datetime.datetime.now(datetime.timezone.utc)
+        self.pending = {table: [] for table in TABLE_ORDER}
+        self.written = {table: 0 for table in TABLE_ORDER}
+
+    def uuid(self):
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def ago(self, max_days):
+        return self.now - datetime.timedelta(days=max_days * self.rng.random())
+
+    def users(self, count):
+        """User ids: new auth users with the copy sink, existing profiles with the REST sink"""
+        return self.sink.users(count, self.prefix)
+
+    def tasks(self, count, owners, status="open", center=SAN_JOSE, radius_km=5.0, workers=None, category=None,
+              reward=None, max_age_days=30):
+        """count tasks within radius_km of center; non-open tasks are assigned to one of workers (default: owners)"""
+        workers = workers or owners
+        rows = []
+        for i in range(count):
+            lat, lon = point_within(self.rng, center, radius_km)
+            owner = self.rng.choice(owners)
+            created_at = self.ago(max_age_days)
+            rows.append({
+                "id": self.uuid(),
+                "title": f"{self.prefix.capitalize()} task {self.written['tasks'] + len(self.pending['tasks']) + i + 1}",
+                "description": "Created by the currijobs-harness data factory",
+                "category": category or self.rng.choice(TASK_CATEGORIES),
+                "reward": reward or 1000 * self.rng.randint(5, 99),
+                "location": "San Jose",
+                "latitude": lat,
+                "longitude": lon,
+                "status": status,
+                "user_id": owner,
+                "assigned_to": None if status == "open" else self.rng.choice([w for w in workers if w != owner] or workers),
+                "created_at": created_at,
+                "completed_at": created_at + datetime.timedelta(days=self.rng.uniform(1, 7)) if status == "completed" else None,
+            })
+        self.pending["tasks"].extend(rows)
+        return rows
+
+    def offers(self, tasks, bidders, per_task=3):
+        """per_task pending offers on each task from bidders other than its owner"""
+        rows = []
+        for task in tasks:
+            candidates = [b for b in bidders if b != task["user_id"]]
+            for bidder in self.rng.sample(candidates, min(per_task, len(candidates))):
+                rows.append({
+                    "id": self.uuid(),
+                    "task_id": task["id"],
+                    "user_id": bidder,
+                    "proposed_reward": round(task["reward"] * self.rng.uniform(0.8, 1.2), -2),
+                    "message": "Factory offer",
+                    "status": "pending",
+                    "created_at": task["created_at"] + datetime.timedelta(hours=self.rng.uniform(0, 48)),
+                })
+        self.pending["offers"].extend(rows)
+        return rows
+
+    def payments(self, tasks):
+        """A completed cash payment from owner to assignee for each assigned task"""
+        rows = []
+        for task in tasks:
+            if not task["assigned_to"]:
+                continue
+            paid_at = task["completed_at"] or task["created_at"] + datetime.timedelta(days=1)
+            rows.append({
+                "id": self.uuid(),
+                "task_id": task["id"],
+                "payer_id": task["user_id"],
+                "payee_id": task["assigned_to"],
+                "amount": task["reward"],
+                "status": "completed",
+                "payment_method": "cash",
+                "completed_at": paid_at,
+                "created_at": paid_at,
+            })
+        self.pending["payments"].extend(rows)
+        return rows
+
+    def reviews(self, payments, share=1.0):
+        """A review of the payee by the payer for share of payments"""
+        rows = []
+        for payment in payments:
+            if self.rng.random() >= share:
+                continue
+            rows.append({
+                "id": self.uuid(),
+                "task_id": payment["task_id"],
+                "reviewer_id": payment["payer_id"],
+                "reviewed_id": payment["payee_id"],
+                "payment_id": payment["id"],
+                "rating": self.rng.randint(3, 5),
+                "comment": "Factory review",
+                "created_at": payment["created_at"] + datetime.timedelta(days=1),
+            })
+        self.pending["reviews"].extend(rows)
+        return rows
+
+    def flush(self):
+        """Write buffered rows, parents first; returns rows written per table"""
+        counts = {}
+        for table in TABLE_ORDER:
+            rows = self.pending[table]
+            if rows:
+                self.sink.write(table, list(rows[0]), rows)
+                self.written[table] += len(rows)
+                counts[table] = len(rows)
+            self.pending[table] = []
+        return counts
+
+
+def run(args):
+    import time
+
+    from currijobs_harness import db, results
+
+    print("🏭 CurriJobs Test Data Factory")
+    print("=" * 50)
+    conn = None
+    try:
+        if args.sink == "copy":
+            conn = db.connect_for(args, autocommit=False)
+            sink = CopySink(conn)
+            print(f"🐘 COPY into {db.target_for(args)}")
+        else:
+            sink = RestSink(args.url, args.token, args.batch_size)
+            print(f"🌐 PostgREST array POSTs to {args.url} ({args.batch_size} rows per request)")
+    except Exception as e:
+        print(f"❌ Could not connect: {e}")
+        return 1
+
+    try:
+        start = time.perf_counter()
+        factory = Factory(sink, seed=args.seed)
+        people = factory.users(args.users)
+        users_ms = (time.perf_counter() - start) * 1000
+        open_tasks = factory.tasks(args.tasks, owners=people, radius_km=args.radius_km)
+        factory.offers(open_tasks[:args.with_offers], bidders=people, per_task=args.offers_per_task)
+        completed = factory.tasks(args.completed, owners=people, status="completed", radius_km=args.radius_km, max_age_days=180)
+        factory.reviews(factory.payments(completed))
+        counts = factory.flush()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    except Exception as e:
+        print(f"❌ Seeding failed: {e}")
+        if conn:
+            conn.rollback()
+            conn.close()
+        return 1
+
+    if conn:
+        if args.keep:
+            conn.commit()
+        else:
+            conn.rollback()
+        conn.close()
+
+    total = sum(counts.values())
+    print(f"👥 {len(people)} users in {users_ms:.0f} ms")
+    for table, count in counts.items():
+        print(f"   {table:<10} {count:>7,}")
+    requests_note = f", {sink.requests} requests" if args.sink == "rest" else ""
+    print(f"⏱️  {total:,} rows in {elapsed_ms:,.0f} ms ({total / (elapsed_ms / 1000):,.0f} rows/s{requests_note})")
+    if conn:
+        print("💾 Committed" if args.keep else "🧹 Factory data rolled back")
+
+    report = {"sink": args.sink, "users": len(people), "rows": counts, "elapsed_ms": round(elapsed_ms, 1),
+              "batch_size": args.batch_size, "requests": getattr(sink, "requests", None)}
+    if not args.no_history:
+        record = results.append_history(HISTORY_NAME, report)
+        print(f"📝 Recorded run for {record['commit']}")
+    if elapsed_ms > args.budget_ms:
+        print(f"❌ Over the {args.budget_ms:,.0f} ms budget")
+        return 1
+    print(f"✅ Seeded within the {args.budget_ms:,.0f} ms budget")
+    return 0
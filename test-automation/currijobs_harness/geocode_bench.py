@@ -0,0 +1,338 @@
+"""
+Geocoding cache benchmark
+Replays a query trace (address keystrokes, place selections and map
+long-presses, as app/settings.tsx issues them) against a local stand-in
+geocoder with injected latency, three times:
+  none         every lookup goes to the geocoder
+  memory       LRU + TTL cache, cleared on every app start (session)
+  memory+disk  the same cache, persisted between sessions
+The cache mirrors lib/geocode-cache.ts: reverse keys are ~110 m lat/lon
+cells, forward keys are normalized queries, and a forward miss is served
+from a complete result list cached for a shorter prefix.
+
+Usage:
+    python -m currijobs_harness geocode-bench
+    python -m currijobs_harness geocode-bench --record trace.jsonl
+    python -m currijobs_harness geocode-bench --trace trace.jsonl --latency-ms 120
+"""
+
+import json
+import random
+import time
+
+HISTORY_NAME = "geocode"
+
+# Keep in sync with lib/geocode-cache.ts and lib/location.ts
+REVERSE_CELL_DEG = 0.001
+SUGGESTION_LIMIT = 5
+MAX_ENTRIES = 500
+TTL_S = {"r": 7 * 24 * 3600, "f": 24 * 3600, "g": 30 * 24 * 3600}
+NEGATIVE_TTL_S = 5 * 60
+MIN_QUERY_LENGTH = 3
+
+
+def add_arguments(parser):
+    parser.add_argument("--trace", help="Replay this JSONL trace instead of generating one")
+    parser.add_argument("--record", help="Write the generated trace to this JSONL file")
+    parser.add_argument("--sessions", type=int, default=60, help="Sessions in a generated trace (default: 60)")
+    parser.add_argument("--latency-ms", type=float, default=40.0, help="Stand-in geocoder latency (default: 40)")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for the generated trace")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+def normalize(text):
+    import unicodedata
+
+    stripped = "".join(c for c in unicodedata.normalize("NFD", text) if not unicodedata.combining(c)).lower()
+    cleaned = "".join(c if c.isascii() and (c.isalnum() or c == " ") else " " for c in stripped)
+    return " ".join(cleaned.split())
+
+
+def suggestion_matches(suggestion, normalized):
+    """suggestionMatches in lib/location.ts"""
+    return (normalized in normalize(suggestion["description"])
+            or normalized in normalize(suggestion["structured_formatting"]["main_text"]))
+
+
+def reverse_key(lat, lon):
+    import math
+
+    return f"r:{math.floor(lat / REVERSE_CELL_DEG)}:{math.floor(lon / REVERSE_CELL_DEG)}"
+
+
+class GeocodeCache:
+    """Python mirror of GeocodeCache in lib/geocode-cache.ts"""
+
+    def __init__(self, clock):
+        from collections import OrderedDict
+
+        self.entries = OrderedDict()
+        self.clock = clock
+        self.stats = {"hits": 0, "prefix_hits": 0, "misses": 0, "evictions": 0, "restored": 0}
+
+    def lookup_entry(self, key):
+        """(value, expires_at), or None when missing or expired"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= self.clock():
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return entry
+
+    def lookup(self, key):
+        entry = self.lookup_entry(key)
+        return (None, False) if entry is None else (entry[0], True)
+
+    def store(self, key, value, expires_at=None):
+        ttl = NEGATIVE_TTL_S if value is None else TTL_S.get(key[0], TTL_S["f"])
+        self.entries[key] = (value, self.clock() + ttl if expires_at is None else expires_at)
+        self.entries.move_to_end(key)
+        while len(self.entries) > MAX_ENTRIES:
+            self.entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def get_or_load(self, key, loader):
+        value, found = self.lookup(key)
+        if found:
+            self.stats["hits"] += 1
+            return value
+        self.stats["misses"] += 1
+        value = loader()
+        self.store(key, value)
+        return value
+
+    def get_suggestions(self, query, loader):
+        normalized = normalize(query)
+        for end in range(len(normalized) - 1, 0, -1):
+            shorter = self.lookup_entry("f:" + normalized[:end])
+            if shorter is not None and len(shorter[0]) < SUGGESTION_LIMIT:
+                self.stats["prefix_hits"] += 1
+                filtered = [s for s in shorter[0] if suggestion_matches(s, normalized)]
+                # A subset is no fresher than the list it came from
+                self.store("f:" + normalized, filtered, shorter[1])
+                return filtered
+        return self.get_or_load("f:" + normalized, loader)
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(list(self.entries.items()), f)
+
+    def load(self, path):
+        import os
+
+        if not os.path.exists(path):
+            return
+        with open(path) as f:
+            for key, (value, expires_at) in json.load(f):
+                if expires_at > self.clock() and key not in self.entries:
+                    self.entries[key] = (value, expires_at)
+                    self.stats["restored"] += 1
+
+
+def start_stand_in(latency_ms):
+    """Threaded HTTP geocoder over the shared gazetteer; returns (server, base_url)"""
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import parse_qs, urlparse
+
+    from currijobs_harness.places import PLACES, describe
+
+    rows = [
+        {"place_id": f"cr_{i}", "description": describe(name, province), "main_text": name,
+         "latitude": lat, "longitude": lon}
+        for i, (name, province, lat, lon) in enumerate(PLACES)
+    ]
+    by_id = {row["place_id"]: row for row in rows}
+    jitter = random.Random(0)
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            q = {k: v[0] for k, v in parse_qs(url.query).items()}
+            time.sleep(latency_ms * (0.75 + 0.5 * jitter.random()) / 1000)
+            if url.path == "/suggest":
+                needle = normalize(q.get("q", ""))
+                suggestions = (
+                    {"place_id": r["place_id"], "description": r["description"],
+                     "structured_formatting": {"main_text": r["main_text"],
+                                               "secondary_text": r["description"][len(r["main_text"]) + 2:]}}
+                    for r in rows
+                )
+                body = [s for s in suggestions if needle and suggestion_matches(s, needle)][:SUGGESTION_LIMIT]
+            elif url.path == "/geocode":
+                body = by_id.get(q.get("place_id"))
+            elif url.path == "/reverse":
+                lat, lon = float(q["lat"]), float(q["lon"])
+                body = min(rows, key=lambda r: (r["latitude"] - lat) ** 2 + (r["longitude"] - lon) ** 2)["description"]
+            else:
+                self.send_response(404)
+                self.end_headers()
+                return
+            payload = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def generate_trace(sessions, rng):
+    """Synthetic sessions: type a town (accents optional), pick it, long-press around home"""
+    from currijobs_harness.places import PLACES
+
+    # Zipf-ish popularity: the metro area dominates
+    weights = [1.0 / (rank + 1) for rank in range(len(PLACES))]
+    trace = []
+    t = 0.0
+    for session in range(sessions):
+        t += rng.uniform(1, 12) * 3600
+        index = rng.choices(range(len(PLACES)), weights=weights)[0]
+        name, _, lat, lon = PLACES[index]
+        typed = name if rng.random() < 0.5 else normalize(name)
+        stop = rng.randint(min(len(typed), MIN_QUERY_LENGTH), len(typed))
+        for end in range(MIN_QUERY_LENGTH, stop + 1):
+            t += rng.uniform(0.1, 0.4)
+            trace.append({"t": round(t, 2), "session": session, "op": "suggest", "q": typed[:end]})
+        trace.append({"t": round(t, 2), "session": session, "op": "geocode", "place_id": f"cr_{index}"})
+        for _ in range(rng.randint(2, 8)):
+            t += rng.uniform(1, 20)
+            trace.append({
+                "t": round(t, 2), "session": session, "op": "reverse",
+                "lat": round(lat + rng.gauss(0, 0.002), 6), "lon": round(lon + rng.gauss(0, 0.002), 6),
+            })
+    return trace
+
+
+def replay(trace, base_url, mode, disk_path):
+    from urllib.parse import urlencode
+    from urllib.request import urlopen
+
+    now = {"t": 0.0}
+    calls = {"count": 0}
+
+    def fetch(path, params):
+        calls["count"] += 1
+        with urlopen(f"{base_url}{path}?{urlencode(params)}") as resp:
+            return json.loads(resp.read())
+
+    cache = None
+    totals = {"hits": 0, "prefix_hits": 0, "misses": 0, "evictions": 0, "restored": 0}
+    latencies = []
+    answers = []
+    session = None
+    for op in trace:
+        now["t"] = op["t"]
+        if op["session"] != session:
+            if cache is not None:
+                if mode == "memory+disk":
+                    cache.save(disk_path)
+                for key in totals:
+                    totals[key] += cache.stats[key]
+            session = op["session"]
+            cache = GeocodeCache(lambda: now["t"]) if mode != "none" else None
+            if cache is not None and mode == "memory+disk":
+                cache.load(disk_path)
+
+        start = time.perf_counter()
+        if op["op"] == "suggest":
+            loader = lambda: fetch("/suggest", {"q": op["q"]})
+            answer = cache.get_suggestions(op["q"], loader) if cache else loader()
+            answer = [s["place_id"] for s in answer]
+        elif op["op"] == "geocode":
+            loader = lambda: fetch("/geocode", {"place_id": op["place_id"]})
+            answer = cache.get_or_load("g:" + op["place_id"], loader) if cache else loader()
+        else:
+            loader = lambda: fetch("/reverse", {"lat": op["lat"], "lon": op["lon"]})
+            answer = cache.get_or_load(reverse_key(op["lat"], op["lon"]), loader) if cache else loader()
+        latencies.append((time.perf_counter() - start) * 1000)
+        answers.append(answer)
+    if cache is not None:
+        for key in totals:
+            totals[key] += cache.stats[key]
+    return {"calls": calls["count"], "latencies": latencies, "answers": answers, "cache": totals}
+
+
+def run(args):
+    import os
+    import tempfile
+
+    from currijobs_harness import results, stats
+
+    print("🧭 CurriJobs Geocoding Cache Benchmark")
+    print("=" * 50)
+
+    if args.trace:
+        with open(args.trace) as f:
+            trace = [json.loads(line) for line in f if line.strip()]
+        print(f"📼 Replaying {len(trace)} lookups from {args.trace}")
+    else:
+        trace = generate_trace(args.sessions, random.Random(args.seed))
+        print(f"📼 Generated {len(trace)} lookups over {args.sessions} sessions")
+        if args.record:
+            with open(args.record, "w") as f:
+                for op in trace:
+                    f.write(json.dumps(op, ensure_ascii=False) + "\n")
+            print(f"💾 Trace written to {args.record}")
+
+    server, base_url = start_stand_in(args.latency_ms)
+    report = {"lookups": len(trace), "latency_ms": args.latency_ms, "modes": {}}
+    runs = {}
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for mode in ("none", "memory", "memory+disk"):
+                runs[mode] = replay(trace, base_url, mode, os.path.join(tmp, "geocode-cache.json"))
+    finally:
+        server.shutdown()
+
+    # Forward and place lookups must be answered exactly; reverse answers may
+    # differ only when two points in one ~110 m cell straddle a boundary
+    baseline = runs["none"]["answers"]
+    problems = []
+    for mode in ("memory", "memory+disk"):
+        wrong = sum(1 for op, a, b in zip(trace, runs[mode]["answers"], baseline) if op["op"] != "reverse" and a != b)
+        shifted = sum(1 for op, a, b in zip(trace, runs[mode]["answers"], baseline) if op["op"] == "reverse" and a != b)
+        if wrong:
+            problems.append(f"{mode}: {wrong} forward lookups differ from the uncached answers")
+        runs[mode]["reverse_shifted"] = shifted
+
+    print(f"\n{'mode':<12} {'calls':>6} {'hit %':>6} {'p50':>7} {'p95':>7} {'total s':>8}")
+    for mode, r in runs.items():
+        summary = stats.summarize(r["latencies"])
+        hit_rate = 100.0 * (1 - r["calls"] / len(trace)) if trace else 0.0
+        report["modes"][mode] = {
+            "calls": r["calls"],
+            "hit_rate": round(hit_rate, 1),
+            "lookup_ms": summary,
+            "total_s": round(sum(r["latencies"]) / 1000, 2),
+            "cache": r["cache"],
+            "reverse_shifted": r.get("reverse_shifted", 0),
+        }
+        print(
+            f"{mode:<12} {r['calls']:>6} {hit_rate:>6.1f} {stats.fmt_ms(summary['p50']):>7} "
+            f"{stats.fmt_ms(summary['p95']):>7} {report['modes'][mode]['total_s']:>8}"
+        )
+    disk = report["modes"]["memory+disk"]
+    print(
+        f"💾 memory+disk: {disk['cache']['prefix_hits']} prefix hits, {disk['cache']['restored']} entries restored across sessions, "
+        f"{disk['reverse_shifted']} reverse answers shifted by cell rounding"
+    )
+
+    if problems:
+        for problem in problems:
+            print(f"❌ {problem}")
+        return 1
+    print("✅ Cached forward lookups match the geocoder")
+
+    if not args.no_history:
+        record = results.append_history(HISTORY_NAME, report)
+        print(f"📝 Recorded run for {record['commit']}")
+    return 0
@@ -0,0 +1,278 @@
+"""
+Hedged vs sequential fetch fallbacks
+Replays fetchTasks' two retry policies against a local stand-in for
+PostgREST that injects latency: a log-normal body (--median-ms, --sigma)
+plus a share of requests that stall for --stall-s, like a dead mobile
+connection.
+
+    sequential   the old fetchTasks: primary raced against a 10 s timeout
+                 (and left running), then direct REST, then postgrest-js
+    hedged       lib/hedge.ts: a backup starts once the primary passes the
+                 p95 of recent primary latencies (clamped 200 ms - 5 s, 2 s
+                 until 5 samples; a primary cut off by a backup win or the
+                 deadline counts at its elapsed time); a failure starts it at
+                 once; the third attempt is a fresh postgrest-js request, hedged
+                 or failed over the same way; the first success wins and the
+                 losers are cancelled; 10 s overall limit, after which the call
+                 fails (fetchTasks returns [])
+
+A failed call counts at the time it failed, so the latency percentiles
+include it, and the check fails if hedging errors more often than the
+sequential policy.
+
+Both run the same seeded latency schedule with --concurrency callers. It
+reports latency percentiles, how often hedges fired and won, and the extra
+requests each policy sent to the server.
+
+Usage:
+    python -m currijobs_harness hedge-bench
+    python -m currijobs_harness hedge-bench --requests 500 --stall-rate 0.05 --stall-s 12
+"""
+
+import asyncio
+import json
+import math
+import random
+import time
+
+HISTORY_NAME = "hedge"
+SEQUENTIAL_TIMEOUT_S = 10.0
+HEDGE = {"percentile": 0.95, "initial_ms": 2000, "min_ms": 200, "max_ms": 5000, "min_samples": 5, "window": 50,
+         "timeout_s": 10.0}
+
+
+def add_arguments(parser):
+    parser.add_argument("--requests", type=int, default=300, help="fetchTasks calls per policy (default: 300)")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent callers (default: 20)")
+    parser.add_argument("--median-ms", type=float, default=120.0, help="Median response time (default: 120)")
+    parser.add_argument("--sigma", type=float, default=0.5, help="Log-normal spread of response times (default: 0.5)")
+    parser.add_argument("--stall-rate", type=float, default=0.04, help="Share of requests that stall (default: 0.04)")
+    parser.add_argument("--stall-s", type=float, default=12.0, help="Seconds a stalled request takes (default: 12)")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed (default: 7)")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+class StandIn:
+    """Local HTTP server answering GET /tasks after an injected delay"""
+
+    def __init__(self, median_ms, sigma, stall_rate, stall_s, seed):
+        self.mu = math.log(median_ms / 1000)
+        self.sigma = sigma
+        self.stall_rate = stall_rate
+        self.stall_s = stall_s
+        self.rng = random.Random(seed)
+        self.body = json.dumps([{"id": i, "title": f"Task {i}", "status": "open"} for i in range(20)]).encode()
+        self.received = 0
+
+    def delay(self):
+        if self.rng.random() < self.stall_rate:
+            return self.stall_s
+        return self.rng.lognormvariate(self.mu, self.sigma)
+
+    async def handle(self, reader, writer):
+        try:
+            await reader.readuntil(b"\r\n\r\n")
+            self.received += 1
+            await asyncio.sleep(self.delay())
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nConnection: close\r\n"
+                         + f"Content-Length: {len(self.body)}\r\n\r\n".encode() + self.body)
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            # Stalled handlers still sleeping when the run ends are cancelled at shutdown
+            pass
+        finally:
+            writer.close()
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+
+async def fetch_tasks(port, path):
+    """GET the stand-in; cancelling the task closes the connection, as AbortController does"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\n\r\n".encode())
+        await writer.drain()
+        response = await reader.read()
+    finally:
+        writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    if not head.startswith(b"HTTP/1.1 200"):
+        raise RuntimeError(head.split(b"\r\n")[0].decode())
+    return json.loads(body)
+
+
+async def sequential(port, counters):
+    """Old fetchTasks: primary vs a 10 s timeout, then direct REST, then postgrest-js"""
+    primary = asyncio.ensure_future(fetch_tasks(port, "/tasks?via=postgrest"))
+    counters["background"].append(primary)
+    done, _ = await asyncio.wait([primary], timeout=SEQUENTIAL_TIMEOUT_S)
+    if done and not primary.exception():
+        return primary.result()
+    counters["retries"] += 1
+    for path in ("/tasks?via=direct", "/tasks?via=postgrest-retry"):
+        try:
+            return await fetch_tasks(port, path)
+        except Exception:
+            continue
+    raise RuntimeError("all strategies failed")
+
+
+class Hedger:
+    """Python port of hedged() in lib/hedge.ts"""
+
+    def __init__(self, options):
+        self.options = options
+        self.samples = []
+        self.stats = {"calls": 0, "hedged": 0, "failovers": 0, "backup_wins": 0, "failures": 0, "timeouts": 0}
+
+    def record(self, ms):
+        self.samples = (self.samples + [ms])[-self.options["window"]:]
+
+    def threshold_s(self):
+        o = self.options
+        if len(self.samples) < o["min_samples"]:
+            return o["initial_ms"] / 1000
+        ordered = sorted(self.samples)
+        rank = min(len(ordered) - 1, max(0, math.ceil(o["percentile"] * len(ordered)) - 1))
+        return min(o["max_ms"], max(o["min_ms"], ordered[rank])) / 1000
+
+    async def call(self, strategies):
+        self.stats["calls"] += 1
+        started = time.perf_counter()
+        pending, launched = set(), 0
+
+        def launch(reason):
+            nonlocal launched
+            if reason != "primary":
+                self.stats[reason] += 1
+            task = asyncio.ensure_future(strategies[launched]())
+            task.index = launched
+            launched += 1
+            pending.add(task)
+
+        primary = {"done": False}
+        launch("primary")
+        deadline = started + self.options["timeout_s"]
+        try:
+            while pending:
+                hedge_at = time.perf_counter() + self.threshold_s() if launched < len(strategies) else deadline
+                wait_s = max(0, min(hedge_at, deadline) - time.perf_counter())
+                done, pending = await asyncio.wait(pending, timeout=wait_s, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.index == 0:
+                        primary["done"] = True
+                        if task.exception() is None:
+                            self.record((time.perf_counter() - started) * 1000)
+                    if task.exception() is None:
+                        if task.index > 0:
+                            self.stats["backup_wins"] += 1
+                        return task.result()
+                if done and launched < len(strategies):
+                    launch("failovers")
+                elif not done and time.perf_counter() >= deadline:
+                    self.stats["timeouts"] += 1
+                    raise TimeoutError("hedged fetchTasks timeout")
+                elif not done and launched < len(strategies):
+                    launch("hedged")
+            self.stats["failures"] += 1
+            raise RuntimeError("all strategies failed")
+        finally:
+            if not primary["done"]:
+                # Cut off by a backup win or the deadline: censored at its elapsed time
+                self.record((time.perf_counter() - started) * 1000)
+            for task in pending:
+                task.cancel()
+
+
+async def replay(policy, args):
+    from currijobs_harness import stats
+
+    server = StandIn(args.median_ms, args.sigma, args.stall_rate, args.stall_s, args.seed)
+    await server.start()
+    counters = {"retries": 0, "background": []}
+    hedger = Hedger(HEDGE)
+    strategies = [lambda: fetch_tasks(server.port, "/tasks?via=postgrest"), lambda: fetch_tasks(server.port, "/tasks?via=direct"),
+                  lambda: fetch_tasks(server.port, "/tasks?via=postgrest-retry")]
+    latencies, errors = [], 0
+    queue = asyncio.Queue()
+    for _ in range(args.requests):
+        queue.put_nowait(None)
+
+    async def caller():
+        nonlocal errors
+        while not queue.empty():
+            queue.get_nowait()
+            start = time.perf_counter()
+            try:
+                if policy == "sequential":
+                    await sequential(server.port, counters)
+                else:
+                    await hedger.call(strategies)
+            except Exception:
+                errors += 1
+            # Failed calls count at the time they failed (the 10 s deadline for a hedged timeout)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    # The old policy never cancelled a timed-out primary; it kept the connection (and server) busy
+    for task in counters["background"]:
+        task.cancel()
+    server.server.close()
+    await server.server.wait_closed()
+    result = {
+        "latency_ms": stats.summarize(latencies),
+        "errors": errors,
+        "requests_sent": server.received,
+        "extra_requests_pct": round((server.received - args.requests) * 100 / args.requests, 1),
+        "elapsed_s": round(elapsed, 1),
+    }
+    if policy == "sequential":
+        result["retries"] = counters["retries"]
+    else:
+        result["hedge"] = dict(hedger.stats, threshold_ms=round(hedger.threshold_s() * 1000))
+    return result
+
+
+def run(args):
+    from currijobs_harness import results
+    from currijobs_harness.stats import fmt_ms
+
+    print("🦔 CurriJobs Hedged Request Benchmark")
+    print("=" * 50)
+    print(f"🎲 Stand-in: median {args.median_ms:.0f} ms (σ {args.sigma}), {args.stall_rate:.0%} stall {args.stall_s:g}s; "
+          f"{args.requests} calls × {args.concurrency} callers")
+    report = {"requests": args.requests, "stall_rate": args.stall_rate, "stall_s": args.stall_s, "policies": {}}
+    for policy in ("sequential", "hedged"):
+        print(f"⏱️  {policy}…")
+        report["policies"][policy] = asyncio.run(replay(policy, args))
+
+    print(f"\n{'policy':<11} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9} {'errors':>7} {'sent':>6} {'extra':>7}")
+    for policy, row in report["policies"].items():
+        latency = row["latency_ms"]
+        print(f"{policy:<11} {fmt_ms(latency['p50']):>7}ms {fmt_ms(latency['p95']):>7}ms {fmt_ms(latency['p99']):>7}ms "
+              f"{fmt_ms(latency['max']):>7}ms {row['errors']:>7} {row['requests_sent']:>6} {row['extra_requests_pct']:>6}%")
+    hedge = report["policies"]["hedged"]["hedge"]
+    print(f"\n🦔 Hedges fired on {hedge['hedged']}/{hedge['calls']} calls ({hedge['hedged'] * 100 / max(1, hedge['calls']):.1f}%), "
+          f"backup won {hedge['backup_wins']}, failovers {hedge['failovers']}, threshold {hedge['threshold_ms']} ms")
+    print(f"🔁 Sequential retried {report['policies']['sequential']['retries']} calls after the 10 s timeout; "
+          f"hedged timed out on {hedge['timeouts']} (fetchTasks returns [] then)")
+
+    if not args.no_history:
+        record = results.append_history(HISTORY_NAME, report)
+        print(f"📝 Recorded run for {record['commit']}")
+    before = report["policies"]["sequential"]["latency_ms"]["p99"]
+    after = report["policies"]["hedged"]["latency_ms"]["p99"]
+    sequential_errors = report["policies"]["sequential"]["errors"]
+    hedged_errors = report["policies"]["hedged"]["errors"]
+    if hedged_errors > sequential_errors:
+        print(f"❌ Hedging failed {hedged_errors} calls vs {sequential_errors} sequential")
+        return 1
+    if before is None or after is None or after >= before:
+        print("❌ Hedging did not reduce p99")
+        return 1
+    print(f"✅ p99 {before / 1000:.1f}s → {after / 1000:.2f}s ({before / after:.0f}x lower)")
+    return 0
@@ -0,0 +1,489 @@
+"""
+Workload-driven index advisor
+Replays the app's query mix (WORKLOAD below, or a recorded one via
+--workload) against seeded data and harvests per-statement time from
+pg_stat_statements. Without that extension it falls back to client-side
+timing. Each statement is tagged with a /* advisor:<name> */ comment so the
+harvested rows map back to it.
+
+Candidate indexes come from the plans themselves: the equality columns in
+scan filters, the ORDER BY column, and constant predicates (status = 'open')
+for partial indexes. Each candidate is tried hypothetically and costed
+with plain EXPLAIN:
+
+    hypopg installed   hypopg_create_index, nothing is built
+    otherwise          CREATE INDEX inside a savepoint, rolled back after
+
+Benefit is the planner cost saved across the workload (cost x calls). Write
+cost is one leaf page (random_page_cost) for every row the workload's writes
+add to the index. Candidates are picked greedily: after each pick the rest
+are re-costed against it, so a composite index that subsumes a single-column
+one is not recommended twice, and picking stops once the best remaining net
+saving is under --min-gain of the workload's cost. The picks are then built for real, the
+workload is replayed again to measure them, and --write-migration emits
+them as a migration. Everything runs in one transaction that is rolled back.
+
+Usage:
+    python -m currijobs_harness index-advisor
+    python -m currijobs_harness index-advisor --workload captured.json --rounds 5
+    python -m currijobs_harness index-advisor --write-migration supabase/migrations/<ts>_workload_indexes.sql
+"""
+
+import os
+import re
+
+from currijobs_harness.cli import REPO_ROOT
+
+HISTORY_NAME = "index"
+SEED_PREFIX = "advisor"
+TAG_RE = re.compile(r"/\* advisor:([\w-]+) \*/")
+
+# The statements lib/database.ts issues through PostgREST, with calls per
+# session. Placeholders: user_id, other_user_id, task_id, category.
+WORKLOAD = [
+    {"name": "all_tasks", "calls": 10,
+     "sql": "SELECT * FROM tasks ORDER BY created_at DESC"},
+    {"name": "open_tasks_by_category", "calls": 6,
+     "sql": "SELECT * FROM tasks WHERE category = %(category)s AND status = 'open' ORDER BY created_at DESC"},
+    {"name": "tasks_by_user", "calls": 4,
+     "sql": "SELECT * FROM tasks WHERE user_id = %(user_id)s ORDER BY created_at DESC"},
+    {"name": "tasks_assigned_to_user", "calls": 4,
+     "sql": "SELECT * FROM tasks WHERE assigned_to = %(user_id)s ORDER BY created_at DESC"},
+    {"name": "offers_for_task", "calls": 8,
+     "sql": "SELECT * FROM offers WHERE task_id = %(task_id)s ORDER BY created_at DESC"},
+    {"name": "payments_for_user", "calls": 3,
+     "sql": "SELECT * FROM payments WHERE payee_id = %(user_id)s ORDER BY created_at DESC"},
+    {"name": "payments_made_count", "calls": 3,
+     "sql": "SELECT id FROM payments WHERE payer_id = %(user_id)s"},
+    {"name": "payments_received_count", "calls": 3,
+     "sql": "SELECT id FROM payments WHERE payee_id = %(user_id)s"},
+    {"name": "reviews_for_user", "calls": 2,
+     "sql": "SELECT * FROM reviews WHERE reviewed_id = %(user_id)s ORDER BY created_at DESC"},
+    {"name": "review_payment", "calls": 10,
+     "sql": "SELECT amount, status, task_id, payee_id FROM payments"
+            " WHERE task_id = %(task_id)s AND payee_id = %(user_id)s ORDER BY created_at DESC LIMIT 1"},
+    {"name": "create_offer", "calls": 3,
+     "sql": "INSERT INTO offers (task_id, user_id, proposed_reward, message)"
+            " VALUES (%(task_id)s, %(user_id)s, 10000, 'Advisor offer')"},
+    {"name": "assign_task", "calls": 2,
+     "sql": "UPDATE tasks SET status = 'in_progress', assigned_to = %(other_user_id)s WHERE id = %(task_id)s"},
+    {"name": "create_payment", "calls": 1,
+     "sql": "INSERT INTO payments (task_id, payer_id, payee_id, amount, status, payment_method)"
+            " VALUES (%(task_id)s, %(user_id)s, %(other_user_id)s, 10000, 'completed', 'cash')"},
+    {"name": "create_review", "calls": 1,
+     "sql": "INSERT INTO reviews (task_id, reviewer_id, reviewed_id, rating)"
+            " VALUES (%(task_id)s, %(user_id)s, %(other_user_id)s, 5)"},
+]
+
+
+def add_arguments(parser):
+    from currijobs_harness import db
+
+    db.add_dsn_argument(parser)
+    parser.add_argument("--workload", default=None, help="JSON list of {name, sql, calls} to replay instead of the app mix")
+    parser.add_argument("--users", type=int, default=2000, help="Users to seed (default: 2000)")
+    parser.add_argument("--tasks", type=int, default=50000, help="Tasks to seed (default: 50000)")
+    parser.add_argument("--rounds", type=int, default=20, help="Times the workload is replayed (default: 20)")
+    parser.add_argument("--max-indexes", type=int, default=8, help="Stop after this many picks (default: 8)")
+    parser.add_argument("--min-gain", type=float, default=0.01,
+                        help="Smallest net saving worth an index, as a fraction of workload cost (default: 0.01)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for statement parameters")
+    parser.add_argument("--write-migration", metavar="PATH", default=None, help="Write the picks as a migration")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+def load_workload(path):
+    import json
+
+    if not path:
+        return [dict(entry) for entry in WORKLOAD]
+    with open(path, encoding="utf-8") as f:
+        entries = json.load(f)
+    for entry in entries:
+        if not {"name", "sql"} <= entry.keys():
+            raise ValueError(f"workload entries need name and sql: {entry}")
+        entry.setdefault("calls", 1)
+    return entries
+
+
+def statement_kind(sql):
+    """('read' | 'write', target table)"""
+    match = re.match(r"\s*(INSERT INTO|UPDATE|DELETE FROM)\s+(\w+)", sql, re.I)
+    if match:
+        return "write", match.group(2)
+    match = re.search(r"\bFROM\s+(\w+)", sql, re.I)
+    return "read", match.group(1) if match else None
+
+
+def seed_data(cur, seed, users, tasks):
+    """Seed a marketplace; returns the parameter pools statements draw from"""
+    ids, task_ids = seed.create_marketplace(cur, users, tasks, prefix=SEED_PREFIX)
+    for table in ("tasks", "offers", "payments", "reviews", "profiles"):
+        cur.execute(f"ANALYZE {table}")
+    return {"user_id": ids, "other_user_id": ids, "task_id": task_ids, "category": seed.TASK_CATEGORIES}
+
+
+def tagged(entry):
+    return f"/* advisor:{entry['name']} */ {entry['sql']}"
+
+
+def params_for(sql, pools, rng):
+    return {name: rng.choice(pools[name]) for name in set(re.findall(r"%\((\w+)\)s", sql))}
+
+
+def stat_statements_view(cur):
+    """Qualified pg_stat_statements view if it is installed and loaded, else None"""
+    for name in ("pg_stat_statements", "extensions.pg_stat_statements"):
+        cur.execute("SELECT to_regclass(%s) IS NOT NULL", (name,))
+        if not cur.fetchone()[0]:
+            continue
+        cur.execute("SAVEPOINT stat_probe")
+        try:
+            cur.execute(f"SELECT 1 FROM {name} LIMIT 1")
+            cur.execute("SELECT pg_stat_statements_reset()")
+            cur.execute("RELEASE SAVEPOINT stat_probe")
+            return name
+        except Exception:
+            cur.execute("ROLLBACK TO SAVEPOINT stat_probe")
+    return None
+
+
+def replay(cur, workload, pools, rounds, seed, view):
+    """{name: {calls, total_ms, mean_ms}} from pg_stat_statements (or client timing without it)"""
+    import random
+    import time
+
+    rng = random.Random(seed)
+    client = {entry["name"]: {"calls": 0, "total_ms": 0.0} for entry in workload}
+    if view:
+        cur.execute("SELECT pg_stat_statements_reset()")
+    for _ in range(rounds):
+        for entry in workload:
+            sql = tagged(entry)
+            for _ in range(entry["calls"]):
+                start = time.perf_counter()
+                cur.execute(sql, params_for(sql, pools, rng))
+                if cur.description:
+                    cur.fetchall()
+                client[entry["name"]]["calls"] += 1
+                client[entry["name"]]["total_ms"] += (time.perf_counter() - start) * 1000
+
+    harvested = client
+    if view:
+        cur.execute(f"SELECT query, calls, total_exec_time FROM {view} WHERE query LIKE '%%/* advisor:%%'")
+        harvested = {}
+        for query, calls, total in cur.fetchall():
+            match = TAG_RE.search(query)
+            if match:
+                row = harvested.setdefault(match.group(1), {"calls": 0, "total_ms": 0.0})
+                row["calls"] += calls
+                row["total_ms"] += total
+    for row in harvested.values():
+        row["mean_ms"] = round(row["total_ms"] / row["calls"], 4) if row["calls"] else 0.0
+        row["total_ms"] = round(row["total_ms"], 2)
+    return harvested
+
+
+def plan_of(cur, sql, params):
+    cur.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+    return cur.fetchone()[0][0]["Plan"]
+
+
+def scans(plan):
+    """(relation, [conditions]) for every scan node"""
+    found = []
+    if "Relation Name" in plan:
+        conds = [plan[key] for key in ("Filter", "Index Cond", "Recheck Cond") if key in plan]
+        found.append((plan["Relation Name"], conds))
+    for child in plan.get("Plans", []):
+        found.extend(scans(child))
+    return found
+
+
+def table_columns(cur, table):
+    cur.execute(
+        "SELECT attname FROM pg_attribute WHERE attrelid = to_regclass(%s) AND attnum > 0 AND NOT attisdropped",
+        (table,),
+    )
+    return {row[0] for row in cur.fetchall()}
+
+
+def existing_indexes(cur, table):
+    """Column lists (as written in the index definition) of plain indexes on table"""
+    cur.execute("SELECT indexdef FROM pg_indexes WHERE schemaname = 'public' AND tablename = %s", (table,))
+    defs = set()
+    for (indexdef,) in cur.fetchall():
+        match = re.search(r"USING btree \((.*)\)$", indexdef)
+        if match:
+            defs.add(match.group(1))
+    return defs
+
+
+def candidates_for(cur, entry, plan, columns_of):
+    """Single-column, composite and partial btree candidates suggested by one read statement"""
+    constants = dict(re.findall(r"\b(\w+) = '([^']*)'", entry["sql"]))
+    order = re.search(r"ORDER BY (\w+)( DESC)?", entry["sql"], re.I)
+    found = []
+    for relation, conds in scans(plan):
+        columns = columns_of(relation)
+        eq = []
+        for cond in conds:
+            for column in re.findall(r"\(?(?:\w+\.)?(\w+) = ", cond):
+                if column in columns and column not in eq:
+                    eq.append(column)
+        keys = [column for column in eq if column not in constants]
+        predicate = " AND ".join(f"{c} = '{constants[c]}'" for c in eq if c in constants) or None
+        sort = [order.group(1) + (" DESC" if order.group(2) else "")] if order and order.group(1) in columns else []
+        options = []
+        if keys:
+            options.append((keys, None))
+            if sort:
+                options.append((keys + sort, None))
+        if predicate and (keys or sort):
+            options.append((keys + sort, predicate))
+        if predicate and not keys:
+            options.append(([c for c in eq if c in constants] + sort, None))
+        for cols, pred in options:
+            found.append({"table": relation, "columns": cols, "predicate": pred})
+    return found
+
+
+def index_name(candidate):
+    parts = [c.split()[0] for c in candidate["columns"]]
+    if candidate["predicate"]:
+        parts += re.findall(r"= '(\w+)'", candidate["predicate"])
+    return f"idx_{candidate['table']}_{'_'.join(parts)}"[:63]
+
+
+def index_sql(candidate, name=None):
+    sql = f"CREATE INDEX {name or index_name(candidate)} ON {candidate['table']} ({', '.join(candidate['columns'])})"
+    if candidate["predicate"]:
+        sql += f" WHERE {candidate['predicate']}"
+    return sql
+
+
+class WhatIf:
+    """Hypothetical indexes through hypopg, or real ones built inside a savepoint"""
+
+    def __init__(self, cur):
+        self.cur = cur
+        cur.execute("SELECT to_regprocedure('hypopg_create_index(text)') IS NOT NULL")
+        self.hypothetical = cur.fetchone()[0]
+
+    @property
+    def method(self):
+        return "hypopg" if self.hypothetical else "savepoint"
+
+    def create(self, candidate):
+        """Create the index; returns (handle, bytes)"""
+        if self.hypothetical:
+            self.cur.execute("SELECT indexrelid FROM hypopg_create_index(%s)", (index_sql(candidate),))
+            oid = self.cur.fetchone()[0]
+            self.cur.execute("SELECT hypopg_relation_size(%s)", (oid,))
+            return oid, self.cur.fetchone()[0]
+        self.cur.execute("SAVEPOINT whatif")
+        self.cur.execute(index_sql(candidate))
+        self.cur.execute("SELECT pg_relation_size(%s)", (index_name(candidate),))
+        return None, self.cur.fetchone()[0]
+
+    def drop(self, handle):
+        if self.hypothetical:
+            self.cur.execute("SELECT hypopg_drop_index(%s)", (handle,))
+        else:
+            self.cur.execute("ROLLBACK TO SAVEPOINT whatif")
+
+    def keep(self, handle):
+        if not self.hypothetical:
+            self.cur.execute("RELEASE SAVEPOINT whatif")
+
+    def materialize(self, candidates):
+        """Build hypothetical picks for real so the measured replay can use them"""
+        if self.hypothetical:
+            self.cur.execute("SELECT hypopg_reset()")
+            for candidate in candidates:
+                self.cur.execute(index_sql(candidate))
+
+
+def write_rows(cur, candidate, writes):
+    """Rows the workload's writes add to this index per replay (partial indexes only see matching rows)"""
+    touched = [c.split()[0] for c in candidate["columns"]] + re.findall(r"(\w+) = '", candidate["predicate"] or "")
+    rows = sum(entry["calls"] for entry in writes if entry["table"] == candidate["table"]
+               and (entry["sql"].lstrip().upper().startswith("INSERT")
+                    or any(re.search(rf"\b{column}\b", entry["sql"]) for column in touched)))
+    if rows and candidate["predicate"]:
+        cur.execute(f"SELECT coalesce(avg(({candidate['predicate']})::int), 0) FROM {candidate['table']}")
+        rows *= float(cur.fetchone()[0])
+    return rows
+
+
+def advise(cur, reads, writes, candidates, max_indexes, min_gain):
+    """Greedy picks worth at least min_gain of the workload's cost; returns (first-round ranking, picks, whatif method)"""
+    whatif = WhatIf(cur)
+    cur.execute("SELECT current_setting('random_page_cost')::float")
+    page_cost = cur.fetchone()[0]
+
+    def workload_costs():
+        return {entry["name"]: plan_of(cur, entry["sql"], entry["params"])["Total Cost"] for entry in reads}
+
+    base = workload_costs()
+    threshold = min_gain * sum(base[entry["name"]] * entry["calls"] for entry in reads)
+    ranking, picks = None, []
+    remaining = list(candidates)
+    while remaining and len(picks) < max_indexes:
+        scored = []
+        for candidate in remaining:
+            handle, size = whatif.create(candidate)
+            try:
+                served, benefit = [], 0.0
+                for entry in reads:
+                    if entry["table"] != candidate["table"]:
+                        continue
+                    saved = base[entry["name"]] - plan_of(cur, entry["sql"], entry["params"])["Total Cost"]
+                    if saved > 0.01 * base[entry["name"]]:
+                        served.append(entry["name"])
+                        benefit += saved * entry["calls"]
+            finally:
+                whatif.drop(handle)
+            write_cost = write_rows(cur, candidate, writes) * page_cost
+            scored.append({**candidate, "name": index_name(candidate), "bytes": size, "served": served,
+                           "benefit": round(benefit, 1), "write_cost": round(write_cost, 1),
+                           "net": round(benefit - write_cost, 1)})
+        scored.sort(key=lambda c: (-c["net"], c["bytes"]))
+        if ranking is None:
+            ranking = scored
+        best = scored[0]
+        if best["net"] <= threshold:
+            break
+        handle, _ = whatif.create(best)
+        whatif.keep(handle)
+        picks.append(best)
+        base = workload_costs()
+        remaining = [c for c in remaining if index_name(c) != best["name"]]
+    whatif.materialize(picks)
+    return ranking or [], picks, whatif.method
+
+
+def migration_text(picks, report):
+    lines = [
+        "-- Workload-driven indexes",
+        "-- Generated by `python -m currijobs_harness index-advisor` from a replay of the",
+        f"-- app workload ({report['statements']} statements x {report['rounds']} rounds) against "
+        f"{report['users']:,} users and {report['tasks']:,} tasks.",
+        "-- Ranked by planner cost saved per replay minus index maintenance for the",
+        "-- workload's writes; each pick was re-costed against the ones before it.",
+    ]
+    for number, pick in enumerate(picks, start=1):
+        lines += [
+            "",
+            f"-- {number}. {', '.join(pick['served'])}",
+            f"--    saves {pick['benefit']:,.0f} cost units per replay, write cost {pick['write_cost']:,.0f}",
+            index_sql(pick).replace("CREATE INDEX", "CREATE INDEX IF NOT EXISTS", 1) + ";",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def run(args):
+    import time
+
+    from currijobs_harness import db, results, seed
+    from currijobs_harness.sourcemap import format_bytes
+
+    print("🧭 CurriJobs Index Advisor")
+    print("=" * 50)
+    try:
+        workload = load_workload(args.workload)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+    for entry in workload:
+        entry["kind"], entry["table"] = statement_kind(entry["sql"])
+
+    try:
+        conn = db.connect_for(args, autocommit=False)
+    except Exception as e:
+        print(f"❌ Could not connect to {db.target_for(args)}: {e}")
+        return 1
+
+    report = {"users": args.users, "tasks": args.tasks, "rounds": args.rounds, "statements": len(workload)}
+    try:
+        with conn.cursor() as cur:
+            start = time.perf_counter()
+            pools = seed_data(cur, seed, args.users, args.tasks)
+            report["seed_s"] = round(time.perf_counter() - start, 1)
+            print(f"🌱 Seeded {args.users:,} users and {args.tasks:,} tasks in {report['seed_s']}s")
+
+            view = stat_statements_view(cur)
+            report["timing"] = "pg_stat_statements" if view else "client"
+            print(f"📊 Timing from {view or 'the client (pg_stat_statements not loaded)'}")
+            before = replay(cur, workload, pools, args.rounds, args.seed, view)
+
+            import random
+
+            rng = random.Random(args.seed)
+            reads = [entry for entry in workload if entry["kind"] == "read"]
+            writes = [entry for entry in workload if entry["kind"] == "write"]
+            columns = {}
+
+            def columns_of(table):
+                if table not in columns:
+                    columns[table] = table_columns(cur, table)
+                return columns[table]
+
+            candidates, seen = [], set()
+            for entry in reads:
+                entry["params"] = params_for(entry["sql"], pools, rng)
+                plan = plan_of(cur, entry["sql"], entry["params"])
+                for candidate in candidates_for(cur, entry, plan, columns_of):
+                    key = index_sql(candidate)
+                    if key in seen or (not candidate["predicate"]
+                                       and ", ".join(candidate["columns"]) in existing_indexes(cur, candidate["table"])):
+                        continue
+                    seen.add(key)
+                    candidates.append(candidate)
+            print(f"🔎 {len(candidates)} candidate indexes from {len(reads)} read statements")
+
+            ranking, picks, method = advise(cur, reads, writes, candidates, args.max_indexes, args.min_gain)
+            report["whatif"] = method
+            after = replay(cur, workload, pools, args.rounds, args.seed, view)
+    finally:
+        conn.rollback()
+        conn.close()
+
+    print(f"\n{'candidate (' + method + ')':<58} {'size':>9} {'benefit':>10} {'writes':>8}")
+    for candidate in ranking:
+        columns = ", ".join(candidate["columns"]) + (f" WHERE {candidate['predicate']}" if candidate["predicate"] else "")
+        print(f"  {candidate['table'] + ' (' + columns + ')':<56} {format_bytes(candidate['bytes']):>9} "
+              f"{candidate['benefit']:>10,.0f} {candidate['write_cost']:>8,.0f}")
+
+    print("\n✅ Recommended" if picks else "\n✅ No index pays for itself on this workload")
+    for number, pick in enumerate(picks, start=1):
+        print(f"  {number}. {index_sql(pick)}")
+        print(f"     serves {', '.join(pick['served'])}; net {pick['net']:,.0f} cost units per replay")
+
+    print(f"\n{'statement':<28} {'calls':>6} {'mean before':>12} {'mean after':>11}")
+    for entry in workload:
+        b, a = before.get(entry["name"], {}), after.get(entry["name"], {})
+        print(f"  {entry['name']:<26} {b.get('calls', 0):>6} {b.get('mean_ms', 0):>10.3f}ms {a.get('mean_ms', 0):>9.3f}ms")
+    total_before = sum(row["total_ms"] for row in before.values())
+    total_after = sum(row["total_ms"] for row in after.values())
+    print(f"\n⏱️  Workload {total_before:.0f} ms → {total_after:.0f} ms with the recommended indexes")
+    print("🧹 Seed data and indexes rolled back")
+
+    report.update({
+        "candidates": len(ranking),
+        "picks": [{k: pick[k] for k in ("name", "table", "columns", "predicate", "served", "benefit", "write_cost", "bytes")}
+                  for pick in picks],
+        "before": before,
+        "after": after,
+        "total_before_ms": round(total_before, 1),
+        "total_after_ms": round(total_after, 1),
+    })
+    if args.write_migration and picks:
+        path = os.path.join(REPO_ROOT, args.write_migration) if not os.path.isabs(args.write_migration) else args.write_migration
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(migration_text(picks, report))
+        print(f"📄 Wrote {os.path.relpath(path, REPO_ROOT)}")
+    if not args.no_history:
+        record = results.append_history(HISTORY_NAME, report)
+        print(f"📝 Recorded run for {record['commit']}")
+    return 0
@@ -0,0 +1,196 @@
+"""
+Leaderboard and rank engine check at scale
+Seeds N users (1M by default) with random jobs, ratings and earnings,
+then verifies the trigger-maintained XP, histogram, top-K and "my
+position" results against brute-force queries and times both RPCs.
+Everything runs in one transaction that is rolled back at the end.
+
+Usage:
+    python -m currijobs_harness leaderboard-check
+    python -m currijobs_harness leaderboard-check --users 100000 --samples 500
+"""
+
+import random
+import time
+
+HISTORY_NAME = "leaderboard"
+SEED_PREFIX = "lb"
+
+TOP_K_SQL = "SELECT leaderboard_position, user_id, xp FROM get_leaderboard(%(k)s)"
+MY_POSITION_SQL = "SELECT get_my_leaderboard_position(%(id)s)"
+BRUTE_TOP_K_SQL = """
+    SELECT rank() OVER (ORDER BY xp DESC), user_id, xp
+    FROM user_progress ORDER BY xp DESC, user_id LIMIT %(k)s
+"""
+BRUTE_POSITION_SQL = """
+    SELECT 1 + COUNT(*) FROM user_progress
+    WHERE xp > (SELECT xp FROM user_progress WHERE user_id = %(id)s)
+"""
+
+
+def add_arguments(parser):
+    from currijobs_harness import db
+
+    db.add_dsn_argument(parser)
+    parser.add_argument("--users", type=int, default=1_000_000, help="Users to seed (default: 1000000)")
+    parser.add_argument("--top", type=int, default=20, help="Leaderboard page size (default: 20)")
+    parser.add_argument("--samples", type=int, default=200, help="Users checked for my-position (default: 200)")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for sampling")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+def seed_stats(cur):
+    """Random stats for every seeded user; the stats triggers derive XP from them"""
+    cur.execute(
+        """
+        INSERT INTO user_public_stats (user_id, jobs_completed, rating_sum, review_count, earnings)
+        SELECT u.id, j.jobs, j.reviews * (3 + floor(random() * 3))::int, j.reviews, j.jobs * (5000 + floor(random() * 45000))
+        FROM auth.users u
+        CROSS JOIN LATERAL (
+            SELECT floor(random() * random() * 200)::int AS jobs,
+                   floor(random() * 20)::int AS reviews
+            WHERE u.id IS NOT NULL
+        ) j
+        WHERE u.email LIKE %(pattern)s
+        ON CONFLICT (user_id) DO NOTHING
+        """,
+        {"pattern": f"{SEED_PREFIX}-%@%"},
+    )
+    cur.execute("ANALYZE user_progress")
+    cur.execute("ANALYZE user_progress_xp_histogram")
+
+
+def timed(cur, sql, params):
+    start = time.perf_counter()
+    cur.execute(sql, params)
+    rows = cur.fetchall()
+    return rows, (time.perf_counter() - start) * 1000
+
+
+def check_consistency(cur):
+    """Problems found comparing trigger output with recomputation from scratch"""
+    problems = []
+    cur.execute(
+        """
+        SELECT COUNT(*) FROM user_progress up JOIN user_public_stats s ON s.user_id = up.user_id
+        WHERE up.xp <> compute_progress_xp(s.jobs_completed, s.avg_rating, s.earnings)
+           OR up.level <> level_for_xp(up.xp) OR up.rank <> rank_for_level(up.level)
+        """
+    )
+    stale = cur.fetchone()[0]
+    if stale:
+        problems.append(f"{stale} users with stale xp/level/rank")
+    cur.execute(
+        """
+        SELECT COUNT(*) FROM (
+            SELECT xp, users FROM user_progress_xp_histogram WHERE users > 0
+            EXCEPT SELECT xp, COUNT(*) FROM user_progress WHERE xp > 0 GROUP BY xp
+        ) d
+        """
+    )
+    drift = cur.fetchone()[0]
+    cur.execute(
+        """
+        SELECT COUNT(*) FROM (
+            SELECT xp, COUNT(*) FROM user_progress WHERE xp > 0 GROUP BY xp
+            EXCEPT SELECT xp, users FROM user_progress_xp_histogram WHERE users > 0
+        ) d
+        """
+    )
+    drift += cur.fetchone()[0]
+    if drift:
+        problems.append(f"{drift} histogram buckets out of sync")
+    return problems
+
+
+def uses_xp_index(cur, k):
+    cur.execute(
+        "EXPLAIN SELECT user_id, xp FROM user_progress ORDER BY xp DESC, user_id LIMIT %(k)s", {"k": k}
+    )
+    return any("idx_user_progress_xp" in row[0] for row in cur.fetchall())
+
+
+def run(args):
+    from currijobs_harness import db, results, seed, stats
+
+    print("🏆 CurriJobs Leaderboard Check")
+    print("=" * 50)
+    rng = random.Random(args.seed)
+
+    try:
+        conn = db.connect_for(args, autocommit=False)
+    except Exception as e:
+        print(f"❌ Could not connect to {db.target_for(args)}: {e}")
+        return 1
+
+    problems = []
+    report = {"users": args.users}
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT to_regprocedure('get_leaderboard(integer,integer)') IS NOT NULL")
+            if not cur.fetchone()[0]:
+                print("❌ get_leaderboard() not found; apply supabase/migrations first")
+                return 1
+
+            start = time.perf_counter()
+            ids = seed.create_users(cur, args.users, prefix=SEED_PREFIX)
+            seed_stats(cur)
+            report["seed_s"] = round(time.perf_counter() - start, 1)
+            print(f"🌱 Seeded {args.users:,} users with stats in {report['seed_s']}s")
+
+            problems += check_consistency(cur)
+
+            top, _ = timed(cur, TOP_K_SQL, {"k": args.top})
+            brute, _ = timed(cur, BRUTE_TOP_K_SQL, {"k": args.top})
+            if [(int(p), u, x) for p, u, x in top] != [(int(p), u, x) for p, u, x in brute]:
+                problems.append("top-K differs from ORDER BY xp DESC")
+
+            sample = rng.sample(ids, min(args.samples, len(ids)))
+            my_ms = []
+            for user_id in sample:
+                rows, ms = timed(cur, MY_POSITION_SQL, {"id": user_id})
+                my_ms.append(ms)
+                expected, _ = timed(cur, BRUTE_POSITION_SQL, {"id": user_id})
+                if rows[0][0]["position"] != expected[0][0]:
+                    problems.append(f"position for {user_id}: {rows[0][0]['position']} != {expected[0][0]}")
+                    break
+
+            # Incremental path: a completed job with a payment and review must move the user up
+            mover = sample[0]
+            before = timed(cur, MY_POSITION_SQL, {"id": mover})[0][0][0]
+            (payer,) = seed.create_users(cur, 1, prefix=f"{SEED_PREFIX}payer")
+            task_id = seed.create_task(cur, payer, status="completed", assigned_to=mover)
+            seed.create_payments(cur, task_id, payer, mover, 1)
+            seed.create_reviews(cur, task_id, payer, mover, 1)
+            after = timed(cur, MY_POSITION_SQL, {"id": mover})[0][0][0]
+            if not (after["xp"] > before["xp"] and after["position"] <= before["position"]):
+                problems.append(f"incremental update did not raise xp/position: {before} -> {after}")
+            problems += check_consistency(cur)
+
+            top_ms = [timed(cur, TOP_K_SQL, {"k": args.top})[1] for _ in range(args.samples)]
+            report["top_k_ms"] = stats.summarize(top_ms)
+            report["my_position_ms"] = stats.summarize(my_ms)
+            report["xp_index_used"] = uses_xp_index(cur, args.top)
+            if not report["xp_index_used"]:
+                problems.append("top-K query does not use idx_user_progress_xp")
+    finally:
+        conn.rollback()
+        conn.close()
+
+    print(f"\n{'rpc':<14} {'p50':>8} {'p95':>8} {'max':>8}  (ms)")
+    for name, key in (("top-K", "top_k_ms"), ("my position", "my_position_ms")):
+        s = report.get(key)
+        if s:
+            print(f"{name:<14} {stats.fmt_ms(s['p50']):>8} {stats.fmt_ms(s['p95']):>8} {stats.fmt_ms(s['max']):>8}")
+    print("🧹 Seed data rolled back")
+
+    if problems:
+        for problem in problems:
+            print(f"❌ {problem}")
+        return 1
+    print("✅ XP, histogram, top-K and positions match brute force")
+
+    if not args.no_history:
+        record = results.append_history(HISTORY_NAME, report)
+        print(f"📝 Recorded run for {record['commit']}")
+    return 0
@@ -0,0 +1,201 @@
+"""
+Locale loading benchmark
+Compares the eager cost of the translation tables before (every language
+in the startup bundle) and after the per-locale split (default language
+only), checks that the Metro web bundle really leaves the other languages
+out, and times first render per route through the web harness. Pass
+--baseline COMMIT to compare first render with a run recorded before the
+split (by this command or by startup-profile).
+
+Usage:
+    python -m currijobs_harness locale-bench --static-only
+    python -m currijobs_harness locale-bench --routes /,/welcome --runs 5
+    python -m currijobs_harness locale-bench --baseline 2c1c647
+"""
+
+import os
+
+from currijobs_harness import metro
+from currijobs_harness.browser import DEFAULT_APP_URL
+from currijobs_harness.sourcemap import format_bytes
+
+HISTORY_NAME = "locale"
+
+
+def add_arguments(parser):
+    parser.add_argument("--url", default=DEFAULT_APP_URL, help="App base URL (default: http://localhost:8081)")
+    parser.add_argument("--routes", default="/,/welcome", help="Comma-separated routes (default: /,/welcome)")
+    parser.add_argument("--runs", type=int, default=3, help="Cold loads per route (default: 3)")
+    parser.add_argument("--timeout", type=int, default=60, help="Seconds to wait for interactivity (default: 60)")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    parser.add_argument("--production", action="store_true", help="Inspect the dev=false&minify=true web bundle")
+    parser.add_argument("--static-only", action="store_true", help="Only compare the generated chunk sizes")
+    parser.add_argument("--baseline", default=None, metavar="COMMIT",
+                        help="Commit whose locale-bench or startup-profile record to compare first render with")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+def chunk_sizes():
+    """{language: (bytes, gzip bytes)} for each generated chunk, plus 'ids'"""
+    import gzip
+
+    from currijobs_harness.locale_compiler import LOCALES_DIR
+
+    sizes = {}
+    for name in sorted(os.listdir(LOCALES_DIR)):
+        if name.endswith(".ts"):
+            with open(os.path.join(LOCALES_DIR, name), "rb") as f:
+                data = f.read()
+            sizes[name[:-len(".ts")]] = (len(data), len(gzip.compress(data)))
+    return sizes
+
+
+def sentinels():
+    """{language: a string only that language's table contains}"""
+    from currijobs_harness.locale_compiler import DEFAULT_LANGUAGE, load_messages
+
+    messages = load_messages()
+    default_values = set(messages[DEFAULT_LANGUAGE].values())
+    found = {}
+    for language, strings in messages.items():
+        if language == DEFAULT_LANGUAGE:
+            continue
+        for value in strings.values():
+            if value not in default_values and len(value) >= 8:
+                found[language] = value
+                break
+    return found
+
+
+def inspect_bundle(server, production):
+    """Web bundle size, locale module sizes and which non-default languages it contains"""
+    import json
+
+    from currijobs_harness import sourcemap
+    from currijobs_harness.cli import REPO_ROOT
+
+    url = metro.bundle_url(server, "web", dev=not production, minify=production)
+    status, _, _, body = metro.fetch(url)
+    if status != 200:
+        raise RuntimeError(f"web bundle returned HTTP {status}")
+    text = body.decode("utf-8", "replace")
+    # Metro may keep non-ASCII literals as-is or escape them
+    leaked = [
+        language for language, value in sentinels().items()
+        if value in text or json.dumps(value)[1:-1] in text
+    ]
+    result = {"bytes": len(body), "leaked": leaked, "modules": {}}
+
+    map_url = metro.bundle_url(server, "web", dev=not production, minify=production, ext="map")
+    map_status, _, _, map_body = metro.fetch(map_url)
+    if map_status == 200:
+        grouped = sourcemap.group_sizes(sourcemap.attribute_sizes(text, json.loads(map_body)), REPO_ROOT)
+        result["modules"] = {
+            name: size for name, size in grouped.items()
+            if name.startswith("lib/locales/") or name in ("lib/localization.ts", "lib/i18n.ts")
+        }
+    return result
+
+
+def first_render(routes, args):
+    """Median first interactive frame and first contentful paint per route"""
+    from currijobs_harness.startup_profile import profile_route, summarize_runs
+
+    summaries = {}
+    for route in routes:
+        url = args.url.rstrip("/") + route
+        runs = []
+        for i in range(args.runs):
+            try:
+                analysis, _ = profile_route(url, args)
+            except Exception as e:
+                print(f"❌ {route} run {i + 1}: {e}")
+                continue
+            runs.append(analysis)
+        if runs:
+            summary = summarize_runs(runs)
+            summaries[route] = {k: summary[k] for k in ("interactive_ms", "first_contentful_paint_ms") if k in summary}
+    return summaries
+
+
+def baseline_routes(commit):
+    """Per-route first render recorded at commit by this bench or startup-profile"""
+    from currijobs_harness import results
+    from currijobs_harness.startup_profile import HISTORY_NAME as STARTUP_HISTORY
+
+    for name in (HISTORY_NAME, STARTUP_HISTORY):
+        for record in reversed(results.load_history(name)):
+            if str(record.get("commit", "")).startswith(commit) and record.get("routes"):
+                return record["routes"]
+    return None
+
+
+def run(args):
+    from currijobs_harness import results
+    from currijobs_harness.locale_compiler import DEFAULT_LANGUAGE
+
+    print("🌐 CurriJobs Locale Loading Benchmark")
+    print("=" * 50)
+    sizes = chunk_sizes()
+    if DEFAULT_LANGUAGE not in sizes or "ids" not in sizes:
+        print("❌ Generated locale chunks not found; run compile-locales")
+        return 1
+
+    languages = [name for name in sizes if name != "ids"]
+    before = [sum(sizes[name][i] for name in sizes) for i in (0, 1)]
+    after = [sizes[DEFAULT_LANGUAGE][i] + sizes["ids"][i] for i in (0, 1)]
+    report = {
+        "chunks": {name: {"bytes": b, "gzip_bytes": g} for name, (b, g) in sizes.items()},
+        "eager_before": {"bytes": before[0], "gzip_bytes": before[1]},
+        "eager_after": {"bytes": after[0], "gzip_bytes": after[1]},
+    }
+    print(f"{'chunk':<8} {'bytes':>10} {'gzip':>10}")
+    for name, (b, g) in sizes.items():
+        note = "  (eager)" if name in (DEFAULT_LANGUAGE, "ids") else "  (on demand)"
+        print(f"{name:<8} {format_bytes(b):>10} {format_bytes(g):>10}{note}")
+    saved = (before[1] - after[1]) * 100 / before[1]
+    print(f"\n📦 Eager tables: {format_bytes(before[0])} → {format_bytes(after[0])} "
+          f"({format_bytes(before[1])} → {format_bytes(after[1])} gzip, -{saved:.0f}%) across {len(languages)} languages")
+
+    if args.static_only:
+        failed = False
+    elif not metro.is_running(args.url):
+        print(f"❌ Expo web server not running at {args.url}")
+        print("Please run: npm run web (or pass --static-only)")
+        return 1
+    else:
+        bundle = inspect_bundle(args.url, args.production)
+        report["bundle"] = bundle
+        print(f"\n🧳 Web bundle: {format_bytes(bundle['bytes'])}")
+        for name, size in sorted(bundle["modules"].items(), key=lambda item: -item[1]):
+            print(f"{format_bytes(size):>10}  {name}")
+        failed = bool(bundle["leaked"])
+        if failed:
+            print(f"❌ Startup bundle still contains: {', '.join(bundle['leaked'])}")
+
+        routes = [r.strip() for r in args.routes.split(",") if r.strip()]
+        report["routes"] = first_render(routes, args)
+        baseline = baseline_routes(args.baseline) if args.baseline else None
+        if args.baseline and baseline is None:
+            print(f"⚠️  No recorded first-render run for {args.baseline}")
+        print(f"\n{'route':<16} {'interactive':>12} {'FCP':>8} {'baseline':>10} {'Δ':>8}")
+        for route, summary in report["routes"].items():
+            fcp = summary.get("first_contentful_paint_ms")
+            line = f"{route:<16} {summary['interactive_ms']:>9.0f} ms {fcp if fcp is None else round(fcp):>8}"
+            base = (baseline or {}).get(route, {}).get("interactive_ms")
+            if base is not None:
+                line += f" {base:>7.0f} ms {summary['interactive_ms'] - base:>+6.0f} ms"
+            print(line)
+        if not report["routes"]:
+            return 1
+
+    if not args.no_history:
+        record = results.append_history(HISTORY_NAME, report)
+        print(f"📝 Recorded run for {record['commit']}")
+    if failed:
+        return 1
+    if args.static_only:
+        print("✅ Chunk sizes compared (run without --static-only to check the web bundle)")
+    else:
+        print("✅ Only the default language is in the startup bundle")
+    return 0
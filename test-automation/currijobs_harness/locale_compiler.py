@@ -0,0 +1,131 @@
+"""
+Compile the translation tables into per-locale chunks
+Source of truth is lib/locales/messages/<language>.json (one object per
+language) plus the LocalizationStrings interface in lib/localization.ts,
+whose field order fixes the message ids. Writes:
+
+    lib/locales/ids.ts          key -> interned numeric id
+    lib/locales/<language>.ts   array of strings indexed by id (null = missing)
+
+lib/localization.ts bundles only the default language and imports the
+others on demand, so adding a language never grows startup.
+
+Usage:
+    python -m currijobs_harness compile-locales
+    python -m currijobs_harness compile-locales --check
+"""
+
+import os
+
+from currijobs_harness.cli import REPO_ROOT
+
+LOCALIZATION_TS = os.path.join(REPO_ROOT, "lib", "localization.ts")
+LOCALES_DIR = os.path.join(REPO_ROOT, "lib", "locales")
+MESSAGES_DIR = os.path.join(LOCALES_DIR, "messages")
+DEFAULT_LANGUAGE = "es-CR"
+HEADER = "// Generated by `python -m currijobs_harness compile-locales` from {source}; do not edit\n"
+
+
+def add_arguments(parser):
+    parser.add_argument("--check", action="store_true", help="Fail if the generated files are out of date")
+
+
+def interface_keys(path=LOCALIZATION_TS):
+    """Field names of the LocalizationStrings interface, in declaration order"""
+    import re
+
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    start = source.index("export interface LocalizationStrings")
+    body = source[source.index("{", start) + 1:source.index("\n}", start)]
+    return re.findall(r"^\s+(\w+)\??: string;", body, re.M)
+
+
+def load_messages():
+    import json
+
+    messages = {}
+    for name in sorted(os.listdir(MESSAGES_DIR)):
+        if name.endswith(".json"):
+            with open(os.path.join(MESSAGES_DIR, name), encoding="utf-8") as f:
+                messages[name[:-len(".json")]] = json.load(f)
+    return messages
+
+
+def render_ids(keys):
+    lines = [HEADER.format(source="lib/localization.ts")]
+    lines.append("import type { LocalizationStrings } from '../localization';\n\n")
+    lines.append("export const MESSAGE_IDS: Record<keyof LocalizationStrings, number> = {\n")
+    lines.extend(f"  {key}: {i},\n" for i, key in enumerate(keys))
+    lines.append("};\n\n")
+    lines.append(f"export const MESSAGE_COUNT = {len(keys)};\n")
+    return "".join(lines)
+
+
+def render_table(language, keys, strings):
+    import json
+
+    lines = [HEADER.format(source=f"lib/locales/messages/{language}.json")]
+    lines.append("const messages: (string | null)[] = [\n")
+    for key in keys:
+        value = strings.get(key)
+        literal = "null" if value is None else json.dumps(value, ensure_ascii=False)
+        lines.append(f"  {literal}, // {key}\n")
+    lines.append("];\n\nexport default messages;\n")
+    return "".join(lines)
+
+
+def compile_locales():
+    """{path: contents} for every generated file, plus a list of problems/warnings"""
+    keys = interface_keys()
+    messages = load_messages()
+    problems, warnings = [], []
+    if DEFAULT_LANGUAGE not in messages:
+        problems.append(f"no messages for the default language {DEFAULT_LANGUAGE}")
+    for language, strings in messages.items():
+        extra = sorted(set(strings) - set(keys))
+        missing = [k for k in keys if k not in strings]
+        if extra:
+            problems.append(f"{language}: keys not in LocalizationStrings: {', '.join(extra)}")
+        if missing and language == DEFAULT_LANGUAGE:
+            problems.append(f"{language}: default language is missing {', '.join(missing)}")
+        elif missing:
+            warnings.append(f"{language}: {len(missing)} missing (falls back to {DEFAULT_LANGUAGE}): {', '.join(missing)}")
+
+    files = {os.path.join(LOCALES_DIR, "ids.ts"): render_ids(keys)}
+    for language, strings in messages.items():
+        files[os.path.join(LOCALES_DIR, f"{language}.ts")] = render_table(language, keys, strings)
+    return files, problems, warnings
+
+
+def run(args):
+    print("🌐 CurriJobs Locale Compiler")
+    print("=" * 50)
+    files, problems, warnings = compile_locales()
+    for warning in warnings:
+        print(f"⚠️  {warning}")
+    if problems:
+        for problem in problems:
+            print(f"❌ {problem}")
+        return 1
+
+    stale = []
+    for path, contents in files.items():
+        current = open(path, encoding="utf-8").read() if os.path.exists(path) else None
+        if current == contents:
+            continue
+        stale.append(path)
+        if not args.check:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(contents)
+
+    for path, contents in files.items():
+        print(f"📄 {os.path.relpath(path, REPO_ROOT):<24} {len(contents.encode('utf-8')):>7,} bytes")
+    if args.check:
+        if stale:
+            print(f"❌ Out of date: {', '.join(os.path.relpath(p, REPO_ROOT) for p in stale)}; run compile-locales")
+            return 1
+        print("✅ Generated locale files are up to date")
+        return 0
+    print(f"✅ Wrote {len(stale)} file(s)" if stale else "✅ Nothing to do")
+    return 0
@@ -0,0 +1,94 @@
+"""
+Metro / Expo dev server helpers
+Builds bundle URLs and optionally starts a fresh `expo start` for cold runs
+"""
+
+import os
+import time
+
+from currijobs_harness.cli import REPO_ROOT
+
+DEFAULT_SERVER = "http://localhost:8081"
+DEFAULT_ENTRY = "node_modules/expo-router/entry"
+
+
+def bundle_url(server, platform, entry=DEFAULT_ENTRY, dev=True, minify=False, ext="bundle"):
+    """URL Metro serves the platform bundle (ext='map' for its source map) from"""
+    params = [
+        f"platform={platform}",
+        f"dev={'true' if dev else 'false'}",
+        "hot=false",
+        "lazy=true",
+        f"minify={'true' if minify else 'false'}",
+        "transform.routerRoot=app",
+    ]
+    if platform in ("ios", "android"):
+        params.append("transform.engine=hermes")
+    return f"{server.rstrip('/')}/{entry}.{ext}?{'&'.join(params)}"
+
+
+def fetch(url, timeout=600):
+    """GET url; return (status, ttfb_ms, total_ms, body bytes)"""
+    import urllib.error
+    import urllib.request
+
+    start = time.perf_counter()
+    try:
+        response = urllib.request.urlopen(url, timeout=timeout)
+    except urllib.error.HTTPError as e:
+        response = e
+    ttfb_ms = (time.perf_counter() - start) * 1000
+    body = response.read()
+    total_ms = (time.perf_counter() - start) * 1000
+    status = getattr(response, "status", None) or response.getcode()
+    response.close()
+    return status, ttfb_ms, total_ms, body
+
+
+def is_running(server=DEFAULT_SERVER, timeout=2):
+    """True when Metro answers its /status endpoint"""
+    try:
+        status, _, _, body = fetch(f"{server.rstrip('/')}/status", timeout=timeout)
+    except Exception:
+        return False
+    return status == 200 and b"packager-status:running" in body
+
+
+def start_metro(port=8081, clear=True, web=False, env=None, timeout=180):
+    """Start `npx expo start` in the background and wait until it is serving
+
+    Returns the Popen handle; pass it to stop_metro() when done.
+    """
+    import subprocess
+
+    cmd = ["npx", "expo", "start", "--port", str(port)]
+    if clear:
+        cmd.append("--clear")
+    if web:
+        cmd.append("--web")
+    process_env = dict(os.environ, CI="1", BROWSER="none")
+    process_env.update(env or {})
+    process = subprocess.Popen(
+        cmd, cwd=REPO_ROOT, env=process_env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    server = f"http://localhost:{port}"
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"expo start exited with code {process.returncode}")
+        if is_running(server):
+            return process
+        time.sleep(1)
+    stop_metro(process)
+    raise RuntimeError(f"Metro did not start on port {port} within {timeout}s")
+
+
+def stop_metro(process):
+    if process is None or process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout=15)
+    except Exception:
+        process.kill()
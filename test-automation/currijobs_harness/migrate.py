@@ -0,0 +1,390 @@
+"""
+Migration runner
+Applies supabase/migrations/*.sql in filename order and records each one in
+supabase_migrations.schema_migrations, the table the Supabase CLI uses, so
+`supabase db push` and this runner agree on what is applied.
+
+Each migration is split into statements and run in segments:
+
+    transactional   consecutive ordinary statements, one transaction
+    online          CREATE INDEX / DROP INDEX rewritten to CONCURRENTLY,
+                    run alone outside any transaction
+
+Indexes on tables the same migration creates are left as they are, since
+nothing else can be writing to those tables yet. Every segment runs with
+lock_timeout, so DDL that cannot get its lock gives up instead of queueing
+ahead of the app's writes. A segment that times out is retried with backoff
+after a rollback. A concurrent build that fails leaves an INVALID index
+behind; that index is dropped before the retry. A monitor connection
+samples the runner's backend to measure, per statement, time spent waiting
+on locks and how many other backends were blocked behind it.
+
+A migration is recorded only after all its segments succeed. A failure
+after an online segment leaves earlier segments applied, so migrations are
+written to be re-runnable (IF NOT EXISTS, OR REPLACE, DROP ... IF EXISTS).
+
+Usage:
+    python -m currijobs_harness migrate --status
+    python -m currijobs_harness migrate --dry-run
+    python -m currijobs_harness migrate --lock-timeout 2s --retries 5
+    python -m currijobs_harness migrate --baseline 20261019000500
+"""
+
+import os
+import re
+
+from currijobs_harness.cli import REPO_ROOT
+
+MIGRATIONS_DIR = os.path.join(REPO_ROOT, "supabase", "migrations")
+HISTORY_NAME = "migrate"
+INDEX_RE = re.compile(r"^(\s*(?:CREATE\s+(?:UNIQUE\s+)?|DROP\s+)INDEX)\s+(?!CONCURRENTLY\b)", re.I)
+INDEX_NAME_RE = re.compile(r"INDEX\s+(?:CONCURRENTLY\s+)?(?:IF\s+(?:NOT\s+)?EXISTS\s+)?(\w+)", re.I)
+INDEX_TABLE_RE = re.compile(r"\bON\s+(?:ONLY\s+)?(?:public\.)?(\w+)", re.I)
+CREATE_TABLE_RE = re.compile(r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:public\.)?(\w+)", re.I)
+RECORD_TABLE_SQL = """
+CREATE SCHEMA IF NOT EXISTS supabase_migrations;
+CREATE TABLE IF NOT EXISTS supabase_migrations.schema_migrations (
+  version TEXT PRIMARY KEY,
+  statements TEXT[],
+  name TEXT
+);
+"""
+
+
+def add_arguments(parser):
+    from currijobs_harness import db
+
+    db.add_dsn_argument(parser)
+    parser.add_argument("--dir", default=MIGRATIONS_DIR, help="Migrations directory (default: supabase/migrations)")
+    parser.add_argument("--status", action="store_true", help="List applied and pending migrations")
+    parser.add_argument("--dry-run", action="store_true", help="Print the segments pending migrations would run")
+    parser.add_argument("--baseline", metavar="VERSION", help="Record migrations up to VERSION as applied without running them")
+    parser.add_argument("--target", metavar="VERSION", help="Apply pending migrations up to VERSION only")
+    parser.add_argument("--lock-timeout", default="2s", help="lock_timeout per statement (default: 2s)")
+    parser.add_argument("--retries", type=int, default=5, help="Retries per segment after a lock timeout (default: 5)")
+    parser.add_argument("--no-concurrently", action="store_true", help="Keep index builds inside transactions")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+def split_statements(sql):
+    """Statements of a SQL script, aware of quotes, dollar quoting and comments"""
+    statements, start, i, n = [], 0, 0, len(sql)
+    while i < n:
+        ch = sql[i]
+        if sql.startswith("--", i):
+            end = sql.find("\n", i)
+            i = n if end < 0 else end + 1
+        elif sql.startswith("/*", i):
+            end = sql.find("*/", i + 2)
+            i = n if end < 0 else end + 2
+        elif ch in ("'", '"'):
+            i += 1
+            while i < n:
+                if sql[i] == ch and sql.startswith(ch * 2, i):
+                    i += 2
+                elif sql[i] == ch:
+                    break
+                else:
+                    i += 1
+            i += 1
+        elif ch == "$" and (match := re.match(r"\$[A-Za-z_]*\$", sql[i:])):
+            tag = match.group(0)
+            end = sql.find(tag, i + len(tag))
+            i = n if end < 0 else end + len(tag)
+        elif ch == ";":
+            statements.append(sql[start:i + 1])
+            start = i = i + 1
+        else:
+            i += 1
+    statements.append(sql[start:])
+    return [s.strip() for s in statements if strip_comments(s).strip()]
+
+
+def strip_comments(statement):
+    return re.sub(r"--[^\n]*|/\*.*?\*/", "", statement, flags=re.S)
+
+
+def summary(statement, width=72):
+    """First line of a statement without its comments"""
+    line = strip_comments(statement).strip().splitlines()[0]
+    return line if len(line) <= width else line[:width - 1] + "…"
+
+
+def load_migrations(directory):
+    """[{version, name, path, statements}] in filename order"""
+    migrations = []
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".sql"):
+            continue
+        version, _, name = filename[:-4].partition("_")
+        with open(os.path.join(directory, filename), encoding="utf-8") as f:
+            statements = split_statements(f.read())
+        for statement in statements:
+            if re.fullmatch(r"(BEGIN|COMMIT|START TRANSACTION|END)\s*;?", strip_comments(statement).strip(), re.I):
+                raise ValueError(f"{filename}: remove {statement!r}; the runner manages transactions")
+        migrations.append({"version": version, "name": name, "path": filename, "statements": statements})
+    return migrations
+
+
+def plan_segments(statements, concurrently=True):
+    """[{online, statements: [(original, to_run)]}] with index builds moved out of transactions"""
+    created = {m.group(1).lower() for s in statements for m in CREATE_TABLE_RE.finditer(strip_comments(s))}
+    segments = []
+    for statement in statements:
+        body = strip_comments(statement).strip()
+        online = False
+        if concurrently and INDEX_RE.match(body):
+            table = INDEX_TABLE_RE.search(body)
+            online = body.upper().startswith("DROP") or not (table and table.group(1).lower() in created)
+        if online:
+            segments.append({"online": True, "statements": [(statement, INDEX_RE.sub(r"\1 CONCURRENTLY ", body, count=1))]})
+        elif segments and not segments[-1]["online"]:
+            segments[-1]["statements"].append((statement, statement))
+        else:
+            segments.append({"online": False, "statements": [(statement, statement)]})
+    return segments
+
+
+class LockMonitor:
+    """Samples a backend from a second connection: lock waits and backends blocked behind it"""
+
+    def __init__(self, dsn, pid, interval=0.005):
+        import threading
+
+        from currijobs_harness import db
+
+        self.conn = db.connect(dsn, autocommit=True)
+        self.pid = pid
+        self.interval = interval
+        self.totals = {"lock_wait_s": 0.0, "blocking_s": 0.0, "blocked_max": 0}
+        self.lock = threading.Lock()
+        self.stop = threading.Event()
+        self.thread = threading.Thread(target=self.sample, daemon=True)
+        self.thread.start()
+
+    def sample(self):
+        import time
+
+        last = time.perf_counter()
+        with self.conn.cursor() as cur:
+            while not self.stop.is_set():
+                cur.execute(
+                    """
+                    SELECT (SELECT wait_event_type FROM pg_stat_activity WHERE pid = %(pid)s),
+                           (SELECT count(*) FROM pg_stat_activity WHERE %(pid)s = ANY(pg_blocking_pids(pid)))
+                    """,
+                    {"pid": self.pid},
+                )
+                waiting, blocked = cur.fetchone()
+                now = time.perf_counter()
+                with self.lock:
+                    if waiting == "Lock":
+                        self.totals["lock_wait_s"] += now - last
+                    if blocked:
+                        self.totals["blocking_s"] += now - last
+                        self.totals["blocked_max"] = max(self.totals["blocked_max"], blocked)
+                last = now
+                self.stop.wait(self.interval)
+
+    def snapshot(self):
+        """Totals since the previous snapshot"""
+        with self.lock:
+            snapshot = dict(self.totals)
+            self.totals = {"lock_wait_s": 0.0, "blocking_s": 0.0, "blocked_max": 0}
+        return snapshot
+
+    def close(self):
+        self.stop.set()
+        self.thread.join()
+        self.conn.close()
+
+
+def drop_invalid_index(conn, statement):
+    """Drop the INVALID leftover of a failed concurrent build so IF NOT EXISTS does not skip the retry"""
+    name = INDEX_NAME_RE.search(statement)
+    if not name:
+        return
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)", (name.group(1),)
+        )
+        row = cur.fetchone()
+        if row and row[0]:
+            cur.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name.group(1)}")
+
+
+def run_segment(conn, segment, monitor, retries, backoff=0.5):
+    """Run one segment with retries on lock timeout; returns a record per statement"""
+    import random
+    import time
+
+    import psycopg
+
+    waited_ms = 0.0
+    for attempt in range(1, retries + 2):
+        records = []
+        try:
+            if segment["online"]:
+                original, statement = segment["statements"][0]
+                drop_invalid_index(conn, statement)
+                records.append(timed(conn, original, statement, monitor, online=True))
+            else:
+                with conn.transaction():
+                    for original, statement in segment["statements"]:
+                        records.append(timed(conn, original, statement, monitor))
+            for record in records:
+                record["attempts"] = attempt
+            # Time spent waiting in attempts that timed out counts against the statement that finally ran
+            records[0]["lock_wait_ms"] = round(records[0]["lock_wait_ms"] + waited_ms, 1)
+            return records
+        except psycopg.errors.LockNotAvailable:
+            if monitor:
+                waited_ms += monitor.snapshot()["lock_wait_s"] * 1000
+            if attempt > retries:
+                raise
+            delay = backoff * 2 ** (attempt - 1) * (1 + random.random())
+            print(f"   🔒 lock_timeout on attempt {attempt}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+
+def timed(conn, original, statement, monitor, online=False):
+    import time
+
+    if monitor:
+        monitor.snapshot()
+    start = time.perf_counter()
+    conn.execute(statement)
+    duration = time.perf_counter() - start
+    locks = monitor.snapshot() if monitor else {"lock_wait_s": 0.0, "blocking_s": 0.0, "blocked_max": 0}
+    return {
+        "statement": summary(original),
+        "online": online,
+        "duration_ms": round(duration * 1000, 1),
+        "lock_wait_ms": round(locks["lock_wait_s"] * 1000, 1),
+        "blocking_ms": round(locks["blocking_s"] * 1000, 1),
+        "blocked_max": locks["blocked_max"],
+    }
+
+
+def apply_sql(conn, dsn, statements, lock_timeout="2s", retries=5, concurrently=True):
+    """Run statements as the runner does (segments, lock_timeout, retries, monitoring); returns statement records"""
+    conn.execute("SELECT set_config('lock_timeout', %s, false)", (lock_timeout,))
+    monitor = LockMonitor(dsn, conn.info.backend_pid)
+    try:
+        records = []
+        for segment in plan_segments(statements, concurrently):
+            records.extend(run_segment(conn, segment, monitor, retries))
+        return records
+    finally:
+        monitor.close()
+
+
+def applied_versions(conn):
+    """{version: statements} recorded as applied"""
+    with conn.cursor() as cur:
+        cur.execute("SELECT to_regclass('supabase_migrations.schema_migrations') IS NOT NULL")
+        if not cur.fetchone()[0]:
+            return {}
+        cur.execute("SELECT version, statements FROM supabase_migrations.schema_migrations")
+        return {version: statements for version, statements in cur.fetchall()}
+
+
+def record(conn, migration):
+    conn.execute(
+        """
+        INSERT INTO supabase_migrations.schema_migrations (version, statements, name) VALUES (%s, %s, %s)
+        ON CONFLICT (version) DO UPDATE SET statements = EXCLUDED.statements, name = EXCLUDED.name
+        """,
+        (migration["version"], migration["statements"], migration["name"]),
+    )
+
+
+def run(args):
+    import time
+
+    from currijobs_harness import db, results
+
+    print("🚚 CurriJobs Migration Runner")
+    print("=" * 50)
+    try:
+        migrations = load_migrations(args.dir)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    if db.pooled_for(args):
+        print("❌ Migrations need a session connection (lock_timeout, CONCURRENTLY); use the direct --dsn")
+        return 1
+    try:
+        conn = db.connect(args.dsn, autocommit=True)
+    except Exception as e:
+        print(f"❌ Could not connect to {db.redact(args.dsn)}: {e}")
+        return 1
+
+    try:
+        applied = applied_versions(conn)
+        for migration in migrations:
+            recorded = applied.get(migration["version"])
+            if recorded is not None and list(recorded) != migration["statements"]:
+                print(f"⚠️  {migration['path']} changed after it was applied")
+        pending = [m for m in migrations if m["version"] not in applied and (not args.target or m["version"] <= args.target)]
+
+        if args.status:
+            for migration in migrations:
+                mark = "✅" if migration["version"] in applied else "⏳"
+                print(f"{mark} {migration['path']}")
+            print(f"\n{len(migrations) - len(pending)} applied, {len(pending)} pending")
+            return 0
+
+        if args.baseline:
+            conn.execute(RECORD_TABLE_SQL)
+            marked = [m for m in pending if m["version"] <= args.baseline]
+            for migration in marked:
+                record(conn, migration)
+                print(f"📌 {migration['path']} recorded as applied")
+            print(f"✅ Baselined {len(marked)} migration(s)")
+            return 0
+
+        if args.dry_run:
+            for migration in pending:
+                print(f"📄 {migration['path']}")
+                for segment in plan_segments(migration["statements"], not args.no_concurrently):
+                    label = "online       " if segment["online"] else "transaction  "
+                    for number, (_, statement) in enumerate(segment["statements"]):
+                        print(f"   {label if number == 0 else ' ' * 13} {summary(statement)}")
+            print(f"\n{len(pending)} pending migration(s)")
+            return 0
+
+        if not pending:
+            print("✅ Nothing to apply")
+            return 0
+
+        conn.execute(RECORD_TABLE_SQL)
+        report = {"lock_timeout": args.lock_timeout, "migrations": {}}
+        for migration in pending:
+            print(f"📄 {migration['path']}")
+            start = time.perf_counter()
+            try:
+                records = apply_sql(conn, args.dsn, migration["statements"], args.lock_timeout, args.retries,
+                                    not args.no_concurrently)
+            except Exception as e:
+                print(f"❌ {migration['path']} failed: {e}")
+                return 1
+            record(conn, migration)
+            for row in records:
+                flag = "⚡" if row["online"] else "  "
+                print(f"   {flag} {row['statement']:<72} {row['duration_ms']:>8.1f}ms  lock wait {row['lock_wait_ms']:.1f}ms"
+                      + (f"  blocked {row['blocked_max']} for {row['blocking_ms']:.0f}ms" if row["blocked_max"] else "")
+                      + (f"  ({row['attempts']} attempts)" if row["attempts"] > 1 else ""))
+            report["migrations"][migration["version"]] = {
+                "duration_s": round(time.perf_counter() - start, 2),
+                "statements": records,
+            }
+    finally:
+        conn.close()
+
+    print(f"\n✅ Applied {len(report['migrations'])} migration(s)")
+    if not args.no_history:
+        entry = results.append_history(HISTORY_NAME, report)
+        print(f"📝 Recorded run for {entry['commit']}")
+    return 0
@@ -0,0 +1,211 @@
+"""
+Migration runner benchmark: do schema changes stall the app's writes?
+Seeds a scratch table and keeps a writer inserting and updating rows (as
+the app does on tasks) while the runner applies changes four ways:
+
+    index in transaction       CREATE INDEX as pasted into the SQL editor
+    index concurrently         the runner's online rewrite
+    DDL, no lock_timeout       ALTER TABLE queued behind a long reader; every
+                               write queues behind the ALTER
+    DDL, lock_timeout          same, but the runner gives up and retries
+
+For each phase it reports the writer's latency (p50/p99/max), writes that
+stalled past --stall-ms, and the runner's duration, attempts and lock wait.
+It fails unless the online phases stall writes less than their blocking
+counterparts. The scratch table is dropped at the end.
+
+Usage:
+    python -m currijobs_harness migrate-bench
+    python -m currijobs_harness migrate-bench --rows 2000000 --hold 5
+"""
+
+HISTORY_NAME = "migrate-bench"
+TABLE = "harness_migrate_bench"
+
+
+def add_arguments(parser):
+    from currijobs_harness import db
+
+    db.add_dsn_argument(parser)
+    parser.add_argument("--rows", type=int, default=500000, help="Rows in the scratch table (default: 500000)")
+    parser.add_argument("--hold", type=float, default=3.0, help="Seconds the long reader holds its lock (default: 3)")
+    parser.add_argument("--lock-timeout", default="200ms", help="lock_timeout for the online phases (default: 200ms)")
+    parser.add_argument("--stall-ms", type=float, default=100.0, help="A write slower than this counts as stalled (default: 100)")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+class Writer:
+    """Background inserts and updates on the scratch table, timing every write"""
+
+    def __init__(self, dsn, ids):
+        import threading
+
+        from currijobs_harness import db
+
+        self.conn = db.connect(dsn, autocommit=True)
+        self.ids = ids
+        self.writes = []
+        self.stop = threading.Event()
+        self.thread = threading.Thread(target=self.loop, daemon=True)
+        self.thread.start()
+
+    def loop(self):
+        import random
+        import time
+
+        with self.conn.cursor() as cur:
+            while not self.stop.is_set():
+                start = time.perf_counter()
+                if random.random() < 0.5:
+                    cur.execute(f"INSERT INTO {TABLE} (status, user_id) VALUES ('open', gen_random_uuid())")
+                else:
+                    cur.execute(f"UPDATE {TABLE} SET status = 'assigned' WHERE id = %s", (random.choice(self.ids),))
+                end = time.perf_counter()
+                self.writes.append((start, end))
+                time.sleep(0.002)
+
+    def between(self, start, end):
+        """Latencies in ms of writes that overlap [start, end]"""
+        return [(e - s) * 1000 for s, e in list(self.writes) if e >= start and s <= end]
+
+    def close(self):
+        self.stop.set()
+        self.thread.join()
+        self.conn.close()
+
+
+def hold_reader(dsn, seconds):
+    """A long read transaction (a report, a pg_dump) holding ACCESS SHARE on the table"""
+    import threading
+    import time
+
+    from currijobs_harness import db
+
+    started = threading.Event()
+
+    def hold():
+        with db.connect(dsn, autocommit=False) as conn:
+            conn.execute(f"SELECT count(*) FROM {TABLE}")
+            started.set()
+            time.sleep(seconds)
+            conn.rollback()
+
+    thread = threading.Thread(target=hold, daemon=True)
+    thread.start()
+    started.wait()
+    return thread
+
+
+def phase(conn, dsn, writer, statement, lock_timeout, concurrently, stall_ms, holder=None):
+    import time
+
+    from currijobs_harness import migrate, stats
+
+    time.sleep(0.3)
+    start = time.perf_counter()
+    try:
+        records = migrate.apply_sql(conn, dsn, [statement], lock_timeout, retries=8, concurrently=concurrently)
+        error = None
+    except Exception as e:
+        records, error = [], str(e).splitlines()[0]
+    end = time.perf_counter()
+    if holder:
+        holder.join()
+    time.sleep(0.3)
+    latencies = writer.between(start, end)
+    summary = stats.summarize(latencies)
+    return {
+        "duration_ms": round((end - start) * 1000, 1),
+        "attempts": records[0]["attempts"] if records else 0,
+        "lock_wait_ms": sum(r["lock_wait_ms"] for r in records),
+        "blocked_max": max((r["blocked_max"] for r in records), default=0),
+        "writes": len(latencies),
+        "write_p50_ms": summary["p50"] or 0,
+        "write_p99_ms": summary["p99"] or 0,
+        "write_max_ms": summary["max"] or 0,
+        "stalled": sum(1 for ms in latencies if ms > stall_ms),
+        "error": error,
+    }
+
+
+def run(args):
+    import time
+
+    from currijobs_harness import db, results
+
+    print("🚧 CurriJobs Migration Runner Benchmark")
+    print("=" * 50)
+    if db.pooled_for(args):
+        print("❌ The benchmark watches backends by pid, which a transaction pooler reassigns; use the direct --dsn")
+        return 1
+    try:
+        conn = db.connect(args.dsn, autocommit=True)
+    except Exception as e:
+        print(f"❌ Could not connect to {db.redact(args.dsn)}: {e}")
+        return 1
+
+    report = {"rows": args.rows, "hold_s": args.hold, "lock_timeout": args.lock_timeout, "phases": {}}
+    writer = None
+    try:
+        start = time.perf_counter()
+        conn.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        conn.execute(f"""
+            CREATE TABLE {TABLE} (
+              id BIGSERIAL PRIMARY KEY,
+              status TEXT NOT NULL,
+              user_id UUID NOT NULL,
+              created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            )
+        """)
+        conn.execute(f"""
+            INSERT INTO {TABLE} (status, user_id, created_at)
+            SELECT (ARRAY['open', 'assigned', 'completed'])[1 + g %% 3], gen_random_uuid(), now() - g * interval '1 minute'
+            FROM generate_series(1, %s) g
+        """, (args.rows,))
+        conn.execute(f"ANALYZE {TABLE}")
+        ids = [row[0] for row in conn.execute(f"SELECT id FROM {TABLE} ORDER BY random() LIMIT 10000").fetchall()]
+        print(f"🌱 Seeded {args.rows:,} rows in {time.perf_counter() - start:.1f}s; writer running")
+        writer = Writer(args.dsn, ids)
+
+        index = f"CREATE INDEX idx_{TABLE}_status_created ON {TABLE} (status, created_at DESC);"
+        ddl = f"ALTER TABLE {TABLE} ADD COLUMN note TEXT;"
+        phases = report["phases"]
+        phases["index_in_transaction"] = phase(conn, args.dsn, writer, index, "0", False, args.stall_ms)
+        conn.execute(f"DROP INDEX idx_{TABLE}_status_created")
+        phases["index_concurrently"] = phase(conn, args.dsn, writer, index, args.lock_timeout, True, args.stall_ms)
+        phases["ddl_no_lock_timeout"] = phase(conn, args.dsn, writer, ddl, "0", True, args.stall_ms,
+                                              holder=hold_reader(args.dsn, args.hold))
+        conn.execute(f"ALTER TABLE {TABLE} DROP COLUMN note")
+        phases["ddl_lock_timeout"] = phase(conn, args.dsn, writer, ddl, args.lock_timeout, True, args.stall_ms,
+                                           holder=hold_reader(args.dsn, args.hold))
+    finally:
+        if writer:
+            writer.close()
+        conn.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        conn.close()
+
+    print(f"\n{'phase':<22} {'runner':>9} {'tries':>6} {'lock wait':>10} {'writes':>7} {'p50':>8} {'p99':>8} {'max':>9} {'stalled':>8}")
+    for name, row in report["phases"].items():
+        print(f"  {name:<20} {row['duration_ms']:>7.0f}ms {row['attempts']:>6} {row['lock_wait_ms']:>8.0f}ms {row['writes']:>7} "
+              f"{row['write_p50_ms']:>6.2f}ms {row['write_p99_ms']:>6.1f}ms {row['write_max_ms']:>7.0f}ms {row['stalled']:>8}")
+        if row["error"]:
+            print(f"    ❌ {row['error']}")
+    print("🧹 Scratch table dropped")
+
+    if not args.no_history:
+        record = results.append_history(HISTORY_NAME, report)
+        print(f"📝 Recorded run for {record['commit']}")
+
+    phases = report["phases"]
+    failures = [name for name, row in phases.items() if row["error"]]
+    if phases["index_concurrently"]["write_max_ms"] >= phases["index_in_transaction"]["write_max_ms"]:
+        failures.append("index_concurrently stalled writes as long as index_in_transaction")
+    if phases["ddl_lock_timeout"]["write_max_ms"] >= phases["ddl_no_lock_timeout"]["write_max_ms"]:
+        failures.append("ddl_lock_timeout stalled writes as long as ddl_no_lock_timeout")
+    if failures:
+        print(f"❌ {'; '.join(failures)}")
+        return 1
+    print(f"✅ Online phases kept the longest write at {phases['index_concurrently']['write_max_ms']:.0f} ms "
+          f"and {phases['ddl_lock_timeout']['write_max_ms']:.0f} ms "
+          f"(vs {phases['index_in_transaction']['write_max_ms']:.0f} ms and {phases['ddl_no_lock_timeout']['write_max_ms']:.0f} ms)")
+    return 0
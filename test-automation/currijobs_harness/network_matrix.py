@@ -0,0 +1,362 @@
+"""
+Network-condition matrix for time to first task card
+Replays a cold load of the task list under emulated links and measures how
+long the first task card takes to appear and how many data requests were
+wasted along the way. It exercises fetchTasks' timeout race and its REST
+and postgrest-js retries.
+
+Links are built from two layers:
+
+    CDP        Network.emulateNetworkConditions: round-trip latency and
+               bandwidth for every request
+    proxy      a local HTTP proxy that drops, stalls or blackholes data
+               requests (PostgREST / Supabase REST and auth). The app shell
+               from the dev server always passes, as if it were cached
+
+Profiles:
+
+    baseline        no emulation
+    3g              300 ms RTT, 750/250 kbps
+    flaky-4g        100 ms RTT, 4/3 Mbps; 10% of data requests dropped and 10%
+                    stalled for 12 s (past fetchTasks' 10 s timeout)
+    satellite       650 ms RTT, 1 Mbps/256 kbps
+    offline-online  data requests fail for the first 8 s after navigation
+
+A data request is wasted if it failed or was aborted, returned an HTTP
+error, never finished, or repeated a request that had already succeeded.
+HTTPS tunnels (hosted Supabase) are faulted per connection, since the
+proxy cannot see inside them; use the local stack (npm run start:local)
+for per-request faults.
+
+Usage:
+    python -m currijobs_harness network-matrix
+    python -m currijobs_harness network-matrix --profiles 3g,flaky-4g --runs 5
+    python -m currijobs_harness network-matrix --route /tasks --email fixture-1@bench.currijobs.test --stand-in
+"""
+
+import statistics
+
+from currijobs_harness.browser import DEFAULT_APP_URL
+
+HISTORY_NAME = "network"
+TASK_CARD_SELECTOR = '[data-testid="task-item"]'
+DATA_KINDS = ("api", "auth")
+DATA_HOST_SUFFIXES = (".supabase.co",)
+
+PROFILES = {
+    "baseline": {"label": "Baseline"},
+    "3g": {"label": "3G", "latency_ms": 300, "down_kbps": 750, "up_kbps": 250},
+    "flaky-4g": {"label": "Flaky 4G", "latency_ms": 100, "down_kbps": 4000, "up_kbps": 3000,
+                 "drop": 0.10, "stall": 0.10, "stall_s": 12},
+    "satellite": {"label": "Satellite", "latency_ms": 650, "down_kbps": 1000, "up_kbps": 256},
+    "offline-online": {"label": "Offline → online", "offline_s": 8},
+}
+
+
+def add_arguments(parser):
+    parser.add_argument("--url", default=DEFAULT_APP_URL, help="App base URL (default: http://localhost:8081)")
+    parser.add_argument("--route", default="/tasks", help="Route that lists tasks (default: /tasks)")
+    parser.add_argument("--profiles", default=",".join(PROFILES), help=f"Comma-separated profiles (default: {','.join(PROFILES)})")
+    parser.add_argument("--runs", type=int, default=3, help="Cold loads per profile (default: 3)")
+    parser.add_argument("--timeout", type=int, default=60, help="Seconds to wait for the first task card (default: 60)")
+    parser.add_argument("--settle", type=float, default=3.0, help="Seconds after the card to keep counting requests (default: 3)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for drops and stalls (default: 1)")
+    parser.add_argument("--email", default=None, help="Open the route signed in as this user (auth-session)")
+    parser.add_argument("--password", default=None, help="Password for --email")
+    parser.add_argument("--stand-in", action="store_true", help="Mint the --email session locally")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+class FaultProxy:
+    """Forwarding HTTP proxy that faults data requests per profile, on a background event loop"""
+
+    def __init__(self, profile, seed=None):
+        import random
+
+        self.drop = profile.get("drop", 0)
+        self.stall = profile.get("stall", 0)
+        self.stall_s = profile.get("stall_s", 0)
+        self.offline_s = profile.get("offline_s", 0)
+        self.rng = random.Random(seed)
+        self.armed_at = None
+        self.counts = {"forwarded": 0, "dropped": 0, "stalled": 0, "offline": 0}
+
+    def start(self):
+        import asyncio
+        import threading
+
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.server = asyncio.run_coroutine_threadsafe(
+            asyncio.start_server(self.handle, "127.0.0.1", 0), self.loop
+        ).result()
+        self.url = f"http://127.0.0.1:{self.server.sockets[0].getsockname()[1]}"
+        return self.url
+
+    def arm(self):
+        """Start the offline window and reset the counters (call right before navigating)"""
+        import time
+
+        self.armed_at = time.monotonic()
+        self.counts = dict.fromkeys(self.counts, 0)
+
+    def stop(self):
+        import asyncio
+
+        async def close():
+            self.server.close()
+            await self.server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(close(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+    def fault(self):
+        """'offline', 'drop', 'stall' or None for the next data request"""
+        import time
+
+        if self.armed_at is not None and time.monotonic() - self.armed_at < self.offline_s:
+            return "offline"
+        roll = self.rng.random()
+        if roll < self.drop:
+            return "drop"
+        if roll < self.drop + self.stall:
+            return "stall"
+        return None
+
+    @staticmethod
+    async def pipe(reader, writer):
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                writer.write(data)
+                await writer.drain()
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle(self, reader, writer):
+        import asyncio
+        from urllib.parse import urlsplit
+
+        from currijobs_harness.trace_analysis import request_kind
+
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")
+        method, target, version = request_line.split(" ", 2)
+        if method == "CONNECT":
+            host, port = target.rsplit(":", 1)
+            is_data = host.endswith(DATA_HOST_SUFFIXES)
+        else:
+            parts = urlsplit(target)
+            host, port = parts.hostname, parts.port or 80
+            is_data = request_kind(target) in DATA_KINDS
+
+        fault = self.fault() if is_data else None
+        if fault in ("offline", "drop"):
+            self.counts["offline" if fault == "offline" else "dropped"] += 1
+            writer.close()
+            return
+        if fault == "stall":
+            self.counts["stalled"] += 1
+            await asyncio.sleep(self.stall_s)
+
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection(host, int(port))
+        except OSError:
+            writer.write(b"HTTP/1.1 502 Bad Gateway\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            writer.close()
+            return
+        self.counts["forwarded"] += 1
+        if method == "CONNECT":
+            writer.write(b"HTTP/1.1 200 Connection established\r\n\r\n")
+            await asyncio.gather(self.pipe(reader, upstream_writer), self.pipe(upstream_reader, writer))
+            return
+
+        # One request per upstream connection keeps faults per request
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        headers = [h for h in header_lines if h and not h.lower().startswith(("connection:", "proxy-connection:", "keep-alive:"))]
+        upstream_writer.write(f"{method} {path} {version}\r\n".encode("latin-1"))
+        upstream_writer.write(("\r\n".join(headers + ["Connection: close"]) + "\r\n\r\n").encode("latin-1"))
+        upload = asyncio.ensure_future(self.pipe(reader, upstream_writer))
+        await self.pipe(upstream_reader, writer)
+        upload.cancel()
+
+
+def data_requests(network):
+    """Data requests from DevTools network messages, with how each ended"""
+    from currijobs_harness.trace_analysis import request_kind
+
+    requests = {}
+    for message in network:
+        params = message.get("params", {})
+        request_id = params.get("requestId")
+        method = message["method"]
+        if method == "Network.requestWillBeSent":
+            request = params["request"]
+            if request["method"] == "OPTIONS" or request_kind(request["url"]) not in DATA_KINDS:
+                continue
+            requests.setdefault(request_id, {
+                "method": request["method"], "url": request["url"], "sent": params["timestamp"],
+                "status": None, "outcome": "unfinished",
+            })
+        elif request_id not in requests:
+            continue
+        elif method == "Network.responseReceived":
+            requests[request_id]["status"] = params["response"]["status"]
+        elif method == "Network.loadingFinished":
+            requests[request_id]["outcome"] = "finished"
+        elif method == "Network.loadingFailed":
+            requests[request_id]["outcome"] = "canceled" if params.get("canceled") else "failed"
+            requests[request_id]["error"] = params.get("errorText")
+    return sorted(requests.values(), key=lambda r: r["sent"])
+
+
+def wasted_requests(requests):
+    """{reason: count} for requests that did not contribute data"""
+    wasted = {"failed": 0, "canceled": 0, "http_error": 0, "unfinished": 0, "duplicate": 0}
+    succeeded = set()
+    for request in requests:
+        key = (request["method"], request["url"])
+        if request["outcome"] != "finished":
+            wasted[request["outcome"]] += 1
+        elif request["status"] and request["status"] >= 400:
+            wasted["http_error"] += 1
+        elif key in succeeded:
+            wasted["duplicate"] += 1
+        else:
+            succeeded.add(key)
+    return wasted
+
+
+def load_once(url, profile, proxy, args, session=None):
+    """One cold load under profile; returns the first card time and request accounting"""
+    import time
+
+    from currijobs_harness import auth_session, browser
+
+    driver = browser.make_driver(headless=not args.headed, trace=True, proxy=proxy.url)
+    try:
+        driver.set_page_load_timeout(args.timeout)
+        driver.execute_cdp_cmd("Network.enable", {})
+        if "latency_ms" in profile:
+            driver.execute_cdp_cmd("Network.emulateNetworkConditions", {
+                "offline": False,
+                "latency": profile["latency_ms"],
+                "downloadThroughput": profile["down_kbps"] * 1000 / 8,
+                "uploadThroughput": profile["up_kbps"] * 1000 / 8,
+            })
+        if session:
+            auth_session.inject(driver, args.url, session)
+        proxy.arm()
+        start = time.monotonic()
+        driver.get(url)
+        remaining = max(1, int(args.timeout - (time.monotonic() - start)))
+        card_ms = browser.wait_for_selector(driver, TASK_CARD_SELECTOR, remaining)
+        time.sleep(args.settle)
+        _, network = browser.read_performance_log(driver)
+    finally:
+        driver.quit()
+    requests = data_requests(network)
+    return {
+        "card_ms": card_ms,
+        "data_requests": len(requests),
+        "wasted": wasted_requests(requests),
+        "proxy": dict(proxy.counts),
+    }
+
+
+def summarize_profile(runs):
+    cards = [r["card_ms"] for r in runs if r["card_ms"] is not None]
+    wasted = [sum(r["wasted"].values()) for r in runs]
+    reasons = {}
+    for r in runs:
+        for reason, count in r["wasted"].items():
+            reasons[reason] = reasons.get(reason, 0) + count
+    return {
+        "runs": len(runs),
+        "no_card": len(runs) - len(cards),
+        "card_p50_ms": round(statistics.median(cards), 1) if cards else None,
+        "card_max_ms": round(max(cards), 1) if cards else None,
+        "data_requests_p50": statistics.median(r["data_requests"] for r in runs),
+        "wasted_p50": statistics.median(wasted),
+        "wasted_by_reason": {k: v for k, v in reasons.items() if v},
+    }
+
+
+def run(args):
+    from currijobs_harness import metro, results
+    from currijobs_harness.stats import fmt_ms
+
+    print("📶 CurriJobs Network Condition Matrix")
+    print("=" * 50)
+    names = [p.strip() for p in args.profiles.split(",") if p.strip()]
+    unknown = [p for p in names if p not in PROFILES]
+    if unknown:
+        print(f"❌ Unknown profile(s): {', '.join(unknown)} (choose from {', '.join(PROFILES)})")
+        return 1
+    if not metro.is_running(args.url):
+        print(f"❌ Expo web server not running at {args.url}")
+        print("Please run: npm run web")
+        return 1
+
+    session = None
+    if args.email:
+        from currijobs_harness import auth_session
+
+        try:
+            session, _ = auth_session.get_session(args.email, args.password, args.stand_in)
+        except Exception as e:
+            print(f"❌ Could not get a session for {args.email}: {e}")
+            return 1
+        print(f"🔑 Signed in as {args.email}")
+
+    url = args.url.rstrip("/") + args.route
+    report = {"url": url, "runs": args.runs, "profiles": {}}
+    for name in names:
+        profile = PROFILES[name]
+        print(f"⏱️  {profile['label']}…")
+        proxy = FaultProxy(profile, seed=args.seed)
+        proxy.start()
+        runs = []
+        try:
+            for i in range(args.runs):
+                try:
+                    runs.append(load_once(url, profile, proxy, args, session))
+                except Exception as e:
+                    print(f"  ❌ run {i + 1}: {str(e).splitlines()[0]}")
+        finally:
+            proxy.stop()
+        if runs:
+            report["profiles"][name] = summarize_profile(runs)
+
+    print(f"\n{'profile':<16} {'first card p50':>15} {'max':>9} {'no card':>8} {'data reqs':>10} {'wasted':>7}")
+    for name, row in report["profiles"].items():
+        reasons = ", ".join(f"{count} {reason}" for reason, count in row["wasted_by_reason"].items())
+        print(f"{PROFILES[name]['label']:<16} {fmt_ms(row['card_p50_ms']):>13}ms {fmt_ms(row['card_max_ms']):>7}ms "
+              f"{row['no_card']:>5}/{row['runs']:<2} {row['data_requests_p50']:>10g} {row['wasted_p50']:>7g}"
+              f"{'  (' + reasons + ' across runs)' if reasons else ''}")
+
+    if not report["profiles"]:
+        print("❌ No profile completed a run")
+        return 1
+    if not args.no_history:
+        record = results.append_history(HISTORY_NAME, report)
+        print(f"📝 Recorded run for {record['commit']}")
+    stuck = [PROFILES[name]["label"] for name, row in report["profiles"].items() if row["no_card"]]
+    if stuck:
+        print(f"❌ No task card within {args.timeout}s under: {', '.join(stuck)}")
+        return 1
+    print("✅ Task cards appeared under every profile")
+    return 0
@@ -0,0 +1,52 @@
+"""
+Quick port check for the local dev servers
+Uses only the standard library so it starts without loading requests/selenium
+"""
+
+DEFAULT_PORTS = [8081, 19006, 3000, 19000]
+
+
+def add_arguments(parser):
+    parser.add_argument("--host", default="localhost", help="Host to probe (default: localhost)")
+    parser.add_argument(
+        "--ports",
+        type=lambda s: [int(p) for p in s.split(",") if p],
+        default=DEFAULT_PORTS,
+        help="Comma-separated ports (default: 8081,19006,3000,19000)",
+    )
+    parser.add_argument("--timeout", type=float, default=2.0, help="Per-port timeout in seconds")
+
+
+def probe(url, timeout):
+    """Return (status, elapsed_ms) for a GET on url, status None if unreachable"""
+    import time
+    import urllib.error
+    import urllib.request
+
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except Exception:
+        status = None
+    return status, (time.perf_counter() - start) * 1000
+
+
+def run(args):
+    from concurrent.futures import ThreadPoolExecutor
+
+    print("🔍 Checking local servers...")
+    urls = [f"http://{args.host}:{port}" for port in args.ports]
+    with ThreadPoolExecutor(max_workers=len(urls) or 1) as pool:
+        results = list(pool.map(lambda u: probe(u, args.timeout), urls))
+
+    up = 0
+    for url, (status, elapsed_ms) in zip(urls, results):
+        if status is None:
+            print(f"❌ {url}: not accessible")
+        else:
+            up += 1
+            print(f"✅ {url}: {status} ({elapsed_ms:.0f} ms)")
+    return 0 if up else 1
@@ -0,0 +1,187 @@
+"""
+Build the offline place autocomplete index
+Reads the Costa Rica gazetteer (assets/data/cr-gazetteer.csv) and writes
+the sorted-array index that lib/place-index.ts searches:
+
+    {"version": 1,
+     "places": [[name, description, latitude, longitude], ...],
+     "keys": ["alajuela", "alajuelita", ...],
+     "ids": [place index for each key]}
+
+Places are ordered by popularity, so a place's index is its rank and the
+best matches for a prefix are simply the smallest ids in the key range.
+Keys are the accent-folded name, each later word of it ("jose" for San
+José) and the aliases, so "san jose", "José" and "chepe" all match.
+
+Usage:
+    python -m currijobs_harness place-index
+    python -m currijobs_harness place-index --check
+"""
+
+import os
+
+from currijobs_harness.cli import REPO_ROOT
+
+GAZETTEER_PATH = os.path.join(REPO_ROOT, "assets", "data", "cr-gazetteer.csv")
+INDEX_PATH = os.path.join(REPO_ROOT, "assets", "data", "cr-places-index.json")
+INDEX_VERSION = 1
+
+KINDS = ("province", "canton", "district", "landmark")
+# Costa Rica bounding box, with a margin for the coast
+LAT_RANGE = (5.4, 11.3)
+LON_RANGE = (-87.2, -82.5)
+# Words that never start a key on their own
+STOP_WORDS = {"de", "del", "la", "las", "el", "los", "y"}
+
+
+def add_arguments(parser):
+    parser.add_argument("--gazetteer", default=GAZETTEER_PATH, help="Gazetteer CSV (default: assets/data/cr-gazetteer.csv)")
+    parser.add_argument("--out", default=INDEX_PATH, help="Index artifact (default: assets/data/cr-places-index.json)")
+    parser.add_argument("--check", action="store_true", help="Fail if the committed artifact is out of date")
+
+
+def normalize(text):
+    """Accent-folded lowercase words; must match normalizeQuery in lib/geocode-cache.ts"""
+    import unicodedata
+
+    stripped = "".join(c for c in unicodedata.normalize("NFD", text) if not unicodedata.combining(c)).lower()
+    cleaned = "".join(c if c.isascii() and (c.isalnum() or c == " ") else " " for c in stripped)
+    return " ".join(cleaned.split())
+
+
+def load_gazetteer(path):
+    """Rows from the gazetteer CSV; raises ValueError listing every bad row"""
+    import csv
+
+    rows, problems, seen = [], [], set()
+    with open(path, newline="", encoding="utf-8") as f:
+        for line, row in enumerate(csv.DictReader(f), start=2):
+            try:
+                lat, lon, popularity = float(row["latitude"]), float(row["longitude"]), float(row["popularity"])
+            except (TypeError, ValueError):
+                problems.append(f"line {line}: bad latitude/longitude/popularity")
+                continue
+            if row["kind"] not in KINDS:
+                problems.append(f"line {line}: unknown kind {row['kind']!r}")
+            if not (LAT_RANGE[0] <= lat <= LAT_RANGE[1] and LON_RANGE[0] <= lon <= LON_RANGE[1]):
+                problems.append(f"line {line}: {row['name']} is outside Costa Rica")
+            key = (normalize(row["name"]), row["kind"], row["parent"])
+            if key in seen:
+                problems.append(f"line {line}: duplicate {row['name']} ({row['kind']})")
+            seen.add(key)
+            rows.append({
+                "name": row["name"].strip(),
+                "kind": row["kind"],
+                "province": row["province"].strip(),
+                "parent": (row["parent"] or "").strip(),
+                "latitude": lat,
+                "longitude": lon,
+                "popularity": popularity,
+                "aliases": [a.strip() for a in (row["aliases"] or "").split("|") if a.strip()],
+            })
+    if problems:
+        raise ValueError("\n".join(problems))
+    return rows
+
+
+def describe(row):
+    """'District, Canton, Province, Costa Rica' without repeating names"""
+    parts = [row["name"]]
+    for extra in (row["parent"], row["province"]):
+        if extra and extra not in parts:
+            parts.append(extra)
+    return ", ".join(parts + ["Costa Rica"])
+
+
+def keys_for(row):
+    keys = set()
+    for text in [row["name"]] + row["aliases"]:
+        words = normalize(text).split()
+        for start in range(len(words)):
+            if start == 0 or words[start] not in STOP_WORDS:
+                keys.add(" ".join(words[start:]))
+    return keys
+
+
+def build_index(rows):
+    ordered = sorted(rows, key=lambda r: (-r["popularity"], normalize(r["name"]), KINDS.index(r["kind"])))
+    places = [[r["name"], describe(r), round(r["latitude"], 5), round(r["longitude"], 5)] for r in ordered]
+    pairs = sorted({(key, place_id) for place_id, row in enumerate(ordered) for key in keys_for(row)})
+    return {
+        "version": INDEX_VERSION,
+        "places": places,
+        "keys": [key for key, _ in pairs],
+        "ids": [place_id for _, place_id in pairs],
+    }
+
+
+def serialize(index):
+    import json
+
+    return json.dumps(index, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def search(index, query, limit=5):
+    """Python mirror of searchPlaces in lib/place-index.ts; returns place ids best first"""
+    from bisect import bisect_left
+
+    needle = normalize(query)
+    if not needle:
+        return []
+    keys, ids = index["keys"], index["ids"]
+    best = set()
+    worst = -1
+    i = bisect_left(keys, needle)
+    while i < len(keys) and keys[i].startswith(needle):
+        place_id = ids[i]
+        if place_id not in best:
+            if len(best) < limit:
+                best.add(place_id)
+                worst = max(worst, place_id)
+            elif place_id < worst:
+                best.discard(worst)
+                best.add(place_id)
+                worst = max(best)
+        i += 1
+    return sorted(best)
+
+
+def run(args):
+    import gzip
+
+    print("🗂️  CurriJobs Place Index Builder")
+    print("=" * 50)
+    try:
+        rows = load_gazetteer(args.gazetteer)
+    except (OSError, ValueError) as e:
+        print(f"❌ Gazetteer problems:\n{e}")
+        return 1
+
+    index = build_index(rows)
+    text = serialize(index)
+    data = text.encode("utf-8")
+    kinds = {kind: sum(1 for r in rows if r["kind"] == kind) for kind in KINDS}
+    print(f"📍 {len(rows)} places ({', '.join(f'{n} {k}s' for k, n in kinds.items())}), {len(index['keys'])} keys")
+    print(f"📦 {len(data):,} bytes ({len(gzip.compress(data)):,} gzipped)")
+
+    # Every place must be reachable by its full name
+    unreachable = [
+        place[0] for place_id, place in enumerate(index["places"]) if place_id not in search(index, place[0], limit=10)
+    ]
+    if unreachable:
+        print(f"❌ Not found by full name: {', '.join(unreachable)}")
+        return 1
+
+    if args.check:
+        current = open(args.out, encoding="utf-8").read() if os.path.exists(args.out) else ""
+        if current != text:
+            print(f"❌ {os.path.relpath(args.out, REPO_ROOT)} is out of date; run place-index")
+            return 1
+        print("✅ Index artifact is up to date")
+        return 0
+
+    os.makedirs(os.path.dirname(args.out), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        f.write(text)
+    print(f"✅ Wrote {os.path.relpath(args.out, REPO_ROOT)}")
+    return 0
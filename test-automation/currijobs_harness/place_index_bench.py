@@ -0,0 +1,105 @@
+"""
+Place autocomplete benchmark
+Types every place name and alias in the index one keystroke at a time
+(with and without accents) and times the sorted-array prefix search
+against the linear includes() scan getAddressSuggestions used before.
+Reports per-lookup latency and the artifact size.
+
+Usage:
+    python -m currijobs_harness place-index-bench
+    python -m currijobs_harness place-index-bench --repeat 20
+"""
+
+import time
+
+HISTORY_NAME = "place_index"
+
+
+def add_arguments(parser):
+    from currijobs_harness.place_index import INDEX_PATH
+
+    parser.add_argument("--index", default=INDEX_PATH, help="Index artifact (default: assets/data/cr-places-index.json)")
+    parser.add_argument("--repeat", type=int, default=5, help="Passes over the keystroke set (default: 5)")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+def keystrokes(index):
+    """Every prefix of every place name, as typed and accent-folded"""
+    from currijobs_harness.place_index import normalize
+
+    queries = []
+    for name, _, _, _ in index["places"]:
+        for typed in {name, normalize(name)}:
+            queries.extend(typed[:end] for end in range(1, len(typed) + 1))
+    return queries
+
+
+def linear_search(index, query, limit=5):
+    """The old approach: normalize and substring-match every description"""
+    from currijobs_harness.place_index import normalize
+
+    needle = normalize(query)
+    return [i for i, place in enumerate(index["places"]) if needle in normalize(place[1])][:limit]
+
+
+def run(args):
+    import gzip
+    import json
+    import os
+
+    from currijobs_harness import results, stats
+    from currijobs_harness.place_index import search
+
+    print("🔎 CurriJobs Place Autocomplete Benchmark")
+    print("=" * 50)
+    if not os.path.exists(args.index):
+        print(f"❌ {args.index} not found; run place-index first")
+        return 1
+    with open(args.index, "rb") as f:
+        data = f.read()
+    start = time.perf_counter()
+    index = json.loads(data)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    queries = keystrokes(index)
+    report = {
+        "places": len(index["places"]),
+        "keys": len(index["keys"]),
+        "bytes": len(data),
+        "gzip_bytes": len(gzip.compress(data)),
+        "load_ms": round(load_ms, 2),
+        "queries": len(queries) * args.repeat,
+    }
+    for name, fn in (("index", search), ("linear", linear_search)):
+        timings = []
+        for _ in range(args.repeat):
+            for query in queries:
+                start = time.perf_counter()
+                fn(index, query)
+                timings.append((time.perf_counter() - start) * 1000)
+        report[f"{name}_ms"] = stats.summarize(timings)
+        # Sub-millisecond percentiles need more precision than summarize keeps
+        report[f"{name}_us"] = {
+            k: round(stats.percentile(timings, p) * 1000, 1) for k, p in (("p50", 50), ("p95", 95), ("p99", 99))
+        }
+
+    misses = sum(1 for place_id, place in enumerate(index["places"]) if place_id not in search(index, place[0], limit=10))
+    print(f"📦 {report['places']} places, {report['keys']} keys, {report['bytes']:,} bytes ({report['gzip_bytes']:,} gzipped), parsed in {report['load_ms']} ms")
+    print(f"⌨️  {report['queries']:,} keystroke lookups")
+    print(f"\n{'search':<8} {'p50 µs':>8} {'p95 µs':>8} {'p99 µs':>8}")
+    for name in ("index", "linear"):
+        us = report[f"{name}_us"]
+        print(f"{name:<8} {us['p50']:>8} {us['p95']:>8} {us['p99']:>8}")
+
+    if misses:
+        print(f"❌ {misses} places not found by their full name")
+        return 1
+    if report["index_us"]["p99"] >= 1000:
+        print("❌ p99 lookup is not sub-millisecond")
+        return 1
+    print("✅ Every place is reachable and p99 lookup is sub-millisecond")
+
+    if not args.no_history:
+        record = results.append_history(HISTORY_NAME, report)
+        print(f"📝 Recorded run for {record['commit']}")
+    return 0
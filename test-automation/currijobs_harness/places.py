@@ -0,0 +1,64 @@
+"""
+Costa Rica gazetteer shared by the geocoding benchmarks
+(name, province, latitude, longitude); coordinates are town centres
+"""
+
+PLACES = [
+    ("San José", "San José", 9.9281, -84.0907),
+    ("Escazú", "San José", 9.9186, -84.1407),
+    ("Santa Ana", "San José", 9.9326, -84.1825),
+    ("Desamparados", "San José", 9.8960, -84.0637),
+    ("Curridabat", "San José", 9.9117, -84.0343),
+    ("Moravia", "San José", 9.9613, -84.0485),
+    ("Tibás", "San José", 9.9573, -84.0823),
+    ("Guadalupe", "San José", 9.9469, -84.0516),
+    ("San Pedro", "San José", 9.9326, -84.0508),
+    ("Alajuelita", "San José", 9.9016, -84.1004),
+    ("Aserrí", "San José", 9.8586, -84.0919),
+    ("Coronado", "San José", 9.9785, -84.0093),
+    ("Pavas", "San José", 9.9542, -84.1300),
+    ("Rohrmoser", "San José", 9.9383, -84.1091),
+    ("La Sabana", "San José", 9.9366, -84.1000),
+    ("Zapote", "San José", 9.9205, -84.0590),
+    ("Heredia", "Heredia", 10.0029, -84.1165),
+    ("Santo Domingo", "Heredia", 9.9817, -84.0889),
+    ("San Pablo", "Heredia", 9.9958, -84.0973),
+    ("Barva", "Heredia", 10.0213, -84.1234),
+    ("Belén", "Heredia", 9.9797, -84.1790),
+    ("Flores", "Heredia", 10.0000, -84.1571),
+    ("San Rafael", "Heredia", 10.0143, -84.0980),
+    ("Alajuela", "Alajuela", 10.0169, -84.2114),
+    ("Grecia", "Alajuela", 10.0730, -84.3116),
+    ("Atenas", "Alajuela", 9.9797, -84.3788),
+    ("San Ramón", "Alajuela", 10.0875, -84.4701),
+    ("Naranjo", "Alajuela", 10.0987, -84.3785),
+    ("Palmares", "Alajuela", 10.0567, -84.4351),
+    ("Ciudad Quesada", "Alajuela", 10.3238, -84.4271),
+    ("La Fortuna", "Alajuela", 10.4678, -84.6427),
+    ("Cartago", "Cartago", 9.8644, -83.9194),
+    ("Paraíso", "Cartago", 9.8383, -83.8656),
+    ("Tres Ríos", "Cartago", 9.9004, -83.9932),
+    ("Turrialba", "Cartago", 9.9042, -83.6838),
+    ("Oreamuno", "Cartago", 9.8729, -83.9048),
+    ("Liberia", "Guanacaste", 10.6350, -85.4377),
+    ("Nicoya", "Guanacaste", 10.1479, -85.4520),
+    ("Tamarindo", "Guanacaste", 10.2993, -85.8371),
+    ("Santa Cruz", "Guanacaste", 10.2604, -85.5852),
+    ("Puntarenas", "Puntarenas", 9.9763, -84.8384),
+    ("Jacó", "Puntarenas", 9.6144, -84.6290),
+    ("Quepos", "Puntarenas", 9.4311, -84.1618),
+    ("Monteverde", "Puntarenas", 10.3009, -84.8238),
+    ("Uvita", "Puntarenas", 9.1631, -83.7384),
+    ("Golfito", "Puntarenas", 8.6390, -83.1808),
+    ("San Isidro de El General", "San José", 9.3733, -83.7034),
+    ("Limón", "Limón", 9.9907, -83.0359),
+    ("Puerto Viejo", "Limón", 9.6554, -82.7540),
+    ("Guápiles", "Limón", 10.2155, -83.7848),
+]
+
+
+def describe(name, province):
+    """Display string in the format lib/location.ts suggestions use"""
+    if name == province:
+        return f"{name}, Costa Rica"
+    return f"{name}, {province}, Costa Rica"
@@ -0,0 +1,203 @@
+"""
+Direct vs pooled connection benchmark
+Opens 10, 100 and 1,000 concurrent clients at once, first straight to
+Postgres and then through a transaction-mode PgBouncer. Each client
+connects, then runs the open-task list query in a loop for --duration
+seconds. Per mode and client count it reports:
+
+    connected / errors   e.g. "too many clients" once direct connections pass max_connections
+    setup p50/p99        time to an established connection
+    tps                  queries completed per second across all clients
+    query p50/p99        per-query latency
+
+Pooled clients run with server-side prepared statements off, as
+db.connect does for --pooled. Pass --pooler-dsn for a running pooler.
+Otherwise, if pgbouncer is on PATH, one is started on --pooler-port in
+front of --dsn (pool_mode = transaction, config under the harness cache).
+
+Usage:
+    python -m currijobs_harness pool-bench
+    python -m currijobs_harness pool-bench --clients 10,100 --duration 5
+    python -m currijobs_harness pool-bench --pooler-dsn postgresql://postgres@localhost:6432/postgres
+"""
+
+import os
+
+HISTORY_NAME = "pool"
+QUERY = "SELECT id, title, reward FROM tasks WHERE status = 'open' ORDER BY created_at DESC LIMIT 20"
+
+
+def add_arguments(parser):
+    from currijobs_harness import db
+
+    parser.add_argument("--dsn", default=db.DEFAULT_DSN, help="Direct Postgres connection string (CURRIJOBS_DATABASE_URL)")
+    parser.add_argument("--pooler-dsn", default=None, help="Running transaction-mode pooler (default: start pgbouncer)")
+    parser.add_argument("--pooler-port", type=int, default=6432, help="Port for the pgbouncer this starts (default: 6432)")
+    parser.add_argument("--pool-size", type=int, default=20, help="Server connections per pool (default: 20)")
+    parser.add_argument("--clients", default="10,100,1000", help="Comma-separated client counts (default: 10,100,1000)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of queries per run (default: 10)")
+    parser.add_argument("--query", default=QUERY, help="Query each client runs")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+def start_pgbouncer(binary, dsn, port, pool_size, max_clients):
+    """pgbouncer in transaction mode in front of dsn; returns (process, pooler dsn)"""
+    import socket
+    import subprocess
+    import time
+
+    from psycopg.conninfo import conninfo_to_dict, make_conninfo
+
+    from currijobs_harness.bootstrap import cache_dir
+
+    target = conninfo_to_dict(dsn)
+    user = target.get("user", "postgres")
+    workdir = os.path.join(cache_dir(), "pgbouncer")
+    os.makedirs(workdir, exist_ok=True)
+    server = " ".join(f"{key}={target[key]}" for key in ("host", "port", "user", "password", "dbname") if target.get(key))
+    with open(os.path.join(workdir, "userlist.txt"), "w", encoding="utf-8") as f:
+        f.write(f'"{user}" ""\n')
+    config = os.path.join(workdir, "pgbouncer.ini")
+    with open(config, "w", encoding="utf-8") as f:
+        f.write(
+            "[databases]\n"
+            f"* = {server}\n"
+            "[pgbouncer]\n"
+            f"listen_addr = 127.0.0.1\nlisten_port = {port}\n"
+            f"unix_socket_dir =\nauth_type = trust\nauth_file = {workdir}/userlist.txt\n"
+            f"pool_mode = transaction\ndefault_pool_size = {pool_size}\nmax_client_conn = {max_clients + 100}\n"
+            f"logfile = {workdir}/pgbouncer.log\npidfile = {workdir}/pgbouncer.pid\n"
+        )
+    process = subprocess.Popen([binary, config], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            break
+        except OSError:
+            if process.poll() is not None:
+                raise RuntimeError(f"pgbouncer exited; see {workdir}/pgbouncer.log")
+            time.sleep(0.1)
+    else:
+        process.terminate()
+        raise RuntimeError(f"pgbouncer did not listen on {port}")
+    return process, make_conninfo(dsn, host="127.0.0.1", port=str(port))
+
+
+async def storm(dsn, pooled, clients, duration, query):
+    """clients connecting at once, then querying until the deadline"""
+    import asyncio
+    import time
+
+    import psycopg
+
+    setup, latencies, errors = [], [], {}
+    # Deadline starts once connections are attempted; slow connects eat into their own run
+    deadline = time.perf_counter() + duration
+
+    async def client():
+        start = time.perf_counter()
+        try:
+            conn = await psycopg.AsyncConnection.connect(
+                dsn, autocommit=True, **({"prepare_threshold": None} if pooled else {})
+            )
+        except Exception as e:
+            message = str(e).strip().splitlines()[-1] if str(e).strip() else type(e).__name__
+            errors[message] = errors.get(message, 0) + 1
+            return
+        setup.append((time.perf_counter() - start) * 1000)
+        async with conn:
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    cur = await conn.execute(query)
+                    await cur.fetchall()
+                except Exception as e:
+                    message = str(e).strip().splitlines()[0]
+                    errors[message] = errors.get(message, 0) + 1
+                    return
+                latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    return setup, latencies, errors, elapsed
+
+
+def measure(dsn, pooled, clients, duration, query):
+    import asyncio
+
+    from currijobs_harness import stats
+
+    setup, latencies, errors, elapsed = asyncio.run(storm(dsn, pooled, clients, duration, query))
+    return {
+        "clients": clients,
+        "connected": len(setup),
+        "errors": errors,
+        "setup_ms": stats.summarize(setup),
+        "query_ms": stats.summarize(latencies),
+        "tps": round(len(latencies) / elapsed, 1) if elapsed else 0,
+    }
+
+
+def run(args):
+    import shutil
+
+    from currijobs_harness import db, results
+    from currijobs_harness.stats import fmt_ms
+
+    print("🏊 CurriJobs Connection Pooler Benchmark")
+    print("=" * 50)
+    counts = [int(c) for c in args.clients.split(",") if c.strip()]
+    try:
+        with db.connect(args.dsn) as conn:
+            max_connections = conn.execute("SHOW max_connections").fetchone()[0]
+    except Exception as e:
+        print(f"❌ Could not connect to {db.redact(args.dsn)}: {e}")
+        return 1
+    print(f"🐘 Direct: {db.redact(args.dsn)} (max_connections {max_connections})")
+
+    process, pooler = None, args.pooler_dsn
+    if not pooler:
+        binary = shutil.which("pgbouncer")
+        if binary:
+            try:
+                process, pooler = start_pgbouncer(binary, args.dsn, args.pooler_port, args.pool_size, max(counts))
+            except RuntimeError as e:
+                print(f"⚠️  {e}")
+    if pooler:
+        print(f"🏊 Pooled: {db.redact(pooler)} (transaction mode, prepared statements off)")
+    else:
+        print("⚠️  No pooler: pass --pooler-dsn or put pgbouncer on PATH; measuring direct only")
+
+    report = {"max_connections": int(max_connections), "duration_s": args.duration, "runs": {"direct": [], "pooled": []}}
+    try:
+        for mode, dsn in (("direct", args.dsn), ("pooled", pooler)):
+            if not dsn:
+                continue
+            for clients in counts:
+                print(f"⏱️  {mode} × {clients} clients…")
+                report["runs"][mode].append(measure(dsn, mode == "pooled", clients, args.duration, args.query))
+    finally:
+        if process:
+            process.terminate()
+            process.wait()
+
+    print(f"\n{'mode':<8} {'clients':>7} {'connected':>10} {'errors':>7} {'setup p50':>10} {'setup p99':>10} "
+          f"{'tps':>8} {'query p50':>10} {'query p99':>10}")
+    for mode, runs in report["runs"].items():
+        for row in runs:
+            print(f"{mode:<8} {row['clients']:>7} {row['connected']:>10} {sum(row['errors'].values()):>7} "
+                  f"{fmt_ms(row['setup_ms']['p50']):>8}ms {fmt_ms(row['setup_ms']['p99']):>8}ms {row['tps']:>8.0f} "
+                  f"{fmt_ms(row['query_ms']['p50']):>8}ms {fmt_ms(row['query_ms']['p99']):>8}ms")
+            for message, count in row["errors"].items():
+                print(f"           ❌ {count} × {message}")
+
+    if not args.no_history:
+        record = results.append_history(HISTORY_NAME, report)
+        print(f"📝 Recorded run for {record['commit']}")
+    if not pooler:
+        print("❌ Pooled side not measured")
+        return 1
+    print("✅ Measured direct and pooled connections")
+    return 0
@@ -0,0 +1,83 @@
+"""
+Startup profiling for harness subcommands
+Re-runs a subcommand under `python -X importtime` and summarizes import costs
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+from currijobs_harness.cli import AUTOMATION_DIR
+
+IMPORTTIME_PREFIX = "import time:"
+
+
+def parse_importtime(lines):
+    """Parse -X importtime lines into (name, depth, self_us, cumulative_us) tuples"""
+    entries = []
+    for line in lines:
+        if not line.startswith(IMPORTTIME_PREFIX):
+            continue
+        parts = line[len(IMPORTTIME_PREFIX):].split("|", 2)
+        if len(parts) != 3:
+            continue
+        self_us, cumulative_us, raw_name = parts
+        try:
+            self_us, cumulative_us = int(self_us), int(cumulative_us)
+        except ValueError:
+            continue  # header line
+        # The name column is "| " followed by two spaces per nesting level
+        name = raw_name.rstrip("\n")[1:]
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        entries.append((name.strip(), depth, self_us, cumulative_us))
+    return entries
+
+
+def summarize(entries, top=15):
+    """Return (total_us, top-level imports by cumulative, modules by self time)"""
+    top_level = [e for e in entries if e[1] == 0]
+    total_us = sum(e[3] for e in top_level)
+    by_cumulative = sorted(top_level, key=lambda e: e[3], reverse=True)[:top]
+    by_self = sorted(entries, key=lambda e: e[2], reverse=True)[:top]
+    return total_us, by_cumulative, by_self
+
+
+def print_report(entries, wall_s, top=15):
+    """Print an import-time report"""
+    total_us, by_cumulative, by_self = summarize(entries, top)
+    print("\n⏱️ Startup Profile")
+    print("=" * 50)
+    print(f"Wall time:       {wall_s * 1000:.1f} ms")
+    print(f"Modules:         {len(entries)}")
+    print(f"Import time:     {total_us / 1000:.1f} ms")
+
+    print(f"\n📦 Top {len(by_cumulative)} top-level imports (cumulative)")
+    print("-" * 50)
+    for name, _, _, cumulative_us in by_cumulative:
+        print(f"{cumulative_us / 1000:9.1f} ms  {name}")
+
+    print(f"\n🔬 Top {len(by_self)} modules (self)")
+    print("-" * 50)
+    for name, _, self_us, _ in by_self:
+        print(f"{self_us / 1000:9.1f} ms  {name}")
+
+
+def profile_startup(argv, top=15):
+    """Run the harness with argv under -X importtime and report the costs"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (AUTOMATION_DIR, env.get("PYTHONPATH")) if p)
+    cmd = [sys.executable, "-X", "importtime", "-m", "currijobs_harness"] + list(argv)
+
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, env=env, stderr=subprocess.PIPE, text=True)
+    wall_s = time.perf_counter() - start
+
+    lines = proc.stderr.splitlines()
+    # Pass the command's own stderr through untouched
+    for line in lines:
+        if not line.startswith(IMPORTTIME_PREFIX):
+            print(line, file=sys.stderr)
+
+    print_report(parse_importtime(lines), wall_s, top)
+    return proc.returncode
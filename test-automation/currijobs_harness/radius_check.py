@@ -0,0 +1,173 @@
+"""
+Radius search check for the earthdistance RPCs
+Seeds N tasks (200k by default, a quarter of them open) around San José
+and across Costa Rica, then for each radius:
+  - EXPLAINs get_tasks_nearby() and confirms idx_tasks_location is used
+  - compares results with a brute-force earth_distance scan
+  - times the nearby, by-category and with-offer-counts RPCs
+Everything runs in one transaction that is rolled back at the end.
+
+Usage:
+    python -m currijobs_harness radius-check
+    python -m currijobs_harness radius-check --tasks 1000000 --radii 1,5,25
+"""
+
+import random
+import time
+
+HISTORY_NAME = "radius"
+SEED_PREFIX = "radius"
+INDEX_NAME = "idx_tasks_location"
+
+NEARBY_SQL = "SELECT (task).id, distance_km FROM get_tasks_nearby(%(lat)s, %(lon)s, %(radius)s, %(limit)s)"
+CATEGORY_SQL = (
+    "SELECT (task).id, distance_km FROM get_tasks_nearby_by_category(%(lat)s, %(lon)s, %(category)s, %(radius)s, %(limit)s)"
+)
+OFFERS_SQL = (
+    "SELECT (task).id, distance_km, offer_count FROM get_tasks_nearby_with_offer_counts(%(lat)s, %(lon)s, %(radius)s, %(limit)s)"
+)
+BRUTE_SQL = """
+    SELECT id FROM (
+        SELECT id, earth_distance(ll_to_earth(%(lat)s, %(lon)s), ll_to_earth(latitude, longitude)) AS d
+        FROM tasks WHERE status = 'open'
+    ) t
+    WHERE d <= %(radius)s * 1000.0 ORDER BY d LIMIT %(limit)s
+"""
+
+
+def add_arguments(parser):
+    from currijobs_harness import db
+
+    db.add_dsn_argument(parser)
+    parser.add_argument("--tasks", type=int, default=200_000, help="Tasks to seed (default: 200000)")
+    parser.add_argument("--radii", default="1,5,10,25,50", help="Comma-separated radii in km (default: 1,5,10,25,50)")
+    parser.add_argument("--limit", type=int, default=50, help="Result limit passed to the RPCs; 0 = no limit (default: 50)")
+    parser.add_argument("--samples", type=int, default=50, help="Random origins per radius (default: 50)")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for origins")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+def seed_tasks(cur, seed, count):
+    (owner,) = seed.create_users(cur, 1, prefix=SEED_PREFIX)
+    open_count = count // 4
+    seed.create_tasks_near(cur, owner, open_count * 3 // 5, spread_km=8)
+    seed.create_tasks_near(cur, owner, open_count - open_count * 3 // 5, spread_km=80)
+    seed.create_tasks_near(cur, owner, count - open_count, spread_km=40, status="completed")
+    # A few pending offers so the offer-count RPC has something to count
+    cur.execute(
+        """
+        INSERT INTO offers (task_id, user_id, proposed_reward, message)
+        SELECT t.id, %(owner)s, t.reward, 'Seeded offer'
+        FROM tasks t WHERE t.user_id = %(owner)s AND t.status = 'open' AND random() < 0.1
+        """,
+        {"owner": owner},
+    )
+    cur.execute("ANALYZE tasks")
+    cur.execute("ANALYZE offers")
+
+
+def plan_uses_index(cur, params):
+    cur.execute("EXPLAIN " + NEARBY_SQL, params)
+    return any(INDEX_NAME in row[0] for row in cur.fetchall())
+
+
+def timed(cur, sql, params):
+    start = time.perf_counter()
+    cur.execute(sql, params)
+    rows = cur.fetchall()
+    return rows, (time.perf_counter() - start) * 1000
+
+
+def run(args):
+    from currijobs_harness import db, results, seed, stats
+
+    print("📍 CurriJobs Radius Search Check")
+    print("=" * 50)
+    rng = random.Random(args.seed)
+    radii = [float(r) for r in args.radii.split(",") if r.strip()]
+
+    try:
+        conn = db.connect_for(args, autocommit=False)
+    except Exception as e:
+        print(f"❌ Could not connect to {db.target_for(args)}: {e}")
+        return 1
+
+    problems = []
+    report = {"tasks": args.tasks, "limit": args.limit, "radii": {}}
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT to_regprocedure('get_tasks_nearby(double precision,double precision,double precision,integer)') IS NOT NULL,"
+                " to_regclass(%s) IS NOT NULL",
+                (INDEX_NAME,),
+            )
+            has_rpc, has_index = cur.fetchone()
+            if not has_rpc:
+                print("❌ get_tasks_nearby() not found; apply supabase/migrations first")
+                return 1
+            if not has_index:
+                print(f"❌ {INDEX_NAME} not found; the earthdistance extension and index are required")
+                return 1
+
+            start = time.perf_counter()
+            seed_tasks(cur, seed, args.tasks)
+            report["seed_s"] = round(time.perf_counter() - start, 1)
+            print(f"🌱 Seeded {args.tasks:,} tasks in {report['seed_s']}s")
+
+            for radius in radii:
+                entry = {"nearby_ms": [], "category_ms": [], "offers_ms": [], "rows": []}
+                for i in range(args.samples):
+                    params = {
+                        "lat": seed.SAN_JOSE[0] + rng.gauss(0, 0.05),
+                        "lon": seed.SAN_JOSE[1] + rng.gauss(0, 0.05),
+                        "radius": radius,
+                        "limit": args.limit or None,
+                        "category": rng.choice(seed.TASK_CATEGORIES),
+                    }
+                    if i == 0:
+                        entry["index_used"] = plan_uses_index(cur, params)
+                        got, _ = timed(cur, NEARBY_SQL, params)
+                        expected, _ = timed(cur, BRUTE_SQL, params)
+                        if [r[0] for r in got] != [r[0] for r in expected]:
+                            problems.append(f"{radius:g} km: results differ from brute-force earth_distance")
+                        if any(d > radius + 1e-9 for _, d in got):
+                            problems.append(f"{radius:g} km: row outside radius")
+                    rows, ms = timed(cur, NEARBY_SQL, params)
+                    entry["nearby_ms"].append(ms)
+                    entry["rows"].append(len(rows))
+                    entry["category_ms"].append(timed(cur, CATEGORY_SQL, params)[1])
+                    entry["offers_ms"].append(timed(cur, OFFERS_SQL, params)[1])
+                report["radii"][f"{radius:g}"] = {
+                    "index_used": entry["index_used"],
+                    "rows_p50": stats.percentile(entry["rows"], 50),
+                    "nearby_ms": stats.summarize(entry["nearby_ms"]),
+                    "category_ms": stats.summarize(entry["category_ms"]),
+                    "offers_ms": stats.summarize(entry["offers_ms"]),
+                }
+            # Small radii must be answered from the index; wide ones may legitimately scan
+            smallest = report["radii"].get(f"{min(radii):g}") if radii else None
+            if smallest and not smallest["index_used"]:
+                problems.append(f"{min(radii):g} km search does not use {INDEX_NAME}")
+    finally:
+        conn.rollback()
+        conn.close()
+
+    print(f"\n{'radius':>7} {'index':>6} {'rows':>5} {'nearby p50':>11} {'p95':>7} {'category p50':>13} {'offers p50':>11}")
+    for radius, r in report["radii"].items():
+        print(
+            f"{radius + ' km':>7} {'yes' if r['index_used'] else 'no':>6} {r['rows_p50']:>5} "
+            f"{stats.fmt_ms(r['nearby_ms']['p50']):>11} {stats.fmt_ms(r['nearby_ms']['p95']):>7} "
+            f"{stats.fmt_ms(r['category_ms']['p50']):>13} {stats.fmt_ms(r['offers_ms']['p50']):>11}"
+        )
+    print("🧹 Seed data rolled back")
+
+    if problems:
+        for problem in problems:
+            print(f"❌ {problem}")
+        return 1
+    print(f"✅ Radius RPCs match brute force and use {INDEX_NAME}")
+
+    if not args.no_history:
+        record = results.append_history(HISTORY_NAME, report)
+        print(f"📝 Recorded run for {record['commit']}")
+    return 0
@@ -0,0 +1,84 @@
+"""
+Benchmark result history
+Each benchmark appends one JSON record per run to <results dir>/<name>.jsonl,
+tagged with the git commit, so regressions can be traced to a change
+"""
+
+import json
+import os
+import time
+
+from currijobs_harness.bootstrap import cache_dir
+from currijobs_harness.cli import REPO_ROOT
+
+
+def results_dir():
+    """Directory holding benchmark histories (CURRIJOBS_RESULTS_DIR overrides)"""
+    return os.environ.get("CURRIJOBS_RESULTS_DIR", os.path.join(cache_dir(), "results"))
+
+
+def history_path(name):
+    return os.path.join(results_dir(), f"{name}.jsonl")
+
+
+def git_revision():
+    """Short commit hash of the working tree, with '+dirty' when modified"""
+    import subprocess
+
+    try:
+        rev = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=REPO_ROOT, capture_output=True, text=True,
+        ).stdout.strip()
+        return rev + ("+dirty" if dirty else "")
+    except Exception:
+        return "unknown"
+
+
+def load_history(name):
+    """All records for a benchmark, oldest first"""
+    path = history_path(name)
+    if not os.path.exists(path):
+        return []
+    records = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    return records
+
+
+def last_record(name, **match):
+    """Most recent record whose fields equal every keyword given"""
+    for record in reversed(load_history(name)):
+        if all(record.get(key) == value for key, value in match.items()):
+            return record
+    return None
+
+
+def append_history(name, record):
+    """Stamp a record with commit/time and append it to the benchmark history"""
+    record = dict(record)
+    record.setdefault("commit", git_revision())
+    record.setdefault("timestamp", time.strftime("%Y-%m-%dT%H:%M:%S%z"))
+    os.makedirs(results_dir(), exist_ok=True)
+    with open(history_path(name), "a") as f:
+        f.write(json.dumps(record, sort_keys=True) + "\n")
+    return record
+
+
+def write_json(path, data):
+    """Write a JSON artifact (trace, report) creating parent directories"""
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    return path
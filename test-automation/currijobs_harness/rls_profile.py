@@ -0,0 +1,310 @@
+"""
+RLS policy cost profiler
+Seeds users, tasks, offers, cancellations and payments, then runs the app's
+query shapes (fetchOffersForTask, fetchOffersWithProfilesForTask,
+fetchOfferCountsForTasks, ...) under EXPLAIN ANALYZE three ways:
+
+    bypass     as the table owner, no RLS: the floor for the query itself
+    baseline   as anon / authenticated with the policies from
+               complete-supabase-schema.sql
+    rewritten  same roles after applying the policy migration
+
+Roles get their JWT claims the way PostgREST sets them (SET LOCAL ROLE plus
+request.jwt.claims). Per policy it reports execution time, RLS overhead over
+bypass and how many times correlated SubPlans ran. It fails unless the
+rewrite returns exactly the same rows for every role and shape and is not
+slower. Everything runs in one transaction that is rolled back.
+
+Usage:
+    python -m currijobs_harness rls-profile
+    python -m currijobs_harness rls-profile --tasks 50000 --offers-per-task 20 --runs 7
+"""
+
+import os
+import statistics
+
+from currijobs_harness.cli import REPO_ROOT
+
+HISTORY_NAME = "rls"
+SEED_PREFIX = "rls"
+SCHEMA_PATH = os.path.join(REPO_ROOT, "complete-supabase-schema.sql")
+MIGRATION_PATH = os.path.join(REPO_ROOT, "supabase", "migrations", "20261019000600_rls_policy_rewrites.sql")
+
+# (shape, table, sql) for the list queries the app issues through PostgREST
+SHAPES = [
+    ("offers_for_task", "offers",
+     "SELECT * FROM offers WHERE task_id = %(task_id)s ORDER BY created_at DESC"),
+    ("offers_with_profiles", "offers",
+     "SELECT o.*, to_jsonb(p) AS user_profile FROM offers o LEFT JOIN profiles p ON p.id = o.user_id"
+     " WHERE o.task_id = %(task_id)s ORDER BY o.created_at DESC"),
+    ("offer_counts", "offers",
+     "SELECT task_id, id FROM offers WHERE task_id = ANY(%(task_ids)s)"),
+    ("offers_unfiltered", "offers",
+     "SELECT id FROM offers"),
+    ("cancellations_for_task", "task_cancellations",
+     "SELECT * FROM task_cancellations WHERE task_id = %(task_id)s"),
+    ("cancellations_unfiltered", "task_cancellations",
+     "SELECT id FROM task_cancellations"),
+    ("payments_for_user", "payments",
+     "SELECT * FROM payments WHERE payer_id = %(user_id)s OR payee_id = %(user_id)s ORDER BY created_at DESC"),
+]
+# (label, database role, whose JWT)
+ROLES = [("anon", "anon", None), ("owner", "authenticated", "owner"), ("bidder", "authenticated", "bidder")]
+# Slack for timer noise when checking the rewrite is not slower
+NOISE_MS = 0.3
+
+
+def add_arguments(parser):
+    from currijobs_harness import db
+
+    db.add_dsn_argument(parser)
+    parser.add_argument("--users", type=int, default=1000, help="Users to seed (default: 1000)")
+    parser.add_argument("--tasks", type=int, default=20000, help="Tasks to seed (default: 20000)")
+    parser.add_argument("--offers-per-task", type=int, default=10, help="Offers per task (default: 10)")
+    parser.add_argument("--runs", type=int, default=5, help="EXPLAIN ANALYZE runs per query; median kept (default: 5)")
+    parser.add_argument("--migration", default=MIGRATION_PATH, help="Policy rewrite to profile (default: migration 0600)")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+def policy_names(sql):
+    """[(policy, table)] created by a SQL script"""
+    import re
+
+    return re.findall(r'CREATE POLICY "([^"]+)" ON (\w+)', sql)
+
+
+def baseline_policies(names):
+    """DROP/CREATE statements for the given policies as complete-supabase-schema.sql defines them"""
+    import re
+
+    with open(SCHEMA_PATH, encoding="utf-8") as f:
+        schema = f.read()
+    statements = []
+    for name, table in names:
+        match = re.search(rf'CREATE POLICY "{re.escape(name)}" ON {table}\b[^;]*;', schema)
+        if not match:
+            raise ValueError(f'policy "{name}" not found in {os.path.basename(SCHEMA_PATH)}')
+        statements.append(f'DROP POLICY IF EXISTS "{name}" ON {table};\n{match.group(0)}')
+    return "\n".join(statements)
+
+
+def seed_data(cur, seed, args):
+    """Users owning tasks round-robin, offers from random bidders, some cancellations and payments"""
+    users = seed.create_users(cur, args.users, prefix=SEED_PREFIX)
+    cur.execute(
+        """
+        INSERT INTO tasks (title, description, category, reward, location, latitude, longitude, status, user_id)
+        SELECT 'RLS task ' || g, 'Seeded by currijobs-harness', 'cleaning', 10000, 'San Jose',
+               9.9281, -84.0907, 'open', (%(users)s::uuid[])[1 + g %% %(n)s]
+        FROM generate_series(1, %(count)s) g
+        """,
+        {"users": users, "n": len(users), "count": args.tasks},
+    )
+    cur.execute(
+        """
+        INSERT INTO offers (task_id, user_id, proposed_reward, message)
+        SELECT t.id, (%(users)s::uuid[])[1 + floor(random() * %(n)s)::int], t.reward, 'Seeded offer'
+        FROM tasks t CROSS JOIN generate_series(1, %(per_task)s)
+        WHERE t.user_id = ANY(%(users)s)
+        """,
+        {"users": users, "n": len(users), "per_task": args.offers_per_task},
+    )
+    cur.execute(
+        """
+        INSERT INTO task_cancellations (task_id, cancelled_by, reason)
+        SELECT t.id, CASE WHEN random() < 0.5 THEN t.user_id ELSE (%(users)s::uuid[])[1 + floor(random() * %(n)s)::int] END,
+               'Seeded cancellation'
+        FROM tasks t WHERE t.user_id = ANY(%(users)s) AND random() < 0.1
+        """,
+        {"users": users, "n": len(users)},
+    )
+    cur.execute(
+        """
+        INSERT INTO payments (task_id, payer_id, payee_id, amount, status, payment_method)
+        SELECT t.id, t.user_id, (%(users)s::uuid[])[1 + floor(random() * %(n)s)::int], 10000, 'completed', 'cash'
+        FROM tasks t WHERE t.user_id = ANY(%(users)s) AND random() < 0.5
+        """,
+        {"users": users, "n": len(users)},
+    )
+    for table in ("tasks", "offers", "task_cancellations", "payments", "profiles"):
+        cur.execute(f"ANALYZE {table}")
+
+    # The owner views offers on one of their tasks; the bidder has offers on it
+    owner = users[0]
+    cur.execute(
+        """
+        SELECT t.id, o.user_id FROM tasks t JOIN offers o ON o.task_id = t.id
+        WHERE t.user_id = %s AND o.user_id <> t.user_id LIMIT 1
+        """,
+        (owner,),
+    )
+    task_id, bidder = cur.fetchone()
+    cur.execute(
+        """
+        (SELECT id FROM tasks WHERE user_id = %(owner)s LIMIT 25)
+        UNION ALL
+        (SELECT id FROM tasks WHERE user_id = ANY(%(users)s) AND user_id <> %(owner)s LIMIT 25)
+        """,
+        {"owner": owner, "users": users},
+    )
+    task_ids = [row[0] for row in cur.fetchall()]
+    return {"owner": owner, "bidder": bidder, "task_id": task_id, "task_ids": task_ids}
+
+
+def as_role(cur, role, user_id):
+    """Act like PostgREST does for a request: SET LOCAL ROLE plus JWT claims"""
+    import json
+
+    from psycopg import sql
+
+    claims = {"role": role, **({"sub": str(user_id)} if user_id else {})}
+    cur.execute(sql.SQL("SET LOCAL ROLE {}").format(sql.Identifier(role)))
+    cur.execute("SELECT set_config('request.jwt.claims', %s, true)", (json.dumps(claims),))
+
+
+def reset_role(cur):
+    cur.execute("RESET ROLE")
+    cur.execute("SELECT set_config('request.jwt.claims', '', true)")
+
+
+def subplan_loops(plan):
+    """Total executions of correlated (non-hashed) SubPlans in an EXPLAIN JSON plan"""
+    total = 0
+    if plan.get("Parent Relationship") == "SubPlan" and "hashed" not in plan.get("Subplan Name", ""):
+        total += plan.get("Actual Loops", 0)
+    for child in plan.get("Plans", []):
+        total += subplan_loops(child)
+    return total
+
+
+def profile(cur, sql, params, runs):
+    """Median execution ms, correlated SubPlan loops and a digest of the visible rows"""
+    import hashlib
+
+    cur.execute(sql, params)
+    digest = hashlib.sha1("\n".join(sorted(repr(row) for row in cur.fetchall())).encode()).hexdigest()
+    rows = cur.rowcount
+    timings, loops = [], 0
+    for _ in range(runs):
+        cur.execute("EXPLAIN (ANALYZE, FORMAT JSON) " + sql, params)
+        (result,) = cur.fetchone()
+        timings.append(result[0]["Execution Time"])
+        loops = subplan_loops(result[0]["Plan"])
+    return {"ms": round(statistics.median(timings), 3), "subplan_loops": loops, "rows": rows, "digest": digest}
+
+
+def measure(cur, fixture, runs, bypass):
+    """{shape: {role: result}}; bypass runs each shape once as the table owner"""
+    users = {"owner": fixture["owner"], "bidder": fixture["bidder"], None: None}
+    measured = {}
+    for shape, _, sql in SHAPES:
+        measured[shape] = {}
+        if bypass:
+            params = {"task_id": fixture["task_id"], "task_ids": fixture["task_ids"], "user_id": fixture["owner"]}
+            measured[shape]["bypass"] = profile(cur, sql, params, runs)
+            continue
+        for label, role, who in ROLES:
+            user_id = users[who]
+            params = {"task_id": fixture["task_id"], "task_ids": fixture["task_ids"], "user_id": user_id or fixture["owner"]}
+            as_role(cur, role, user_id)
+            try:
+                measured[shape][label] = profile(cur, sql, params, runs)
+            finally:
+                reset_role(cur)
+    return measured
+
+
+def run(args):
+    import time
+
+    from currijobs_harness import db, results, seed
+
+    print("🛡️  CurriJobs RLS Policy Profiler")
+    print("=" * 50)
+    with open(args.migration, encoding="utf-8") as f:
+        rewrite_sql = f.read()
+    names = policy_names(rewrite_sql)
+    try:
+        baseline_sql = baseline_policies(names)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    try:
+        conn = db.connect_for(args, autocommit=False)
+    except Exception as e:
+        print(f"❌ Could not connect to {db.target_for(args)}: {e}")
+        return 1
+
+    report = {"users": args.users, "tasks": args.tasks, "offers_per_task": args.offers_per_task, "shapes": {}}
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT to_regprocedure('auth.uid()') IS NOT NULL, to_regrole('authenticated') IS NOT NULL")
+            if not all(cur.fetchone()):
+                print("❌ auth.uid() or the anon/authenticated roles are missing; this needs a Supabase-shaped database")
+                return 1
+            start = time.perf_counter()
+            fixture = seed_data(cur, seed, args)
+            report["seed_s"] = round(time.perf_counter() - start, 1)
+            cur.execute("SELECT count(*) FROM offers")
+            print(f"🌱 Seeded {args.users:,} users, {args.tasks:,} tasks, {cur.fetchone()[0]:,} offers in {report['seed_s']}s")
+
+            bypass = measure(cur, fixture, args.runs, bypass=True)
+            cur.execute(baseline_sql)
+            baseline = measure(cur, fixture, args.runs, bypass=False)
+            cur.execute(rewrite_sql)
+            cur.execute("ANALYZE offers; ANALYZE task_cancellations")
+            rewritten = measure(cur, fixture, args.runs, bypass=False)
+    finally:
+        conn.rollback()
+        conn.close()
+
+    problems = []
+    table_policy = {table: name for name, table in names}
+    print(f"\n{'policy / shape':<34} {'role':<7} {'rows':>6} {'no RLS':>9} {'baseline':>10} {'rewritten':>10} {'subplans':>15}")
+    current_table = None
+    for shape, table, _ in SHAPES:
+        if table != current_table:
+            current_table = table
+            print(f"📜 {table_policy.get(table, table)}")
+        floor = bypass[shape]["bypass"]["ms"]
+        report["shapes"][shape] = {"policy": table_policy.get(table), "bypass_ms": floor, "roles": {}}
+        for label, _, _ in ROLES:
+            before, after = baseline[shape][label], rewritten[shape][label]
+            report["shapes"][shape]["roles"][label] = {
+                "rows": after["rows"],
+                "baseline_ms": before["ms"],
+                "rewritten_ms": after["ms"],
+                "baseline_overhead_ms": round(before["ms"] - floor, 3),
+                "rewritten_overhead_ms": round(after["ms"] - floor, 3),
+                "baseline_subplan_loops": before["subplan_loops"],
+                "rewritten_subplan_loops": after["subplan_loops"],
+            }
+            flag = ""
+            if before["digest"] != after["digest"]:
+                problems.append(f"{shape} as {label}: rewritten policy returns different rows")
+                flag = "  ❌ rows differ"
+            elif after["ms"] > before["ms"] * 1.1 + NOISE_MS:
+                problems.append(f"{shape} as {label}: rewritten policy is slower ({before['ms']} → {after['ms']} ms)")
+                flag = "  ❌ slower"
+            print(f"  {shape:<32} {label:<7} {after['rows']:>6} {floor:>7.2f}ms {before['ms']:>8.2f}ms {after['ms']:>8.2f}ms "
+                  f"{before['subplan_loops']:>7} → {after['subplan_loops']:<5}{flag}")
+
+    total_before = sum(r["baseline_ms"] for s in report["shapes"].values() for r in s["roles"].values())
+    total_after = sum(r["rewritten_ms"] for s in report["shapes"].values() for r in s["roles"].values())
+    report["total_baseline_ms"] = round(total_before, 2)
+    report["total_rewritten_ms"] = round(total_after, 2)
+    print(f"\n⏱️  All shapes and roles: {total_before:.1f} ms → {total_after:.1f} ms")
+    print("🧹 Seed data and policy changes rolled back")
+
+    if not args.no_history:
+        record = results.append_history(HISTORY_NAME, report)
+        print(f"📝 Recorded run for {record['commit']}")
+    if problems or total_after >= total_before:
+        for problem in problems:
+            print(f"❌ {problem}")
+        if total_after >= total_before:
+            print("❌ The rewrite is not faster overall")
+        return 1
+    print(f"✅ {os.path.basename(args.migration)} returns the same rows and is faster")
+    return 0
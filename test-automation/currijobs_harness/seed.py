@@ -0,0 +1,147 @@
+"""
+Set-based seeding helpers for database benchmarks
+Everything is generated server-side with generate_series so seeding a
+million rows is one statement, not a million round trips. Callers run
+inside a transaction and roll it back when done.
+"""
+
+SEED_EMAIL_DOMAIN = "bench.currijobs.test"
+
+
+def create_users(cur, count, prefix="bench"):
+    """Insert count auth users (profiles come from the on_auth_user_created trigger); returns their ids"""
+    cur.execute(
+        """
+        INSERT INTO auth.users (id, email, raw_user_meta_data)
+        SELECT gen_random_uuid(),
+               %(prefix)s || '-' || g || '@' || %(domain)s,
+               jsonb_build_object('full_name', initcap(%(prefix)s) || ' ' || g)
+        FROM generate_series(1, %(count)s) g
+        RETURNING id
+        """,
+        {"prefix": prefix, "domain": SEED_EMAIL_DOMAIN, "count": count},
+    )
+    ids = [row[0] for row in cur.fetchall()]
+    # Projects without the signup trigger still need a profile row
+    cur.execute(
+        """
+        INSERT INTO profiles (id, email, full_name)
+        SELECT u.id, u.email, u.raw_user_meta_data ->> 'full_name'
+        FROM auth.users u
+        WHERE u.email LIKE %(prefix)s || '-%%@' || %(domain)s
+        ON CONFLICT (id) DO NOTHING
+        """,
+        {"prefix": prefix, "domain": SEED_EMAIL_DOMAIN},
+    )
+    return ids
+
+
+def create_task(cur, owner_id, status="completed", assigned_to=None, title="Bench task"):
+    cur.execute(
+        """
+        INSERT INTO tasks (title, description, category, reward, location, latitude, longitude, status, user_id, assigned_to)
+        VALUES (%s, 'Seeded by currijobs-harness', 'other', 10000, 'San Jose', 9.9281, -84.0907, %s, %s, %s)
+        RETURNING id
+        """,
+        (title, status, owner_id, assigned_to),
+    )
+    return cur.fetchone()[0]
+
+
+def create_payments(cur, task_id, payer_id, payee_id, count):
+    cur.execute(
+        """
+        INSERT INTO payments (task_id, payer_id, payee_id, amount, status, payment_method)
+        SELECT %s, %s, %s, 10000, 'completed', 'cash' FROM generate_series(1, %s)
+        """,
+        (task_id, payer_id, payee_id, count),
+    )
+
+
+def create_reviews(cur, task_id, reviewer_id, reviewed_id, count):
+    cur.execute(
+        """
+        INSERT INTO reviews (task_id, reviewer_id, reviewed_id, rating, comment)
+        SELECT %s, %s, %s, 3 + g %% 3, 'Seeded review' FROM generate_series(1, %s) g
+        """,
+        (task_id, reviewer_id, reviewed_id, count),
+    )
+
+
+# San José centre; most seeded tasks cluster around it like production traffic
+SAN_JOSE = (9.9281, -84.0907)
+TASK_CATEGORIES = [
+    "plumbing", "electrician", "carpentry", "painting", "appliance_repair", "cleaning",
+    "laundry_ironing", "cooking", "grocery_shopping", "pet_care", "gardening", "moving_help",
+    "trash_removal", "window_washing", "babysitting", "elderly_care", "tutoring",
+    "delivery_errands", "tech_support", "photography",
+]
+
+
+def create_tasks_near(cur, owner_id, count, center=SAN_JOSE, spread_km=5.0, status="open"):
+    """Insert count tasks normally distributed around center (sigma = spread_km)"""
+    cur.execute(
+        """
+        INSERT INTO tasks (title, description, category, reward, location, latitude, longitude, status, user_id)
+        SELECT 'Bench task ' || g, 'Seeded by currijobs-harness',
+               (%(categories)s::text[])[1 + floor(random() * %(ncat)s)::int],
+               1000 * (5 + floor(random() * 95)), 'San Jose',
+               %(lat)s + sqrt(-2 * ln(1 - random())) * cos(2 * pi() * random()) * %(spread)s / 111.0,
+               %(lon)s + sqrt(-2 * ln(1 - random())) * cos(2 * pi() * random()) * %(spread)s / (111.0 * cos(radians(%(lat)s))),
+               %(status)s, %(owner)s
+        FROM generate_series(1, %(count)s) g
+        """,
+        {
+            "categories": TASK_CATEGORIES, "ncat": len(TASK_CATEGORIES),
+            "lat": center[0], "lon": center[1], "spread": spread_km,
+            "status": status, "owner": owner_id, "count": count,
+        },
+    )
+
+
+def create_marketplace(cur, users, tasks, prefix="bench"):
+    """Users, tasks in every status over the last 180 days, offers, payments and reviews; returns (user ids, task ids)"""
+    ids = create_users(cur, users, prefix=prefix)
+    cur.execute(
+        """
+        INSERT INTO tasks (title, description, category, reward, location, latitude, longitude, status, user_id, assigned_to,
+                           created_at)
+        SELECT initcap(%(prefix)s) || ' task ' || g, 'Seeded by currijobs-harness',
+               (%(categories)s::text[])[1 + floor(random() * %(ncat)s)::int], 10000, 'San Jose', 9.9281, -84.0907,
+               s.status, (%(users)s::uuid[])[1 + floor(random() * %(n)s)::int],
+               CASE WHEN s.status <> 'open' THEN (%(users)s::uuid[])[1 + floor(random() * %(n)s)::int] END,
+               now() - random() * interval '180 days'
+        FROM generate_series(1, %(count)s) g,
+             LATERAL (SELECT CASE WHEN r < 0.3 THEN 'open' WHEN r < 0.45 THEN 'assigned' WHEN r < 0.5 THEN 'cancelled'
+                                  ELSE 'completed' END AS status FROM (SELECT random() + g * 0 AS r) x) s
+        """,
+        {"categories": TASK_CATEGORIES, "ncat": len(TASK_CATEGORIES), "users": ids, "n": len(ids), "count": tasks, "prefix": prefix},
+    )
+    cur.execute(
+        """
+        INSERT INTO offers (task_id, user_id, proposed_reward, message, created_at)
+        SELECT t.id, (%(users)s::uuid[])[1 + floor(random() * %(n)s)::int], t.reward, 'Seeded offer',
+               t.created_at + random() * interval '2 days'
+        FROM tasks t CROSS JOIN generate_series(1, 3)
+        WHERE t.user_id = ANY(%(users)s)
+        """,
+        {"users": ids, "n": len(ids)},
+    )
+    cur.execute(
+        """
+        INSERT INTO payments (task_id, payer_id, payee_id, amount, status, payment_method, created_at)
+        SELECT id, user_id, assigned_to, reward, 'completed', 'cash', created_at + random() * interval '7 days'
+        FROM tasks WHERE user_id = ANY(%(users)s) AND status = 'completed'
+        """,
+        {"users": ids},
+    )
+    cur.execute(
+        """
+        INSERT INTO reviews (task_id, reviewer_id, reviewed_id, rating, comment, created_at)
+        SELECT task_id, payer_id, payee_id, 3 + floor(random() * 3)::int, 'Seeded review', created_at + interval '1 day'
+        FROM payments WHERE payer_id = ANY(%(users)s) AND random() < 0.7
+        """,
+        {"users": ids},
+    )
+    cur.execute("SELECT id FROM tasks WHERE user_id = ANY(%s)", (ids,))
+    return ids, [row[0] for row in cur.fetchall()]
@@ -0,0 +1,444 @@
+"""
+Multi-user marketplace simulator
+Spawns thousands of virtual users as asyncio tasks. Each one walks a Markov
+chain over the real app flows (create task, browse nearby, make offer,
+assign, finish, pay, review, worker cancel) against PostgREST, using the
+same tables and filters as lib/database.ts
+
+State transitions use conditional updates (e.g. PATCH ... status=eq.open),
+so two users racing for the same task show up as contention failures
+instead of silently overwriting each other.
+
+Usage:
+    python -m currijobs_harness simulate --users 2000 --duration 120
+    python -m currijobs_harness simulate --users 500 --dsn postgresql://... (adds DB counters)
+"""
+
+import asyncio
+import random
+import time
+
+from currijobs_harness.db import DEFAULT_POSTGREST_URL, add_dsn_argument, dsn_for, pooled_for, postgrest_headers
+
+HISTORY_NAME = "simulate"
+
+CATEGORIES = [
+    "plumbing", "electrician", "carpentry", "painting", "cleaning",
+    "gardening", "moving_help", "pet_care", "tutoring", "delivery_errands",
+]
+SAN_JOSE = (9.9281, -84.0907)
+
+# Next-state probabilities after each action. Poster actions (assign, finish,
+# pay, review) and worker actions (browse, offer, cancel) share one chain
+# because every real user can do both.
+TRANSITIONS = {
+    "idle":   {"browse": 0.40, "create": 0.20, "assign": 0.15, "finish": 0.10, "pay": 0.08, "review": 0.05, "cancel": 0.02},
+    "create": {"idle": 0.50, "browse": 0.30, "create": 0.20},
+    "browse": {"offer": 0.55, "browse": 0.20, "idle": 0.25},
+    "offer":  {"browse": 0.40, "idle": 0.50, "offer": 0.10},
+    "assign": {"idle": 0.60, "finish": 0.20, "browse": 0.20},
+    "finish": {"pay": 0.80, "idle": 0.20},
+    "pay":    {"review": 0.85, "idle": 0.15},
+    "review": {"idle": 0.70, "create": 0.30},
+    "cancel": {"idle": 1.00},
+}
+
+
+class SimTask:
+    __slots__ = ("id", "owner", "status", "assigned_to", "reward", "created_at", "api_ms", "paid_to")
+
+    def __init__(self, task_id, owner, reward):
+        self.id = task_id
+        self.owner = owner
+        self.status = "open"
+        self.assigned_to = None
+        self.reward = reward
+        self.created_at = time.perf_counter()
+        self.api_ms = 0.0
+        self.paid_to = None
+
+
+class Metrics:
+    def __init__(self):
+        self.latency = {}        # action -> [ms]
+        self.ok = {}
+        self.failed = {}
+        self.contention = {}     # action -> conditional updates that matched nothing
+        self.http_errors = {}    # status -> count
+        self.requests = 0
+        self.writes = 0
+        self.flow_wall_ms = []
+        self.flow_api_ms = []
+
+    def record(self, action, ms, ok=True, contention=False):
+        self.latency.setdefault(action, []).append(ms)
+        bucket = self.ok if ok else self.failed
+        bucket[action] = bucket.get(action, 0) + 1
+        if contention:
+            self.contention[action] = self.contention.get(action, 0) + 1
+
+
+class Marketplace:
+    """Shared view of simulated tasks; the DB stays the source of truth"""
+
+    def __init__(self, session, base_url, headers, metrics, rng):
+        self.session = session
+        self.base_url = base_url.rstrip("/")
+        self.headers = headers
+        self.metrics = metrics
+        self.rng = rng
+        self.tasks = {}
+
+    async def request(self, method, path, params=None, json=None, write=False):
+        """One PostgREST call; returns (status, body, elapsed_ms)"""
+        start = time.perf_counter()
+        async with self.session.request(
+            method, f"{self.base_url}/{path}", params=params, json=json, headers=self.headers
+        ) as resp:
+            body = await resp.json(content_type=None) if resp.status != 204 else None
+            status = resp.status
+        elapsed = (time.perf_counter() - start) * 1000
+        self.metrics.requests += 1
+        if write:
+            self.metrics.writes += 1
+        if status >= 400:
+            self.metrics.http_errors[status] = self.metrics.http_errors.get(status, 0) + 1
+        return status, body, elapsed
+
+    def own_tasks(self, user, status):
+        return [t for t in self.tasks.values() if t.owner == user and t.status == status]
+
+
+class VirtualUser:
+    def __init__(self, user_id, market, think_ms, rng):
+        self.id = user_id
+        self.market = market
+        self.think_ms = think_ms
+        self.rng = rng
+        self.location = (
+            SAN_JOSE[0] + rng.uniform(-0.08, 0.08),
+            SAN_JOSE[1] + rng.uniform(-0.08, 0.08),
+        )
+        self.candidates = []
+        self.paid = []
+
+    async def live(self, deadline):
+        state = "idle"
+        while time.perf_counter() < deadline:
+            await asyncio.sleep(self.rng.expovariate(1000.0 / self.think_ms) if self.think_ms else 0)
+            state = self.next_state(state)
+            if state == "idle":
+                continue
+            try:
+                await getattr(self, f"do_{state}")()
+            except Exception:
+                self.market.metrics.record(state, 0.0, ok=False)
+
+    def next_state(self, state):
+        row = TRANSITIONS[state]
+        pick, acc = self.rng.random(), 0.0
+        for nxt, p in row.items():
+            acc += p
+            if pick <= acc:
+                return nxt
+        return "idle"
+
+    async def do_create(self):
+        m = self.market
+        reward = self.rng.choice([5000, 8000, 10000, 15000, 25000])
+        lat = self.location[0] + self.rng.uniform(-0.02, 0.02)
+        lon = self.location[1] + self.rng.uniform(-0.02, 0.02)
+        status, body, ms = await m.request("POST", "tasks", json={
+            "title": f"Sim task {self.rng.randrange(1 << 30)}",
+            "description": "Generated by the marketplace simulator",
+            "category": self.rng.choice(CATEGORIES),
+            "reward": reward,
+            "location": "San José",
+            "latitude": round(lat, 6),
+            "longitude": round(lon, 6),
+            "status": "open",
+            "user_id": self.id,
+        }, write=True)
+        ok = status < 300 and body
+        m.metrics.record("create", ms, ok=bool(ok))
+        if ok:
+            task = SimTask(body[0]["id"], self.id, reward)
+            task.api_ms += ms
+            m.tasks[task.id] = task
+
+    async def do_browse(self):
+        m = self.market
+        lat, lon = self.location
+        d = 0.045  # ~5 km box, filtered the way fetchTasksNearby filters
+        status, body, ms = await m.request("GET", "tasks", params=[
+            ("select", "id,user_id,reward,latitude,longitude"),
+            ("status", "eq.open"),
+            ("latitude", f"gte.{lat - d}"), ("latitude", f"lte.{lat + d}"),
+            ("longitude", f"gte.{lon - d}"), ("longitude", f"lte.{lon + d}"),
+            ("order", "created_at.desc"),
+            ("limit", "50"),
+        ])
+        ok = status < 300
+        m.metrics.record("browse", ms, ok=ok)
+        if ok:
+            self.candidates = [r for r in (body or []) if r["user_id"] != self.id]
+
+    async def do_offer(self):
+        m = self.market
+        if not self.candidates:
+            return
+        row = self.rng.choice(self.candidates)
+        status, _, ms = await m.request("POST", "offers", json={
+            "task_id": row["id"],
+            "user_id": self.id,
+            "proposed_reward": row["reward"],
+            "message": "I can do it today",
+            "status": "pending",
+        }, write=True)
+        m.metrics.record("offer", ms, ok=status < 300)
+        task = m.tasks.get(row["id"])
+        if task:
+            task.api_ms += ms
+
+    async def do_assign(self):
+        m = self.market
+        open_tasks = m.own_tasks(self.id, "open")
+        if not open_tasks:
+            return
+        task = self.rng.choice(open_tasks)
+        status, offers, ms1 = await m.request("GET", "offers", params={
+            "select": "id,user_id", "task_id": f"eq.{task.id}", "status": "eq.pending", "limit": "5",
+        })
+        task.api_ms += ms1
+        if status >= 300 or not offers:
+            m.metrics.record("assign", ms1, ok=status < 300)
+            return
+        offer = self.rng.choice(offers)
+        # Only an open task can be assigned: a concurrent change makes this match 0 rows
+        status, rows, ms2 = await m.request("PATCH", "tasks", params={
+            "id": f"eq.{task.id}", "status": "eq.open",
+        }, json={"assigned_to": offer["user_id"], "status": "in_progress"}, write=True)
+        task.api_ms += ms2
+        won = status < 300 and bool(rows)
+        m.metrics.record("assign", ms1 + ms2, ok=won, contention=status < 300 and not rows)
+        if won:
+            task.status, task.assigned_to = "in_progress", offer["user_id"]
+            await m.request("PATCH", "offers", params={"id": f"eq.{offer['id']}"}, json={"status": "accepted"}, write=True)
+
+    async def do_finish(self):
+        m = self.market
+        active = m.own_tasks(self.id, "in_progress")
+        if not active:
+            return
+        task = self.rng.choice(active)
+        status, rows, ms = await m.request("PATCH", "tasks", params={
+            "id": f"eq.{task.id}", "status": "eq.in_progress",
+        }, json={"status": "completed"}, write=True)
+        task.api_ms += ms
+        won = status < 300 and bool(rows)
+        m.metrics.record("finish", ms, ok=won, contention=status < 300 and not rows)
+        if won:
+            task.status = "completed"
+        elif status < 300:
+            # Worker cancelled in between; resync from our local view
+            task.status, task.assigned_to = "open", None
+
+    async def do_pay(self):
+        m = self.market
+        done = [t for t in m.own_tasks(self.id, "completed") if t.paid_to is None and t.assigned_to]
+        if not done:
+            return
+        task = self.rng.choice(done)
+        status, _, ms = await m.request("POST", "payments", json={
+            "task_id": task.id,
+            "payer_id": self.id,
+            "payee_id": task.assigned_to,
+            "amount": task.reward,
+            "currency": "CRC",
+            "status": "completed",
+            "payment_method": "cash",
+        }, write=True)
+        task.api_ms += ms
+        m.metrics.record("pay", ms, ok=status < 300)
+        if status < 300:
+            task.paid_to = task.assigned_to
+            self.paid.append(task)
+
+    async def do_review(self):
+        m = self.market
+        if not self.paid:
+            return
+        task = self.paid.pop(self.rng.randrange(len(self.paid)))
+        status, _, ms = await m.request("POST", "reviews", json={
+            "task_id": task.id,
+            "reviewer_id": self.id,
+            "reviewed_id": task.paid_to,
+            "rating": self.rng.choice([3, 4, 5, 5, 5]),
+            "comment": "Simulated review",
+        }, write=True)
+        task.api_ms += ms
+        m.metrics.record("review", ms, ok=status < 300)
+        if status < 300:
+            task.status = "reviewed"
+            m.metrics.flow_wall_ms.append((time.perf_counter() - task.created_at) * 1000)
+            m.metrics.flow_api_ms.append(task.api_ms)
+
+    async def do_cancel(self):
+        m = self.market
+        mine = [t for t in m.tasks.values() if t.assigned_to == self.id and t.status == "in_progress"]
+        if not mine:
+            return
+        task = self.rng.choice(mine)
+        # Mirrors cancelAssignedTaskByWorker, but conditional on still being ours
+        status, rows, ms = await m.request("PATCH", "tasks", params={
+            "id": f"eq.{task.id}", "assigned_to": f"eq.{self.id}", "status": "eq.in_progress",
+        }, json={"assigned_to": None, "status": "open"}, write=True)
+        won = status < 300 and bool(rows)
+        m.metrics.record("cancel", ms, ok=won, contention=status < 300 and not rows)
+        if won:
+            task.status, task.assigned_to = "open", None
+
+
+def db_counters(dsn, pooled=None):
+    """Committed transactions and tuple writes for the current database"""
+    from currijobs_harness.db import connect
+
+    with connect(dsn, pooled=pooled) as conn:
+        row = conn.execute(
+            "SELECT xact_commit, xact_rollback, tup_inserted, tup_updated, tup_deleted, tup_fetched "
+            "FROM pg_stat_database WHERE datname = current_database()"
+        ).fetchone()
+    keys = ("xact_commit", "xact_rollback", "tup_inserted", "tup_updated", "tup_deleted", "tup_fetched")
+    return dict(zip(keys, row))
+
+
+async def load_user_ids(session, base_url, headers, count):
+    """Existing profile ids (tasks.user_id references real users)"""
+    async with session.get(
+        f"{base_url.rstrip('/')}/profiles", params={"select": "id", "limit": str(count)}, headers=headers
+    ) as resp:
+        if resp.status >= 300:
+            return []
+        return [r["id"] for r in await resp.json(content_type=None)]
+
+
+async def simulate(args):
+    import aiohttp
+    import uuid
+
+    rng = random.Random(args.seed)
+    metrics = Metrics()
+    headers = postgrest_headers(args.token)
+    connector = aiohttp.TCPConnector(limit=args.connections)
+    timeout = aiohttp.ClientTimeout(total=args.request_timeout)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        ids = await load_user_ids(session, args.url, headers, args.users)
+        if not ids:
+            print("⚠️ No profiles found; using random user ids (requires FK-free local schema)")
+            ids = [str(uuid.uuid4()) for _ in range(args.users)]
+        market = Marketplace(session, args.url, headers, metrics, rng)
+        users = [
+            VirtualUser(ids[i % len(ids)], market, args.think_ms, random.Random(rng.random()))
+            for i in range(args.users)
+        ]
+        deadline = time.perf_counter() + args.duration
+        # Stagger arrivals over the ramp-up window
+        async def arrive(user, delay):
+            await asyncio.sleep(delay)
+            await user.live(deadline)
+
+        await asyncio.gather(*(arrive(u, rng.uniform(0, args.ramp_up)) for u in users))
+    return metrics, market
+
+
+def print_report(metrics, elapsed_s, db_delta):
+    from currijobs_harness.stats import fmt_ms, summarize
+
+    print("\n📊 Action latency (ms)")
+    print("-" * 78)
+    print(f"{'action':<8} {'ok':>7} {'failed':>7} {'contend':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>9}")
+    for action in ("create", "browse", "offer", "assign", "finish", "pay", "review", "cancel"):
+        s = summarize(metrics.latency.get(action, []))
+        print(f"{action:<8} {metrics.ok.get(action, 0):>7} {metrics.failed.get(action, 0):>7} "
+              f"{metrics.contention.get(action, 0):>8} {fmt_ms(s['p50']):>8} {fmt_ms(s['p95']):>8} "
+              f"{fmt_ms(s['p99']):>8} {fmt_ms(s['max']):>9}")
+
+    wall, api = summarize(metrics.flow_wall_ms), summarize(metrics.flow_api_ms)
+    print("\n🔁 End-to-end flows (create → review)")
+    print("-" * 50)
+    print(f"Completed flows:      {wall['count']}")
+    print(f"Flow wall time p50/p95: {fmt_ms(wall['p50'])} / {fmt_ms(wall['p95'])} ms")
+    # Sum of every request touching the task, by poster and workers alike
+    print(f"Flow API time p50/p95 (all actors): {fmt_ms(api['p50'])} / {fmt_ms(api['p95'])} ms")
+
+    print("\n⚡ Throughput")
+    print("-" * 50)
+    print(f"Requests:  {metrics.requests} ({metrics.requests / elapsed_s:.1f}/s)")
+    print(f"Writes:    {metrics.writes} ({metrics.writes / elapsed_s:.1f}/s)")
+    print(f"Contention failures: {sum(metrics.contention.values())}")
+    if metrics.http_errors:
+        print(f"HTTP errors: {dict(sorted(metrics.http_errors.items()))}")
+    if db_delta:
+        print(f"DB commits: {db_delta['xact_commit']} ({db_delta['xact_commit'] / elapsed_s:.1f} TPS), "
+              f"rollbacks: {db_delta['xact_rollback']}")
+        print(f"DB tuples: +{db_delta['tup_inserted']} ins, {db_delta['tup_updated']} upd, "
+              f"{db_delta['tup_fetched']} fetched")
+
+
+def add_arguments(parser):
+    parser.add_argument("--url", default=DEFAULT_POSTGREST_URL, help="PostgREST URL (EXPO_PUBLIC_POSTGREST_URL)")
+    parser.add_argument("--token", default=None, help="JWT sent as Bearer token (optional)")
+    parser.add_argument("--users", type=int, default=1000, help="Virtual users (default: 1000)")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds to run (default: 60)")
+    parser.add_argument("--ramp-up", type=float, default=10, help="Seconds to spread user arrival over (default: 10)")
+    parser.add_argument("--think-ms", type=float, default=500, help="Mean think time between actions (default: 500)")
+    parser.add_argument("--connections", type=int, default=100, help="Max concurrent HTTP connections (default: 100)")
+    parser.add_argument("--request-timeout", type=float, default=30, help="Per-request timeout in seconds")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for a reproducible run")
+    add_dsn_argument(parser)
+    parser.add_argument("--no-db-stats", action="store_true", help="Skip pg_stat_database sampling")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+def run(args):
+    from currijobs_harness import results
+    from currijobs_harness.stats import summarize
+
+    print("🚀 CurriJobs Marketplace Simulator")
+    print("=" * 50)
+    print(f"👥 {args.users} users for {args.duration:.0f}s against {args.url}")
+
+    before = None
+    if not args.no_db_stats:
+        try:
+            before = db_counters(dsn_for(args), pooled_for(args))
+        except Exception as e:
+            print(f"⚠️ DB stats unavailable ({e}); reporting HTTP throughput only")
+
+    start = time.perf_counter()
+    try:
+        metrics, _ = asyncio.run(simulate(args))
+    except Exception as e:
+        print(f"❌ Simulation failed: {e}")
+        return 1
+    elapsed = time.perf_counter() - start
+
+    db_delta = None
+    if before is not None:
+        after = db_counters(dsn_for(args), pooled_for(args))
+        db_delta = {k: after[k] - before[k] for k in before}
+
+    print_report(metrics, elapsed, db_delta)
+
+    if not args.no_history:
+        results.append_history(HISTORY_NAME, {
+            "users": args.users,
+            "duration_s": args.duration,
+            "requests_per_s": round(metrics.requests / elapsed, 1),
+            "writes_per_s": round(metrics.writes / elapsed, 1),
+            "contention": metrics.contention,
+            "flows": summarize(metrics.flow_wall_ms),
+            "actions": {a: summarize(v) for a, v in metrics.latency.items()},
+            "db": db_delta,
+        })
+    return 0
@@ -0,0 +1,120 @@
+"""
+Source map size attribution
+Decodes the VLQ `mappings` of a bundle's source map and attributes every
+generated byte to the original source (and npm package) it came from
+"""
+
+BASE64 = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+BASE64_VALUES = {c: i for i, c in enumerate(BASE64)}
+UNMAPPED = "<unmapped>"
+
+
+def decode_vlq(segment):
+    """Decode one base64 VLQ segment into a list of ints"""
+    values = []
+    value = shift = 0
+    for char in segment:
+        digit = BASE64_VALUES[char]
+        value += (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+            continue
+        values.append(-(value >> 1) if value & 1 else value >> 1)
+        value = shift = 0
+    return values
+
+
+def utf16_to_index(line):
+    """Map source-map columns (UTF-16 code units) to str indexes; None when they coincide"""
+    if line.isascii() or all(ord(c) <= 0xFFFF for c in line):
+        return None
+    index = []
+    for i, char in enumerate(line):
+        index.extend([i, i] if ord(char) > 0xFFFF else [i])
+    index.append(len(line))
+    return lambda column: index[min(column, len(index) - 1)]
+
+
+def attribute_sizes(bundle_text, source_map):
+    """Return {source path: generated byte count} for a bundle and its map"""
+    if "sections" in source_map:
+        raise ValueError("Indexed source maps (sections) are not supported")
+
+    sources = source_map.get("sources", [])
+    lines = bundle_text.split("\n")
+    sizes = {}
+    source_index = 0
+
+    for line_no, mapping_line in enumerate(source_map.get("mappings", "").split(";")):
+        line = lines[line_no] if line_no < len(lines) else ""
+        # Generated column resets each line; source fields are deltas across lines
+        column = 0
+        spans = []
+        for segment in mapping_line.split(","):
+            if not segment:
+                continue
+            fields = decode_vlq(segment)
+            column += fields[0]
+            if len(fields) >= 4:
+                source_index += fields[1]
+                spans.append((column, source_index))
+            else:
+                spans.append((column, None))
+
+        # Columns count UTF-16 code units; emoji and other non-BMP characters take two
+        to_index = utf16_to_index(line)
+        if to_index:
+            spans = [(to_index(start), src) for start, src in spans]
+
+        if not spans:
+            if line:
+                sizes[UNMAPPED] = sizes.get(UNMAPPED, 0) + len(line.encode()) + 1
+            continue
+
+        if spans[0][0] > 0:
+            head = len(line[:spans[0][0]].encode())
+            sizes[UNMAPPED] = sizes.get(UNMAPPED, 0) + head
+        for i, (start, src) in enumerate(spans):
+            end = spans[i + 1][0] if i + 1 < len(spans) else len(line) + 1  # + newline
+            key = sources[src] if src is not None and src < len(sources) else UNMAPPED
+            sizes[key] = sizes.get(key, 0) + len(line[start:end].encode()) + (1 if end > len(line) else 0)
+
+    return sizes
+
+
+def module_name(source, project_root=None):
+    """Group a source path: npm package for node_modules, repo-relative path otherwise"""
+    path = source.replace("\\", "/")
+    marker = "node_modules/"
+    idx = path.rfind(marker)
+    if idx != -1:
+        parts = path[idx + len(marker):].split("/")
+        if parts[0].startswith("@") and len(parts) > 1:
+            return f"{parts[0]}/{parts[1]}"
+        return parts[0]
+    if project_root:
+        root = project_root.replace("\\", "/").rstrip("/") + "/"
+        if path.startswith(root):
+            return path[len(root):]
+    return path.lstrip("/")
+
+
+def group_sizes(sizes, project_root=None):
+    """Collapse per-source sizes into per-module sizes"""
+    grouped = {}
+    for source, size in sizes.items():
+        name = source if source == UNMAPPED else module_name(source, project_root)
+        grouped[name] = grouped.get(name, 0) + size
+    return grouped
+
+
+def top_modules(grouped, top=20):
+    """Largest modules first as [(name, bytes)]"""
+    return sorted(grouped.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def format_bytes(n):
+    for unit in ("B", "KB", "MB"):
+        if abs(n) < 1024 or unit == "MB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024.0
@@ -0,0 +1,146 @@
+"""
+Route-level cold-start profiler for the Expo web build
+Loads each entry route in a fresh Chrome profile with DevTools tracing on,
+waits for the first interactive frame instead of sleeping, and breaks the
+startup down into compile, module init, script, render and network time
+
+Usage:
+    python -m currijobs_harness startup-profile
+    python -m currijobs_harness startup-profile --routes /,/welcome,/login --runs 5 --out traces/
+"""
+
+import os
+import statistics
+
+from currijobs_harness.browser import DEFAULT_APP_URL
+
+HISTORY_NAME = "startup"
+DEFAULT_ROUTES = "/,/welcome,/login,/onboarding"
+BREAKDOWN_ORDER = [
+    "script_compile", "module_init", "script_execution",
+    "render", "network_wait", "other", "idle",
+]
+
+
+def add_arguments(parser):
+    parser.add_argument("--url", default=DEFAULT_APP_URL, help="App base URL (default: http://localhost:8081)")
+    parser.add_argument("--routes", default=DEFAULT_ROUTES, help=f"Comma-separated routes (default: {DEFAULT_ROUTES})")
+    parser.add_argument("--runs", type=int, default=3, help="Cold runs per route (default: 3)")
+    parser.add_argument("--timeout", type=int, default=60, help="Seconds to wait for interactivity (default: 60)")
+    parser.add_argument("--out", default=None, help="Directory for per-run trace files (default: results dir)")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+def route_slug(route):
+    return route.strip("/").replace("/", "_") or "root"
+
+
+def profile_route(url, args, driver_options=None, setup=None, collect=None):
+    """One cold load of url; returns the analysis dict plus the raw trace events
+
+    setup(driver) runs before navigation (device emulation, network
+    throttling) for callers that build matrices on top of this profiler.
+    collect(driver) runs once the page is interactive; its result is
+    stored under analysis["collected"].
+    """
+    from currijobs_harness import browser, trace_analysis
+
+    driver = browser.make_driver(headless=not args.headed, trace=True, **(driver_options or {}))
+    try:
+        if setup:
+            setup(driver)
+        driver.get(url)
+        interactive_ms = browser.wait_for_interactive(driver, args.timeout)
+        timing = browser.navigation_timing(driver)
+        collected = collect(driver) if collect and interactive_ms is not None else None
+        events, _ = browser.read_performance_log(driver)
+    finally:
+        driver.quit()
+
+    if interactive_ms is None:
+        raise RuntimeError(f"not interactive after {args.timeout}s")
+    analysis = trace_analysis.breakdown(events, interactive_ms, url_prefix=args.url)
+    analysis["interactive_ms"] = interactive_ms
+    analysis["navigation"] = timing
+    if collect:
+        analysis["collected"] = collected
+    return analysis, events
+
+
+def summarize_runs(runs):
+    """Median of each metric across runs"""
+    keys = runs[0]["breakdown_ms"].keys()
+    summary = {
+        "interactive_ms": statistics.median(r["interactive_ms"] for r in runs),
+        "breakdown_ms": {k: round(statistics.median(r["breakdown_ms"][k] for r in runs), 1) for k in keys},
+    }
+    fcp = [r["navigation"].get("first_contentful_paint_ms") for r in runs if r["navigation"]]
+    fcp = [v for v in fcp if v is not None]
+    if fcp:
+        summary["first_contentful_paint_ms"] = statistics.median(fcp)
+    return summary
+
+
+def print_route(route, summary, last_run):
+    print(f"\n🛣️ {route}")
+    print("-" * 50)
+    print(f"First interactive frame: {summary['interactive_ms']:.0f} ms")
+    if summary.get("first_contentful_paint_ms") is not None:
+        print(f"First contentful paint:  {summary['first_contentful_paint_ms']:.0f} ms")
+    for key in BREAKDOWN_ORDER:
+        value = summary["breakdown_ms"].get(key, 0)
+        share = value * 100 / summary["interactive_ms"] if summary["interactive_ms"] else 0
+        print(f"  {key:<17} {value:8.0f} ms  {share:5.1f}%")
+
+    slow = [r for r in last_run["requests"] if r["kind"] in ("font", "auth", "api", "bundle")][:5]
+    if slow:
+        print("  Slowest startup requests:")
+        for r in slow:
+            print(f"    {r['duration_ms']:7.0f} ms  [{r['kind']}] {r['url'][:80]}")
+
+
+def run(args):
+    from currijobs_harness import metro, results, trace_analysis
+
+    print("🚀 CurriJobs Cold-Start Profiler")
+    print("=" * 50)
+
+    if not metro.is_running(args.url):
+        print(f"❌ Expo web server not running at {args.url}")
+        print("Please run: npm run web")
+        return 1
+
+    out_dir = args.out or os.path.join(results.results_dir(), "traces")
+    routes = [r.strip() for r in args.routes.split(",") if r.strip()]
+    summaries = {}
+
+    for route in routes:
+        url = args.url.rstrip("/") + route
+        runs = []
+        for i in range(args.runs):
+            try:
+                analysis, events = profile_route(url, args)
+            except Exception as e:
+                print(f"❌ {route} run {i + 1}: {e}")
+                continue
+            runs.append(analysis)
+            trace_path = os.path.join(out_dir, f"startup-{route_slug(route)}-{i + 1}.json")
+            results.write_json(trace_path, trace_analysis.to_trace_file(events, {
+                "route": route,
+                "run": i + 1,
+                "interactive_ms": analysis["interactive_ms"],
+            }))
+        if not runs:
+            continue
+        summaries[route] = summarize_runs(runs)
+        print_route(route, summaries[route], runs[-1])
+
+    if not summaries:
+        return 1
+
+    print(f"\n🔥 Traces written to {out_dir} (open in chrome://tracing, Perfetto or speedscope)")
+    if not args.no_history:
+        record = results.append_history(HISTORY_NAME, {"url": args.url, "runs": args.runs, "routes": summaries})
+        print(f"📝 Recorded run for {record['commit']}")
+    return 0
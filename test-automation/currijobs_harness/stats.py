@@ -0,0 +1,31 @@
+"""
+Small statistics helpers shared by the benchmarks
+"""
+
+import math
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile (pct in 0..100); None for no values"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = min(len(ordered), max(1, math.ceil(pct / 100.0 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def summarize(values):
+    """count / p50 / p95 / p99 / max for a list of latencies"""
+    if not values:
+        return {"count": 0, "p50": None, "p95": None, "p99": None, "max": None}
+    return {
+        "count": len(values),
+        "p50": round(percentile(values, 50), 2),
+        "p95": round(percentile(values, 95), 2),
+        "p99": round(percentile(values, 99), 2),
+        "max": round(max(values), 2),
+    }
+
+
+def fmt_ms(value):
+    return "-" if value is None else f"{value:.1f}"
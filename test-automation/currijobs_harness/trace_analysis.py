@@ -0,0 +1,212 @@
+"""
+Chrome trace analysis
+Breaks the renderer main thread between navigation start and the first
+interactive frame into script compile, module init, script execution,
+render, network wait and idle time
+"""
+
+COMPILE = "script_compile"
+MODULE_INIT = "module_init"
+SCRIPT = "script_execution"
+RENDER = "render"
+OTHER = "other"
+
+MODULE_INIT_ROOTS = {"EvaluateScript", "v8.evaluateModule"}
+SCRIPT_ROOTS = {
+    "FunctionCall", "TimerFire", "EventDispatch", "FireAnimationFrame",
+    "RunMicrotasks", "v8.callFunction", "FireIdleCallback", "XHRReadyStateChange",
+}
+RENDER_NAMES = {
+    "Layout", "UpdateLayoutTree", "RecalculateStyles", "Paint", "PaintImage",
+    "PrePaint", "Layerize", "CompositeLayers", "UpdateLayerTree", "Commit",
+    "HitTest", "ImageDecodeTask", "Decode Image",
+}
+
+
+def classify(event):
+    name, cat = event.get("name", ""), event.get("cat", "")
+    lowered = name.lower()
+    if "v8" in cat and ("compile" in lowered or "parse" in lowered):
+        return COMPILE
+    if name in MODULE_INIT_ROOTS:
+        return MODULE_INIT
+    if name in SCRIPT_ROOTS:
+        return SCRIPT
+    if name in RENDER_NAMES:
+        return RENDER
+    return None
+
+
+def find_main_thread(events):
+    """(pid, tid) of the CrRendererMain thread that did the most work"""
+    candidates = {
+        (e["pid"], e["tid"]) for e in events
+        if e.get("ph") == "M" and e.get("name") == "thread_name"
+        and e.get("args", {}).get("name") == "CrRendererMain"
+    }
+    busy = {}
+    for e in events:
+        key = (e.get("pid"), e.get("tid"))
+        if key in candidates and e.get("ph") == "X":
+            busy[key] = busy.get(key, 0) + e.get("dur", 0)
+    if not busy:
+        return None
+    return max(busy, key=busy.get)
+
+
+def navigation_start(events, main_thread, url_prefix=None):
+    """Timestamp (us) of the app's navigationStart on the main thread"""
+    starts = []
+    for e in events:
+        if e.get("name") != "navigationStart" or (e.get("pid"), e.get("tid")) != main_thread:
+            continue
+        loader_url = e.get("args", {}).get("data", {}).get("documentLoaderURL", "")
+        if url_prefix and loader_url and not loader_url.startswith(url_prefix):
+            continue
+        starts.append(e["ts"])
+    return max(starts) if starts else None
+
+
+def complete_events(events, main_thread):
+    """Main-thread events as (ts, dur, event) with B/E pairs folded into spans"""
+    spans, open_stack = [], []
+    for e in events:
+        if (e.get("pid"), e.get("tid")) != main_thread:
+            continue
+        ph = e.get("ph")
+        if ph == "X":
+            spans.append((e["ts"], e.get("dur", 0), e))
+        elif ph == "B":
+            open_stack.append(e)
+        elif ph == "E" and open_stack:
+            begin = open_stack.pop()
+            spans.append((begin["ts"], e["ts"] - begin["ts"], begin))
+    spans.sort(key=lambda s: (s[0], -s[1]))
+    return spans
+
+
+def merge_intervals(intervals):
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def subtract_intervals(intervals, holes):
+    """Parts of merged intervals not covered by merged holes"""
+    result = []
+    holes = merge_intervals(holes)
+    for start, end in merge_intervals(intervals):
+        cursor = start
+        for h_start, h_end in holes:
+            if h_end <= cursor or h_start >= end:
+                continue
+            if h_start > cursor:
+                result.append([cursor, h_start])
+            cursor = max(cursor, h_end)
+        if cursor < end:
+            result.append([cursor, end])
+    return result
+
+
+def total(intervals):
+    return sum(end - start for start, end in intervals)
+
+
+def network_requests(events, window_start, window_end):
+    """Requests started inside the window as dicts with url/start_ms/duration_ms"""
+    sent, finished = {}, {}
+    for e in events:
+        data = e.get("args", {}).get("data", {})
+        request_id = data.get("requestId")
+        if not request_id:
+            continue
+        if e.get("name") == "ResourceSendRequest":
+            sent.setdefault(request_id, (e["ts"], data.get("url", "")))
+        elif e.get("name") == "ResourceFinish":
+            finished[request_id] = e["ts"]
+    requests = []
+    for request_id, (ts, url) in sent.items():
+        if ts < window_start or ts > window_end:
+            continue
+        end = finished.get(request_id, window_end)
+        requests.append({
+            "url": url,
+            "start_ms": (ts - window_start) / 1000,
+            "duration_ms": (end - ts) / 1000,
+            "_interval": (ts, min(end, window_end)),
+        })
+    return requests
+
+
+def request_kind(url):
+    lowered = url.split("?")[0].lower()
+    if lowered.endswith((".ttf", ".otf", ".woff", ".woff2")):
+        return "font"
+    if lowered.endswith(".bundle") or ".bundle" in lowered:
+        return "bundle"
+    if "/auth/v1/" in lowered:
+        return "auth"
+    if "/rest/v1/" in lowered or ":3000/" in lowered:
+        return "api"
+    if lowered.endswith((".png", ".jpg", ".jpeg", ".webp", ".gif", ".svg")):
+        return "image"
+    return "other"
+
+
+def breakdown(events, interactive_ms, url_prefix=None):
+    """Time breakdown (ms) from navigation start to the first interactive frame"""
+    main_thread = find_main_thread(events)
+    if main_thread is None:
+        raise ValueError("No CrRendererMain thread in trace")
+    window_start = navigation_start(events, main_thread, url_prefix)
+    if window_start is None:
+        window_start = min(e["ts"] for e in events if e.get("ph") == "X")
+    window_end = window_start + interactive_ms * 1000
+
+    buckets = {COMPILE: 0, MODULE_INIT: 0, SCRIPT: 0, RENDER: 0, OTHER: 0}
+    scripts = {}
+    busy = []
+    stack = []  # (end, class)
+    for ts, dur, event in complete_events(events, main_thread):
+        start, end = max(ts, window_start), min(ts + dur, window_end)
+        if end <= start:
+            continue
+        while stack and stack[-1][0] <= start:
+            stack.pop()
+        parent_class = stack[-1][1] if stack else None
+        own = classify(event)
+        cls = own if own == COMPILE else (own or parent_class or OTHER)
+        if not stack:
+            busy.append((start, end))
+        else:
+            # Child time is removed from the parent's bucket and added to its own
+            buckets[stack[-1][1]] -= end - start
+        buckets[cls] += end - start
+        stack.append((end, cls))
+        if event.get("name") in MODULE_INIT_ROOTS:
+            url = event.get("args", {}).get("data", {}).get("url", "")
+            scripts[url] = scripts.get(url, 0) + (end - start)
+
+    requests = network_requests(events, window_start, window_end)
+    network_wait = subtract_intervals([r.pop("_interval") for r in requests], busy)
+    busy_total = total(merge_intervals(busy))
+    result = {name: value / 1000 for name, value in buckets.items()}
+    result["network_wait"] = total(network_wait) / 1000
+    result["idle"] = max(0, (window_end - window_start) - busy_total - total(network_wait)) / 1000
+    result["total"] = interactive_ms
+    for request in requests:
+        request["kind"] = request_kind(request["url"])
+    return {
+        "breakdown_ms": result,
+        "scripts_ms": {url: ms / 1000 for url, ms in sorted(scripts.items(), key=lambda i: -i[1])},
+        "requests": sorted(requests, key=lambda r: -r["duration_ms"]),
+    }
+
+
+def to_trace_file(events, metadata=None):
+    """Chrome Trace Event Format document (chrome://tracing, Perfetto, speedscope)"""
+    return {"traceEvents": events, "displayTimeUnit": "ms", "metadata": metadata or {}}
@@ -0,0 +1,123 @@
+"""
+Public user card benchmark
+Compares the old card load (profile + two `select id` scans over payments,
+as fetchUserProfile + fetchPaymentsCountsForUser did) with the single
+get_user_public_card() lookup, for users with growing payment histories.
+All seed data lives in one transaction that is rolled back at the end.
+
+Usage:
+    python -m currijobs_harness user-card-bench
+    python -m currijobs_harness user-card-bench --sizes 10,1000,100000 --iterations 500
+"""
+
+import time
+
+HISTORY_NAME = "user-card"
+DEFAULT_SIZES = "10,1000,10000,100000"
+
+LEGACY_QUERIES = [
+    "SELECT * FROM profiles WHERE id = %(id)s",
+    "SELECT id FROM payments WHERE payer_id = %(id)s",
+    "SELECT id FROM payments WHERE payee_id = %(id)s",
+]
+CARD_QUERY = "SELECT get_user_public_card(%(id)s)"
+
+
+def add_arguments(parser):
+    from currijobs_harness import db
+
+    db.add_dsn_argument(parser)
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"Payments per seeded user (default: {DEFAULT_SIZES})")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed lookups per user and path (default: 200)")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+def seed(cur, sizes):
+    """One user per history size; each pays `size` and receives `size // 2` payments"""
+    from currijobs_harness import seed as seeding
+
+    (counterparty,) = seeding.create_users(cur, 1, prefix="counterparty")
+    users = seeding.create_users(cur, len(sizes), prefix="card")
+    seeded = {}
+    for size, user_id in zip(sizes, users):
+        task_id = seeding.create_task(cur, counterparty, status="completed", assigned_to=user_id)
+        seeding.create_payments(cur, task_id, user_id, counterparty, size)
+        seeding.create_payments(cur, task_id, counterparty, user_id, size // 2)
+        seeding.create_reviews(cur, task_id, counterparty, user_id, max(1, size // 10))
+        seeded[size] = user_id
+    cur.execute("ANALYZE payments")
+    cur.execute("ANALYZE user_public_stats")
+    return seeded
+
+
+def time_path(cur, queries, user_id, iterations):
+    samples = []
+    rows = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        rows = []
+        for query in queries:
+            cur.execute(query, {"id": user_id})
+            rows.append(cur.fetchall())
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples, rows
+
+
+def run(args):
+    from currijobs_harness import db, results, stats
+
+    print("🪪 CurriJobs User Card Benchmark")
+    print("=" * 50)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    try:
+        conn = db.connect_for(args, autocommit=False)
+    except Exception as e:
+        print(f"❌ Could not connect to {db.target_for(args)}: {e}")
+        return 1
+
+    report = {}
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT to_regprocedure('get_user_public_card(uuid)') IS NOT NULL")
+            if not cur.fetchone()[0]:
+                print("❌ get_user_public_card() not found; apply supabase/migrations first")
+                return 1
+
+            print(f"🌱 Seeding users with {', '.join(map(str, sizes))} payments...")
+            seeded = seed(cur, sizes)
+
+            print(f"\n{'payments':>9}  {'legacy p50':>10} {'p95':>8}  {'card p50':>9} {'p95':>8}")
+            for size, user_id in seeded.items():
+                legacy, legacy_rows = time_path(cur, LEGACY_QUERIES, user_id, args.iterations)
+                card, card_rows = time_path(cur, [CARD_QUERY], user_id, args.iterations)
+
+                card_stats = card_rows[0][0][0]["stats"]
+                made, received = len(legacy_rows[1]), len(legacy_rows[2])
+                if (card_stats["payments_made"], card_stats["payments_received"]) != (made, received):
+                    print(f"❌ Counts differ for {size}: legacy {made}/{received}, card "
+                          f"{card_stats['payments_made']}/{card_stats['payments_received']}")
+                    return 1
+
+                report[str(size)] = {"legacy_ms": stats.summarize(legacy), "card_ms": stats.summarize(card)}
+                l, c = report[str(size)]["legacy_ms"], report[str(size)]["card_ms"]
+                print(f"{size:>9}  {stats.fmt_ms(l['p50']):>10} {stats.fmt_ms(l['p95']):>8}  "
+                      f"{stats.fmt_ms(c['p50']):>9} {stats.fmt_ms(c['p95']):>8}")
+    finally:
+        conn.rollback()
+        conn.close()
+
+    smallest, largest = report[str(sizes[0])]["card_ms"], report[str(sizes[-1])]["card_ms"]
+    growth = largest["p50"] / smallest["p50"] if smallest["p50"] else None
+    if growth is not None:
+        print(f"\n📐 Card p50 at {sizes[-1]} vs {sizes[0]} payments: {growth:.2f}x")
+    print("🧹 Seed data rolled back")
+
+    if not args.no_history:
+        record = results.append_history(HISTORY_NAME, {
+            "iterations": args.iterations,
+            "sizes": report,
+            "card_growth": round(growth, 2) if growth is not None else None,
+        })
+        print(f"📝 Recorded run for {record['commit']}")
+    return 0
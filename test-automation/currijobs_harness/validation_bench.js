@@ -0,0 +1,61 @@
+// Node side of validation-bench: runs lib/row-validation.ts on the rows the
+// Python harness wrote to a JSON file and prints timings as JSON.
+//
+//   node validation_bench.js <repo root> <input.json>
+//
+// The TypeScript sources are transpiled on require with the repo's own
+// typescript devDependency, so the modes measured are the shipped ones.
+
+const fs = require('fs');
+const path = require('path');
+const ts = require('typescript');
+
+require.extensions['.ts'] = (module, filename) => {
+  const source = fs.readFileSync(filename, 'utf8');
+  const { outputText } = ts.transpileModule(source, {
+    fileName: filename,
+    compilerOptions: { module: ts.ModuleKind.CommonJS, target: ts.ScriptTarget.ES2020, esModuleInterop: true },
+  });
+  module._compile(outputText, filename);
+};
+
+const [repoRoot, inputPath] = process.argv.slice(2);
+const { validateRows, validationStats, TASK_ROWS } = require(path.join(repoRoot, 'lib', 'row-validation.ts'));
+const { rows, repeat, sampleEvery, faultRows, faults } = JSON.parse(fs.readFileSync(inputPath, 'utf8'));
+
+// rejectInvalid warns once per batch with dropped rows; keep stdout/stderr to the report
+console.warn = () => {};
+
+const timeMode = (mode) => {
+  let bestMs = Infinity;
+  let valid = 0;
+  for (let attempt = 0; attempt < repeat; attempt++) {
+    const start = process.hrtime.bigint();
+    valid = validateRows(TASK_ROWS, rows, { mode, sampleEvery }).length;
+    bestMs = Math.min(bestMs, Number(process.hrtime.bigint() - start) / 1e6);
+  }
+  return { best_ms: bestMs, valid };
+};
+
+// One untimed pass per mode so every mode is measured with warm JIT
+['full', 'compiled', 'sampled'].forEach((mode) => validateRows(TASK_ROWS, rows, { mode, sampleEvery }));
+const modes = {};
+['full', 'compiled', 'sampled'].forEach((mode) => {
+  modes[mode] = timeMode(mode);
+});
+
+const base = rows.slice(0, faultRows);
+const faultResults = faults.map((fault) => {
+  const batch = base.slice();
+  batch[fault.index] = fault.row;
+  const escalations = validationStats.escalations;
+  validateRows(TASK_ROWS, batch, { mode: 'sampled', sampleEvery });
+  return {
+    fault: fault.name,
+    full_rejected: batch.length - validateRows(TASK_ROWS, batch, { mode: 'full' }).length,
+    compiled_rejected: batch.length - validateRows(TASK_ROWS, batch, { mode: 'compiled' }).length,
+    sampled_escalated: validationStats.escalations > escalations,
+  };
+});
+
+process.stdout.write(JSON.stringify({ node: process.version, modes, faults: faultResults }));
@@ -0,0 +1,182 @@
+"""
+Row validation benchmark
+Runs the three lib/row-validation.ts modes over a large synthetic task
+list shaped like PostgREST output and reports rows per second per mode.
+The rows are generated here; the timing runs in Node on the shipped
+module (validation_bench.js transpiles it with the repo's typescript
+devDependency), so run `npm install` first.
+
+A fault pass then corrupts single rows and checks that full and compiled
+agree and that sampled mode escalates on column drift.
+
+Usage:
+    python -m currijobs_harness validation-bench
+    python -m currijobs_harness validation-bench --rows 50000 --sample-every 50
+"""
+
+import os
+import time
+
+HISTORY_NAME = "validation"
+MODES = ("full", "compiled", "sampled")
+DRIVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "validation_bench.js")
+FAULT_ROWS = 2000
+
+
+def add_arguments(parser):
+    parser.add_argument("--rows", type=int, default=20000, help="Synthetic task rows (default: 20000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes per mode; best is reported (default: 3)")
+    parser.add_argument("--sample-every", type=int, default=25, help="Sampled mode stride (default: 25)")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed (default: 7)")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+
+
+def synthetic_tasks(count, seed):
+    """Rows as GET /tasks?select=* returns them: offset timestamps, nulls for unset columns"""
+    import random
+    import uuid
+
+    from currijobs_harness.seed import SAN_JOSE, TASK_CATEGORIES
+
+    rng = random.Random(seed)
+    owners = [str(uuid.UUID(int=rng.getrandbits(128), version=4)) for _ in range(max(1, count // 20))]
+    rows = []
+    for i in range(count):
+        status = rng.choice(("open", "open", "open", "in_progress", "completed"))
+        stamp = f"2026-{rng.randint(1, 9):02d}-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}.{rng.randint(0, 999999):06d}+00:00"
+        rows.append({
+            "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            "title": f"Tarea {i}",
+            "description": "Necesito ayuda " * rng.randint(1, 12),
+            "category": rng.choice(TASK_CATEGORIES),
+            "reward": float(rng.randrange(2000, 80000, 500)),
+            "location": "San José, Costa Rica",
+            "latitude": SAN_JOSE[0] + rng.uniform(-0.3, 0.3),
+            "longitude": SAN_JOSE[1] + rng.uniform(-0.3, 0.3),
+            "status": status,
+            "user_id": rng.choice(owners),
+            "assigned_to": rng.choice(owners) if status != "open" else None,
+            "created_at": stamp,
+            "updated_at": stamp,
+            "deadline": stamp if rng.random() < 0.3 else None,
+            "time_estimate": rng.choice(("1 hora", "2 horas", None)),
+            "images": None,
+            "tags": ["urgente"] if rng.random() < 0.1 else None,
+            "priority": rng.choice(("low", "medium", "high")),
+            "is_urgent": rng.random() < 0.1,
+            "completed_at": stamp if status == "completed" else None,
+        })
+    return rows
+
+
+# (name, kind, rows the schema rejects, mutation); drift changes the column
+# signature, value faults keep it and only show up when the row is checked
+FAULTS = [
+    ("reward as string", "drift", 1, lambda row: row.update(reward=str(row["reward"]))),
+    ("latitude out of range", "value", 1, lambda row: row.update(latitude=123.0)),
+    ("bad uuid", "value", 1, lambda row: row.update(user_id="not-a-uuid")),
+    ("timestamp without offset", "value", 1, lambda row: row.update(created_at="2026-01-01 10:00:00")),
+    ("unknown status", "value", 1, lambda row: row.update(status="archived")),
+    ("missing title", "drift", 1, lambda row: row.pop("title")),
+    ("missing nullish column", "drift", 0, lambda row: row.pop("category")),
+    ("extra column", "drift", 0, lambda row: row.update(offer_count=3)),
+]
+
+
+def fault_batches(rows):
+    """One corrupted copy of a row per fault, placed mid-batch"""
+    import copy
+
+    victim = min(len(rows), FAULT_ROWS) // 2 + 2
+    batches = []
+    for name, _, _, mutate in FAULTS:
+        row = copy.deepcopy(rows[victim])
+        mutate(row)
+        batches.append({"name": name, "index": victim, "row": row})
+    return batches
+
+
+def run_driver(payload):
+    """Run validation_bench.js on payload; returns its report or raises RuntimeError"""
+    import json
+    import shutil
+    import subprocess
+    import tempfile
+
+    from currijobs_harness.cli import REPO_ROOT
+
+    node = shutil.which("node")
+    if not node:
+        raise RuntimeError("node not found on PATH")
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+        json.dump(payload, f)
+    try:
+        proc = subprocess.run([node, DRIVER, REPO_ROOT, f.name], cwd=REPO_ROOT, capture_output=True, text=True)
+    finally:
+        os.unlink(f.name)
+    if proc.returncode != 0:
+        lines = proc.stderr.strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"exit status {proc.returncode}")
+    return json.loads(proc.stdout)
+
+
+def run(args):
+    from currijobs_harness import results
+
+    print("🧪 CurriJobs Row Validation Benchmark")
+    print("=" * 50)
+    rows = synthetic_tasks(args.rows, args.seed)
+    print(f"📋 {len(rows):,} synthetic task rows, sampling every {args.sample_every}")
+
+    start = time.perf_counter()
+    try:
+        output = run_driver({
+            "rows": rows,
+            "repeat": max(1, args.repeat),
+            "sampleEvery": args.sample_every,
+            "faultRows": FAULT_ROWS,
+            "faults": fault_batches(rows),
+        })
+    except (RuntimeError, ValueError) as e:
+        print(f"❌ Could not run lib/row-validation.ts under Node: {e}")
+        print("Please run: npm install")
+        return 1
+    print(f"⚙️  Node {output['node']} ({time.perf_counter() - start:.1f}s including transpile)")
+
+    report = {"rows": len(rows), "sample_every": args.sample_every, "node": output["node"], "modes": {}}
+    print(f"\n{'mode':<10} {'rows/s':>12} {'ms/1000 rows':>14} {'speedup':>8}")
+    for mode in MODES:
+        result = output["modes"][mode]
+        if result["valid"] != len(rows):
+            print(f"❌ {mode} rejected {len(rows) - result['valid']} valid rows")
+            return 1
+        best_s = max(result["best_ms"], 1e-3) / 1000
+        report["modes"][mode] = {"rows_per_s": round(len(rows) / best_s), "ms_per_1000": round(best_s * 1e6 / len(rows), 3)}
+    base = report["modes"]["full"]["rows_per_s"]
+    for mode, result in report["modes"].items():
+        print(f"{mode:<10} {result['rows_per_s']:>12,} {result['ms_per_1000']:>14} {result['rows_per_s'] / base:>7.1f}x")
+
+    faults = []
+    for (name, kind, expected, _), result in zip(FAULTS, output["faults"]):
+        faults.append(dict(result, kind=kind, expected_rejected=expected))
+    report["faults"] = faults
+    print(f"\n{'fault':<26} {'full':>5} {'compiled':>9} {'sampled':>10}")
+    failed = False
+    for fault in faults:
+        agree = fault["full_rejected"] == fault["compiled_rejected"] == fault["expected_rejected"]
+        caught = fault["sampled_escalated"] or fault["kind"] != "drift"
+        failed = failed or not agree or not caught
+        sampled = "escalated" if fault["sampled_escalated"] else "-"
+        print(f"{fault['fault']:<26} {fault['full_rejected']:>5} {fault['compiled_rejected']:>9} {sampled:>10}"
+              f"{'' if agree and caught else '  ❌'}")
+
+    print(f"(value faults outside the sample pass unnoticed in sampled mode; about 1 in {args.sample_every} is caught)")
+
+    if not args.no_history:
+        record = results.append_history(HISTORY_NAME, report)
+        print(f"📝 Recorded run for {record['commit']}")
+    if failed:
+        print("❌ Validators disagree or sampled mode missed column drift")
+        return 1
+    print("✅ Compiled matches full validation and sampled mode escalates on column drift")
+    return 0
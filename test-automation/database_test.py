@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+CurriJobs Database Test Suite
+Checks the server-side engines against brute-force queries on a Postgres
+with supabase/migrations applied (CURRIJOBS_DATABASE_URL, or pass --dsn). Every
+check seeds inside a transaction that is rolled back.
+"""
+
+import argparse
+import sys
+
+from currijobs_harness import cli
+
+def dsn_args():
+    """Forward --dsn <url> to the harness checks"""
+    parser = argparse.ArgumentParser(description="CurriJobs database test suite")
+    parser.add_argument("--dsn", help="Postgres URL (default: CURRIJOBS_DATABASE_URL)")
+    args, _ = parser.parse_known_args()
+    return ["--dsn", args.dsn] if args.dsn else []
+
+def test_leaderboard():
+    """Test XP, histogram, top-K and my-position against brute force"""
+    print("🧪 Test 1: Leaderboard")
+    if cli.main(["leaderboard-check", "--users", "20000", "--samples", "50", "--no-history"] + dsn_args()) == 0:
+        print("✅ Leaderboard matches brute force")
+        return True
+    print("❌ Leaderboard check failed")
+    return False
+
+def test_radius_search():
+    """Test the radius RPCs (default: no limit) use idx_tasks_location and match brute force"""
+    print("\n🧪 Test 2: Radius search")
+    if cli.main(["radius-check", "--tasks", "20000", "--samples", "10", "--limit", "0", "--no-history"] + dsn_args()) == 0:
+        print("✅ Radius search matches brute force")
+        return True
+    print("❌ Radius check failed")
+    return False
+
+def main():
+    """Run all tests and provide summary"""
+    print("🚀 CurriJobs Database Test Suite")
+    print("=" * 50)
+
+    tests = [
+        test_leaderboard,
+        test_radius_search,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+
+    print("\n" + "=" * 50)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
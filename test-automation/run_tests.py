@@ -3,26 +3,26 @@
 Quick test runner for CurriJobs
 """
 
+import argparse
 import subprocess
 import sys
 import os
 
-def install_dependencies():
-    """Install Python dependencies"""
-    print("📦 Installing Python dependencies...")
+from currijobs_harness.bootstrap import ensure_dependencies
+
+def install_dependencies(offline=None):
+    """Install Python dependencies (skipped when requirements.txt is unchanged)"""
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
-        print("✅ Dependencies installed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
+        return ensure_dependencies("requirements.txt", offline=offline)
+    except (subprocess.CalledProcessError, RuntimeError) as e:
         print(f"❌ Failed to install dependencies: {e}")
-        return False
+        return None
 
-def run_tests():
+def run_tests(python):
     """Run the test suite"""
     print("🧪 Running CurriJobs test suite...")
     try:
-        subprocess.check_call([sys.executable, "simple_test.py"])
+        subprocess.check_call([python, "simple_test.py"])
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ Tests failed: {e}")
@@ -30,19 +30,25 @@ def run_tests():
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Quick test runner for CurriJobs")
+    parser.add_argument("--offline", action="store_true", default=None,
+                        help="Install only from the local wheelhouse (default: CURRIJOBS_OFFLINE)")
+    args = parser.parse_args()
+
     print("🚀 CurriJobs Test Runner")
     print("=" * 40)
-    
+
     # Change to test-automation directory
-    os.chdir("test-automation")
-    
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
     # Install dependencies
-    if not install_dependencies():
+    python = install_dependencies(offline=args.offline)
+    if not python:
         print("❌ Cannot continue without dependencies")
         return
-    
+
     # Run tests
-    run_tests()
+    run_tests(python)
 
 if __name__ == "__main__":
     main()
@@ -14,6 +14,9 @@ import time
 import random
 import string
 
+TEST_EMAIL = "test@example.com"
+TEST_PASSWORD = "TestPassword123!"
+
 class CurriJobsTestSuite:
     def __init__(self):
         self.driver = None
@@ -35,6 +38,19 @@ class CurriJobsTestSuite:
         """Generate a random email for testing"""
         username = ''.join(random.choices(string.ascii_lowercase, k=8))
         return f"{username}@test.com"
+
+    def open_signed_in(self, route):
+        """Open route as the test user with an API session instead of the login form"""
+        from currijobs_harness import auth_session
+
+        try:
+            session, _ = auth_session.get_session(TEST_EMAIL, TEST_PASSWORD)
+        except Exception as e:
+            print(f"⚠️ No API session ({e}); continuing signed out")
+            self.driver.get(f"{self.base_url}{route}")
+            return False
+        auth_session.open_as(self.driver, self.base_url, route, session)
+        return True
     
     def test_app_loading(self):
         """Test that the app loads correctly"""
@@ -101,8 +117,8 @@ class CurriJobsTestSuite:
             time.sleep(2)
             
             # Use test credentials
-            test_email = "test@example.com"
-            test_password = "TestPassword123!"
+            test_email = TEST_EMAIL
+            test_password = TEST_PASSWORD
             
             # Fill login form
             email_input = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='email']")))
@@ -133,9 +149,8 @@ class CurriJobsTestSuite:
         """Test task creation functionality"""
         print("\n🧪 Test 4: Task Creation")
         try:
-            # Navigate to create task page
-            self.driver.get(f"{self.base_url}/create-task")
-            time.sleep(2)
+            # Start on the create task page already signed in
+            self.open_signed_in("/create-task")
             
             # Fill task form
             title_input = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder*='title']")))
@@ -4,10 +4,6 @@ Test CurriJobs App Access
 """
 
 import requests
-import time
-import webbrowser
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 
 def test_app_access():
     """Test if the app is accessible"""
@@ -48,6 +44,9 @@ def open_app_in_browser(url):
     print(f"\n🎬 Opening app in browser: {url}")
     
     try:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
         options = Options()
         options.add_experimental_option("excludeSwitches", ["enable-logging"])
         options.add_argument("--no-sandbox")